@@ -0,0 +1,118 @@
+// Reader for api/data/agricola-cards.bin, the columnar card dataset built by
+// scripts/build_card_binary.py (layout documented in scripts/cardlib/cardbin.py).
+// Only the header, field table and string offsets are parsed on open; a
+// column is decoded when first asked for, so a function that needs the card
+// names never touches the descriptions or stats.
+
+const fs = require('fs');
+
+const MAGIC = 'AGCB';
+const VERSION = 1;
+const HEADER_SIZE = 36;   // '<4sHHIIIIIII'
+const FIELD_SIZE = 16;    // '<IB3xII'
+
+const STR = 1, INT = 2, DEC = 3, BOOL = 4, STRLIST = 5, OBJ = 6, JSON_KIND = 7;
+const NULL_ID = 0xFFFFFFFF;
+const INT_NULL = -(2 ** 31);
+const SCALE_NULL = 0xFF;
+const BOOL_NULL = 0xFF;
+
+function decodeDecimal(mantissa, scale) {
+    const sign = mantissa < 0 ? '-' : '';
+    let digits = String(Math.abs(mantissa));
+    if (scale === 0) return sign + digits;
+    digits = digits.padStart(scale + 1, '0');
+    return `${sign}${digits.slice(0, -scale)}.${digits.slice(-scale)}`;
+}
+
+class CardBinary {
+    constructor(buf) {
+        this.buf = buf;
+        if (buf.toString('latin1', 0, 4) !== MAGIC || buf.readUInt16LE(4) !== VERSION) {
+            throw new Error(`not a version ${VERSION} card binary`);
+        }
+        this.nRows = buf.readUInt32LE(8);
+        const nFields = buf.readUInt32LE(12);
+        const nStrings = buf.readUInt32LE(20);
+        const stringsOff = buf.readUInt32LE(24);
+        const fieldsOff = buf.readUInt32LE(28);
+        this.strOffsets = stringsOff;
+        this.blobOff = stringsOff + 4 * (nStrings + 1);
+        this.strings = new Map();
+        this.columns = new Map();
+
+        this.fields = new Map();
+        for (let fid = 0; fid < nFields; fid++) {
+            const at = fieldsOff + fid * FIELD_SIZE;
+            this.fields.set(this.string(buf.readUInt32LE(at)), {
+                kind: buf.readUInt8(at + 4),
+                off: buf.readUInt32LE(at + 8),
+            });
+        }
+    }
+
+    static open(file) {
+        return new CardBinary(fs.readFileSync(file));
+    }
+
+    string(i) {
+        let s = this.strings.get(i);
+        if (s === undefined) {
+            const a = this.buf.readUInt32LE(this.strOffsets + 4 * i);
+            const b = this.buf.readUInt32LE(this.strOffsets + 4 * (i + 1));
+            s = this.buf.toString('utf8', this.blobOff + a, this.blobOff + b);
+            this.strings.set(i, s);
+        }
+        return s;
+    }
+
+    // Values of one field for every row (null for null or absent). OBJ
+    // columns give layout ids, as in the Python reader.
+    column(name) {
+        if (this.columns.has(name)) return this.columns.get(name);
+        const field = this.fields.get(name);
+        if (!field) throw new Error(`no field ${name}`);
+        const { kind, off } = field;
+        const n = this.nRows;
+        const buf = this.buf;
+        const values = new Array(n);
+        if (kind === STR || kind === JSON_KIND) {
+            for (let r = 0; r < n; r++) {
+                const id = buf.readUInt32LE(off + 4 * r);
+                const s = id === NULL_ID ? null : this.string(id);
+                values[r] = kind === JSON_KIND && s !== null ? JSON.parse(s) : s;
+            }
+        } else if (kind === INT) {
+            for (let r = 0; r < n; r++) {
+                const v = buf.readInt32LE(off + 4 * r);
+                values[r] = v === INT_NULL ? null : v;
+            }
+        } else if (kind === DEC) {
+            for (let r = 0; r < n; r++) {
+                const scale = buf.readUInt8(off + 4 * n + r);
+                values[r] = scale === SCALE_NULL ? null : decodeDecimal(buf.readInt32LE(off + 4 * r), scale);
+            }
+        } else if (kind === BOOL) {
+            for (let r = 0; r < n; r++) {
+                const v = buf.readUInt8(off + r);
+                values[r] = v === BOOL_NULL ? null : v === 1;
+            }
+        } else if (kind === STRLIST) {
+            const ids = off + 4 * (n + 1);
+            for (let r = 0; r < n; r++) {
+                const a = buf.readUInt32LE(off + 4 * r);
+                const b = buf.readUInt32LE(off + 4 * (r + 1));
+                values[r] = [];
+                for (let k = a; k < b; k++) values[r].push(this.string(buf.readUInt32LE(ids + 4 * k)));
+            }
+        } else if (kind === OBJ) {
+            for (let r = 0; r < n; r++) values[r] = buf.readUInt16LE(off + 2 * r);
+        } else {
+            throw new Error(`unknown column kind ${kind} for ${name}`);
+        }
+        this.columns.set(name, values);
+        return values;
+    }
+}
+
+module.exports = { CardBinary };
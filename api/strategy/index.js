@@ -6,29 +6,23 @@ const { app } = require('@azure/functions');
 const path = require('path');
 const fs = require('fs');
 
-// --- Load card database at module level (cold start only) ---
-const CARDS = JSON.parse(
-    fs.readFileSync(path.join(__dirname, '..', 'data', 'agricola-cards.json'), 'utf8')
-);
-const CARD_MAP = {};
-CARDS.forEach(card => { CARD_MAP[card.name] = card; });
-
-// --- Compact card index for system prompt ---
-function buildCompactIndex(playerCount) {
-    return CARDS
-        .map(c => {
-            if (playerCount === 3) {
-                if (!c.stats_3p) return null;
-                return `${c.name}|${c.stats_3p.rank}|${c.stats_3p.adp}|${c.type === 'Occupation' ? 'O' : 'M'}`;
-            }
-            if (c.rank == null) return null;
-            return `${c.name}|${c.rank}|${c.adp}|${c.type === 'Occupation' ? 'O' : 'M'}`;
-        })
-        .filter(Boolean)
-        .join('\n');
+// --- Load prebuilt card indexes at module level (cold start only) ---
+// Built offline by scripts/build_strategy_index.py: each artifact holds the
+// compact "name|rank|adp|O/M" prompt index and a name -> enriched card table
+// with that player count's stats already resolved.
+function loadStrategyIndex(playerCount) {
+    const file = path.join(__dirname, '..', 'data', `strategy-index-${playerCount}p.json`);
+    const artifact = JSON.parse(fs.readFileSync(file, 'utf8'));
+    if (artifact.version !== 1 || artifact.player_count !== playerCount) {
+        throw new Error(`Unexpected strategy index artifact: ${file}`);
+    }
+    return artifact;
 }
-const COMPACT_INDEX_4P = buildCompactIndex(4);
-const COMPACT_INDEX_3P = buildCompactIndex(3);
+const STRATEGY_INDEX = { 3: loadStrategyIndex(3), 4: loadStrategyIndex(4) };
+const COMPACT_INDEX_4P = STRATEGY_INDEX[4].index;
+const COMPACT_INDEX_3P = STRATEGY_INDEX[3].index;
+// Card type lookup; type doesn't depend on player count.
+const CARD_MAP = STRATEGY_INDEX[4].cards;
 
 // --- Rate limiting (in-memory, resets on cold start) ---
 const rateLimitMap = new Map();
@@ -53,6 +47,125 @@ const STRATEGY_GUIDE = fs.readFileSync(
     path.join(__dirname, '..', 'docs', 'agricola-strategy-guide.md'), 'utf8'
 );
 
+// --- Passage index over the guide and the rulebook ---
+// Built offline by scripts/build_doc_index.py (BM25 with precomputed,
+// quantized term impacts; see scripts/cardlib/doc_index.py, which this
+// query code mirrors). Each request gets the passages that best match its
+// hand and drafted cards instead of the whole guide. Set
+// STRATEGY_FULL_GUIDE=1 to embed the full guide as before.
+function loadDocIndex() {
+    try {
+        const file = path.join(__dirname, '..', 'data', 'doc-index.json');
+        const index = JSON.parse(fs.readFileSync(file, 'utf8'));
+        if (index.version !== 1) throw new Error(`unexpected version ${index.version}`);
+        index.stopwordSet = new Set(index.stopwords);
+        return index;
+    } catch (err) {
+        console.warn(`Passage index unavailable, embedding the full strategy guide: ${err.message}`);
+        return null;
+    }
+}
+const DOC_INDEX = loadDocIndex();
+const USE_FULL_GUIDE = process.env.STRATEGY_FULL_GUIDE === '1' || !DOC_INDEX;
+const PASSAGE_COUNT = 6;
+const TAG_WEIGHT = 2.0;
+const NAME_WEIGHT = 1.0;
+const DESCRIPTION_WEIGHT = 0.5;
+
+function stemTerm(word) {
+    if (word.length > 4 && word.endsWith('ies')) return word.slice(0, -3) + 'y';
+    if (word.length > 4 && word.endsWith('es') && 'sxz'.includes(word[word.length - 3])) return word.slice(0, -2);
+    if (word.length > 3 && word.endsWith('s') && !word.endsWith('ss')) return word.slice(0, -1);
+    return word;
+}
+
+function indexTerms(text) {
+    return (text.toLowerCase().match(/[a-z0-9]+/g) || [])
+        .filter(w => !DOC_INDEX.stopwordSet.has(w))
+        .map(stemTerm);
+}
+
+// {term: weight} for a list of enriched cards; repeats add up as 1 + log(sum)
+function handQuery(cards) {
+    const raw = new Map();
+    const add = (text, weight) => {
+        for (const term of indexTerms(text)) raw.set(term, (raw.get(term) || 0) + weight);
+    };
+    for (const card of cards) {
+        for (const tag of card.tags || []) add(tag, TAG_WEIGHT);
+        add(card.name || '', NAME_WEIGHT);
+        add(card.description || '', DESCRIPTION_WEIGHT);
+    }
+    const weights = new Map();
+    for (const [term, w] of raw) weights.set(term, w > 1 ? 1 + Math.log(w) : w);
+    return weights;
+}
+
+function searchPassages(weights, k) {
+    const scores = new Map();
+    for (const [term, weight] of weights) {
+        const flat = DOC_INDEX.postings[term];
+        if (!flat) continue;
+        let c = 0;
+        for (let i = 0; i < flat.length; i += 2) {
+            c += flat[i];
+            scores.set(c, (scores.get(c) || 0) + weight * flat[i + 1]);
+        }
+    }
+    return [...scores.entries()]
+        .sort((a, b) => b[1] - a[1] || a[0] - b[0])
+        .slice(0, k)
+        .map(([c]) => DOC_INDEX.chunks[c]);
+}
+
+function formatPassages(cards) {
+    const passages = searchPassages(handQuery(cards), PASSAGE_COUNT);
+    return passages.map(([source, title, text]) =>
+        `[${DOC_INDEX.sources[source].name}: ${title}]\n${text}`).join('\n\n');
+}
+
+// --- Synergy partners ---
+// Built offline by scripts/build_synergy.py: each card's top-k partners scored
+// by shared tags, description terms and resources. Optional; without it the
+// user message simply has no synergy section.
+function loadSynergy() {
+    try {
+        const file = path.join(__dirname, '..', 'data', 'card-synergy.json');
+        const artifact = JSON.parse(fs.readFileSync(file, 'utf8'));
+        if (artifact.version !== 1) throw new Error(`unexpected version ${artifact.version}`);
+        return artifact.partners;
+    } catch (err) {
+        console.warn(`Synergy partners unavailable: ${err.message}`);
+        return null;
+    }
+}
+const SYNERGY = loadSynergy();
+
+// "Hand card: drafted partner (score), ..." for each hand card with drafted
+// cards among its top partners, or whose own top partners include it
+function formatSynergies(handNames, draftedNames) {
+    if (!SYNERGY || draftedNames.length === 0) return '';
+    const drafted = new Set(draftedNames);
+    const lines = [];
+    for (const name of handNames) {
+        const found = new Map();
+        for (const [partner, score] of SYNERGY[name] || []) {
+            if (drafted.has(partner)) found.set(partner, score);
+        }
+        for (const other of drafted) {
+            if (found.has(other)) continue;
+            const entry = (SYNERGY[other] || []).find(([partner]) => partner === name);
+            if (entry) found.set(other, entry[1]);
+        }
+        if (found.size > 0) {
+            const partners = [...found].sort((a, b) => b[1] - a[1])
+                .map(([partner, score]) => `${partner} (${score.toFixed(2)})`);
+            lines.push(`${name}: ${partners.join(', ')}`);
+        }
+    }
+    return lines.join('\n');
+}
+
 // --- System prompt (static — enables Azure OpenAI prompt caching across all requests) ---
 const SYSTEM_PROMPT = `You are an expert Agricola (board game) draft strategy advisor for 3- and 4-player games. You analyze a player's draft state and provide strategic guidance. The user message will tell you the exact PLAYER COUNT and round-to-hand rotation for this draft.
 
@@ -99,7 +212,7 @@ Draft stage awareness:
 
 STRATEGIC FRAMEWORK:
 
-${STRATEGY_GUIDE}
+${USE_FULL_GUIDE ? STRATEGY_GUIDE : 'The user message includes the passages of the strategy guide and the rulebook most relevant to this draft. Ground your analysis in them.'}
 
 COMPLETE CARD INDEX (format "name|rank|adp|type" where type is O=Occupation, M=Minor Improvement). Use this to reason about what cards may still appear in future hands and what the opponents could potentially draft. Fully-enriched details (description, tags, play rate, elo, cost, VPs) for the player's current hand and drafted cards are provided in the user message — rely on that for detailed analysis.
 Rankings and stats differ between 3-player and 4-player games. The card index below matches the player count for this game.
@@ -109,37 +222,16 @@ Rankings and stats differ between 3-player and 4-player games. The card index be
 const SYSTEM_PROMPT_4P = SYSTEM_PROMPT + COMPACT_INDEX_4P;
 const SYSTEM_PROMPT_3P = SYSTEM_PROMPT + COMPACT_INDEX_3P;
 
-// --- Resolve stats based on player count ---
-function getStats(card, playerCount) {
-    if (playerCount === 3 && card.stats_3p) return card.stats_3p;
-    return card;
-}
-
 // --- Enrich card names with full details for user message ---
 function enrichCards(names, playerCount) {
-    return names
-        .map(name => CARD_MAP[name])
-        .filter(Boolean)
-        .map(c => {
-            const s = getStats(c, playerCount);
-            return {
-                name: c.name, rank: s.rank, apr: s.apr, adp: s.adp,
-                play_rate: s.play_rate, elo_per_play: s.elo_per_play,
-                type: c.type, description: c.description,
-                cost: c.cost, vps: c.vps, tags: c.tags,
-            };
-        });
+    const cards = STRATEGY_INDEX[playerCount].cards;
+    return names.map(name => cards[name]).filter(Boolean);
 }
 
 // --- Light enrichment for opponent cards ---
 function enrichOpponentCards(names, playerCount) {
-    return names
-        .map(name => CARD_MAP[name])
-        .filter(Boolean)
-        .map(c => {
-            const s = getStats(c, playerCount);
-            return { name: c.name, rank: s.rank, type: c.type, tags: c.tags };
-        });
+    return enrichCards(names, playerCount)
+        .map(c => ({ name: c.name, rank: c.rank, type: c.type, tags: c.tags }));
 }
 
 // --- Build user message from draft state ---
@@ -157,11 +249,21 @@ function buildUserMessage(body) {
     msg += `CURRENT HAND (choose from these cards):\n${JSON.stringify(handCards, null, 1)}\n\n`;
     if (draftedCards.length > 0) {
         msg += `MY DRAFTED CARDS SO FAR:\n${JSON.stringify(draftedCards, null, 1)}\n\n`;
+        const synergies = formatSynergies(handCards.map(c => c.name), draftedCards.map(c => c.name));
+        if (synergies) {
+            msg += `PRECOMPUTED SYNERGIES WITH MY DRAFTED CARDS (score 0-1 from shared tags, description terms and resources):\n${synergies}\n\n`;
+        }
     }
     if (othersDrafted.length > 0) {
         const enrichedOpponents = enrichOpponentCards(othersDrafted, playerCount);
         msg += `CARDS TAKEN BY OPPONENTS (with type, rank, and strategy tags):\n${JSON.stringify(enrichedOpponents, null, 1)}\n\n`;
     }
+    if (!USE_FULL_GUIDE) {
+        const passages = formatPassages([...handCards, ...draftedCards]);
+        if (passages) {
+            msg += `RELEVANT STRATEGY GUIDE AND RULEBOOK PASSAGES:\n${passages}\n\n`;
+        }
+    }
     msg += 'Analyze my draft state and suggest the best picks from my current hand.';
     return msg;
 }
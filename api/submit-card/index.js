@@ -1,8 +1,10 @@
 // Azure Function: Card submission pipeline for Agricola draft tool
 // Validates user-submitted card data, deduplicates, and creates a GitHub Issue
-// as a moderation queue. Admin reviews issues and adds approved cards to the DB.
+// as a moderation queue. Admin reviews issues and adds approved cards to the DB
+// in batches with scripts/ingest_submissions.py (which reads the JSON block below).
 
 const path = require('path');
+const { CardBinary } = require('../src/card-binary');
 
 // --- Rate limiting (in-memory, resets on cold start) ---
 const rateLimitMap = new Map();
@@ -23,8 +25,9 @@ function isRateLimited(ip) {
 }
 
 // --- Card database (loaded once on cold start) ---
-const cardData = require(path.join(__dirname, '..', 'data', 'agricola-cards.json'));
-const existingCardNames = new Set(cardData.map(c => c.name.toLowerCase()));
+// Only the name column of the binary dataset is decoded, not the full JSON.
+const cardBinary = CardBinary.open(path.join(__dirname, '..', 'data', 'agricola-cards.bin'));
+const existingCardNames = new Set(cardBinary.column('name').map(n => n.toLowerCase()));
 
 // --- Validation constants ---
 const NAME_PATTERN = /^[\p{L}\p{N}\s'\-.,!&()]+$/u;
@@ -1,719 +1,1441 @@
+// Generated by scripts/optimize_images.py — do not edit by hand.
 // Shared list of all card image filenames — used by both index.html and draft.html
 var CARD_IMAGE_LIST = [
-    'abort oriel.png',
-    'acornsbasket.png',
-    'acquirer.png',
-    'agricultural fertilizers.png',
-    'agriculturallabourer.png',
-    'alchemists lab.png',
-    'ale-benches.png',
-    'almsbag.png',
-    'ambition.png',
-    'angler.png',
-    'animal bedding.png',
-    'animalactivist.png',
-    'animaldealer.png',
-    'animaldriver.png',
-    'animalhusbandryworker.png',
-    'animalreeve.png',
-    'animaltamer\'sapprentice.png',
-    'animaltamer.png',
-    'animalteacher.png',
-    'apiary.png',
-    'artichoke field.png',
-    'artisan district.png',
-    'ash trees.png',
-    'asparagus gift.png',
-    'asparagus knife.png',
-    'assistanttiller.png',
-    'autumnmother.png',
-    'baker.png',
-    'baking course.png',
-    'baking sheet.png',
-    'barley mill.png',
-    'barn cats.png',
-    'barn shed.png',
-    'barrowpusher.png',
-    'bartering hut.png',
-    'baseboards.png',
-    'basket.png',
-    'basketmaker\'swife.png',
-    'beancounter.png',
-    'beanfield.png',
-    'beating rod.png',
-    'beaver colony.png',
-    'bed in the grain field.png',
-    'bedmaker.png',
-    'bee statue.png',
-    'beer keg.png',
-    'beer stall.png',
-    'beer table.png',
-    'beer tap.png',
-    'beertentoperator.png',
-    'beggingstudent.png',
-    'bellfounder.png',
-    'beneficiary.png',
-    'bigcountry.png',
-    'blackberryfarmer.png',
-    'blade shears.png',
-    'blighter.png',
-    'blueprint.png',
-    'boar spear.png',
-    'bohemian.png',
-    'bonehead.png',
-    'bookcase.png',
-    'bookmark.png',
-    'bookshelf.png',
-    'bottles.png',
-    'braidmaker.png',
-    'breadpaddle.png',
-    'breed registry.png',
-    'breederbuyer.png',
-    'brewery pond.png',
-    'brewing water.png',
-    'briar hedge.png',
-    'brickhammer.png',
-    'bricklayer.png',
-    'brook.png',
-    'brushwoodcollector.png',
-    'bucksaw.png',
-    'buildingtycoon.png',
-    'bunk beds.png',
-    'bunnybreeder.png',
-    'butler.png',
-    'butterchurn.png',
-    'buyer.png',
-    'canoe.png',
-    'canvas sack.png',
-    'caravan.png',
-    'carpenter\'s axe.png',
-    'carpenter\'s bench.png',
-    'carpenter\'s hammer.png',
-    'carpenter\'s yard.png',
-    'carpenter.png',
-    'carpentersparlor.png',
-    'carriagetrip.png',
-    'carrotmuseum.png',
-    'carter.png',
-    'casebuilder.png',
-    'casualworker.png',
-    'cattlebuyer.png',
-    'cattlefeeder.png',
-    'cattlewhisperer.png',
-    'ceilings.png',
-    'cesspit.png',
-    'chain float.png',
-    'chairman.png',
-    'championbreeder.png',
-    'changeover.png',
-    'chapel.png',
-    'charcoalburner.png',
-    'cheese fondue.png',
-    'cherry orchard.png',
-    'chick stable.png',
-    'chickencoop.png',
-    'chiefforester.png',
-    'child\'s toy.png',
-    'childless.png',
-    'childombudsman.png',
-    'chimneysweep.png',
-    'chophouse.png',
-    'christianity.png',
-    'churchyard.png',
-    'civicfacade.png',
-    'claw knife.png',
-    'clay deposit.png',
-    'claycarrier.png',
-    'claydeliveryman.png',
-    'clayembankment.png',
-    'clayfirer.png',
-    'clayhutbuilder.png',
-    'claykneader.png',
-    'claypipe.png',
-    'claypitowner.png',
-    'clayplasterer.png',
-    'claypuncher.png',
-    'claysupply.png',
-    'claysupports.png',
-    'claywarden.png',
-    'clearingspade.png',
-    'club house.png',
-    'clutterer.png',
-    'cob.png',
-    'collector.png',
-    'collier.png',
-    'comb and cutter.png',
-    'confidant.png',
-    'conjurer.png',
-    'conservator.png',
-    'constable.png',
-    'consultant.png',
-    'contraband.png',
-    'cookery lesson.png',
-    'cookeryoutfitter.png',
-    'cooperativeplower.png',
-    'cordmaker.png',
-    'corf.png',
-    'corn schnapps distillery.png',
-    'cornscoop.png',
-    'cottager.png',
-    'cottar.png',
-    'cow patty.png',
-    'cowherd.png',
-    'crack weeder.png',
-    'craft brewery.png',
-    'craftteacher.png',
-    'credit.png',
-    'crop rotation field.png',
-    'crosscutwood.png',
-    'crudite.png',
-    'cubbyhole.png',
-    'cubecutter.png',
-    'culinaryartist.png',
-    'cultivator.png',
-    'curator.png',
-    'dairycrier.png',
-    'debt security.png',
-    'deliverynurse.png',
-    'denbuilder.png',
-    'dentist.png',
-    'digging spade.png',
-    'diligentfarmer.png',
-    'districtmanager.png',
-    'dolly\'s mother.png',
-    'domesticianexpert.png',
-    'double-turn plow.png',
-    'drift-net boat.png',
-    'drill harrow.png',
-    'drinkingtrough.png',
-    'drudgeryreeve.png',
-    'dungcollector.png',
-    'dutchwindmill.png',
-    'dwellingmound.png',
-    'dwellingplan.png',
-    'early cattle.png',
-    'earth oven.png',
-    'ebonist.png',
-    'educationbonus.png',
-    'elder.png',
-    'elderbaker.png',
-    'elephantgrass plant.png',
-    'emergencyseller.png',
-    'entrepreneur.png',
-    'equipper.png',
-    'establishedperson.png',
-    'estatemaster.png',
-    'estateworker.png',
-    'eternal rye cultivation.png',
-    'excavator.png',
-    'excursion to the quarry.png',
-    'facades carving.png',
-    'family friendly home.png',
-    'farm building.png',
-    'farmers market.png',
-    'farmstore.png',
-    'farmyard manure.png',
-    'fatstock stretcher.png',
-    'feedfence.png',
-    'feeding dish.png',
-    'feedpellets.png',
-    'feedyard.png',
-    'fellowgrazer.png',
-    'field spade.png',
-    'fieldcaretaker.png',
-    'fieldclay.png',
-    'fieldcultivator.png',
-    'fielddoctor.png',
-    'fieldfences.png',
-    'fieldmerchant.png',
-    'fieldwatchman.png',
-    'final scenario.png',
-    'fircutter.png',
-    'fire protection pond.png',
-    'firewood.png',
-    'firewoodcollector.png',
-    'fisherman\'sfriend.png',
-    'fishfarmer.png',
-    'fishingnet.png',
-    'flail.png',
-    'flaxfarmer.png',
-    'fodder beets.png',
-    'fodderchamber.png',
-    'fodderplanter.png',
-    'food basket.png',
-    'fooddistributor.png',
-    'foodmerchant.png',
-    'foreignaid.png',
-    'forest lake hut.png',
-    'forest plow.png',
-    'forest school.png',
-    'forest stone.png',
-    'forestcampaigner.png',
-    'forestclearer.png',
-    'forestreviewer.png',
-    'forestry studies.png',
-    'foresttrader.png',
-    'forestwell.png',
-    'framebuilder.png',
-    'freemason.png',
-    'freshman.png',
-    'fruit ladder.png',
-    'fullfarmer.png',
-    'furnisher.png',
-    'furniturecarpenter.png',
-    'furnituremaker.png',
-    'furrows.png',
-    'future building site.png',
-    'gamecatcher.png',
-    'gameprovider.png',
-    'gametrade.png',
-    'garden claw.png',
-    'gardendesigner.png',
-    'gardener\'s knife.png',
-    'gardeningheadofficial.png',
-    'geologist.png',
-    'germanheathkeeper.png',
-    'gift basket.png',
-    'godlyspouse.png',
-    'godmother.png',
-    'grain bag.png',
-    'grain depot.png',
-    'grainthief.png',
-    'granary.png',
-    'grange.png',
-    'grassland harrow.png',
-    'greengrocer.png',
-    'greening plan.png',
-    'grocer.png',
-    'groom.png',
-    'growing farm.png',
-    'guest room.png',
-    'gypsy\'s crock.png',
-    'halftimberedhouse.png',
-    'handcart.png',
-    'handplow.png',
-    'hardporcelain.png',
-    'hardware store.png',
-    'hardworkingman.png',
-    'harpooner.png',
-    'harvest house.png',
-    'hauberg.png',
-    'hawktower.png',
-    'haydryer.png',
-    'hayloft barn.png',
-    'heart of stone.png',
-    'hedgekeeper.png',
-    'heirloom.png',
-    'henpeckedhusband.png',
-    'herbal garden.png',
-    'herringpot.png',
-    'hewer.png',
-    'hidefarmer.png',
-    'hod.png',
-    'homebrewer.png',
-    'homekeeper.png',
-    'hoofcaregiver.png',
-    'hook knife.png',
-    'horsedrawnboat.png',
-    'housebookmaster.png',
-    'housemaster.png',
-    'housesteward.png',
-    'huntingtrophy.png',
-    'huntsman\'s hat.png',
-    'huntsman.png',
-    'hutch.png',
-    'illusionist.png',
-    'informant.png',
-    'innerdistrictsdirector.png',
-    'interim storage.png',
-    'interiordecorator.png',
-    'iron hoe.png',
-    'iron oven.png',
-    'job contract.png',
-    'joinerofthesea.png',
-    'journeymanbricklayer.png',
-    'junkroom.png',
-    'kelpgatherer.png',
-    'kettle.png',
-    'kindlinggatherer.png',
-    'knapper.png',
-    'land register.png',
-    'landheir.png',
-    'landsurveyor.png',
-    'lanternhouse.png',
-    'large pottery.png',
-    'largegreenhouse.png',
-    'lasso.png',
-    'lawn fertilzer.png',
-    'layabout.png',
-    'lazybones.png',
-    'lazysowman.png',
-    'lettucepatch.png',
-    'lieutenantgeneral.png',
-    'lifting machine.png',
-    'littlepeasant.png',
-    'littlestickknitter.png',
-    'livestockfeeder.png',
-    'loampit.png',
-    'lodger.png',
-    'loom.png',
-    'loppers.png',
-    'loudmouth.png',
-    'lover.png',
-    'lumber pile.png',
-    'lumberjack.png',
-    'lumbermill.png',
-    'lutenist.png',
-    'lynchet.png',
-    'maintenance premium.png',
-    'mandoline.png',
-    'manger.png',
-    'manservant.png',
-    'mantlepiece.png',
-    'margrave.png',
-    'market stall.png',
-    'marketcrier.png',
-    'marketmaster.png',
-    'marketstall.png',
-    'mason.png',
-    'masterbricklayer.png',
-    'masterbuilder.png',
-    'masterfencer.png',
-    'masterhuntsman.png',
-    'masterrenovator.png',
-    'mastertanner.png',
-    'masterworkman.png',
-    'mattock.png',
-    'mayorcandidate.png',
-    'melon patch.png',
-    'merchant.png',
-    'milking parlor.png',
-    'milkingplace.png',
-    'milkingstool.png',
-    'milkjug.png',
-    'mill wheel.png',
-    'miller.png',
-    'millwright.png',
-    'mineral feeder.png',
-    'mineralogist.png',
-    'mininghammer.png',
-    'minipasture.png',
-    'misanthropy.png',
-    'moldboardplow.png',
-    'mole plow.png',
-    'moralcrusader.png',
-    'motivator.png',
-    'muckrake.png',
-    'mud patch.png',
-    'muddy puddles.png',
-    'muddy waters.png',
-    'mudwallower.png',
-    'museumcaretaker.png',
-    'mushroomcollector.png',
-    'nail basket.png',
-    'nave.png',
-    'nest site.png',
-    'new purchase.png',
-    'newmarket.png',
-    'night loot.png',
-    'night-schoolstudent.png',
-    'nightworker.png',
-    'nutritionexpert.png',
-    'oldmiser.png',
-    'openairfarmer.png',
-    'organicfarmer.png',
-    'oriental fireplace.png',
-    'outrider.png',
-    'outskirtsdirector.png',
-    'ovenfiringboy.png',
-    'overachiever.png',
-    'overhaul.png',
-    'ox goad.png',
-    'ox skull.png',
-    'oystereater.png',
-    'paintbrush.png',
-    'panbaker.png',
-    'paper knife.png',
-    'papermaker.png',
-    'partyorganizer.png',
-    'parvenu.png',
-    'pastor.png',
-    'pasturemaster.png',
-    'patchcaregiver.png',
-    'patron.png',
-    'patroness.png',
-    'patternmaker.png',
-    'pavior.png',
-    'paymaster.png',
-    'pelletpress.png',
-    'penbuilder.png',
-    'petgrower.png',
-    'petlover.png',
-    'petrifiedwood.png',
-    'petting zoo.png',
-    'pickler.png',
-    'pigbreeder.png',
-    'piggy bank.png',
-    'pigowner.png',
-    'pigstalker.png',
-    'pigswill.png',
-    'pioneer.png',
-    'pipesmoker.png',
-    'pitchfork.png',
-    'plowbuilder.png',
-    'plowdriver.png',
-    'plowmaker.png',
-    'plowman.png',
-    'pole barns.png',
-    'pondhut.png',
-    'porter.png',
-    'portmonger.png',
-    'potato ridger.png',
-    'potatodigger.png',
-    'potatoharvester.png',
-    'potatoplanter.png',
-    'potter\'s yard.png',
-    'potterceramics.png',
-    'potters market.png',
-    'pottery yard.png',
-    'priest.png',
-    'privateforest.png',
-    'prodigy.png',
-    'profiteering.png',
-    'prophet.png',
-    'pub owner.png',
-    'pulverizer plow.png',
-    'pumpernickel.png',
-    'puppeteer.png',
-    'raised bed.png',
-    'rammedclay.png',
-    'ranchprovost.png',
-    'ravenoushunger.png',
-    'reader.png',
-    'reaphook.png',
-    'reclamation plow.png',
-    'recluse.png',
-    'recount.png',
-    'recreationalcarpenter.png',
-    'recruitment.png',
-    'recycledbrick.png',
-    'reed belt.png',
-    'reedhattedtoad.png',
-    'reedpond.png',
-    'reedroofrenovator.png',
-    'remodeling.png',
-    'renovation company.png',
-    'renovation materials.png',
-    'renovationpreparer.png',
-    'reseller.png',
-    'resourceanalyzer.png',
-    'resourcerecycler.png',
-    'retraining.png',
-    'riverineshepherd.png',
-    'roastmaster.png',
-    'rockbeater.png',
-    'rocky terrain.png',
-    'rod collection.png',
-    'rollingpin.png',
-    'roman pot.png',
-    'roofballaster.png',
-    'roofexaminer.png',
-    'ropemaker.png',
-    'roughcaster.png',
-    'royal wood.png',
-    'rustic.png',
-    'sackcart.png',
-    'saddler.png',
-    'samplestablemaker.png',
-    'scales.png',
-    'schnappsdistiller.png',
-    'schnappsdistillery.png',
-    'scholar.png',
-    'scrapcollector.png',
-    'scullery.png',
-    'sculptor.png',
-    'sculpture course.png',
-    'sculpture.png',
-    'scythe.png',
-    'scytheworker.png',
-    'seasonalworker.png',
-    'seducer.png',
-    'seed almanac.png',
-    'seed pellets.png',
-    'seedresearcher.png',
-    'seedseller.png',
-    'seedservant.png',
-    'seedtrader.png',
-    'shaving horse.png',
-    'shedbuilder.png',
-    'sheep rug.png',
-    'sheepkeeper.png',
-    'sheepprovider.png',
-    'sheepwalker.png',
-    'sheepwell.png',
-    'sheepwhisperer.png',
-    'shelter.png',
-    'shepherd\'s whistle.png',
-    'shiftingcultivation.png',
-    'shiftingcultivator.png',
-    'shoreforester.png',
-    'shovelbearer.png',
-    'silage.png',
-    'silokeeper.png',
-    'simple oven.png',
-    'sitemanager.png',
-    'skillfulrenovator.png',
-    'skimmer plow.png',
-    'sleepingcorner.png',
-    'sleight of hand.png',
-    'slurry.png',
-    'slurryspreader.png',
-    'smallanimalbreeder.png',
-    'smallbasket.png',
-    'smallgreenhouse.png',
-    'smuggler.png',
-    'soilscientist.png',
-    'sour dough.png',
-    'sower.png',
-    'sowingdirector.png',
-    'sowingmaster.png',
-    'special food.png',
-    'spicetrader.png',
-    'spindoctor.png',
-    'stable manure.png',
-    'stable tree.png',
-    'stable yard.png',
-    'stable.png',
-    'stablearchitect.png',
-    'stablecleaner.png',
-    'stablehand.png',
-    'stablemaster.png',
-    'stablemilker.png',
-    'stableplanner.png',
-    'stablesergeant.png',
-    'stagehand.png',
-    'stallholder.png',
-    'stallwright.png',
-    'steammachine.png',
-    'stew.png',
-    'stockman.png',
-    'stockprotector.png',
-    'stockyard.png',
-    'stone axe.png',
-    'stone company.png',
-    'stone house reconstruction.png',
-    'stone weir.png',
-    'stonebuyer.png',
-    'stonecart.png',
-    'stonecarver.png',
-    'stoneclearing.png',
-    'stonecustodian.png',
-    'stonecutter.png',
-    'stoneimporter.png',
-    'stonesculptor.png',
-    'stonetongs.png',
-    'storage barn.png',
-    'store of experience.png',
-    'storehousekeeper.png',
-    'storehousesteward.png',
-    'storeroom.png',
-    'stork\'snest.png',
-    'straw manure.png',
-    'strawberrypatch.png',
-    'strawthatchedroof.png',
-    'studio boat.png',
-    'studio.png',
-    'sugarbaker.png',
-    'summer house.png',
-    'sundial.png',
-    'supplyboat.png',
-    'swingplow.png',
-    'syrup tap.png',
-    'taskartisan.png',
-    'tasting.png',
-    'taxcollector.png',
-    'tea house.png',
-    'teacher\'s desk.png',
-    'teatime.png',
-    'telegram.png',
-    'thickforest.png',
-    'threefieldrotation.png',
-    'thresher.png',
-    'threshingboard.png',
-    'throwing axe.png',
-    'thunderbolt.png',
-    'timbershinglemaker.png',
-    'tinsmith master.png',
-    'toolbox.png',
-    'town hall.png',
-    'tradeteacher.png',
-    'transactor.png',
-    'trapbuilder.png',
-    'treefarmjoiner.png',
-    'treegardener.png',
-    'treeguard.png',
-    'trellis.png',
-    'trellises.png',
-    'trident.png',
-    'trimmer.png',
-    'troutpool.png',
-    'trowel.png',
-    'trufflesearcher.png',
-    'truffleslicer.png',
-    'turnipfarmer.png',
-    'turnwrestplow.png',
-    'tutor.png',
-    'twibil.png',
-    'twinresearcher.png',
-    'uncaringparents.png',
-    'upholstery.png',
-    'upscale lifestyle.png',
-    'usufructuary.png',
-    'value assets.png',
-    'vegetable slicer.png',
-    'vegetablevendor.png',
-    'veggielover.png',
-    'visionary.png',
-    'wage.png',
-    'walking boots.png',
-    'wall builder.png',
-    'water gully.png',
-    'waterlily pond.png',
-    'waterworker.png',
-    'weakling.png',
-    'wealthyman.png',
-    'whale oil.png',
-    'whiskydistiller.png',
-    'wholesalemarket.png',
-    'wholesaler.png',
-    'wild greens.png',
-    'wildlifereserve.png',
-    'wintercaretaker.png',
-    'wolf.png',
-    'wood craft.png',
-    'wood pile.png',
-    'wood saw.png',
-    'wood slide hammer.png',
-    'wood workshop.png',
-    'woodbarterer.png',
-    'woodcarrier.png',
-    'woodcart.png',
-    'woodcollector.png',
-    'woodcutter.png',
-    'wooden shed.png',
-    'woodenhutextender.png',
-    'woodenwheybucket.png',
-    'woodexpert.png',
-    'woodfield.png',
-    'woodharvester.png',
-    'woodworker.png',
-    'woolblankets.png',
-    'woolgrower.png',
-    'work permit.png',
-    'writing boards.png',
-    'writing chamber.png',
-    'writingdesk.png',
-    'younganimalmarket.png',
-    'youngfarmer.png',
-    'zigzag harrow.png',
+    "abort oriel.png",
+    "acornsbasket.png",
+    "acquirer.png",
+    "agricultural fertilizers.png",
+    "agriculturallabourer.png",
+    "alchemists lab.png",
+    "ale-benches.png",
+    "almsbag.png",
+    "ambition.png",
+    "angler.png",
+    "animal bedding.png",
+    "animalactivist.png",
+    "animaldealer.png",
+    "animaldriver.png",
+    "animalhusbandryworker.png",
+    "animalreeve.png",
+    "animaltamer'sapprentice.png",
+    "animaltamer.png",
+    "animalteacher.png",
+    "apiary.png",
+    "artichoke field.png",
+    "artisan district.png",
+    "ash trees.png",
+    "asparagus gift.png",
+    "asparagus knife.png",
+    "assistanttiller.png",
+    "autumnmother.png",
+    "baker.png",
+    "baking course.png",
+    "baking sheet.png",
+    "barley mill.png",
+    "barn cats.png",
+    "barn shed.png",
+    "barrowpusher.png",
+    "bartering hut.png",
+    "baseboards.png",
+    "basket.png",
+    "basketmaker'swife.png",
+    "beancounter.png",
+    "beanfield.png",
+    "beating rod.png",
+    "beaver colony.png",
+    "bed in the grain field.png",
+    "bedmaker.png",
+    "bee statue.png",
+    "beer keg.png",
+    "beer stall.png",
+    "beer table.png",
+    "beer tap.png",
+    "beertentoperator.png",
+    "beggingstudent.png",
+    "bellfounder.png",
+    "beneficiary.png",
+    "bigcountry.png",
+    "blackberryfarmer.png",
+    "blade shears.png",
+    "blighter.png",
+    "blueprint.png",
+    "boar spear.png",
+    "bohemian.png",
+    "bonehead.png",
+    "bookcase.png",
+    "bookmark.png",
+    "bookshelf.png",
+    "bottles.png",
+    "braidmaker.png",
+    "breadpaddle.png",
+    "breed registry.png",
+    "breederbuyer.png",
+    "brewery pond.png",
+    "brewing water.png",
+    "briar hedge.png",
+    "brickhammer.png",
+    "bricklayer.png",
+    "brook.png",
+    "brushwoodcollector.png",
+    "bucksaw.png",
+    "buildingtycoon.png",
+    "bunk beds.png",
+    "bunnybreeder.png",
+    "butler.png",
+    "butterchurn.png",
+    "buyer.png",
+    "canoe.png",
+    "canvas sack.png",
+    "caravan.png",
+    "carpenter's axe.png",
+    "carpenter's bench.png",
+    "carpenter's hammer.png",
+    "carpenter's yard.png",
+    "carpenter.png",
+    "carpentersparlor.png",
+    "carriagetrip.png",
+    "carrotmuseum.png",
+    "carter.png",
+    "casebuilder.png",
+    "casualworker.png",
+    "cattlebuyer.png",
+    "cattlefeeder.png",
+    "cattlewhisperer.png",
+    "ceilings.png",
+    "cesspit.png",
+    "chain float.png",
+    "chairman.png",
+    "championbreeder.png",
+    "changeover.png",
+    "chapel.png",
+    "charcoalburner.png",
+    "cheese fondue.png",
+    "cherry orchard.png",
+    "chick stable.png",
+    "chickencoop.png",
+    "chiefforester.png",
+    "child's toy.png",
+    "childless.png",
+    "childombudsman.png",
+    "chimneysweep.png",
+    "chophouse.png",
+    "christianity.png",
+    "churchyard.png",
+    "civicfacade.png",
+    "claw knife.png",
+    "clay deposit.png",
+    "claycarrier.png",
+    "claydeliveryman.png",
+    "clayembankment.png",
+    "clayfirer.png",
+    "clayhutbuilder.png",
+    "claykneader.png",
+    "claypipe.png",
+    "claypitowner.png",
+    "clayplasterer.png",
+    "claypuncher.png",
+    "claysupply.png",
+    "claysupports.png",
+    "claywarden.png",
+    "clearingspade.png",
+    "club house.png",
+    "clutterer.png",
+    "cob.png",
+    "collector.png",
+    "collier.png",
+    "comb and cutter.png",
+    "confidant.png",
+    "conjurer.png",
+    "conservator.png",
+    "constable.png",
+    "consultant.png",
+    "contraband.png",
+    "cookery lesson.png",
+    "cookeryoutfitter.png",
+    "cooperativeplower.png",
+    "cordmaker.png",
+    "corf.png",
+    "corn schnapps distillery.png",
+    "cornscoop.png",
+    "cottager.png",
+    "cottar.png",
+    "cow patty.png",
+    "cowherd.png",
+    "crack weeder.png",
+    "craft brewery.png",
+    "craftteacher.png",
+    "credit.png",
+    "crop rotation field.png",
+    "crosscutwood.png",
+    "crudite.png",
+    "cubbyhole.png",
+    "cubecutter.png",
+    "culinaryartist.png",
+    "cultivator.png",
+    "curator.png",
+    "dairycrier.png",
+    "debt security.png",
+    "deliverynurse.png",
+    "denbuilder.png",
+    "dentist.png",
+    "digging spade.png",
+    "diligentfarmer.png",
+    "districtmanager.png",
+    "dolly's mother.png",
+    "domesticianexpert.png",
+    "double-turn plow.png",
+    "drift-net boat.png",
+    "drill harrow.png",
+    "drinkingtrough.png",
+    "drudgeryreeve.png",
+    "dungcollector.png",
+    "dutchwindmill.png",
+    "dwellingmound.png",
+    "dwellingplan.png",
+    "early cattle.png",
+    "earth oven.png",
+    "ebonist.png",
+    "educationbonus.png",
+    "elder.png",
+    "elderbaker.png",
+    "elephantgrass plant.png",
+    "emergencyseller.png",
+    "entrepreneur.png",
+    "equipper.png",
+    "establishedperson.png",
+    "estatemaster.png",
+    "estateworker.png",
+    "eternal rye cultivation.png",
+    "excavator.png",
+    "excursion to the quarry.png",
+    "facades carving.png",
+    "family friendly home.png",
+    "farm building.png",
+    "farmers market.png",
+    "farmstore.png",
+    "farmyard manure.png",
+    "fatstock stretcher.png",
+    "feedfence.png",
+    "feeding dish.png",
+    "feedpellets.png",
+    "feedyard.png",
+    "fellowgrazer.png",
+    "field spade.png",
+    "fieldcaretaker.png",
+    "fieldclay.png",
+    "fieldcultivator.png",
+    "fielddoctor.png",
+    "fieldfences.png",
+    "fieldmerchant.png",
+    "fieldwatchman.png",
+    "final scenario.png",
+    "fircutter.png",
+    "fire protection pond.png",
+    "firewood.png",
+    "firewoodcollector.png",
+    "fisherman'sfriend.png",
+    "fishfarmer.png",
+    "fishingnet.png",
+    "flail.png",
+    "flaxfarmer.png",
+    "fodder beets.png",
+    "fodderchamber.png",
+    "fodderplanter.png",
+    "food basket.png",
+    "fooddistributor.png",
+    "foodmerchant.png",
+    "foreignaid.png",
+    "forest lake hut.png",
+    "forest plow.png",
+    "forest school.png",
+    "forest stone.png",
+    "forestcampaigner.png",
+    "forestclearer.png",
+    "forestreviewer.png",
+    "forestry studies.png",
+    "foresttrader.png",
+    "forestwell.png",
+    "framebuilder.png",
+    "freemason.png",
+    "freshman.png",
+    "fruit ladder.png",
+    "fullfarmer.png",
+    "furnisher.png",
+    "furniturecarpenter.png",
+    "furnituremaker.png",
+    "furrows.png",
+    "future building site.png",
+    "gamecatcher.png",
+    "gameprovider.png",
+    "gametrade.png",
+    "garden claw.png",
+    "gardendesigner.png",
+    "gardener's knife.png",
+    "gardeningheadofficial.png",
+    "geologist.png",
+    "germanheathkeeper.png",
+    "gift basket.png",
+    "godlyspouse.png",
+    "godmother.png",
+    "grain bag.png",
+    "grain depot.png",
+    "grainthief.png",
+    "granary.png",
+    "grange.png",
+    "grassland harrow.png",
+    "greengrocer.png",
+    "greening plan.png",
+    "grocer.png",
+    "groom.png",
+    "growing farm.png",
+    "guest room.png",
+    "gypsy's crock.png",
+    "halftimberedhouse.png",
+    "handcart.png",
+    "handplow.png",
+    "hardporcelain.png",
+    "hardware store.png",
+    "hardworkingman.png",
+    "harpooner.png",
+    "harvest house.png",
+    "hauberg.png",
+    "hawktower.png",
+    "haydryer.png",
+    "hayloft barn.png",
+    "heart of stone.png",
+    "hedgekeeper.png",
+    "heirloom.png",
+    "henpeckedhusband.png",
+    "herbal garden.png",
+    "herringpot.png",
+    "hewer.png",
+    "hidefarmer.png",
+    "hod.png",
+    "homebrewer.png",
+    "homekeeper.png",
+    "hoofcaregiver.png",
+    "hook knife.png",
+    "horsedrawnboat.png",
+    "housebookmaster.png",
+    "housemaster.png",
+    "housesteward.png",
+    "huntingtrophy.png",
+    "huntsman's hat.png",
+    "huntsman.png",
+    "hutch.png",
+    "illusionist.png",
+    "informant.png",
+    "innerdistrictsdirector.png",
+    "interim storage.png",
+    "interiordecorator.png",
+    "iron hoe.png",
+    "iron oven.png",
+    "job contract.png",
+    "joinerofthesea.png",
+    "journeymanbricklayer.png",
+    "junkroom.png",
+    "kelpgatherer.png",
+    "kettle.png",
+    "kindlinggatherer.png",
+    "knapper.png",
+    "land register.png",
+    "landheir.png",
+    "landsurveyor.png",
+    "lanternhouse.png",
+    "large pottery.png",
+    "largegreenhouse.png",
+    "lasso.png",
+    "lawn fertilzer.png",
+    "layabout.png",
+    "lazybones.png",
+    "lazysowman.png",
+    "lettucepatch.png",
+    "lieutenantgeneral.png",
+    "lifting machine.png",
+    "littlepeasant.png",
+    "littlestickknitter.png",
+    "livestockfeeder.png",
+    "loampit.png",
+    "lodger.png",
+    "loom.png",
+    "loppers.png",
+    "loudmouth.png",
+    "lover.png",
+    "lumber pile.png",
+    "lumberjack.png",
+    "lumbermill.png",
+    "lutenist.png",
+    "lynchet.png",
+    "maintenance premium.png",
+    "mandoline.png",
+    "manger.png",
+    "manservant.png",
+    "mantlepiece.png",
+    "margrave.png",
+    "market stall.png",
+    "marketcrier.png",
+    "marketmaster.png",
+    "marketstall.png",
+    "mason.png",
+    "masterbricklayer.png",
+    "masterbuilder.png",
+    "masterfencer.png",
+    "masterhuntsman.png",
+    "masterrenovator.png",
+    "mastertanner.png",
+    "masterworkman.png",
+    "mattock.png",
+    "mayorcandidate.png",
+    "melon patch.png",
+    "merchant.png",
+    "milking parlor.png",
+    "milkingplace.png",
+    "milkingstool.png",
+    "milkjug.png",
+    "mill wheel.png",
+    "miller.png",
+    "millwright.png",
+    "mineral feeder.png",
+    "mineralogist.png",
+    "mininghammer.png",
+    "minipasture.png",
+    "misanthropy.png",
+    "moldboardplow.png",
+    "mole plow.png",
+    "moralcrusader.png",
+    "motivator.png",
+    "muckrake.png",
+    "mud patch.png",
+    "muddy puddles.png",
+    "muddy waters.png",
+    "mudwallower.png",
+    "museumcaretaker.png",
+    "mushroomcollector.png",
+    "nail basket.png",
+    "nave.png",
+    "nest site.png",
+    "new purchase.png",
+    "newmarket.png",
+    "night loot.png",
+    "night-schoolstudent.png",
+    "nightworker.png",
+    "nutritionexpert.png",
+    "oldmiser.png",
+    "openairfarmer.png",
+    "organicfarmer.png",
+    "oriental fireplace.png",
+    "outrider.png",
+    "outskirtsdirector.png",
+    "ovenfiringboy.png",
+    "overachiever.png",
+    "overhaul.png",
+    "ox goad.png",
+    "ox skull.png",
+    "oystereater.png",
+    "paintbrush.png",
+    "panbaker.png",
+    "paper knife.png",
+    "papermaker.png",
+    "partyorganizer.png",
+    "parvenu.png",
+    "pastor.png",
+    "pasturemaster.png",
+    "patchcaregiver.png",
+    "patron.png",
+    "patroness.png",
+    "patternmaker.png",
+    "pavior.png",
+    "paymaster.png",
+    "pelletpress.png",
+    "penbuilder.png",
+    "petgrower.png",
+    "petlover.png",
+    "petrifiedwood.png",
+    "petting zoo.png",
+    "pickler.png",
+    "pigbreeder.png",
+    "piggy bank.png",
+    "pigowner.png",
+    "pigstalker.png",
+    "pigswill.png",
+    "pioneer.png",
+    "pipesmoker.png",
+    "pitchfork.png",
+    "plowbuilder.png",
+    "plowdriver.png",
+    "plowmaker.png",
+    "plowman.png",
+    "pole barns.png",
+    "pondhut.png",
+    "porter.png",
+    "portmonger.png",
+    "potato ridger.png",
+    "potatodigger.png",
+    "potatoharvester.png",
+    "potatoplanter.png",
+    "potter's yard.png",
+    "potterceramics.png",
+    "potters market.png",
+    "pottery yard.png",
+    "priest.png",
+    "privateforest.png",
+    "prodigy.png",
+    "profiteering.png",
+    "prophet.png",
+    "pub owner.png",
+    "pulverizer plow.png",
+    "pumpernickel.png",
+    "puppeteer.png",
+    "raised bed.png",
+    "rammedclay.png",
+    "ranchprovost.png",
+    "ravenoushunger.png",
+    "reader.png",
+    "reaphook.png",
+    "reclamation plow.png",
+    "recluse.png",
+    "recount.png",
+    "recreationalcarpenter.png",
+    "recruitment.png",
+    "recycledbrick.png",
+    "reed belt.png",
+    "reedhattedtoad.png",
+    "reedpond.png",
+    "reedroofrenovator.png",
+    "remodeling.png",
+    "renovation company.png",
+    "renovation materials.png",
+    "renovationpreparer.png",
+    "reseller.png",
+    "resourceanalyzer.png",
+    "resourcerecycler.png",
+    "retraining.png",
+    "riverineshepherd.png",
+    "roastmaster.png",
+    "rockbeater.png",
+    "rocky terrain.png",
+    "rod collection.png",
+    "rollingpin.png",
+    "roman pot.png",
+    "roofballaster.png",
+    "roofexaminer.png",
+    "ropemaker.png",
+    "roughcaster.png",
+    "royal wood.png",
+    "rustic.png",
+    "sackcart.png",
+    "saddler.png",
+    "samplestablemaker.png",
+    "scales.png",
+    "schnappsdistiller.png",
+    "schnappsdistillery.png",
+    "scholar.png",
+    "scrapcollector.png",
+    "scullery.png",
+    "sculptor.png",
+    "sculpture course.png",
+    "sculpture.png",
+    "scythe.png",
+    "scytheworker.png",
+    "seasonalworker.png",
+    "seducer.png",
+    "seed almanac.png",
+    "seed pellets.png",
+    "seedresearcher.png",
+    "seedseller.png",
+    "seedservant.png",
+    "seedtrader.png",
+    "shaving horse.png",
+    "shedbuilder.png",
+    "sheep rug.png",
+    "sheepkeeper.png",
+    "sheepprovider.png",
+    "sheepwalker.png",
+    "sheepwell.png",
+    "sheepwhisperer.png",
+    "shelter.png",
+    "shepherd's whistle.png",
+    "shiftingcultivation.png",
+    "shiftingcultivator.png",
+    "shoreforester.png",
+    "shovelbearer.png",
+    "silage.png",
+    "silokeeper.png",
+    "simple oven.png",
+    "sitemanager.png",
+    "skillfulrenovator.png",
+    "skimmer plow.png",
+    "sleepingcorner.png",
+    "sleight of hand.png",
+    "slurry.png",
+    "slurryspreader.png",
+    "smallanimalbreeder.png",
+    "smallbasket.png",
+    "smallgreenhouse.png",
+    "smuggler.png",
+    "soilscientist.png",
+    "sour dough.png",
+    "sower.png",
+    "sowingdirector.png",
+    "sowingmaster.png",
+    "special food.png",
+    "spicetrader.png",
+    "spindoctor.png",
+    "stable manure.png",
+    "stable tree.png",
+    "stable yard.png",
+    "stable.png",
+    "stablearchitect.png",
+    "stablecleaner.png",
+    "stablehand.png",
+    "stablemaster.png",
+    "stablemilker.png",
+    "stableplanner.png",
+    "stablesergeant.png",
+    "stagehand.png",
+    "stallholder.png",
+    "stallwright.png",
+    "steammachine.png",
+    "stew.png",
+    "stockman.png",
+    "stockprotector.png",
+    "stockyard.png",
+    "stone axe.png",
+    "stone company.png",
+    "stone house reconstruction.png",
+    "stone weir.png",
+    "stonebuyer.png",
+    "stonecart.png",
+    "stonecarver.png",
+    "stoneclearing.png",
+    "stonecustodian.png",
+    "stonecutter.png",
+    "stoneimporter.png",
+    "stonesculptor.png",
+    "stonetongs.png",
+    "storage barn.png",
+    "store of experience.png",
+    "storehousekeeper.png",
+    "storehousesteward.png",
+    "storeroom.png",
+    "stork'snest.png",
+    "straw manure.png",
+    "strawberrypatch.png",
+    "strawthatchedroof.png",
+    "studio boat.png",
+    "studio.png",
+    "sugarbaker.png",
+    "summer house.png",
+    "sundial.png",
+    "supplyboat.png",
+    "swingplow.png",
+    "syrup tap.png",
+    "taskartisan.png",
+    "tasting.png",
+    "taxcollector.png",
+    "tea house.png",
+    "teacher's desk.png",
+    "teatime.png",
+    "telegram.png",
+    "thickforest.png",
+    "threefieldrotation.png",
+    "thresher.png",
+    "threshingboard.png",
+    "throwing axe.png",
+    "thunderbolt.png",
+    "timbershinglemaker.png",
+    "tinsmith master.png",
+    "toolbox.png",
+    "town hall.png",
+    "tradeteacher.png",
+    "transactor.png",
+    "trapbuilder.png",
+    "treefarmjoiner.png",
+    "treegardener.png",
+    "treeguard.png",
+    "trellis.png",
+    "trellises.png",
+    "trident.png",
+    "trimmer.png",
+    "troutpool.png",
+    "trowel.png",
+    "trufflesearcher.png",
+    "truffleslicer.png",
+    "turnipfarmer.png",
+    "turnwrestplow.png",
+    "tutor.png",
+    "twibil.png",
+    "twinresearcher.png",
+    "uncaringparents.png",
+    "upholstery.png",
+    "upscale lifestyle.png",
+    "usufructuary.png",
+    "value assets.png",
+    "vegetable slicer.png",
+    "vegetablevendor.png",
+    "veggielover.png",
+    "visionary.png",
+    "wage.png",
+    "walking boots.png",
+    "wall builder.png",
+    "water gully.png",
+    "waterlily pond.png",
+    "waterworker.png",
+    "weakling.png",
+    "wealthyman.png",
+    "whale oil.png",
+    "whiskydistiller.png",
+    "wholesalemarket.png",
+    "wholesaler.png",
+    "wild greens.png",
+    "wildlifereserve.png",
+    "wintercaretaker.png",
+    "wolf.png",
+    "wood craft.png",
+    "wood pile.png",
+    "wood saw.png",
+    "wood slide hammer.png",
+    "wood workshop.png",
+    "woodbarterer.png",
+    "woodcarrier.png",
+    "woodcart.png",
+    "woodcollector.png",
+    "woodcutter.png",
+    "wooden shed.png",
+    "woodenhutextender.png",
+    "woodenwheybucket.png",
+    "woodexpert.png",
+    "woodfield.png",
+    "woodharvester.png",
+    "woodworker.png",
+    "woolblankets.png",
+    "woolgrower.png",
+    "work permit.png",
+    "writing boards.png",
+    "writing chamber.png",
+    "writingdesk.png",
+    "younganimalmarket.png",
+    "youngfarmer.png",
+    "zigzag harrow.png",
 ];
+
+// Full-size WebP per CARD_IMAGE_LIST filename (relative to card-images/);
+// sizes and thumbnails are in card-images/webp/manifest.json
+var CARD_IMAGE_WEBP = {
+    "abort oriel.png": "webp/abortoriel.4c6b83c4a6.webp",
+    "acornsbasket.png": "webp/acornsbasket.aa3eba789d.webp",
+    "acquirer.png": "webp/acquirer.9e3cdb7325.webp",
+    "agricultural fertilizers.png": "webp/agriculturalfertilizers.673e9be273.webp",
+    "agriculturallabourer.png": "webp/agriculturallabourer.50368a7370.webp",
+    "alchemists lab.png": "webp/alchemistslab.007c5c9ab8.webp",
+    "ale-benches.png": "webp/alebenches.03dc19af69.webp",
+    "almsbag.png": "webp/almsbag.677c6b378e.webp",
+    "ambition.png": "webp/ambition.d18c6881fe.webp",
+    "angler.png": "webp/angler.f30a32aa26.webp",
+    "animal bedding.png": "webp/animalbedding.cf7fbe19a6.webp",
+    "animalactivist.png": "webp/animalactivist.4d04fcc5ad.webp",
+    "animaldealer.png": "webp/animaldealer.88b6f50062.webp",
+    "animaldriver.png": "webp/animaldriver.52d46c214f.webp",
+    "animalhusbandryworker.png": "webp/animalhusbandryworker.6c30228566.webp",
+    "animalreeve.png": "webp/animalreeve.7376bba5b7.webp",
+    "animaltamer'sapprentice.png": "webp/animaltamersapprentice.e755bc515c.webp",
+    "animaltamer.png": "webp/animaltamer.4f8a5a7b22.webp",
+    "animalteacher.png": "webp/animalteacher.5effa81678.webp",
+    "apiary.png": "webp/apiary.7ef29b1265.webp",
+    "artichoke field.png": "webp/artichokefield.51a61d0f13.webp",
+    "artisan district.png": "webp/artisandistrict.17a105f95e.webp",
+    "ash trees.png": "webp/ashtrees.c3cfacf40b.webp",
+    "asparagus gift.png": "webp/asparagusgift.d0df27d3bc.webp",
+    "asparagus knife.png": "webp/asparagusknife.ea0f63903c.webp",
+    "assistanttiller.png": "webp/assistanttiller.a16e35d075.webp",
+    "autumnmother.png": "webp/autumnmother.1c10d7f11d.webp",
+    "baker.png": "webp/baker.f498faa7f9.webp",
+    "baking course.png": "webp/bakingcourse.5b8a0d8327.webp",
+    "baking sheet.png": "webp/bakingsheet.36bbe87e71.webp",
+    "barley mill.png": "webp/barleymill.8c2c91ca10.webp",
+    "barn cats.png": "webp/barncats.74912699b2.webp",
+    "barn shed.png": "webp/barnshed.d244a78a59.webp",
+    "barrowpusher.png": "webp/barrowpusher.a94b5e7a92.webp",
+    "bartering hut.png": "webp/barteringhut.cbdfbd9cb2.webp",
+    "baseboards.png": "webp/baseboards.d24aeb995e.webp",
+    "basket.png": "webp/basket.090374cbbd.webp",
+    "basketmaker'swife.png": "webp/basketmakerswife.c5099888d8.webp",
+    "beancounter.png": "webp/beancounter.1faeb8b230.webp",
+    "beanfield.png": "webp/beanfield.c943e67f6d.webp",
+    "beating rod.png": "webp/beatingrod.bdd1132239.webp",
+    "beaver colony.png": "webp/beavercolony.9dd1e33559.webp",
+    "bed in the grain field.png": "webp/bedinthegrainfield.b38c087ca3.webp",
+    "bedmaker.png": "webp/bedmaker.5d21a308fa.webp",
+    "bee statue.png": "webp/beestatue.dac43ef4ef.webp",
+    "beer keg.png": "webp/beerkeg.dc00337641.webp",
+    "beer stall.png": "webp/beerstall.a06c325595.webp",
+    "beer table.png": "webp/beertable.c8062373df.webp",
+    "beer tap.png": "webp/beertap.fe9b57df42.webp",
+    "beertentoperator.png": "webp/beertentoperator.2e6aa3863c.webp",
+    "beggingstudent.png": "webp/beggingstudent.22b797d2b7.webp",
+    "bellfounder.png": "webp/bellfounder.09e5df6666.webp",
+    "beneficiary.png": "webp/beneficiary.a619bc6db4.webp",
+    "bigcountry.png": "webp/bigcountry.8236bd9b75.webp",
+    "blackberryfarmer.png": "webp/blackberryfarmer.9b742e5e6a.webp",
+    "blade shears.png": "webp/bladeshears.3e3d3af01b.webp",
+    "blighter.png": "webp/blighter.aa66d86c15.webp",
+    "blueprint.png": "webp/blueprint.e17b3ec7da.webp",
+    "boar spear.png": "webp/boarspear.c77716bfe9.webp",
+    "bohemian.png": "webp/bohemian.7846c31662.webp",
+    "bonehead.png": "webp/bonehead.e98e5ac9a5.webp",
+    "bookcase.png": "webp/bookcase.e959014ec9.webp",
+    "bookmark.png": "webp/bookmark.0489c3d87c.webp",
+    "bookshelf.png": "webp/bookshelf.e3c29e61f8.webp",
+    "bottles.png": "webp/bottles.b13f17f6b1.webp",
+    "braidmaker.png": "webp/braidmaker.6dd5851131.webp",
+    "breadpaddle.png": "webp/breadpaddle.f97243c775.webp",
+    "breed registry.png": "webp/breedregistry.c368b1d163.webp",
+    "breederbuyer.png": "webp/breederbuyer.4a96267fe6.webp",
+    "brewery pond.png": "webp/brewerypond.e7cda6db0b.webp",
+    "brewing water.png": "webp/brewingwater.280407b3a2.webp",
+    "briar hedge.png": "webp/briarhedge.3f81c4d362.webp",
+    "brickhammer.png": "webp/brickhammer.55bcc822db.webp",
+    "bricklayer.png": "webp/bricklayer.e8787c6592.webp",
+    "brook.png": "webp/brook.fd657f1632.webp",
+    "brushwoodcollector.png": "webp/brushwoodcollector.ab4b5613c6.webp",
+    "bucksaw.png": "webp/bucksaw.fac427d3f7.webp",
+    "buildingtycoon.png": "webp/buildingtycoon.dd083f1d81.webp",
+    "bunk beds.png": "webp/bunkbeds.7500f392b2.webp",
+    "bunnybreeder.png": "webp/bunnybreeder.8d9bb1061c.webp",
+    "butler.png": "webp/butler.5acf710a4a.webp",
+    "butterchurn.png": "webp/butterchurn.8f5598ad55.webp",
+    "buyer.png": "webp/buyer.5d2367e8c2.webp",
+    "canoe.png": "webp/canoe.1ab3b72c34.webp",
+    "canvas sack.png": "webp/canvassack.2d1b0c738d.webp",
+    "caravan.png": "webp/caravan.5061f15105.webp",
+    "carpenter's axe.png": "webp/carpentersaxe.ec1b47166b.webp",
+    "carpenter's bench.png": "webp/carpentersbench.2aec843e3d.webp",
+    "carpenter's hammer.png": "webp/carpentershammer.f06be45fc5.webp",
+    "carpenter's yard.png": "webp/carpentersyard.e0a02227dd.webp",
+    "carpenter.png": "webp/carpenter.7e5c109e9f.webp",
+    "carpentersparlor.png": "webp/carpentersparlor.a4a67a3dfd.webp",
+    "carriagetrip.png": "webp/carriagetrip.c8c0d52777.webp",
+    "carrotmuseum.png": "webp/carrotmuseum.d571ef351a.webp",
+    "carter.png": "webp/carter.81c6ef98f0.webp",
+    "casebuilder.png": "webp/casebuilder.a9f02b417a.webp",
+    "casualworker.png": "webp/casualworker.b83c8d869b.webp",
+    "cattlebuyer.png": "webp/cattlebuyer.a79b4df5e0.webp",
+    "cattlefeeder.png": "webp/cattlefeeder.0141919d11.webp",
+    "cattlewhisperer.png": "webp/cattlewhisperer.5f23f6d1a6.webp",
+    "ceilings.png": "webp/ceilings.f64e8a7938.webp",
+    "cesspit.png": "webp/cesspit.8322f3a0a0.webp",
+    "chain float.png": "webp/chainfloat.3a274a19f9.webp",
+    "chairman.png": "webp/chairman.7eaf054fd9.webp",
+    "championbreeder.png": "webp/championbreeder.22c30598c0.webp",
+    "changeover.png": "webp/changeover.fbb5f0b5ef.webp",
+    "chapel.png": "webp/chapel.30b778ce05.webp",
+    "charcoalburner.png": "webp/charcoalburner.52d5106617.webp",
+    "cheese fondue.png": "webp/cheesefondue.47c791ac3b.webp",
+    "cherry orchard.png": "webp/cherryorchard.55839de335.webp",
+    "chick stable.png": "webp/chickstable.97107f7d41.webp",
+    "chickencoop.png": "webp/chickencoop.cb3207256a.webp",
+    "chiefforester.png": "webp/chiefforester.4d74fe09d4.webp",
+    "child's toy.png": "webp/childstoy.31efa8f5f4.webp",
+    "childless.png": "webp/childless.b3b30ef0d6.webp",
+    "childombudsman.png": "webp/childombudsman.375ff19271.webp",
+    "chimneysweep.png": "webp/chimneysweep.2f267f5f94.webp",
+    "chophouse.png": "webp/chophouse.d26a0bc959.webp",
+    "christianity.png": "webp/christianity.a91dadf6e6.webp",
+    "churchyard.png": "webp/churchyard.5a5e539554.webp",
+    "civicfacade.png": "webp/civicfacade.8cff78c3f1.webp",
+    "claw knife.png": "webp/clawknife.cfa8b8f501.webp",
+    "clay deposit.png": "webp/claydeposit.7b404f8afd.webp",
+    "claycarrier.png": "webp/claycarrier.69b8eb5f05.webp",
+    "claydeliveryman.png": "webp/claydeliveryman.48e91938de.webp",
+    "clayembankment.png": "webp/clayembankment.96a6642c26.webp",
+    "clayfirer.png": "webp/clayfirer.ec46c9c46c.webp",
+    "clayhutbuilder.png": "webp/clayhutbuilder.696889a12c.webp",
+    "claykneader.png": "webp/claykneader.7dd8f5618f.webp",
+    "claypipe.png": "webp/claypipe.689c051f89.webp",
+    "claypitowner.png": "webp/claypitowner.6d1885529b.webp",
+    "clayplasterer.png": "webp/clayplasterer.212b79cadc.webp",
+    "claypuncher.png": "webp/claypuncher.41a268e477.webp",
+    "claysupply.png": "webp/claysupply.a262901382.webp",
+    "claysupports.png": "webp/claysupports.88b203f839.webp",
+    "claywarden.png": "webp/claywarden.e19de9fd72.webp",
+    "clearingspade.png": "webp/clearingspade.bfd5b329ef.webp",
+    "club house.png": "webp/clubhouse.194a4dbcff.webp",
+    "clutterer.png": "webp/clutterer.6f6308bbe8.webp",
+    "cob.png": "webp/cob.f0bf0ca4c3.webp",
+    "collector.png": "webp/collector.ab1e467edb.webp",
+    "collier.png": "webp/collier.59e9b59f08.webp",
+    "comb and cutter.png": "webp/combandcutter.1471f44ff4.webp",
+    "confidant.png": "webp/confidant.71900a1f44.webp",
+    "conjurer.png": "webp/conjurer.5bee06471b.webp",
+    "conservator.png": "webp/conservator.89691cd11c.webp",
+    "constable.png": "webp/constable.1b2e4c8b38.webp",
+    "consultant.png": "webp/consultant.fca5f5dbf3.webp",
+    "contraband.png": "webp/contraband.d210dea103.webp",
+    "cookery lesson.png": "webp/cookerylesson.4642ce58fb.webp",
+    "cookeryoutfitter.png": "webp/cookeryoutfitter.ed231823ed.webp",
+    "cooperativeplower.png": "webp/cooperativeplower.52f10e6cc2.webp",
+    "cordmaker.png": "webp/cordmaker.4c80332c28.webp",
+    "corf.png": "webp/corf.38cbb19881.webp",
+    "corn schnapps distillery.png": "webp/cornschnappsdistillery.a97319785b.webp",
+    "cornscoop.png": "webp/cornscoop.1db953c464.webp",
+    "cottager.png": "webp/cottager.24e58d2838.webp",
+    "cottar.png": "webp/cottar.2eb6cd3ebb.webp",
+    "cow patty.png": "webp/cowpatty.3e100676cc.webp",
+    "cowherd.png": "webp/cowherd.50f7d43f0d.webp",
+    "crack weeder.png": "webp/crackweeder.5866273247.webp",
+    "craft brewery.png": "webp/craftbrewery.2e015cd504.webp",
+    "craftteacher.png": "webp/craftteacher.b11a8e299b.webp",
+    "credit.png": "webp/credit.ecb05d14f0.webp",
+    "crop rotation field.png": "webp/croprotationfield.09d645b96a.webp",
+    "crosscutwood.png": "webp/crosscutwood.a3bf0df17e.webp",
+    "crudite.png": "webp/crudite.fe3063a5fb.webp",
+    "cubbyhole.png": "webp/cubbyhole.e09e39250c.webp",
+    "cubecutter.png": "webp/cubecutter.c2f51e2f77.webp",
+    "culinaryartist.png": "webp/culinaryartist.426d4859b1.webp",
+    "cultivator.png": "webp/cultivator.ab9cc8152a.webp",
+    "curator.png": "webp/curator.1d5e6c7cdc.webp",
+    "dairycrier.png": "webp/dairycrier.b9dca41e1b.webp",
+    "debt security.png": "webp/debtsecurity.879ae618e2.webp",
+    "deliverynurse.png": "webp/deliverynurse.92caa08474.webp",
+    "denbuilder.png": "webp/denbuilder.5cf849a34e.webp",
+    "dentist.png": "webp/dentist.56bea24151.webp",
+    "digging spade.png": "webp/diggingspade.ab2476e027.webp",
+    "diligentfarmer.png": "webp/diligentfarmer.93fc4ce704.webp",
+    "districtmanager.png": "webp/districtmanager.91445dada5.webp",
+    "dolly's mother.png": "webp/dollysmother.7e18081feb.webp",
+    "domesticianexpert.png": "webp/domesticianexpert.0ebba0652d.webp",
+    "double-turn plow.png": "webp/doubleturnplow.41671499a1.webp",
+    "drift-net boat.png": "webp/driftnetboat.f0971d3d78.webp",
+    "drill harrow.png": "webp/drillharrow.61cf7091d0.webp",
+    "drinkingtrough.png": "webp/drinkingtrough.2961ffa58b.webp",
+    "drudgeryreeve.png": "webp/drudgeryreeve.3eb74dbff9.webp",
+    "dungcollector.png": "webp/dungcollector.ea35db9599.webp",
+    "dutchwindmill.png": "webp/dutchwindmill.2dd3d291d8.webp",
+    "dwellingmound.png": "webp/dwellingmound.e20cd8b6a1.webp",
+    "dwellingplan.png": "webp/dwellingplan.dad6ab5f8b.webp",
+    "early cattle.png": "webp/earlycattle.a50f5cfc04.webp",
+    "earth oven.png": "webp/earthoven.566a3e9406.webp",
+    "ebonist.png": "webp/ebonist.25424986ab.webp",
+    "educationbonus.png": "webp/educationbonus.205f5ac700.webp",
+    "elder.png": "webp/elder.025afa8e3f.webp",
+    "elderbaker.png": "webp/elderbaker.d82d6a9426.webp",
+    "elephantgrass plant.png": "webp/elephantgrassplant.23bb3ffad5.webp",
+    "emergencyseller.png": "webp/emergencyseller.2a7bee1e0a.webp",
+    "entrepreneur.png": "webp/entrepreneur.5c5d777ff8.webp",
+    "equipper.png": "webp/equipper.067241e1c5.webp",
+    "establishedperson.png": "webp/establishedperson.7710216832.webp",
+    "estatemaster.png": "webp/estatemaster.78f1bef00f.webp",
+    "estateworker.png": "webp/estateworker.56377d6127.webp",
+    "eternal rye cultivation.png": "webp/eternalryecultivation.cfac5cdf08.webp",
+    "excavator.png": "webp/excavator.e437212478.webp",
+    "excursion to the quarry.png": "webp/excursiontothequarry.d998ef4b81.webp",
+    "facades carving.png": "webp/facadescarving.5fb0ff559a.webp",
+    "family friendly home.png": "webp/familyfriendlyhome.add3fac64e.webp",
+    "farm building.png": "webp/farmbuilding.a29d1940f7.webp",
+    "farmers market.png": "webp/farmersmarket.665cde1848.webp",
+    "farmstore.png": "webp/farmstore.47b4ec1472.webp",
+    "farmyard manure.png": "webp/farmyardmanure.37b39166c2.webp",
+    "fatstock stretcher.png": "webp/fatstockstretcher.fd6a3c17c6.webp",
+    "feedfence.png": "webp/feedfence.129f026f8e.webp",
+    "feeding dish.png": "webp/feedingdish.59ccafa5fa.webp",
+    "feedpellets.png": "webp/feedpellets.508fdcdc1f.webp",
+    "feedyard.png": "webp/feedyard.55030e9f4c.webp",
+    "fellowgrazer.png": "webp/fellowgrazer.0bf26433f9.webp",
+    "field spade.png": "webp/fieldspade.6e6cd33910.webp",
+    "fieldcaretaker.png": "webp/fieldcaretaker.14674303be.webp",
+    "fieldclay.png": "webp/fieldclay.0c27a52b2e.webp",
+    "fieldcultivator.png": "webp/fieldcultivator.1a965c9d17.webp",
+    "fielddoctor.png": "webp/fielddoctor.79a2d1e930.webp",
+    "fieldfences.png": "webp/fieldfences.4b3b91e609.webp",
+    "fieldmerchant.png": "webp/fieldmerchant.7cddb3dfdc.webp",
+    "fieldwatchman.png": "webp/fieldwatchman.66f662e8ef.webp",
+    "final scenario.png": "webp/finalscenario.2f9d00eb2c.webp",
+    "fircutter.png": "webp/fircutter.c8f2476e58.webp",
+    "fire protection pond.png": "webp/fireprotectionpond.10d8ee1ccf.webp",
+    "firewood.png": "webp/firewood.3fddca2a74.webp",
+    "firewoodcollector.png": "webp/firewoodcollector.cb9d0172b5.webp",
+    "fisherman'sfriend.png": "webp/fishermansfriend.e188acd20a.webp",
+    "fishfarmer.png": "webp/fishfarmer.0339d55faf.webp",
+    "fishingnet.png": "webp/fishingnet.05073051c9.webp",
+    "flail.png": "webp/flail.c3fac512fb.webp",
+    "flaxfarmer.png": "webp/flaxfarmer.c4d053aecc.webp",
+    "fodder beets.png": "webp/fodderbeets.e2037abc15.webp",
+    "fodderchamber.png": "webp/fodderchamber.cdeaed0d16.webp",
+    "fodderplanter.png": "webp/fodderplanter.8d7753c60c.webp",
+    "food basket.png": "webp/foodbasket.ed2c7a0a4f.webp",
+    "fooddistributor.png": "webp/fooddistributor.79ab511826.webp",
+    "foodmerchant.png": "webp/foodmerchant.7ebc240858.webp",
+    "foreignaid.png": "webp/foreignaid.458a457cb7.webp",
+    "forest lake hut.png": "webp/forestlakehut.37c874c332.webp",
+    "forest plow.png": "webp/forestplow.bdb4173446.webp",
+    "forest school.png": "webp/forestschool.9d2b8d2fea.webp",
+    "forest stone.png": "webp/foreststone.08cb2a1c8e.webp",
+    "forestcampaigner.png": "webp/forestcampaigner.04653b6a99.webp",
+    "forestclearer.png": "webp/forestclearer.bd0d35d7fd.webp",
+    "forestreviewer.png": "webp/forestreviewer.21456c449e.webp",
+    "forestry studies.png": "webp/forestrystudies.5a2056301f.webp",
+    "foresttrader.png": "webp/foresttrader.08674db571.webp",
+    "forestwell.png": "webp/forestwell.81e1e7eee7.webp",
+    "framebuilder.png": "webp/framebuilder.ebf78ee70f.webp",
+    "freemason.png": "webp/freemason.4bf949e8af.webp",
+    "freshman.png": "webp/freshman.4029bef4a0.webp",
+    "fruit ladder.png": "webp/fruitladder.4f592ee8f7.webp",
+    "fullfarmer.png": "webp/fullfarmer.a56722d943.webp",
+    "furnisher.png": "webp/furnisher.e514131934.webp",
+    "furniturecarpenter.png": "webp/furniturecarpenter.bdd81414f2.webp",
+    "furnituremaker.png": "webp/furnituremaker.1662b97437.webp",
+    "furrows.png": "webp/furrows.27a12d29fb.webp",
+    "future building site.png": "webp/futurebuildingsite.472fcfb846.webp",
+    "gamecatcher.png": "webp/gamecatcher.d7eace52f6.webp",
+    "gameprovider.png": "webp/gameprovider.19dca5a0bb.webp",
+    "gametrade.png": "webp/gametrade.e69c5982ee.webp",
+    "garden claw.png": "webp/gardenclaw.b1c7a64439.webp",
+    "gardendesigner.png": "webp/gardendesigner.22627f6642.webp",
+    "gardener's knife.png": "webp/gardenersknife.e4efa7f3df.webp",
+    "gardeningheadofficial.png": "webp/gardeningheadofficial.08b4ab330d.webp",
+    "geologist.png": "webp/geologist.c358101d56.webp",
+    "germanheathkeeper.png": "webp/germanheathkeeper.dc5a59774b.webp",
+    "gift basket.png": "webp/giftbasket.7c7dda66c0.webp",
+    "godlyspouse.png": "webp/godlyspouse.5ff1956876.webp",
+    "godmother.png": "webp/godmother.39b656f4b1.webp",
+    "grain bag.png": "webp/grainbag.c2950f84f3.webp",
+    "grain depot.png": "webp/graindepot.4c6148cf34.webp",
+    "grainthief.png": "webp/grainthief.a9103e0db3.webp",
+    "granary.png": "webp/granary.3f471fa2cd.webp",
+    "grange.png": "webp/grange.10c5ca7592.webp",
+    "grassland harrow.png": "webp/grasslandharrow.4259cd542b.webp",
+    "greengrocer.png": "webp/greengrocer.370326a9ec.webp",
+    "greening plan.png": "webp/greeningplan.92185e4f23.webp",
+    "grocer.png": "webp/grocer.e9d3d9f6ff.webp",
+    "groom.png": "webp/groom.7b687cdc48.webp",
+    "growing farm.png": "webp/growingfarm.46147b1836.webp",
+    "guest room.png": "webp/guestroom.6962fe618a.webp",
+    "gypsy's crock.png": "webp/gypsyscrock.d2a1e944c2.webp",
+    "halftimberedhouse.png": "webp/halftimberedhouse.f9aec526db.webp",
+    "handcart.png": "webp/handcart.6833e00c7e.webp",
+    "handplow.png": "webp/handplow.2eae5e80b0.webp",
+    "hardporcelain.png": "webp/hardporcelain.cdc9b1cd73.webp",
+    "hardware store.png": "webp/hardwarestore.9e517fdf11.webp",
+    "hardworkingman.png": "webp/hardworkingman.aaca8ec361.webp",
+    "harpooner.png": "webp/harpooner.a80f4edef7.webp",
+    "harvest house.png": "webp/harvesthouse.57466cdfaf.webp",
+    "hauberg.png": "webp/hauberg.fc42857865.webp",
+    "hawktower.png": "webp/hawktower.bafb172083.webp",
+    "haydryer.png": "webp/haydryer.96b62f30ed.webp",
+    "hayloft barn.png": "webp/hayloftbarn.1ed40231a4.webp",
+    "heart of stone.png": "webp/heartofstone.8f2407db6a.webp",
+    "hedgekeeper.png": "webp/hedgekeeper.de6632f535.webp",
+    "heirloom.png": "webp/heirloom.961156f2af.webp",
+    "henpeckedhusband.png": "webp/henpeckedhusband.9c95a3b03f.webp",
+    "herbal garden.png": "webp/herbalgarden.572699c2eb.webp",
+    "herringpot.png": "webp/herringpot.87290f5323.webp",
+    "hewer.png": "webp/hewer.6c83df2c25.webp",
+    "hidefarmer.png": "webp/hidefarmer.b65bfccb62.webp",
+    "hod.png": "webp/hod.5bb9b8d1cd.webp",
+    "homebrewer.png": "webp/homebrewer.ef93338006.webp",
+    "homekeeper.png": "webp/homekeeper.7411c1691e.webp",
+    "hoofcaregiver.png": "webp/hoofcaregiver.68089a2ba7.webp",
+    "hook knife.png": "webp/hookknife.b82b77684d.webp",
+    "horsedrawnboat.png": "webp/horsedrawnboat.e081864d65.webp",
+    "housebookmaster.png": "webp/housebookmaster.36e4a1bd55.webp",
+    "housemaster.png": "webp/housemaster.80bdac7851.webp",
+    "housesteward.png": "webp/housesteward.9312e03d9c.webp",
+    "huntingtrophy.png": "webp/huntingtrophy.7e93bc8ed2.webp",
+    "huntsman's hat.png": "webp/huntsmanshat.3d430f0a12.webp",
+    "huntsman.png": "webp/huntsman.7d015ade31.webp",
+    "hutch.png": "webp/hutch.f6077cbab9.webp",
+    "illusionist.png": "webp/illusionist.59978656c3.webp",
+    "informant.png": "webp/informant.4f4be321d6.webp",
+    "innerdistrictsdirector.png": "webp/innerdistrictsdirector.68d3ec7ce4.webp",
+    "interim storage.png": "webp/interimstorage.cbd5fcb776.webp",
+    "interiordecorator.png": "webp/interiordecorator.148d7f545b.webp",
+    "iron hoe.png": "webp/ironhoe.0e06fc69af.webp",
+    "iron oven.png": "webp/ironoven.dc9e616f6e.webp",
+    "job contract.png": "webp/jobcontract.58edd66911.webp",
+    "joinerofthesea.png": "webp/joinerofthesea.4090282339.webp",
+    "journeymanbricklayer.png": "webp/journeymanbricklayer.fada4c437d.webp",
+    "junkroom.png": "webp/junkroom.5a5a15f892.webp",
+    "kelpgatherer.png": "webp/kelpgatherer.5bb5eb0671.webp",
+    "kettle.png": "webp/kettle.fcf615cb96.webp",
+    "kindlinggatherer.png": "webp/kindlinggatherer.147bc8b765.webp",
+    "knapper.png": "webp/knapper.92cf9dfa03.webp",
+    "land register.png": "webp/landregister.625ffefb9d.webp",
+    "landheir.png": "webp/landheir.5f9641bf49.webp",
+    "landsurveyor.png": "webp/landsurveyor.98044ea174.webp",
+    "lanternhouse.png": "webp/lanternhouse.2415b8430b.webp",
+    "large pottery.png": "webp/largepottery.5e1a266a40.webp",
+    "largegreenhouse.png": "webp/largegreenhouse.3b8e3737e1.webp",
+    "lasso.png": "webp/lasso.056d4769bd.webp",
+    "lawn fertilzer.png": "webp/lawnfertilzer.cfdee447de.webp",
+    "layabout.png": "webp/layabout.bd53bb55ca.webp",
+    "lazybones.png": "webp/lazybones.f95f192217.webp",
+    "lazysowman.png": "webp/lazysowman.2ad851fde2.webp",
+    "lettucepatch.png": "webp/lettucepatch.7ab31ed7c0.webp",
+    "lieutenantgeneral.png": "webp/lieutenantgeneral.eb76e967c5.webp",
+    "lifting machine.png": "webp/liftingmachine.81fa865b4f.webp",
+    "littlepeasant.png": "webp/littlepeasant.f06ba1ae51.webp",
+    "littlestickknitter.png": "webp/littlestickknitter.2c4db1c47d.webp",
+    "livestockfeeder.png": "webp/livestockfeeder.800aa0cb14.webp",
+    "loampit.png": "webp/loampit.45a8beb656.webp",
+    "lodger.png": "webp/lodger.cf3fce5b0a.webp",
+    "loom.png": "webp/loom.584c9efcb3.webp",
+    "loppers.png": "webp/loppers.b95790b026.webp",
+    "loudmouth.png": "webp/loudmouth.2a7a8d1a8b.webp",
+    "lover.png": "webp/lover.1c3eb6dc76.webp",
+    "lumber pile.png": "webp/lumberpile.8815e776de.webp",
+    "lumberjack.png": "webp/lumberjack.89d5dbe8f7.webp",
+    "lumbermill.png": "webp/lumbermill.2402c246f6.webp",
+    "lutenist.png": "webp/lutenist.cc7d68f12f.webp",
+    "lynchet.png": "webp/lynchet.6d4905eefd.webp",
+    "maintenance premium.png": "webp/maintenancepremium.f642efc104.webp",
+    "mandoline.png": "webp/mandoline.6c9ac5387e.webp",
+    "manger.png": "webp/manger.83a1b4ade1.webp",
+    "manservant.png": "webp/manservant.b347e5f713.webp",
+    "mantlepiece.png": "webp/mantlepiece.0180eb6483.webp",
+    "margrave.png": "webp/margrave.80916f044a.webp",
+    "market stall.png": "webp/marketstall.9da68e9fdc.webp",
+    "marketcrier.png": "webp/marketcrier.8c71fe1508.webp",
+    "marketmaster.png": "webp/marketmaster.04f829323f.webp",
+    "marketstall.png": "webp/marketstall.d5abba2021.webp",
+    "mason.png": "webp/mason.9db4ae7f09.webp",
+    "masterbricklayer.png": "webp/masterbricklayer.49e4acef89.webp",
+    "masterbuilder.png": "webp/masterbuilder.f5bd34113a.webp",
+    "masterfencer.png": "webp/masterfencer.d9ebcaf951.webp",
+    "masterhuntsman.png": "webp/masterhuntsman.5b3fb16a99.webp",
+    "masterrenovator.png": "webp/masterrenovator.fee7ac6611.webp",
+    "mastertanner.png": "webp/mastertanner.5f5e2f003d.webp",
+    "masterworkman.png": "webp/masterworkman.39a3c13c61.webp",
+    "mattock.png": "webp/mattock.257c0ee8c2.webp",
+    "mayorcandidate.png": "webp/mayorcandidate.2cd61f3583.webp",
+    "melon patch.png": "webp/melonpatch.869789efa8.webp",
+    "merchant.png": "webp/merchant.cb2e8c6dba.webp",
+    "milking parlor.png": "webp/milkingparlor.905d7b2d15.webp",
+    "milkingplace.png": "webp/milkingplace.6551e0b9d3.webp",
+    "milkingstool.png": "webp/milkingstool.8b881a4b1c.webp",
+    "milkjug.png": "webp/milkjug.6ce24ee0ce.webp",
+    "mill wheel.png": "webp/millwheel.35b10f7d35.webp",
+    "miller.png": "webp/miller.c0d0623748.webp",
+    "millwright.png": "webp/millwright.3854e1b46d.webp",
+    "mineral feeder.png": "webp/mineralfeeder.42611aeb17.webp",
+    "mineralogist.png": "webp/mineralogist.d7b41a7ca8.webp",
+    "mininghammer.png": "webp/mininghammer.05ea01a28e.webp",
+    "minipasture.png": "webp/minipasture.ccdfac3075.webp",
+    "misanthropy.png": "webp/misanthropy.61e43c2753.webp",
+    "moldboardplow.png": "webp/moldboardplow.98e110f3ed.webp",
+    "mole plow.png": "webp/moleplow.ec8c5af8d9.webp",
+    "moralcrusader.png": "webp/moralcrusader.14ab724a4d.webp",
+    "motivator.png": "webp/motivator.34e700f5f2.webp",
+    "muckrake.png": "webp/muckrake.d4018209db.webp",
+    "mud patch.png": "webp/mudpatch.376819923f.webp",
+    "muddy puddles.png": "webp/muddypuddles.8f049d1702.webp",
+    "muddy waters.png": "webp/muddywaters.a29a2b4a75.webp",
+    "mudwallower.png": "webp/mudwallower.bc042e828b.webp",
+    "museumcaretaker.png": "webp/museumcaretaker.be5395fa77.webp",
+    "mushroomcollector.png": "webp/mushroomcollector.e78f3f42a9.webp",
+    "nail basket.png": "webp/nailbasket.89d0b986bb.webp",
+    "nave.png": "webp/nave.9230348027.webp",
+    "nest site.png": "webp/nestsite.c5b1118be9.webp",
+    "new purchase.png": "webp/newpurchase.9a3dd70c72.webp",
+    "newmarket.png": "webp/newmarket.ff296423c5.webp",
+    "night loot.png": "webp/nightloot.e1eaa574e0.webp",
+    "night-schoolstudent.png": "webp/nightschoolstudent.f946fa8da0.webp",
+    "nightworker.png": "webp/nightworker.860fe86367.webp",
+    "nutritionexpert.png": "webp/nutritionexpert.bddfb3eafd.webp",
+    "oldmiser.png": "webp/oldmiser.8ef42474f9.webp",
+    "openairfarmer.png": "webp/openairfarmer.98f7c71412.webp",
+    "organicfarmer.png": "webp/organicfarmer.48171caf01.webp",
+    "oriental fireplace.png": "webp/orientalfireplace.c4594c3585.webp",
+    "outrider.png": "webp/outrider.5a393105c0.webp",
+    "outskirtsdirector.png": "webp/outskirtsdirector.0de49ba3f6.webp",
+    "ovenfiringboy.png": "webp/ovenfiringboy.2fda00c96f.webp",
+    "overachiever.png": "webp/overachiever.13b4fe8352.webp",
+    "overhaul.png": "webp/overhaul.6724ed11ef.webp",
+    "ox goad.png": "webp/oxgoad.a27da21f90.webp",
+    "ox skull.png": "webp/oxskull.048d3b39c7.webp",
+    "oystereater.png": "webp/oystereater.9a60b6dd37.webp",
+    "paintbrush.png": "webp/paintbrush.2f17b96fd7.webp",
+    "panbaker.png": "webp/panbaker.7e158b62d7.webp",
+    "paper knife.png": "webp/paperknife.8fdf979501.webp",
+    "papermaker.png": "webp/papermaker.9f32302a19.webp",
+    "partyorganizer.png": "webp/partyorganizer.6a43a85767.webp",
+    "parvenu.png": "webp/parvenu.9978924864.webp",
+    "pastor.png": "webp/pastor.26dee138a0.webp",
+    "pasturemaster.png": "webp/pasturemaster.6cdf79c0c5.webp",
+    "patchcaregiver.png": "webp/patchcaregiver.91eda17dd5.webp",
+    "patron.png": "webp/patron.de4aea929a.webp",
+    "patroness.png": "webp/patroness.395204c4a2.webp",
+    "patternmaker.png": "webp/patternmaker.cb12356ce5.webp",
+    "pavior.png": "webp/pavior.51803e35b1.webp",
+    "paymaster.png": "webp/paymaster.0deb1e1ece.webp",
+    "pelletpress.png": "webp/pelletpress.9b17c17219.webp",
+    "penbuilder.png": "webp/penbuilder.2eadcbb0e9.webp",
+    "petgrower.png": "webp/petgrower.725b1230c1.webp",
+    "petlover.png": "webp/petlover.213283a25c.webp",
+    "petrifiedwood.png": "webp/petrifiedwood.a0de752170.webp",
+    "petting zoo.png": "webp/pettingzoo.0b0ed87427.webp",
+    "pickler.png": "webp/pickler.505c5ea46f.webp",
+    "pigbreeder.png": "webp/pigbreeder.55be2788ee.webp",
+    "piggy bank.png": "webp/piggybank.72edd2ed97.webp",
+    "pigowner.png": "webp/pigowner.2186de4791.webp",
+    "pigstalker.png": "webp/pigstalker.8295c08be4.webp",
+    "pigswill.png": "webp/pigswill.c4b87c6369.webp",
+    "pioneer.png": "webp/pioneer.f7f506cc2f.webp",
+    "pipesmoker.png": "webp/pipesmoker.5a98b26c28.webp",
+    "pitchfork.png": "webp/pitchfork.aff36f71c1.webp",
+    "plowbuilder.png": "webp/plowbuilder.5697f976e3.webp",
+    "plowdriver.png": "webp/plowdriver.f3485967fb.webp",
+    "plowmaker.png": "webp/plowmaker.74e663c4a3.webp",
+    "plowman.png": "webp/plowman.1aaa432105.webp",
+    "pole barns.png": "webp/polebarns.b9af5dfd1b.webp",
+    "pondhut.png": "webp/pondhut.5e04a5b2f5.webp",
+    "porter.png": "webp/porter.95e418a112.webp",
+    "portmonger.png": "webp/portmonger.94bc58fed7.webp",
+    "potato ridger.png": "webp/potatoridger.6e4ced33a8.webp",
+    "potatodigger.png": "webp/potatodigger.35c0a2aec5.webp",
+    "potatoharvester.png": "webp/potatoharvester.f8a0ddfb31.webp",
+    "potatoplanter.png": "webp/potatoplanter.2718b429f9.webp",
+    "potter's yard.png": "webp/pottersyard.0c170079fd.webp",
+    "potterceramics.png": "webp/potterceramics.86e06acdbd.webp",
+    "potters market.png": "webp/pottersmarket.17e352fc46.webp",
+    "pottery yard.png": "webp/potteryyard.e12b8c8bc1.webp",
+    "priest.png": "webp/priest.78db7f208c.webp",
+    "privateforest.png": "webp/privateforest.afc1ad32a6.webp",
+    "prodigy.png": "webp/prodigy.244e47fb2b.webp",
+    "profiteering.png": "webp/profiteering.4fa5824abe.webp",
+    "prophet.png": "webp/prophet.b08686d979.webp",
+    "pub owner.png": "webp/pubowner.73ed23ffbd.webp",
+    "pulverizer plow.png": "webp/pulverizerplow.95fc3038ba.webp",
+    "pumpernickel.png": "webp/pumpernickel.fa5551396e.webp",
+    "puppeteer.png": "webp/puppeteer.8c973cbf04.webp",
+    "raised bed.png": "webp/raisedbed.863a51607e.webp",
+    "rammedclay.png": "webp/rammedclay.57038f03ce.webp",
+    "ranchprovost.png": "webp/ranchprovost.4be9030f3f.webp",
+    "ravenoushunger.png": "webp/ravenoushunger.ee461b14ed.webp",
+    "reader.png": "webp/reader.0f501c7cfb.webp",
+    "reaphook.png": "webp/reaphook.e0f81300e5.webp",
+    "reclamation plow.png": "webp/reclamationplow.c1ba174033.webp",
+    "recluse.png": "webp/recluse.6f04f05350.webp",
+    "recount.png": "webp/recount.f3ee1d3aba.webp",
+    "recreationalcarpenter.png": "webp/recreationalcarpenter.193d9d6094.webp",
+    "recruitment.png": "webp/recruitment.82ce956892.webp",
+    "recycledbrick.png": "webp/recycledbrick.a0c9fe7ade.webp",
+    "reed belt.png": "webp/reedbelt.dba399a329.webp",
+    "reedhattedtoad.png": "webp/reedhattedtoad.758394439f.webp",
+    "reedpond.png": "webp/reedpond.14cbf51c75.webp",
+    "reedroofrenovator.png": "webp/reedroofrenovator.34196d7595.webp",
+    "remodeling.png": "webp/remodeling.ddbdbc82c2.webp",
+    "renovation company.png": "webp/renovationcompany.c9af347d45.webp",
+    "renovation materials.png": "webp/renovationmaterials.830ba13e28.webp",
+    "renovationpreparer.png": "webp/renovationpreparer.e8377c9ab8.webp",
+    "reseller.png": "webp/reseller.2d7ff3fd3c.webp",
+    "resourceanalyzer.png": "webp/resourceanalyzer.fc1c0d23a6.webp",
+    "resourcerecycler.png": "webp/resourcerecycler.3b1336f615.webp",
+    "retraining.png": "webp/retraining.dac6eeaf4c.webp",
+    "riverineshepherd.png": "webp/riverineshepherd.49fd86d6f6.webp",
+    "roastmaster.png": "webp/roastmaster.2710155c1e.webp",
+    "rockbeater.png": "webp/rockbeater.d0b9336216.webp",
+    "rocky terrain.png": "webp/rockyterrain.2b6eb40f23.webp",
+    "rod collection.png": "webp/rodcollection.95af3aaae5.webp",
+    "rollingpin.png": "webp/rollingpin.261a037519.webp",
+    "roman pot.png": "webp/romanpot.223bc146da.webp",
+    "roofballaster.png": "webp/roofballaster.02e3c74aca.webp",
+    "roofexaminer.png": "webp/roofexaminer.39856ee719.webp",
+    "ropemaker.png": "webp/ropemaker.4dc502544c.webp",
+    "roughcaster.png": "webp/roughcaster.800cbf1a89.webp",
+    "royal wood.png": "webp/royalwood.ba9fef4372.webp",
+    "rustic.png": "webp/rustic.67e089fc5f.webp",
+    "sackcart.png": "webp/sackcart.55da977248.webp",
+    "saddler.png": "webp/saddler.8dfa7673f4.webp",
+    "samplestablemaker.png": "webp/samplestablemaker.97bda00d09.webp",
+    "scales.png": "webp/scales.875e4d32b8.webp",
+    "schnappsdistiller.png": "webp/schnappsdistiller.1c92a58ed5.webp",
+    "schnappsdistillery.png": "webp/schnappsdistillery.52bb8f395a.webp",
+    "scholar.png": "webp/scholar.05a3af22c0.webp",
+    "scrapcollector.png": "webp/scrapcollector.212583d99a.webp",
+    "scullery.png": "webp/scullery.01b3008482.webp",
+    "sculptor.png": "webp/sculptor.3ad57bd5f8.webp",
+    "sculpture course.png": "webp/sculpturecourse.75f3dac653.webp",
+    "sculpture.png": "webp/sculpture.9955c22d35.webp",
+    "scythe.png": "webp/scythe.114e198389.webp",
+    "scytheworker.png": "webp/scytheworker.3e770e3ebe.webp",
+    "seasonalworker.png": "webp/seasonalworker.fb38050a28.webp",
+    "seducer.png": "webp/seducer.43653e6d7d.webp",
+    "seed almanac.png": "webp/seedalmanac.74626fd1c7.webp",
+    "seed pellets.png": "webp/seedpellets.cbc2fc5da7.webp",
+    "seedresearcher.png": "webp/seedresearcher.a8a95e915b.webp",
+    "seedseller.png": "webp/seedseller.9d05cfeafb.webp",
+    "seedservant.png": "webp/seedservant.5bc57aac02.webp",
+    "seedtrader.png": "webp/seedtrader.707264b995.webp",
+    "shaving horse.png": "webp/shavinghorse.0602d1738c.webp",
+    "shedbuilder.png": "webp/shedbuilder.c878fe0de4.webp",
+    "sheep rug.png": "webp/sheeprug.f459f0129a.webp",
+    "sheepkeeper.png": "webp/sheepkeeper.2cc53f97ba.webp",
+    "sheepprovider.png": "webp/sheepprovider.ffeec7539f.webp",
+    "sheepwalker.png": "webp/sheepwalker.753f7ab373.webp",
+    "sheepwell.png": "webp/sheepwell.e15c6ca236.webp",
+    "sheepwhisperer.png": "webp/sheepwhisperer.4505a9fefb.webp",
+    "shelter.png": "webp/shelter.5674adc509.webp",
+    "shepherd's whistle.png": "webp/shepherdswhistle.c75e70fb74.webp",
+    "shiftingcultivation.png": "webp/shiftingcultivation.35554b7ab7.webp",
+    "shiftingcultivator.png": "webp/shiftingcultivator.8cc20e48ae.webp",
+    "shoreforester.png": "webp/shoreforester.268c7fa629.webp",
+    "shovelbearer.png": "webp/shovelbearer.6c2e4943da.webp",
+    "silage.png": "webp/silage.ba0be372b9.webp",
+    "silokeeper.png": "webp/silokeeper.591f405143.webp",
+    "simple oven.png": "webp/simpleoven.b2fabbc027.webp",
+    "sitemanager.png": "webp/sitemanager.9ca6b97e7c.webp",
+    "skillfulrenovator.png": "webp/skillfulrenovator.ab0f7ff658.webp",
+    "skimmer plow.png": "webp/skimmerplow.764f1dcbb1.webp",
+    "sleepingcorner.png": "webp/sleepingcorner.8245efe1cf.webp",
+    "sleight of hand.png": "webp/sleightofhand.c10997ed30.webp",
+    "slurry.png": "webp/slurry.ac701fdc21.webp",
+    "slurryspreader.png": "webp/slurryspreader.5f98b6caa3.webp",
+    "smallanimalbreeder.png": "webp/smallanimalbreeder.89f20a2548.webp",
+    "smallbasket.png": "webp/smallbasket.d9a1ea4b20.webp",
+    "smallgreenhouse.png": "webp/smallgreenhouse.5f2b772550.webp",
+    "smuggler.png": "webp/smuggler.f98968090e.webp",
+    "soilscientist.png": "webp/soilscientist.0eef2143fa.webp",
+    "sour dough.png": "webp/sourdough.d2ddb3fa74.webp",
+    "sower.png": "webp/sower.93feacf7d8.webp",
+    "sowingdirector.png": "webp/sowingdirector.e749921d98.webp",
+    "sowingmaster.png": "webp/sowingmaster.a32a7d34b1.webp",
+    "special food.png": "webp/specialfood.ea03bf467b.webp",
+    "spicetrader.png": "webp/spicetrader.2d3fda7181.webp",
+    "spindoctor.png": "webp/spindoctor.ffe719dacd.webp",
+    "stable manure.png": "webp/stablemanure.f126937ec0.webp",
+    "stable tree.png": "webp/stabletree.0ba82b5553.webp",
+    "stable yard.png": "webp/stableyard.4d76ad3afb.webp",
+    "stable.png": "webp/stable.660f5f2d88.webp",
+    "stablearchitect.png": "webp/stablearchitect.e334f54470.webp",
+    "stablecleaner.png": "webp/stablecleaner.3293264320.webp",
+    "stablehand.png": "webp/stablehand.92e7e15adf.webp",
+    "stablemaster.png": "webp/stablemaster.2bb3fe15b2.webp",
+    "stablemilker.png": "webp/stablemilker.6493dfbe9c.webp",
+    "stableplanner.png": "webp/stableplanner.03e8b48fcb.webp",
+    "stablesergeant.png": "webp/stablesergeant.b336246f2f.webp",
+    "stagehand.png": "webp/stagehand.0776d8945f.webp",
+    "stallholder.png": "webp/stallholder.34807c98ba.webp",
+    "stallwright.png": "webp/stallwright.169b135b99.webp",
+    "steammachine.png": "webp/steammachine.76eb44e41c.webp",
+    "stew.png": "webp/stew.2d5357b22d.webp",
+    "stockman.png": "webp/stockman.e079968b8e.webp",
+    "stockprotector.png": "webp/stockprotector.6a88eef51c.webp",
+    "stockyard.png": "webp/stockyard.22af8d3212.webp",
+    "stone axe.png": "webp/stoneaxe.b63d49b2c8.webp",
+    "stone company.png": "webp/stonecompany.bb2c580fec.webp",
+    "stone house reconstruction.png": "webp/stonehousereconstruction.6c96b3eb9a.webp",
+    "stone weir.png": "webp/stoneweir.28e9bced45.webp",
+    "stonebuyer.png": "webp/stonebuyer.bb3ec6df40.webp",
+    "stonecart.png": "webp/stonecart.bb3cbf9219.webp",
+    "stonecarver.png": "webp/stonecarver.148330ddf0.webp",
+    "stoneclearing.png": "webp/stoneclearing.3c7d915891.webp",
+    "stonecustodian.png": "webp/stonecustodian.c66630b3c7.webp",
+    "stonecutter.png": "webp/stonecutter.8f011b038c.webp",
+    "stoneimporter.png": "webp/stoneimporter.b1c2346f93.webp",
+    "stonesculptor.png": "webp/stonesculptor.988e193079.webp",
+    "stonetongs.png": "webp/stonetongs.b709e48ccd.webp",
+    "storage barn.png": "webp/storagebarn.bde7edd815.webp",
+    "store of experience.png": "webp/storeofexperience.3c89c7c4dc.webp",
+    "storehousekeeper.png": "webp/storehousekeeper.b77a73c578.webp",
+    "storehousesteward.png": "webp/storehousesteward.d2d2b896ec.webp",
+    "storeroom.png": "webp/storeroom.92749fa4e7.webp",
+    "stork'snest.png": "webp/storksnest.403889f474.webp",
+    "straw manure.png": "webp/strawmanure.0f688e410f.webp",
+    "strawberrypatch.png": "webp/strawberrypatch.deb51835e3.webp",
+    "strawthatchedroof.png": "webp/strawthatchedroof.612348d9fa.webp",
+    "studio boat.png": "webp/studioboat.9458427100.webp",
+    "studio.png": "webp/studio.2787dc363f.webp",
+    "sugarbaker.png": "webp/sugarbaker.99a5f5667b.webp",
+    "summer house.png": "webp/summerhouse.be10128026.webp",
+    "sundial.png": "webp/sundial.89fa5ec4d1.webp",
+    "supplyboat.png": "webp/supplyboat.2a06e5b0b4.webp",
+    "swingplow.png": "webp/swingplow.0d7ce072e5.webp",
+    "syrup tap.png": "webp/syruptap.eaddafdf91.webp",
+    "taskartisan.png": "webp/taskartisan.703b802816.webp",
+    "tasting.png": "webp/tasting.07d9c36aa9.webp",
+    "taxcollector.png": "webp/taxcollector.80d9c24412.webp",
+    "tea house.png": "webp/teahouse.41cd32622e.webp",
+    "teacher's desk.png": "webp/teachersdesk.f2a192dc45.webp",
+    "teatime.png": "webp/teatime.3d05937ef1.webp",
+    "telegram.png": "webp/telegram.e7481e6356.webp",
+    "thickforest.png": "webp/thickforest.d78fb3f098.webp",
+    "threefieldrotation.png": "webp/threefieldrotation.516812b6ab.webp",
+    "thresher.png": "webp/thresher.c78525b720.webp",
+    "threshingboard.png": "webp/threshingboard.c42848d88d.webp",
+    "throwing axe.png": "webp/throwingaxe.340a533532.webp",
+    "thunderbolt.png": "webp/thunderbolt.f6b2e63ef8.webp",
+    "timbershinglemaker.png": "webp/timbershinglemaker.e9e45a43c8.webp",
+    "tinsmith master.png": "webp/tinsmithmaster.c07f1aa672.webp",
+    "toolbox.png": "webp/toolbox.cf03295284.webp",
+    "town hall.png": "webp/townhall.438cc8a76c.webp",
+    "tradeteacher.png": "webp/tradeteacher.b912f673e1.webp",
+    "transactor.png": "webp/transactor.7b7581af9b.webp",
+    "trapbuilder.png": "webp/trapbuilder.d70faca266.webp",
+    "treefarmjoiner.png": "webp/treefarmjoiner.d557fd937b.webp",
+    "treegardener.png": "webp/treegardener.75bc162278.webp",
+    "treeguard.png": "webp/treeguard.057be2d9a1.webp",
+    "trellis.png": "webp/trellis.3c100edd88.webp",
+    "trellises.png": "webp/trellises.0d1dcc8334.webp",
+    "trident.png": "webp/trident.9fadb4c40e.webp",
+    "trimmer.png": "webp/trimmer.2ed3c35f54.webp",
+    "troutpool.png": "webp/troutpool.ebc0be5508.webp",
+    "trowel.png": "webp/trowel.9b5b757ebc.webp",
+    "trufflesearcher.png": "webp/trufflesearcher.bd646704cb.webp",
+    "truffleslicer.png": "webp/truffleslicer.abe73a8968.webp",
+    "turnipfarmer.png": "webp/turnipfarmer.5c979ae3c4.webp",
+    "turnwrestplow.png": "webp/turnwrestplow.39e87b5d91.webp",
+    "tutor.png": "webp/tutor.5827b81b03.webp",
+    "twibil.png": "webp/twibil.10a41439be.webp",
+    "twinresearcher.png": "webp/twinresearcher.739154f9a6.webp",
+    "uncaringparents.png": "webp/uncaringparents.b6fdec5814.webp",
+    "upholstery.png": "webp/upholstery.208738180d.webp",
+    "upscale lifestyle.png": "webp/upscalelifestyle.86ebc17d0d.webp",
+    "usufructuary.png": "webp/usufructuary.aae7b339a0.webp",
+    "value assets.png": "webp/valueassets.b4b904fe1c.webp",
+    "vegetable slicer.png": "webp/vegetableslicer.4ce20ab9be.webp",
+    "vegetablevendor.png": "webp/vegetablevendor.f0be49fd5c.webp",
+    "veggielover.png": "webp/veggielover.10f92ff3bf.webp",
+    "visionary.png": "webp/visionary.afa2b7fc48.webp",
+    "wage.png": "webp/wage.4794d8e70d.webp",
+    "walking boots.png": "webp/walkingboots.792c6cc156.webp",
+    "wall builder.png": "webp/wallbuilder.e4184bec5d.webp",
+    "water gully.png": "webp/watergully.93d62bf8c2.webp",
+    "waterlily pond.png": "webp/waterlilypond.688f44d6d4.webp",
+    "waterworker.png": "webp/waterworker.204c8d1fc5.webp",
+    "weakling.png": "webp/weakling.72e3ac7edb.webp",
+    "wealthyman.png": "webp/wealthyman.3f08686af2.webp",
+    "whale oil.png": "webp/whaleoil.9914b575cb.webp",
+    "whiskydistiller.png": "webp/whiskydistiller.2ea944a3da.webp",
+    "wholesalemarket.png": "webp/wholesalemarket.5c5f023f3f.webp",
+    "wholesaler.png": "webp/wholesaler.599b1cd576.webp",
+    "wild greens.png": "webp/wildgreens.aafae370bf.webp",
+    "wildlifereserve.png": "webp/wildlifereserve.7860b732c0.webp",
+    "wintercaretaker.png": "webp/wintercaretaker.7b377ab040.webp",
+    "wolf.png": "webp/wolf.e717f58247.webp",
+    "wood craft.png": "webp/woodcraft.e3a63485a2.webp",
+    "wood pile.png": "webp/woodpile.0e13db8484.webp",
+    "wood saw.png": "webp/woodsaw.04a996cd97.webp",
+    "wood slide hammer.png": "webp/woodslidehammer.e11a7b1e0d.webp",
+    "wood workshop.png": "webp/woodworkshop.3ff0cdffce.webp",
+    "woodbarterer.png": "webp/woodbarterer.50f63273d8.webp",
+    "woodcarrier.png": "webp/woodcarrier.9eda5caafa.webp",
+    "woodcart.png": "webp/woodcart.eed90f137f.webp",
+    "woodcollector.png": "webp/woodcollector.e33d1fda5f.webp",
+    "woodcutter.png": "webp/woodcutter.a8ee9d4225.webp",
+    "wooden shed.png": "webp/woodenshed.1f54f42926.webp",
+    "woodenhutextender.png": "webp/woodenhutextender.c3a0af0375.webp",
+    "woodenwheybucket.png": "webp/woodenwheybucket.c532f93788.webp",
+    "woodexpert.png": "webp/woodexpert.9b7acdc379.webp",
+    "woodfield.png": "webp/woodfield.b877043505.webp",
+    "woodharvester.png": "webp/woodharvester.08014ef490.webp",
+    "woodworker.png": "webp/woodworker.c8469d8d0c.webp",
+    "woolblankets.png": "webp/woolblankets.6d227122cc.webp",
+    "woolgrower.png": "webp/woolgrower.b2552eebfb.webp",
+    "work permit.png": "webp/workpermit.3072e8fb96.webp",
+    "writing boards.png": "webp/writingboards.4f8c82ef43.webp",
+    "writing chamber.png": "webp/writingchamber.3932a49e38.webp",
+    "writingdesk.png": "webp/writingdesk.bb0dddcf37.webp",
+    "younganimalmarket.png": "webp/younganimalmarket.86b8927116.webp",
+    "youngfarmer.png": "webp/youngfarmer.b7d02a175f.webp",
+    "zigzag harrow.png": "webp/zigzagharrow.30e6093809.webp",
+};
@@ -0,0 +1,113 @@
+// Card autocomplete over the prebuilt index in data/card-search-index.json
+// (scripts/build_search_index.py). normalize() and query() mirror
+// scripts/cardlib/normalize.py and scripts/cardlib/search_index.py, so a typed
+// query and the stored names normalize the same way; keep them in step.
+// Until the index has loaded, query() returns null and callers scan the card list.
+// Uses `var` for Babel standalone compatibility.
+
+var cardSearch = (function () {
+
+    var INDEX_URL = 'data/card-search-index.json';
+    var INDEX_VERSION = 1;
+
+    var index = null;       // the parsed index, once loaded
+    var request = null;     // the pending or settled load
+
+    // Lowercase, strip accents, remove spaces/hyphens/apostrophes/periods.
+    function normalize(name) {
+        return name.trim()
+            .normalize('NFKD').replace(/\p{Mn}/gu, '')
+            .toLowerCase()
+            .replace(/[ \-'.’]/g, '');
+    }
+
+    function trigrams(s) {
+        var out = [];
+        for (var i = 0; i + 3 <= s.length; i++) out.push(s.slice(i, i + 3));
+        return out;
+    }
+
+    function load(url) {
+        if (!request) {
+            request = fetch(url || INDEX_URL)
+                .then(function (res) {
+                    if (!res.ok) throw new Error('HTTP ' + res.status);
+                    return res.json();
+                })
+                .then(function (data) {
+                    if (data.version !== INDEX_VERSION) throw new Error('unexpected version ' + data.version);
+                    index = data;
+                    return true;
+                })
+                .catch(function (err) {
+                    console.warn('Card search index unavailable, scanning the card list: ' + err.message);
+                    return false;
+                });
+        }
+        return request;
+    }
+
+    // First position in a sorted [key, row] table whose key is >= q.
+    function lowerBound(table, q) {
+        var lo = 0;
+        var hi = table.length;
+        while (lo < hi) {
+            var mid = (lo + hi) >> 1;
+            if (table[mid][0] < q) lo = mid + 1;
+            else hi = mid;
+        }
+        return lo;
+    }
+
+    // Card names matching text by prefix, word prefix or substring, in 4p or
+    // 3p rank order; names in exclude (a Set) are skipped. null until loaded.
+    function query(text, options) {
+        if (!index) return null;
+        options = options || {};
+        var limit = options.limit || 10;
+        var exclude = options.exclude || null;
+        var q = normalize(text);
+        if (!q) return [];
+        var rows = index.cards;
+
+        var hits = new Set();
+        var tables = /\d/.test(q) ? [index.keys, index.ids] : [index.keys];
+        tables.forEach(function (table) {
+            for (var i = lowerBound(table, q); i < table.length && table[i][0].startsWith(q); i++) {
+                hits.add(table[i][1]);
+            }
+        });
+
+        if (q.length >= 3) {
+            var postings = Array.from(new Set(trigrams(q)), function (g) { return index.trigrams[g]; });
+            if (postings.every(Boolean)) {
+                postings.sort(function (a, b) { return a.length - b.length; });
+                var rest = postings.slice(1).map(function (p) { return new Set(p); });
+                postings[0].forEach(function (r) {
+                    if (rest.every(function (p) { return p.has(r); }) && rows[r][1].includes(q)) hits.add(r);
+                });
+            }
+        }
+
+        var ordered = Array.from(hits);
+        if (options.playerCount === 3) {
+            ordered.sort(function (a, b) { return index.pos_3p[a] - index.pos_3p[b]; });
+        } else {
+            ordered.sort(function (a, b) { return a - b; });
+        }
+        var out = [];
+        for (var j = 0; j < ordered.length && out.length < limit; j++) {
+            var name = rows[ordered[j]][0];
+            if (!exclude || !exclude.has(name)) out.push(name);
+        }
+        return out;
+    }
+
+    return {
+        normalize: normalize,
+        load: load,
+        query: query,
+        isLoaded: function () { return index !== null; },
+    };
+
+})();
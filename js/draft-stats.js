@@ -1,6 +1,8 @@
 // Draft statistics module for Agricola draft tool
 // Computes hand grades, per-card quality indicators, and tag probability distributions.
-// All math is analytical (order statistics, hypergeometric distribution) — no simulation.
+// All math is analytical (order statistics, hypergeometric distribution) — no simulation,
+// except that returning-hand survival uses the precomputed Monte Carlo table in
+// data/draft-survival.json (scripts/simulate_draft.py) once setSurvivalTable() is called.
 // Uses `var` for Babel standalone compatibility.
 
 var draftStats = (function () {
@@ -14,6 +16,7 @@ var draftStats = (function () {
     var minorVar = 0;
     var tagCounts = {};     // { tagName: { occ: N, minor: N } }
     var cardsByName = {};   // { cardName: cardObject }
+    var survivalTable = null; // data/draft-survival.json, or null to use the rank heuristic
     var initialized = false;
 
     // Hand sizes by round (matches HAND_SIZE_BY_ROUND in draft.html)
@@ -253,11 +256,41 @@ var draftStats = (function () {
         return probs;
     }
 
+    // --- Simulated survival table ---
+    function setSurvivalTable(table) {
+        survivalTable = (table && table.players) ? table : null;
+    }
+
+    // P(card is still in the hand when it comes back), for a hand first seen in `round`.
+    // Returns null if there is no table entry, so callers can fall back to the heuristic.
+    function survivalProbability(cardName, round, playerCount) {
+        if (!survivalTable) return null;
+        var section = survivalTable.players[String(playerCount)];
+        if (!section) return null;
+        var probs = section.cards[cardName];
+        var i = section.rounds.indexOf(round);
+        if (!probs || i === -1 || typeof probs[i] !== 'number') return null;
+        return probs[i];
+    }
+
     // --- P(≥1 tagged card survives) for a known returning hand ---
-    // Uses actual card composition and ranks. Under the "opponents take best cards"
-    // model, we sort cards by rank and remove the top `passes` of each type.
-    // Tagged cards that survive are those not in the top `passes` picks.
-    function probAtLeastOneTaggedSurvivesKnown(tag, knownCards, passes) {
+    // With a survival table (and `round`/`playerCount` given), combines each tagged
+    // card's simulated survival probability, treating cards as independent.
+    // Otherwise uses actual card composition and ranks: under the "opponents take
+    // best cards" model, we sort cards by rank and remove the top `passes` of each
+    // type. Tagged cards that survive are those not in the top `passes` picks.
+    function probAtLeastOneTaggedSurvivesKnown(tag, knownCards, passes, round, playerCount) {
+        var tagged = knownCards.filter(function (c) {
+            return c && c.tags && c.tags.indexOf(tag) !== -1 &&
+                (c.type === 'Occupation' || c.type === 'Minor Improvement');
+        });
+        var pNone = 1;
+        for (var t = 0; t < tagged.length && pNone !== null; t++) {
+            var pSurvive = survivalProbability(tagged[t].name, round, playerCount);
+            pNone = pSurvive === null ? null : pNone * (1 - pSurvive);
+        }
+        if (pNone !== null && tagged.length > 0) return 1 - pNone;
+
         var occs = knownCards
             .filter(function (c) { return c && c.type === 'Occupation' && typeof c.rank === 'number' && isFinite(c.rank); })
             .sort(function (a, b) { return a.rank - b.rank; });
@@ -284,7 +317,8 @@ var draftStats = (function () {
     // what's P(you can draft 0, 1, 2, 3+ additional tagged cards across the other hands)?
     //
     // futureHandsInfo: array of { type: 'known'|'unknown', passes, cards? (known), handSize? (unknown) }
-    //   - 'known': a returning hand whose exact cards we saw before — uses rank-based deterministic model
+    //   - 'known': a returning hand whose exact cards we saw before (in `seenRound`) — uses the
+    //     simulated survival table if loaded, else the rank-based deterministic model
     //   - 'unknown': an unseen hand — uses hypergeometric pool model with correct passes
     //
     // passes = min(round - 1, playerCount - 1): how many opponents draft before you in that round.
@@ -311,7 +345,8 @@ var draftStats = (function () {
 
             if (handInfo.type === 'known') {
                 // We know the exact cards — use rank-based deterministic survival model
-                pEither = probAtLeastOneTaggedSurvivesKnown(tag, handInfo.cards, handInfo.passes);
+                pEither = probAtLeastOneTaggedSurvivesKnown(tag, handInfo.cards, handInfo.passes,
+                    handInfo.seenRound, handInfo.playerCount);
             } else {
                 // Unknown future hand — use hypergeometric with correct passes
                 var futureHandSize = handInfo.handSize;
@@ -484,7 +519,10 @@ var draftStats = (function () {
                     });
                     knownCards = remainingNames.map(function (n) { return cardsByName[n]; }).filter(Boolean);
                 }
-                futureHandsInfo.push({ type: 'known', cards: knownCards, passes: passes });
+                futureHandsInfo.push({
+                    type: 'known', cards: knownCards, passes: passes,
+                    seenRound: priorRound, playerCount: pc
+                });
             } else {
                 // Unseen future hand — use corrected passes and hand size
                 futureHandsInfo.push({ type: 'unknown', passes: passes, handSize: futureHandSize });
@@ -521,6 +559,8 @@ var draftStats = (function () {
 
     return {
         init: init,
+        setSurvivalTable: setSurvivalTable,
+        survivalProbability: survivalProbability,
         analyzeHand: analyzeHand,
         handPercentile: handPercentile,
         handGrade: handGrade,
@@ -1,8 +1,11 @@
 // Screenshot OCR module for Agricola draft tool
 // Handles image preprocessing, Azure Function call, and fuzzy matching.
+// Load after js/card-search.js, whose normalize() it shares.
 // Uses `var` for Babel standalone compatibility.
 
 var OCR_FUNCTION_URL = '/api/ocr';
+// Built by scripts/build_ocr_dictionary.py (see scripts/cardlib/symspell.py).
+var OCR_NAME_DICTIONARY_URL = 'data/ocr-name-dictionary.json';
 
 var screenshotOCR = (function () {
 
@@ -103,9 +106,131 @@ var screenshotOCR = (function () {
         return matrix[b.length][a.length];
     }
 
+    // --- OCR name dictionary (SymSpell-style deletion neighbourhoods) ---
+    // Mirrors NameDictionary.lookup() in scripts/cardlib/symspell.py.
+    var nameDictionaryRequest = null;
+
+    function loadNameDictionary() {
+        if (!nameDictionaryRequest) {
+            nameDictionaryRequest = fetch(OCR_NAME_DICTIONARY_URL).then(function (response) {
+                if (!response.ok) throw new Error('HTTP ' + response.status);
+                return response.json();
+            }).then(function (data) {
+                var exact = {};
+                data.keys.forEach(function (entry, k) { exact[entry[0]] = k; });
+                data.exact = exact;
+                return data;
+            }).catch(function (err) {
+                console.warn('[ocr] Name dictionary unavailable, using the slow scan:', err.message);
+                return null;
+            });
+        }
+        return nameDictionaryRequest;
+    }
+
+    // Same normalization as the dictionary keys (cardlib.normalize); needs
+    // js/card-search.js loaded first.
+    var normalizeName = cardSearch.normalize;
+
+    function ocrKey(dictionary, str) {
+        var key = normalizeName(str).split('').map(function (c) {
+            return dictionary.digits[c] || c;
+        }).join('').replace(/[^a-z]/g, '');
+        dictionary.folds.forEach(function (fold) { key = key.split(fold[0]).join(fold[1]); });
+        return key;
+    }
+
+    function deletesOf(str, maxDistance) {
+        var out = {};
+        out[str] = true;
+        var frontier = [str];
+        for (var d = 0; d < maxDistance; d++) {
+            var next = {};
+            frontier.forEach(function (x) {
+                for (var i = 0; i < x.length; i++) next[x.slice(0, i) + x.slice(i + 1)] = true;
+            });
+            frontier = Object.keys(next);
+            frontier.forEach(function (x) { out[x] = true; });
+        }
+        return Object.keys(out);
+    }
+
+    // Optimal string alignment distance; limit + 1 once it exceeds limit
+    function osaDistance(a, b, limit) {
+        if (Math.abs(a.length - b.length) > limit) return limit + 1;
+        var prev2 = null;
+        var prev = [];
+        for (var j = 0; j <= b.length; j++) prev.push(j);
+        for (var i = 1; i <= a.length; i++) {
+            var cur = [i];
+            var best = i;
+            for (var j = 1; j <= b.length; j++) {
+                var d = Math.min(prev[j] + 1, cur[j - 1] + 1, prev[j - 1] + (a[i - 1] === b[j - 1] ? 0 : 1));
+                if (prev2 && i > 1 && j > 1 && a[i - 1] === b[j - 2] && a[i - 2] === b[j - 1]) {
+                    d = Math.min(d, prev2[j - 2] + 1);
+                }
+                cur.push(d);
+                if (d < best) best = d;
+            }
+            if (best > limit) return limit + 1;
+            prev2 = prev;
+            prev = cur;
+        }
+        return prev[b.length] <= limit ? prev[b.length] : limit + 1;
+    }
+
+    function asList(ids) {
+        return typeof ids === 'number' ? [ids] : ids;
+    }
+
+    // Returns the canonical card name for an OCR'd name, or null
+    function lookupName(dictionary, raw) {
+        var key = ocrKey(dictionary, raw);
+        if (!key) return null;
+        var limit = Math.min(dictionary.max_distance, Math.max(1, Math.floor(key.length / 4)));
+        var best = [];
+        var bestDist = limit + 1;
+        if (dictionary.exact.hasOwnProperty(key)) {
+            best = asList(dictionary.keys[dictionary.exact[key]][1]).slice();
+            bestDist = 0;
+        } else {
+            var candidates = {};
+            deletesOf(key.slice(0, dictionary.prefix_length), limit).forEach(function (d) {
+                var ids = dictionary.deletes[d];
+                if (ids !== undefined) asList(ids).forEach(function (k) { candidates[k] = true; });
+            });
+            Object.keys(candidates).forEach(function (k) {
+                var entry = dictionary.keys[k];
+                var dist = osaDistance(key, entry[0], best.length ? bestDist : limit);
+                if (dist < bestDist) {
+                    best = asList(entry[1]).slice();
+                    bestDist = dist;
+                } else if (dist === bestDist && dist <= limit) {
+                    asList(entry[1]).forEach(function (i) { if (best.indexOf(i) < 0) best.push(i); });
+                }
+            });
+            if (!best.length) return null;
+        }
+        if (best.length > 1) {
+            // Same folded distance: fall back to the unfolded spelling, then
+            // to spacing and case for names that normalize alike
+            var plain = normalizeName(raw);
+            var spelled = raw.trim().toLowerCase();
+            var scored = best.map(function (i) {
+                var name = dictionary.names[i];
+                return [osaDistance(plain, normalizeName(name), 64),
+                        osaDistance(spelled, name.toLowerCase(), 64), i];
+            }).sort(function (a, b) { return a[0] - b[0] || a[1] - b[1] || a[2] - b[2]; });
+            if (scored[0][0] === scored[1][0] && scored[0][1] === scored[1][1]) return null;
+            best = [scored[0][2]];
+        }
+        return dictionary.names[best[0]];
+    }
+
     // --- Fuzzy match returned names against card database ---
-    // Uses normalizeForMatch (global from draft.html) and Levenshtein distance.
-    function matchNames(rawNames, cards, cardMap) {
+    // Uses normalizeForMatch (global from draft.html), then the OCR name
+    // dictionary when it has loaded, then a Levenshtein scan.
+    function matchNames(rawNames, cards, cardMap, dictionary) {
         var matched = [];
         var unmatched = [];
 
@@ -132,7 +257,16 @@ var screenshotOCR = (function () {
                 return;
             }
 
-            // 3. Levenshtein fuzzy match (threshold: 25% of name length, minimum 1)
+            // 3. Dictionary lookup: OCR confusions and up to two edits
+            if (dictionary) {
+                var resolved = lookupName(dictionary, rawName);
+                if (resolved && cardMap[resolved]) {
+                    matched.push(resolved);
+                    return;
+                }
+            }
+
+            // 4. Levenshtein fuzzy match (threshold: 25% of name length, minimum 1)
             var bestMatch = null;
             var bestDist = Infinity;
             var threshold = Math.max(1, Math.floor(norm.length * 0.25));
@@ -166,10 +300,11 @@ var screenshotOCR = (function () {
         var HAND_SIZE = { 1: 10, 2: 9, 3: 8, 4: 7, 5: 6, 6: 5, 7: 4 };
 
         return resizeImage(imageBlob, 2048).then(function (resizedBlob) {
-            return callOCRFunction(resizedBlob, OCR_FUNCTION_URL);
-        }).then(function (rawNames) {
+            return Promise.all([callOCRFunction(resizedBlob, OCR_FUNCTION_URL), loadNameDictionary()]);
+        }).then(function (results) {
+            var rawNames = results[0];
             // Match against card database
-            var result = matchNames(rawNames, cards, cardMap);
+            var result = matchNames(rawNames, cards, cardMap, results[1]);
             var total = rawNames.length;
 
             // Categorize matched cards
@@ -269,6 +404,8 @@ var screenshotOCR = (function () {
     return {
         processImage: processImage,
         matchNames: matchNames,
+        loadNameDictionary: loadNameDictionary,
+        lookupName: lookupName,
         resizeImage: resizeImage,
         extractCardDetails: extractCardDetails,
         checkAvailability: checkAvailability,
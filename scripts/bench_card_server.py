@@ -0,0 +1,207 @@
+#!/usr/bin/env python3
+"""
+Load generator for card_server.py: latency percentiles and throughput.
+
+Builds a deterministic request mix from the real card data:
+
+    get      /cards/NAME, names drawn with a rank-skewed distribution
+             (popular cards are looked up more, as in real drafts)
+    filter   /cards with random type / tag / players / sort / page
+    search   /search with 2-5 character name prefixes
+
+and replays it with --concurrency keep-alive connections, each sending
+one request at a time. Reports requests per second, p50/p90/p99/max
+latency, status codes and the server's cache hit rate (X-Cache).
+
+--spawn starts card_server.py on a free port for the run; otherwise point
+--url at a running server. Client and server share the machine's CPUs,
+so compare numbers from the same setup only.
+
+Usage: python bench_card_server.py [--spawn] [--url http://127.0.0.1:8765]
+                                   [--requests 20000] [--concurrency 32]
+                                   [--mix get=50,filter=30,search=20]
+                                   [--gzip] [--seed 1]
+"""
+
+import argparse
+import asyncio
+import os
+import random
+import socket
+import subprocess
+import sys
+import time
+from urllib.parse import quote, urlencode, urlsplit
+
+from cardlib import load_cards
+from cardlib.card_store import SORT_FIELDS
+
+SERVER_SCRIPT = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'card_server.py')
+
+
+def build_requests(cards, n, mix, seed):
+    rng = random.Random(seed)
+    names = [c['name'] for c in sorted(cards, key=lambda c: (c.get('rank') is None, c.get('rank') or 0))]
+    # Zipf-like weights: the k-th ranked card is looked up ~1/k as often.
+    name_weights = [1 / (k + 1) for k in range(len(names))]
+    types = sorted({c.get('type') for c in cards if c.get('type')})
+    tags = sorted({t for c in cards for t in c.get('tags') or ()})
+
+    kinds = list(mix)
+    weights = [mix[k] for k in kinds]
+    requests = []
+    for kind in rng.choices(kinds, weights, k=n):
+        if kind == 'get':
+            requests.append('/cards/' + quote(rng.choices(names, name_weights)[0]))
+        elif kind == 'filter':
+            params = {}
+            if rng.random() < 0.7:
+                params['type'] = rng.choice(types)
+            if tags and rng.random() < 0.4:
+                params['tag'] = rng.choice(tags)
+            if rng.random() < 0.5:
+                params['players'] = rng.choice((3, 4))
+            params['sort'] = rng.choice(('', '-')) + rng.choice(SORT_FIELDS)
+            params['limit'] = rng.choice((10, 25, 50))
+            params['offset'] = rng.choice((0, 0, 0, 50, 100))
+            requests.append('/cards?' + urlencode(params))
+        else:
+            name = rng.choice(names)
+            q = name[:rng.randint(2, min(5, len(name)))]
+            requests.append('/search?' + urlencode({'q': q, 'players': rng.choice((3, 4))}))
+    return requests
+
+
+async def _read_response(reader):
+    head = await reader.readuntil(b'\r\n\r\n')
+    lines = head.decode('latin-1').split('\r\n')
+    status = int(lines[0].split(' ')[1])
+    headers = {}
+    for line in lines[1:]:
+        name, _, value = line.partition(':')
+        if name:
+            headers[name.strip().lower()] = value.strip()
+    body = await reader.readexactly(int(headers.get('content-length') or 0))
+    return status, headers, body
+
+
+async def worker(host, port, queue, accept_gzip, stats):
+    reader, writer = await asyncio.open_connection(host, port)
+    extra = 'Accept-Encoding: gzip\r\n' if accept_gzip else ''
+    try:
+        while True:
+            try:
+                target = queue.pop()
+            except IndexError:
+                return
+            request = f"GET {target} HTTP/1.1\r\nHost: {host}\r\n{extra}\r\n".encode('latin-1')
+            t0 = time.perf_counter()
+            writer.write(request)
+            status, headers, body = await _read_response(reader)
+            stats['latencies'].append(time.perf_counter() - t0)
+            stats['status'][status] = stats['status'].get(status, 0) + 1
+            stats['bytes'] += len(body)
+            if headers.get('x-cache') == 'hit':
+                stats['hits'] += 1
+    finally:
+        writer.close()
+
+
+async def run_load(host, port, requests, concurrency, accept_gzip):
+    queue = list(reversed(requests))
+    stats = {'latencies': [], 'status': {}, 'bytes': 0, 'hits': 0}
+    t0 = time.perf_counter()
+    await asyncio.gather(*(worker(host, port, queue, accept_gzip, stats) for _ in range(concurrency)))
+    stats['seconds'] = time.perf_counter() - t0
+    return stats
+
+
+def percentile(sorted_values, p):
+    if not sorted_values:
+        return 0.0
+    i = min(len(sorted_values) - 1, max(0, round(p / 100 * len(sorted_values)) - 1))
+    return sorted_values[i]
+
+
+def _free_port():
+    with socket.socket() as s:
+        s.bind(('127.0.0.1', 0))
+        return s.getsockname()[1]
+
+
+def spawn_server(port, cache_size):
+    proc = subprocess.Popen(
+        [sys.executable, SERVER_SCRIPT, '--port', str(port), '--cache-size', str(cache_size)],
+        stdout=subprocess.DEVNULL,
+    )
+    deadline = time.monotonic() + 10
+    while time.monotonic() < deadline:
+        try:
+            socket.create_connection(('127.0.0.1', port), timeout=0.2).close()
+            return proc
+        except OSError:
+            if proc.poll() is not None:
+                break
+            time.sleep(0.05)
+    proc.kill()
+    raise RuntimeError("card_server.py did not start")
+
+
+def parse_mix(text):
+    mix = {}
+    for part in text.split(','):
+        kind, _, weight = part.partition('=')
+        if kind not in ('get', 'filter', 'search'):
+            raise ValueError(f"unknown request kind: {kind}")
+        mix[kind] = float(weight or 1)
+    return mix
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Load-test card_server.py.")
+    parser.add_argument('--url', default='http://127.0.0.1:8765')
+    parser.add_argument('--spawn', action='store_true', help="start a server on a free port for the run")
+    parser.add_argument('--cache-size', type=int, default=4096, help="cache size for a --spawn'ed server")
+    parser.add_argument('--requests', type=int, default=20000)
+    parser.add_argument('--concurrency', type=int, default=32)
+    parser.add_argument('--mix', default='get=50,filter=30,search=20')
+    parser.add_argument('--gzip', action='store_true', help="send Accept-Encoding: gzip")
+    parser.add_argument('--seed', type=int, default=1)
+    args = parser.parse_args(argv)
+
+    try:
+        mix = parse_mix(args.mix)
+    except ValueError as e:
+        parser.error(str(e))
+    requests = build_requests(load_cards().records, args.requests, mix, args.seed)
+
+    proc = None
+    if args.spawn:
+        host, port = '127.0.0.1', _free_port()
+        proc = spawn_server(port, args.cache_size)
+    else:
+        url = urlsplit(args.url)
+        host, port = url.hostname, url.port or 80
+    try:
+        stats = asyncio.run(run_load(host, port, requests, args.concurrency, args.gzip))
+    finally:
+        if proc is not None:
+            proc.terminate()
+            proc.wait()
+
+    latencies = sorted(stats['latencies'])
+    n = len(latencies)
+    print(f"{n} requests, {args.concurrency} connections, mix {args.mix}"
+          f"{', gzip' if args.gzip else ''}")
+    print(f"  throughput  {n / stats['seconds']:>10.0f} req/s  ({stats['seconds']:.2f}s)")
+    for label, p in (('p50', 50), ('p90', 90), ('p99', 99)):
+        print(f"  {label:<11} {1000 * percentile(latencies, p):>10.2f} ms")
+    print(f"  max         {1000 * latencies[-1] if n else 0:>10.2f} ms")
+    print(f"  cache hits  {100 * stats['hits'] / max(n, 1):>10.1f} %")
+    print(f"  body bytes  {stats['bytes'] / max(n, 1):>10.0f} avg")
+    print(f"  status      {', '.join(f'{s}: {c}' for s, c in sorted(stats['status'].items()))}")
+    return 0 if set(stats['status']) <= {200, 404} else 1
+
+
+if __name__ == '__main__':
+    sys.exit(main())
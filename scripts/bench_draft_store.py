@@ -0,0 +1,200 @@
+#!/usr/bin/env python3
+"""
+Load test for the draft state store: full-state PUTs against deltas.
+
+Plays --drafts synthetic drafts the way draft.html saves them: one save
+when a hand is entered, one per card marked as remaining and one when
+marking is done on returning hands, one per confirmed pick, plus the odd
+wheel-watch toggle or notes edit. The drafts are interleaved, as
+concurrent users would be, against two SQLite stores in a temporary
+directory:
+
+  full    every save sends and stores the whole state (DraftStore.put,
+          what api/draft does with Azure Tables today)
+  delta   every save sends diff(previous state, state) computed against
+          the last acknowledged seq (DraftStore.append), folded into a
+          snapshot every --snapshot-every deltas
+
+Reports request bytes and stored bytes per pick, write latency, the
+time to read every draft back, and checks that both stores return the
+same final states.
+
+Usage: python bench_draft_store.py [--drafts 300] [--players 4]
+                                   [--snapshot-every 16] [--seed 0]
+"""
+
+import argparse
+import copy
+import json
+import os
+import random
+import statistics
+import sys
+import tempfile
+import time
+
+from cardlib import load_cards
+from cardlib.draft_store import SCHEMA_VERSION, DraftStore, diff, encode
+
+ROUNDS = 7
+HAND_SIZE = 10
+CLIENT_ID = 'k3v9x2m8q4w7z1b5'
+
+
+def initial_state(players):
+    grid = [''] * 15
+    grid[5] = grid[10] = 'H'
+    return {
+        'currentRound': 1, 'playerCount': players, 'draftStarted': True,
+        'currentHandNames': [], 'hands': {}, 'draftedCards': {}, 'sortKey': 'rank',
+        'markingPhase': False, 'markedRemaining': [], 'othersDrafted': [],
+        'farmGrid': grid, 'strategyNotes': '', 'wheelWatch': {}, 'tempCards': {},
+        'playedCards': [], 'ghostAssignments': {}, 'autoAdviceTriggered': False,
+    }
+
+
+def draft_saves(occupations, minors, players, rng):
+    """Successive saved states of one draft, and the number of picks."""
+    state = initial_state(players)
+    saves = []
+
+    def save():
+        saves.append(copy.deepcopy(state))
+
+    occ = rng.sample(occupations, HAND_SIZE * players)
+    mins = rng.sample(minors, HAND_SIZE * players)
+    for r in range(1, ROUNDS + 1):
+        if r <= players:
+            hand = occ[(r - 1) * HAND_SIZE:r * HAND_SIZE][:HAND_SIZE - r + 1] \
+                + mins[(r - 1) * HAND_SIZE:r * HAND_SIZE][:HAND_SIZE - r + 1]
+            state['currentHandNames'] = hand
+            save()
+        else:
+            picked = state['draftedCards'][str(r - players)]
+            hand = [n for n in state['hands'][str(r - players)]
+                    if n not in (picked['occupation'], picked['minor'])]
+            state['currentHandNames'] = hand
+            state['markingPhase'] = True
+            save()
+            remaining = rng.sample(hand, HAND_SIZE - r + 1)
+            for name in remaining:
+                state['markedRemaining'].append(name)
+                save()
+            state['othersDrafted'] += [n for n in hand if n not in remaining]
+            state['markedRemaining'] = []
+            state['markingPhase'] = False
+            save()
+            hand = [n for n in hand if n in remaining]
+        if rng.random() < 0.3:
+            name = rng.choice(hand)
+            state['wheelWatch'][name] = {'note': ''}
+            save()
+        if rng.random() < 0.2:
+            state['strategyNotes'] += rng.choice(('Going for pastures. ', 'Need food engine. ',
+                                                  'Watch the clay. ', 'Baking route? '))
+            save()
+        half = len(hand) // 2
+        state['hands'][str(r)] = list(hand)
+        state['draftedCards'][str(r)] = {'occupation': rng.choice(hand[:half]),
+                                         'minor': rng.choice(hand[half:])}
+        state['currentHandNames'] = []
+        state['currentRound'] = r + 1
+        save()
+    return saves, ROUNDS
+
+
+def percentile(sorted_values, p):
+    return sorted_values[min(len(sorted_values) - 1, int(p * len(sorted_values)))]
+
+
+def run(store, schedule, mode):
+    """Play ``schedule`` [(user, state)] into ``store``; returns (request bytes, latencies)."""
+    sent = 0
+    latencies = []
+    acked = {}   # user -> (seq, state the server has)
+    for user, state in schedule:
+        now = int(time.time() * 1000)
+        if mode == 'full':
+            body = encode({'state': state, 'lastModifiedAt': now,
+                           'clientId': CLIENT_ID, 'schemaVersion': SCHEMA_VERSION})
+            t0 = time.perf_counter()
+            store.put(user, json.loads(body)['state'], now, CLIENT_ID)
+        else:
+            prev = acked.get(user)
+            if prev is None:
+                body = encode({'state': state, 'lastModifiedAt': now,
+                               'clientId': CLIENT_ID, 'schemaVersion': SCHEMA_VERSION})
+            else:
+                body = encode({'baseSeq': prev[0], 'ops': diff(prev[1], state),
+                               'lastModifiedAt': now, 'clientId': CLIENT_ID})
+            t0 = time.perf_counter()
+            request = json.loads(body)
+            if prev is None:
+                seq = store.put(user, request['state'], now, CLIENT_ID)
+            else:
+                seq = store.append(user, request['baseSeq'], request['ops'], now, CLIENT_ID)
+            acked[user] = (seq, state)
+        latencies.append(time.perf_counter() - t0)
+        sent += len(body.encode('utf-8'))
+    return sent, latencies
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Load test full-state vs delta draft saves.")
+    parser.add_argument('--drafts', type=int, default=300, help="concurrent synthetic drafts")
+    parser.add_argument('--players', type=int, choices=(3, 4), default=4)
+    parser.add_argument('--snapshot-every', type=int, default=16)
+    parser.add_argument('--seed', type=int, default=0)
+    args = parser.parse_args(argv)
+
+    rng = random.Random(args.seed)
+    cards = load_cards()
+    occupations = sorted({c.name for c in cards if c.type == 'Occupation'})
+    minors = sorted({c.name for c in cards if c.type == 'Minor Improvement'})
+
+    drafts = []
+    picks = 0
+    for d in range(args.drafts):
+        saves, n = draft_saves(occupations, minors, args.players, rng)
+        drafts.append([(f"u{d}", s) for s in saves])
+        picks += n
+    # Interleave the drafts: each step, a random draft that still has saves.
+    schedule = []
+    cursors = [0] * len(drafts)
+    live = list(range(len(drafts)))
+    while live:
+        i = rng.randrange(len(live))
+        d = live[i]
+        schedule.append(drafts[d][cursors[d]])
+        cursors[d] += 1
+        if cursors[d] == len(drafts[d]):
+            live[i] = live[-1]
+            live.pop()
+    final_bytes = statistics.mean(len(encode(saves[-1][1])) for saves in drafts)
+    print(f"{args.drafts} drafts, {len(schedule)} saves, {picks} picks; "
+          f"final state {final_bytes / 1024:.1f} KB on average\n")
+
+    print(f"{'store':<6} {'sent/pick':>10} {'stored/pick':>12} {'at rest':>9} "
+          f"{'write p50':>10} {'write p99':>10} {'read all':>9}")
+    finals = {}
+    with tempfile.TemporaryDirectory() as tmp:
+        for mode in ('full', 'delta'):
+            with DraftStore(os.path.join(tmp, f"{mode}.sqlite3"),
+                            snapshot_every=args.snapshot_every) as store:
+                sent, latencies = run(store, schedule, mode)
+                latencies.sort()
+                t0 = time.perf_counter()
+                finals[mode] = {f"u{d}": store.get(f"u{d}").state for d in range(args.drafts)}
+                read_ms = 1000 * (time.perf_counter() - t0)
+                print(f"{mode:<6} {sent / picks / 1024:8.2f}KB {store.bytes_written / picks / 1024:10.2f}KB "
+                      f"{store.size() / 1024:7.0f}KB {1e3 * percentile(latencies, 0.5):8.3f}ms "
+                      f"{1e3 * percentile(latencies, 0.99):8.3f}ms {read_ms:7.0f}ms")
+    if finals['full'] != finals['delta']:
+        print("\nMISMATCH: delta store did not rebuild the same final states")
+        return 1
+    print("\nBoth stores return identical final states")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,128 @@
+#!/usr/bin/env python3
+"""
+Benchmark FuzzyIndex against the old all-pairs SequenceMatcher loop.
+
+Generates synthetic card names and image names (noisy copies of some of
+the cards plus unrelated names), then times:
+
+  - the indexed matcher over every image, and
+  - the brute-force loop over a sample of images, extrapolated to all
+    of them (the full 10k x 10k brute force takes hours).
+
+The sampled images are also used to check that both approaches pick the
+same best card.
+
+Usage: python bench_fuzzy_match.py [--names 10000] [--images 10000]
+                                   [--brute-sample 100] [--seed 1]
+"""
+
+import argparse
+import random
+import string
+import time
+from difflib import SequenceMatcher
+
+from cardlib import FuzzyIndex
+
+THRESHOLD = 0.85
+
+WORDS = (
+    "wood clay reed stone grain veg sheep boar cattle field pasture stable "
+    "oven hearth well house room farm fence plow hoe basket carrier brewer "
+    "baker potter mason carpenter keeper trader hut mill market stall "
+    "forest river lake hill meadow garden patch barn shed yard cart "
+    "master junior senior little small large wandering traveling royal"
+).split()
+
+
+def synthetic_names(n, rng):
+    """Return ``n`` distinct normalized card-like names."""
+    names = set()
+    while len(names) < n:
+        parts = rng.sample(WORDS, rng.randint(2, 3))
+        if rng.random() < 0.3:
+            parts.append(rng.choice(string.ascii_lowercase) * rng.randint(1, 2))
+        names.add("".join(parts))
+    return sorted(names)
+
+
+def corrupt(name, rng):
+    """Apply one or two OCR/typo-style edits to ``name``."""
+    s = list(name)
+    for _ in range(rng.randint(1, 2)):
+        op = rng.random()
+        pos = rng.randrange(len(s))
+        if op < 0.35 and len(s) > 4:
+            del s[pos]
+        elif op < 0.7:
+            s[pos] = rng.choice(string.ascii_lowercase)
+        elif pos + 1 < len(s):
+            s[pos], s[pos + 1] = s[pos + 1], s[pos]
+    return "".join(s)
+
+
+def synthetic_images(names, n, rng):
+    """Half noisy copies of card names, half unrelated names."""
+    images = [corrupt(rng.choice(names), rng) for _ in range(n // 2)]
+    images += synthetic_names(n - len(images), random.Random(rng.random()))
+    rng.shuffle(images)
+    return images
+
+
+def brute_force_best(query, names):
+    """The loop fuzzy_rename.py used to run for every image."""
+    best_ratio = 0.0
+    best = None
+    for name in names:
+        ratio = SequenceMatcher(None, query, name).ratio()
+        if ratio > best_ratio:
+            best_ratio = ratio
+            best = name
+    if best_ratio >= THRESHOLD:
+        return best, best_ratio
+    return None
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--names', type=int, default=10000)
+    parser.add_argument('--images', type=int, default=10000)
+    parser.add_argument('--brute-sample', type=int, default=100)
+    parser.add_argument('--seed', type=int, default=1)
+    args = parser.parse_args()
+
+    rng = random.Random(args.seed)
+    names = synthetic_names(args.names, rng)
+    images = synthetic_images(names, args.images, rng)
+    print(f"{len(images)} images x {len(names)} names")
+
+    t0 = time.perf_counter()
+    index = FuzzyIndex(names)
+    build_s = time.perf_counter() - t0
+
+    t0 = time.perf_counter()
+    indexed = [index.best(img, cutoff=THRESHOLD) for img in images]
+    indexed_s = time.perf_counter() - t0
+    matched = sum(1 for r in indexed if r is not None)
+
+    sample = rng.sample(range(len(images)), min(args.brute_sample, len(images)))
+    t0 = time.perf_counter()
+    brute = {i: brute_force_best(images[i], names) for i in sample}
+    brute_sample_s = time.perf_counter() - t0
+    brute_s = brute_sample_s / len(sample) * len(images)
+
+    agree = sum(1 for i in sample if brute[i] == indexed[i])
+
+    print(f"\nIndexed: build {build_s:.2f}s, query {indexed_s:.2f}s "
+          f"({1000 * indexed_s / len(images):.3f} ms/image)")
+    print(f"         {index.comparisons} ratio() calls, {matched} images matched")
+    print(f"Brute:   {brute_sample_s:.2f}s for {len(sample)} images, "
+          f"~{brute_s:.0f}s extrapolated "
+          f"({1000 * brute_sample_s / len(sample):.1f} ms/image)")
+    print(f"         {len(names) * len(images)} ratio() calls")
+    print(f"\nSpeedup: ~{brute_s / (build_s + indexed_s):.0f}x")
+    print(f"Agreement on sample: {agree}/{len(sample)}")
+
+
+if __name__ == '__main__':
+    main()
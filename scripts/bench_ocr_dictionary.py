@@ -0,0 +1,172 @@
+#!/usr/bin/env python3
+"""
+Benchmark OCR name resolution: the cardlib.symspell dictionary against
+the Levenshtein scan in js/screenshot-ocr.js.
+
+Makes synthetic OCR reads of the real card names: each one gets one or
+two typical OCR errors (0/o, 1/l, rn for m, vv for w, c/e, a dropped,
+doubled or swapped letter, words run together, a stray character), and
+some are left clean. Reads of screen text that is not a card ("Round 4",
+"Major Improvement", random words) are mixed in, and should not resolve.
+
+For both methods, reports the share of card reads resolved to the right
+card, to a wrong card, or left unresolved (those are what the page sends
+back for a second, detail-extraction model call), the share of non-card
+reads wrongly resolved, and the time per lookup.
+
+Usage: python bench_ocr_dictionary.py [--reads 5000] [--noise 0.1]
+                                      [--seed 0]
+"""
+
+import argparse
+import random
+import statistics
+import string
+import sys
+import time
+
+from cardlib import load_aliases, load_cards, normalize
+from cardlib.symspell import NameDictionary, build_dictionary
+
+CONFUSIONS = (
+    ('o', '0'), ('l', '1'), ('i', 'l'), ('i', '1'), ('s', '5'), ('m', 'rn'),
+    ('w', 'vv'), ('e', 'c'), ('c', 'e'), ('h', 'b'), ('n', 'h'), ('u', 'v'),
+)
+
+NOT_CARDS = (
+    "Round 4", "Major Improvement", "Occupation", "Minor Improvement", "Pass",
+    "Choose a card", "Food", "Begging", "Harvest", "Your hand", "Draft",
+    "Confirm", "Wood", "Clay", "Reed", "Stone", "Grain", "Vegetable",
+)
+
+
+def _edit(name, rng):
+    """Apply one OCR-style error to ``name``."""
+    kind = rng.random()
+    if kind < 0.45:
+        options = [(i, a, b) for a, b in CONFUSIONS
+                   for i in range(len(name)) if name.lower().startswith(a, i)]
+        if options:
+            i, a, b = rng.choice(options)
+            return name[:i] + b + name[i + len(a):]
+    if len(name) < 3:
+        return name
+    i = rng.randrange(1, len(name) - 1)
+    if kind < 0.6:
+        return name[:i] + name[i + 1:]                          # dropped
+    if kind < 0.7:
+        return name[:i] + name[i] + name[i:]                    # doubled
+    if kind < 0.8:
+        return name[:i - 1] + name[i] + name[i - 1] + name[i + 1:]  # swapped
+    if kind < 0.9:
+        return name.replace(' ', '', 1) if ' ' in name else name[:i] + ' ' + name[i:]
+    return name[:i] + rng.choice(string.ascii_lowercase + '.,') + name[i:]
+
+
+def ocr_reads(names, n, rng, noise):
+    """``n`` (read, true name or None) pairs."""
+    reads = []
+    for _ in range(n):
+        if rng.random() < noise:
+            text = rng.choice(NOT_CARDS)
+            if rng.random() < 0.5:
+                text = _edit(text, rng)
+            reads.append((text, None))
+            continue
+        name = rng.choice(names)
+        text = name
+        for _ in range(rng.choice((0, 1, 1, 2))):
+            text = _edit(text, rng)
+        reads.append((text, name))
+    return reads
+
+
+def levenshtein(a, b):
+    prev = list(range(len(b) + 1))
+    for i in range(1, len(a) + 1):
+        cur = [i] + [0] * len(b)
+        for j in range(1, len(b) + 1):
+            cur[j] = min(prev[j] + 1, cur[j - 1] + 1, prev[j - 1] + (a[i - 1] != b[j - 1]))
+        prev = cur
+    return prev[-1]
+
+
+class LinearScan:
+    """Port of matchNames() in js/screenshot-ocr.js: exact, normalized, then
+    a Levenshtein scan within 25% of the name's length."""
+
+    def __init__(self, names):
+        self.lookup_table = {normalize(name): name for name in names}
+        self.keys = list(self.lookup_table)
+
+    def lookup(self, raw):
+        norm = normalize(raw)
+        if norm in self.lookup_table:
+            return self.lookup_table[norm], 0
+        threshold = max(1, len(norm) // 4)
+        best, best_d = None, float('inf')
+        for key in self.keys:
+            if abs(len(key) - len(norm)) > threshold:
+                continue
+            d = levenshtein(norm, key)
+            if d < best_d:
+                best, best_d = key, d
+        if best is not None and best_d <= threshold:
+            return self.lookup_table[best], best_d
+        return None
+
+
+def evaluate(method, reads):
+    times = []
+    right = wrong = missed = false_hits = 0
+    for text, truth in reads:
+        t0 = time.perf_counter()
+        result = method.lookup(text)
+        times.append(time.perf_counter() - t0)
+        got = result[0] if result else None
+        if truth is None:
+            false_hits += got is not None
+        elif got is None:
+            missed += 1
+        elif normalize(got) == normalize(truth):
+            right += 1
+        else:
+            wrong += 1
+    return right, wrong, missed, false_hits, times
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Benchmark OCR name resolution.")
+    parser.add_argument('--reads', type=int, default=5000, help="synthetic OCR reads")
+    parser.add_argument('--noise', type=float, default=0.1, help="share of reads that are not card names")
+    parser.add_argument('--seed', type=int, default=0)
+    args = parser.parse_args(argv)
+
+    rng = random.Random(args.seed)
+    names = load_cards().names()
+    t0 = time.perf_counter()
+    dictionary, _ = build_dictionary(names, load_aliases())
+    build_ms = 1000 * (time.perf_counter() - t0)
+    t0 = time.perf_counter()
+    symspell = NameDictionary(dictionary)
+    load_ms = 1000 * (time.perf_counter() - t0)
+    print(f"{len(dictionary['names'])} cards, {len(dictionary['deletes'])} deletes; "
+          f"build {build_ms:.0f} ms, load {load_ms:.1f} ms")
+
+    reads = ocr_reads(names, args.reads, rng, args.noise)
+    cards = sum(1 for _, truth in reads if truth is not None)
+    others = len(reads) - cards
+    print(f"{len(reads)} reads: {cards} card names, {others} other screen text\n")
+    print(f"{'method':<12} {'right':>7} {'wrong':>7} {'unresolved':>11} {'non-card hits':>14} "
+          f"{'mean us':>9} {'p99 us':>9}")
+    for label, method in (('symspell', symspell), ('linear scan', LinearScan(names))):
+        right, wrong, missed, false_hits, times = evaluate(method, reads)
+        p99 = sorted(times)[int(0.99 * (len(times) - 1))]
+        print(f"{label:<12} {100 * right / cards:6.1f}% {100 * wrong / cards:6.1f}% "
+              f"{100 * missed / cards:10.1f}% {100 * false_hits / max(others, 1):13.1f}% "
+              f"{1e6 * statistics.mean(times):9.1f} {1e6 * p99:9.1f}")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,229 @@
+#!/usr/bin/env python3
+"""
+Benchmark the data pipeline on synthetic data at 1x, 10x and 100x size.
+
+For each scale, writes a synthetic data set (see cardlib.synthetic) to a
+temporary directory and measures:
+
+  normalize       normalize() over every card name (cache cleared first)
+  parse_tsv       parsing the 4p rankings TSV
+  derive_stats    typing its columns and deriving play rate / value
+  compute_matches exact card <-> image matching (fuzzy_rename.py)
+  fuzzy_renames   the fuzzy rename search over the unmatched leftovers
+  merge_rankings  merge_rankings.main() end to end, pointed at the
+                  synthetic files
+
+Each is timed as the best of --repeat runs (one run at 100x and above),
+then run once more under tracemalloc for its peak memory.
+
+Results are compared with the stored baseline (bench_baseline.json next
+to this script); anything slower or bigger than the baseline by more
+than the tolerance (and by more than 50 ms / 1 MB, to ignore noise)
+is flagged and the exit status is 1. --save-baseline stores the current
+results instead. Baselines are only comparable on the same machine.
+
+Requires numpy.
+
+Usage: python bench_pipeline.py [--scales 1,10,100] [--repeat 3]
+                                [--save-baseline] [--tolerance 0.5]
+                                [--memory-tolerance 0.2]
+"""
+
+import argparse
+import contextlib
+import io
+import json
+import os
+import platform
+import sys
+import tempfile
+import time
+import tracemalloc
+
+import fuzzy_rename
+import merge_rankings
+from cardlib import normalize
+from cardlib.rankings import derive_stats, parse_tsv
+from cardlib.synthetic import write_dataset
+
+BASELINE_JSON = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'bench_baseline.json')
+# Differences below these are timer / allocator noise, never regressions.
+MIN_DELTA_SECONDS = 0.05
+MIN_DELTA_BYTES = 1 << 20
+
+
+def bench_normalize(ds):
+    with open(ds['cards'], 'r', encoding='utf-8') as f:
+        names = [c['name'] for c in json.load(f)]
+
+    def run():
+        normalize.cache_clear()
+        for name in names:
+            normalize(name)
+    return run
+
+
+def bench_parse_tsv(ds):
+    return lambda: parse_tsv(ds['tsv_4p'])
+
+
+def bench_derive_stats(ds):
+    table = parse_tsv(ds['tsv_4p'])
+
+    def run():
+        # column() caches its typed arrays; drop them so every run (the
+        # single one at 100x included) converts the strings again.
+        table._typed.clear()
+        derive_stats(table)
+    return run
+
+
+def _names_and_images(ds):
+    with open(ds['cards'], 'r', encoding='utf-8') as f:
+        names = [c['name'] for c in json.load(f)]
+    return names, sorted(os.listdir(ds['images']))
+
+
+def bench_compute_matches(ds):
+    names, images = _names_and_images(ds)
+    return lambda: fuzzy_rename.compute_matches(names, images)
+
+
+def bench_fuzzy_renames(ds):
+    names, images = _names_and_images(ds)
+    _, unmatched_cards, unmatched_images = fuzzy_rename.compute_matches(names, images)
+    return lambda: fuzzy_rename.find_fuzzy_renames(unmatched_cards, unmatched_images)
+
+
+def bench_merge_rankings(ds):
+    def run():
+        patched = {
+            'CARDS_JSON': ds['cards'],
+            'API_CARDS_JSON': ds['api_cards'],
+            'TSV_4P': ds['tsv_4p'],
+            'TSV_3P': ds['tsv_3p'],
+            'STATE_JSON': os.path.join(os.path.dirname(ds['cards']), 'rankings-state.json'),
+            'RANKING_HISTORY': os.path.join(os.path.dirname(ds['cards']), 'ranking-history.bin'),
+        }
+        saved = {k: getattr(merge_rankings, k) for k in patched}
+        try:
+            for k, v in patched.items():
+                setattr(merge_rankings, k, v)
+            with contextlib.redirect_stdout(io.StringIO()):
+                merge_rankings.main([])
+        finally:
+            for k, v in saved.items():
+                setattr(merge_rankings, k, v)
+    return run
+
+
+BENCHMARKS = {
+    'normalize': bench_normalize,
+    'parse_tsv': bench_parse_tsv,
+    'derive_stats': bench_derive_stats,
+    'compute_matches': bench_compute_matches,
+    'fuzzy_renames': bench_fuzzy_renames,
+    'merge_rankings': bench_merge_rankings,
+}
+
+
+def measure(run, repeat):
+    times = []
+    for _ in range(repeat):
+        t0 = time.perf_counter()
+        run()
+        times.append(time.perf_counter() - t0)
+    tracemalloc.start()
+    try:
+        run()
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    return {'seconds': min(times), 'peak_bytes': peak}
+
+
+def compare(results, baseline, tolerance, memory_tolerance):
+    """Return a list of regression messages."""
+    problems = []
+    for scale, benches in results.items():
+        for name, r in benches.items():
+            base = baseline.get(scale, {}).get(name)
+            if not base:
+                continue
+            if r['seconds'] > base['seconds'] * (1 + tolerance) \
+                    and r['seconds'] - base['seconds'] > MIN_DELTA_SECONDS:
+                problems.append(f"{scale} {name}: {r['seconds']:.3f}s vs baseline {base['seconds']:.3f}s")
+            if r['peak_bytes'] > base['peak_bytes'] * (1 + memory_tolerance) \
+                    and r['peak_bytes'] - base['peak_bytes'] > MIN_DELTA_BYTES:
+                problems.append(f"{scale} {name}: peak {r['peak_bytes'] / 1e6:.1f} MB "
+                                f"vs baseline {base['peak_bytes'] / 1e6:.1f} MB")
+    return problems
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Benchmark the data pipeline at scaled sizes.")
+    parser.add_argument('--scales', default='1,10,100', help="comma-separated size multipliers")
+    parser.add_argument('--repeat', type=int, default=3, help="timed runs per benchmark below 100x")
+    parser.add_argument('--only', help="comma-separated benchmark names to run")
+    parser.add_argument('--save-baseline', action='store_true', help="store results as the new baseline")
+    parser.add_argument('--tolerance', type=float, default=0.5,
+                        help="allowed fractional slowdown before flagging (default 0.5 = 50%%)")
+    parser.add_argument('--memory-tolerance', type=float, default=0.2,
+                        help="allowed fractional peak-memory growth before flagging")
+    parser.add_argument('--seed', type=int, default=0)
+    args = parser.parse_args(argv)
+
+    scales = [int(s) for s in args.scales.split(',')]
+    names = args.only.split(',') if args.only else list(BENCHMARKS)
+    unknown = [n for n in names if n not in BENCHMARKS]
+    if unknown:
+        parser.error(f"unknown benchmark(s): {', '.join(unknown)}")
+
+    results = {}
+    with tempfile.TemporaryDirectory(prefix='agricola-bench-') as tmp:
+        for scale in scales:
+            t0 = time.perf_counter()
+            ds = write_dataset(os.path.join(tmp, f'{scale}x'), scale=scale, seed=args.seed)
+            print(f"\n{scale}x: {ds['n_cards']} cards, {ds['n_images']} images "
+                  f"(generated in {time.perf_counter() - t0:.1f}s)")
+            repeat = args.repeat if scale < 100 else 1
+            key = f'{scale}x'
+            results[key] = {}
+            for name in names:
+                r = measure(BENCHMARKS[name](ds), repeat)
+                results[key][name] = r
+                print(f"  {name:<16} {r['seconds'] * 1000:>10.1f} ms  {r['peak_bytes'] / 1e6:>8.1f} MB peak")
+
+    if args.save_baseline:
+        baseline = {
+            'meta': {
+                'python': platform.python_version(),
+                'platform': platform.platform(),
+                'machine': platform.machine(),
+            },
+            'results': results,
+        }
+        with open(BASELINE_JSON, 'w', encoding='utf-8') as f:
+            json.dump(baseline, f, indent=2, sort_keys=True)
+        print(f"\nWrote {os.path.relpath(BASELINE_JSON)}")
+        return 0
+
+    try:
+        with open(BASELINE_JSON, 'r', encoding='utf-8') as f:
+            baseline = json.load(f)
+    except FileNotFoundError:
+        print("\nNo baseline stored; run with --save-baseline to create one")
+        return 0
+
+    problems = compare(results, baseline['results'], args.tolerance, args.memory_tolerance)
+    if problems:
+        print(f"\nREGRESSIONS vs baseline ({baseline['meta']['platform']}):")
+        for p in problems:
+            print(f"  - {p}")
+        return 1
+    print("\nNo regressions vs baseline")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
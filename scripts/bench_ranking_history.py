@@ -0,0 +1,138 @@
+#!/usr/bin/env python3
+"""
+Benchmark the ranking history store with hundreds of snapshots.
+
+Writes --snapshots synthetic snapshots per player count to a temporary
+history file. Each one is a random walk from the real 4p/3p TSVs: ranks
+drift by local swaps, ADP and Elo/Play by small noise, and a few cards
+drop in and out. Then times:
+
+  append     writing each snapshot (dictionary + columns + fsync)
+  open       mapping the file and reading the block directory
+  trend      one card's rank/ADP/Elo across every snapshot
+  matrix     the rank of every card in every snapshot
+  movers     biggest rank changes between the first and last snapshot
+
+For comparison, the same snapshots are stored as one JSON document (the
+"keep every TSV as a list of dicts" alternative), and the trend query
+is timed against it, including its load.
+
+Requires numpy.
+
+Usage: python bench_ranking_history.py [--snapshots 500] [--queries 200]
+                                       [--seed 0]
+"""
+
+import argparse
+import json
+import os
+import random
+import sys
+import tempfile
+import time
+
+import numpy as np
+
+from cardlib import TSV_3P, TSV_4P
+from cardlib.history import COLUMNS, RankingHistory, append_snapshot
+from cardlib.rankings import parse_tsv
+
+DROP_RATE = 0.01
+
+
+def walk(table, n, rng):
+    """Yield ``n`` successive (names, columns) snapshots drifting from ``table``."""
+    names = list(table.names)
+    cols = {f: np.asarray(table.column(tsv), dtype=np.float64)
+            for f, (_, tsv) in COLUMNS.items() if tsv is not None}
+    order = np.argsort(cols['rank'], kind='stable')
+    for _ in range(n):
+        for _ in range(len(names) // 10):
+            i = int(rng.integers(len(order) - 1))
+            order[i], order[i + 1] = order[i + 1], order[i]
+        cols['rank'][order] = np.arange(1, len(order) + 1)
+        cols['adp'] = np.clip(cols['adp'] + rng.normal(0, 0.05, len(names)), 1, 7)
+        cols['elo_per_play'] = cols['elo_per_play'] + rng.normal(0, 0.1, len(names))
+        cols['deals'] = cols['deals'] + rng.integers(0, 20, len(names))
+        keep = rng.random(len(names)) >= DROP_RATE
+        yield ([n for n, k in zip(names, keep) if k], {f: v[keep] for f, v in cols.items()})
+
+
+def timed(fn, repeat=1):
+    best = float('inf')
+    for _ in range(repeat):
+        t0 = time.perf_counter()
+        result = fn()
+        best = min(best, time.perf_counter() - t0)
+    return best, result
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Benchmark the ranking history store.")
+    parser.add_argument('--snapshots', type=int, default=500, help="snapshots per player count")
+    parser.add_argument('--queries', type=int, default=200, help="trend queries to time")
+    parser.add_argument('--seed', type=int, default=0)
+    args = parser.parse_args(argv)
+
+    rng = np.random.default_rng(args.seed)
+    tables = {4: parse_tsv(TSV_4P), 3: parse_tsv(TSV_3P)}
+
+    with tempfile.TemporaryDirectory(prefix='agricola-history-') as tmp:
+        path = os.path.join(tmp, 'ranking-history.bin')
+        json_path = os.path.join(tmp, 'ranking-history.json')
+        naive = []
+        append_times = []
+        for players, table in tables.items():
+            for k, (names, cols) in enumerate(walk(table, args.snapshots, rng)):
+                t0 = time.perf_counter()
+                append_snapshot(path, players, names, cols, label=f'synthetic {k}',
+                                timestamp=1735689600 + 86400 * k, source=os.urandom(20))
+                append_times.append(time.perf_counter() - t0)
+                naive.append({'players': players, 'rows': [
+                    {'name': name, **{f: float(v[i]) for f, v in cols.items()}}
+                    for i, name in enumerate(names)
+                ]})
+        with open(json_path, 'w', encoding='utf-8') as f:
+            json.dump(naive, f, separators=(',', ':'))
+        del naive
+
+        n_snap = 2 * args.snapshots
+        print(f"{n_snap} snapshots, history file {os.path.getsize(path) / 1e6:.1f} MB "
+              f"(JSON equivalent {os.path.getsize(json_path) / 1e6:.1f} MB)")
+        print(f"  append      {1000 * np.mean(append_times):8.2f} ms mean  "
+              f"{1000 * np.percentile(append_times, 99):8.2f} ms p99")
+
+        t_open, history = timed(lambda: RankingHistory(path))
+        print(f"  open        {1000 * t_open:8.2f} ms  ({len(history.names)} cards in dictionary)")
+
+        pick = random.Random(args.seed).choices(tables[4].names, k=args.queries)
+        times = []
+        for name in pick:
+            t0 = time.perf_counter()
+            history.trend(name, players=4)
+            times.append(time.perf_counter() - t0)
+        print(f"  trend       {1000 * np.mean(times):8.2f} ms mean  "
+              f"{1000 * np.percentile(times, 99):8.2f} ms p99  ({args.snapshots} points each)")
+
+        t_matrix, (_, matrix) = timed(lambda: history.matrix('rank', players=4), repeat=3)
+        print(f"  matrix      {1000 * t_matrix:8.2f} ms  ({matrix.shape[0]} x {matrix.shape[1]}, "
+              f"{matrix.nbytes / 1e6:.1f} MB)")
+        del matrix
+
+        t_movers, movers = timed(lambda: history.movers('rank', players=4), repeat=3)
+        print(f"  movers      {1000 * t_movers:8.2f} ms  (top: {movers[0][0] if movers else '-'})")
+        history.close()
+
+        def naive_trend():
+            with open(json_path, 'r', encoding='utf-8') as f:
+                snapshots = json.load(f)
+            name = pick[0]
+            return [next((r['rank'] for r in s['rows'] if r['name'] == name), None)
+                    for s in snapshots if s['players'] == 4]
+        t_naive, _ = timed(naive_trend)
+        print(f"  JSON trend  {1000 * t_naive:8.2f} ms  (load everything, then scan)")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
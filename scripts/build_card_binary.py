@@ -0,0 +1,82 @@
+#!/usr/bin/env python3
+"""
+Build the compact binary card dataset and regenerate the JSON from it.
+
+Encodes data/agricola-cards.json with cardlib.cardbin (columnar, with a
+deduplicated string table and typed numeric columns) and writes
+agricola-cards.bin to data/ and api/data/. Both JSON copies are then
+rewritten from the decoded binary, so the .bin, data/ and api/data/
+can never disagree. The API reads the card names it needs straight from
+api/data/agricola-cards.bin (api/src/card-binary.js).
+
+Usage: python build_card_binary.py [--check]
+"""
+
+import argparse
+import os
+import sys
+
+from cardlib import API_CARDS_BIN, API_CARDS_JSON, CARDS_BIN, CARDS_JSON, load_cards, trace
+from cardlib.cardbin import KIND_NAMES, CardBinary, encode
+from cardlib.files import dump_cards, write_if_changed
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Build agricola-cards.bin from the card JSON.")
+    parser.add_argument(
+        '--check', action='store_true',
+        help="exit non-zero if any output is out of date instead of writing it",
+    )
+    trace.add_arguments(parser)
+    args = parser.parse_args(argv)
+    trace.configure(args)
+
+    cards = load_cards(CARDS_JSON).records
+    with trace.span('encode'):
+        blob = encode(cards)
+    with trace.span('decode'):
+        reader = CardBinary(blob)
+        decoded = reader.records()
+    if decoded != cards:
+        print("ERROR: binary encoding did not round-trip; nothing written")
+        return 1
+    text = dump_cards(decoded)
+
+    outputs = [
+        (CARDS_BIN, blob),
+        (API_CARDS_BIN, blob),
+        (CARDS_JSON, text),
+        (API_CARDS_JSON, text),
+    ]
+
+    print(f"{len(cards)} cards, {len(reader.field_names)} columns, "
+          f"{reader.n_strings} unique strings, {len(reader.layouts)} layouts")
+    for name in reader.field_names:
+        kind, _, length = reader.fields[name]
+        print(f"  {name:<28} {KIND_NAMES[kind]:<8} {length:>8} bytes")
+    print(f"\nbinary: {len(blob):>8} bytes")
+    print(f"json:   {len(text):>8} bytes")
+
+    stale = []
+    for path, data in outputs:
+        if args.check:
+            try:
+                with open(path, 'rb') as f:
+                    current = f.read()
+            except FileNotFoundError:
+                current = None
+            if current != data:
+                stale.append(path)
+        elif write_if_changed(path, data):
+            print(f"Wrote {os.path.relpath(path)}")
+
+    if stale:
+        print("\nOut of date:")
+        for path in stale:
+            print(f"  - {os.path.relpath(path)}")
+        return 1
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,103 @@
+#!/usr/bin/env python3
+"""
+Build the field-projected card bundles index.html loads (cardlib.bundles).
+
+Splits data/agricola-cards.json into a first-paint shard (names, types
+and stats) and lazily fetched tag and description shards, each named by
+its content hash, under data/bundles/. data/card-bundles.json names the
+current files; shard files it no longer names are deleted. The shards
+are decoded again and compared with the card JSON before anything is
+written.
+
+Prints each group's raw and gzipped size next to the full card JSON's,
+which is what the page fetched before.
+
+Usage: python build_card_bundles.py [--shard-size 100] [--check]
+"""
+
+import argparse
+import gzip
+import json
+import os
+import sys
+
+from cardlib import CARD_BUNDLES_DIR, CARD_BUNDLES_JSON, CARDS_JSON, load_cards, trace
+from cardlib.bundles import DEFAULT_SHARD_SIZE, build_bundles, decode, expected
+from cardlib.files import write_if_changed
+
+
+def _gz(data):
+    return len(gzip.compress(data, 9))
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Build the card data bundles for index.html.")
+    parser.add_argument('--shard-size', type=int, default=DEFAULT_SHARD_SIZE,
+                        help=f"cards per details shard (default {DEFAULT_SHARD_SIZE})")
+    parser.add_argument(
+        '--check', action='store_true',
+        help="exit non-zero if the bundles are out of date instead of writing them",
+    )
+    trace.add_arguments(parser)
+    args = parser.parse_args(argv)
+    trace.configure(args)
+    if args.shard_size < 1:
+        parser.error("--shard-size must be positive")
+
+    cards = load_cards(CARDS_JSON).records
+    with trace.span('build_bundles'):
+        manifest, files = build_bundles(cards, shard_size=args.shard_size)
+    if decode(manifest, files) != expected(cards):
+        print("ERROR: bundles did not round-trip; nothing written")
+        return 1
+    manifest_data = (json.dumps(manifest, indent=2) + '\n').encode('utf-8')
+
+    with open(CARDS_JSON, 'rb') as f:
+        full = f.read()
+    print(f"{len(cards)} cards")
+    print(f"  {'full JSON':<10} {'':>9} {len(full):>9} bytes {_gz(full):>8} gzipped")
+    for group in manifest['groups']:
+        sizes = [len(files[name]) for name in group['files']]
+        gz = sum(_gz(files[name]) for name in group['files'])
+        label = 'first paint' if group['eager'] else 'lazy'
+        print(f"  {group['name']:<10} {len(sizes):>3} files {sum(sizes):>9} bytes {gz:>8} gzipped  ({label})")
+
+    existing = set()
+    if os.path.isdir(CARD_BUNDLES_DIR):
+        existing = {name for name in os.listdir(CARD_BUNDLES_DIR) if name.endswith('.json')}
+    missing = sorted(set(files) - existing)
+    stale = sorted(existing - set(files))
+
+    if args.check:
+        out_of_date = [os.path.join(CARD_BUNDLES_DIR, name) for name in missing + stale]
+        try:
+            with open(CARD_BUNDLES_JSON, 'rb') as f:
+                if f.read() != manifest_data:
+                    out_of_date.append(CARD_BUNDLES_JSON)
+        except FileNotFoundError:
+            out_of_date.append(CARD_BUNDLES_JSON)
+        if out_of_date:
+            print("\nOut of date:")
+            for path in out_of_date:
+                print(f"  - {os.path.relpath(path)}")
+            return 1
+        return 0
+
+    # New shards first, then the manifest that points at them, then the
+    # old shards, so a page loading mid-build never requests a missing file.
+    os.makedirs(CARD_BUNDLES_DIR, exist_ok=True)
+    for name in missing:
+        write_if_changed(os.path.join(CARD_BUNDLES_DIR, name), files[name])
+    if missing:
+        print(f"Wrote {len(missing)} shards to {os.path.relpath(CARD_BUNDLES_DIR)}")
+    if write_if_changed(CARD_BUNDLES_JSON, manifest_data):
+        print(f"Wrote {os.path.relpath(CARD_BUNDLES_JSON)}")
+    for name in stale:
+        os.unlink(os.path.join(CARD_BUNDLES_DIR, name))
+    if stale:
+        print(f"Removed {len(stale)} stale shards")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,85 @@
+#!/usr/bin/env python3
+"""
+Build the typed stat columns and regenerate the JSON stats from them.
+
+Parses the 4p and 3p stats of data/agricola-cards.json once into a
+cardlib.stats_store StatsStore (float32/int32 columns with null masks)
+and writes data/card-stats.bin. Both JSON copies are then rewritten with
+their stat fields exported from the store, so the strings in the JSON
+are derived from the typed columns and can never disagree with them.
+
+Usage: python build_card_stats.py [--check]
+"""
+
+import argparse
+import copy
+import hashlib
+import os
+import sys
+
+from cardlib import API_CARDS_JSON, CARD_STATS_BIN, CARDS_JSON, load_cards, trace
+from cardlib.files import dump_cards, write_if_changed
+from cardlib.stats_store import PLAYER_COUNTS, STAT_FIELDS, StatsStore
+
+
+def _read(path):
+    try:
+        with open(path, 'rb') as f:
+            return f.read()
+    except FileNotFoundError:
+        return None
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Build card-stats.bin from the card JSON.")
+    parser.add_argument(
+        '--check', action='store_true',
+        help="exit non-zero if any output is out of date instead of writing it",
+    )
+    trace.add_arguments(parser)
+    args = parser.parse_args(argv)
+    trace.configure(args)
+
+    cards = load_cards(CARDS_JSON).records
+    with trace.span('parse'):
+        try:
+            store = StatsStore.from_records(cards)
+        except ValueError as e:
+            print(f"ERROR: {e}; nothing written")
+            return 1
+    with trace.span('export'):
+        exported = store.export(copy.deepcopy(cards))
+    if exported != cards:
+        print("ERROR: stats did not round-trip through the typed columns; nothing written")
+        return 1
+    text = dump_cards(exported)
+
+    # The store records the JSON it was built from: the bytes written below.
+    store.source = hashlib.sha1(text).digest()
+    blob = store.tobytes()
+
+    for players in PLAYER_COUNTS:
+        block = store.blocks[players]
+        print(f"{players}p: {int(block.present.sum())} cards with stats; nulls: "
+              + ', '.join(f"{f} {int((block.null[f] & block.present).sum())}" for f in STAT_FIELDS))
+    print(f"\nstats: {len(blob):>8} bytes for {len(store)} cards")
+
+    outputs = [(CARD_STATS_BIN, blob), (CARDS_JSON, text), (API_CARDS_JSON, text)]
+    stale = []
+    for path, data in outputs:
+        if args.check:
+            if _read(path) != data:
+                stale.append(path)
+        elif write_if_changed(path, data):
+            print(f"Wrote {os.path.relpath(path)}")
+
+    if stale:
+        print("\nOut of date:")
+        for path in stale:
+            print(f"  - {os.path.relpath(path)}")
+        return 1
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
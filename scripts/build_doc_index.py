@@ -0,0 +1,127 @@
+#!/usr/bin/env python3
+"""
+Build the strategy function's passage index (api/data/doc-index.json).
+
+Splits api/docs/agricola-strategy-guide.md and the text of
+f5-agricola-rulebook.pdf (extracted with cardlib.pdftext) into passages
+and indexes them for BM25 retrieval; see cardlib.doc_index for the
+layout. With --query or --hand, prints the best passages for some text
+or for a hand of cards instead of writing the file.
+
+Usage: python build_doc_index.py [--check]
+       python build_doc_index.py --query "bake bread fireplace" [-k 5]
+       python build_doc_index.py --hand "Basket Carrier,Cesspit" [--players 3]
+"""
+
+import argparse
+import hashlib
+import json
+import os
+import sys
+import time
+
+from cardlib import (
+    DOC_INDEX_JSON,
+    ROOT_DIR,
+    RULEBOOK_PDF,
+    STRATEGY_GUIDE_MD,
+    STRATEGY_INDEX_3P,
+    STRATEGY_INDEX_4P,
+    trace,
+)
+from cardlib.doc_index import build_index, chunk_markdown, chunk_pages, hand_query, search
+from cardlib.files import write_if_changed
+from cardlib.pdftext import extract_pages
+
+
+def _sha256(data):
+    return hashlib.sha256(data).hexdigest()
+
+
+def load_sources():
+    """[(name, repo-relative path, sha256, passages)] for the guide and the rulebook."""
+    with open(STRATEGY_GUIDE_MD, 'rb') as f:
+        guide = f.read()
+    with open(RULEBOOK_PDF, 'rb') as f:
+        rulebook = _sha256(f.read())
+    with trace.span('extract_pdf'):
+        pages = extract_pages(RULEBOOK_PDF)
+    return [
+        ('guide', os.path.relpath(STRATEGY_GUIDE_MD, ROOT_DIR), _sha256(guide),
+         chunk_markdown(guide.decode('utf-8'))),
+        ('rulebook', os.path.relpath(RULEBOOK_PDF, ROOT_DIR), rulebook, chunk_pages(pages)),
+    ]
+
+
+def print_results(index, results, elapsed_ms):
+    for score, c in results:
+        source, title, text = index['chunks'][c]
+        print(f"[{score:6.2f}] {index['sources'][source]['name']}: {title}")
+        print(f"         {text[:160]}{'...' if len(text) > 160 else ''}")
+    print(f"({len(results)} passages in {elapsed_ms:.3f} ms)")
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Build the strategy guide / rulebook passage index.")
+    parser.add_argument('--query', help="print the best passages for TEXT instead of writing the index")
+    parser.add_argument('--hand', help="print the best passages for a comma-separated list of card names")
+    parser.add_argument('--players', type=int, choices=(3, 4), default=4)
+    parser.add_argument('-k', type=int, default=5, help="passages to print (default 5)")
+    parser.add_argument(
+        '--check', action='store_true',
+        help="exit non-zero if the index is out of date instead of writing it",
+    )
+    trace.add_arguments(parser)
+    args = parser.parse_args(argv)
+    trace.configure(args)
+
+    sources = load_sources()
+    with trace.span('build_index'):
+        index = build_index(sources)
+
+    if args.query is not None or args.hand is not None:
+        if args.hand is not None:
+            path = STRATEGY_INDEX_3P if args.players == 3 else STRATEGY_INDEX_4P
+            with open(path, 'r', encoding='utf-8') as f:
+                table = json.load(f)['cards']
+            names = [n.strip() for n in args.hand.split(',') if n.strip()]
+            unknown = [n for n in names if n not in table]
+            if unknown:
+                print(f"Unknown card(s): {', '.join(unknown)}")
+                return 1
+            query = hand_query([table[n] for n in names])
+        else:
+            query = args.query
+        t0 = time.perf_counter()
+        results = search(index, query, k=args.k)
+        print_results(index, results, 1000 * (time.perf_counter() - t0))
+        return 0
+
+    data = json.dumps(index, ensure_ascii=False, separators=(',', ':')).encode('utf-8')
+    counts = {}
+    for source, _, _ in index['chunks']:
+        counts[source] = counts.get(source, 0) + 1
+    print(f"{len(index['chunks'])} passages ("
+          + ', '.join(f"{counts.get(s, 0)} {src['name']}" for s, src in enumerate(index['sources']))
+          + f"), {len(index['postings'])} terms")
+
+    if args.check:
+        try:
+            with open(DOC_INDEX_JSON, 'rb') as f:
+                current = f.read()
+        except FileNotFoundError:
+            current = None
+        if current != data:
+            print(f"Out of date: {os.path.relpath(DOC_INDEX_JSON)}")
+            return 1
+        return 0
+
+    if write_if_changed(DOC_INDEX_JSON, data):
+        print(f"Wrote {os.path.relpath(DOC_INDEX_JSON)} ({len(data)} bytes)")
+    else:
+        print(f"{os.path.relpath(DOC_INDEX_JSON)} unchanged")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
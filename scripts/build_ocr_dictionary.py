@@ -0,0 +1,71 @@
+#!/usr/bin/env python3
+"""
+Build the OCR name dictionary (data/ocr-name-dictionary.json).
+
+Indexes every card name and alias from data/card-aliases.json for
+typo-tolerant lookup; js/screenshot-ocr.js resolves names the OCR
+function misread with it before giving up on them. See cardlib.symspell
+for the layout.
+
+Usage: python build_ocr_dictionary.py [--lookup TEXT]
+"""
+
+import argparse
+import json
+import os
+import sys
+import time
+
+from cardlib import OCR_NAMES_JSON, load_aliases, load_cards, normalize, trace
+from cardlib.files import write_if_changed
+from cardlib.symspell import NameDictionary, build_dictionary
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Build the OCR name dictionary.")
+    parser.add_argument('--lookup', help="resolve TEXT with the freshly built dictionary and print the result")
+    trace.add_arguments(parser)
+    args = parser.parse_args(argv)
+    trace.configure(args)
+
+    names = load_cards().names()
+    aliases = load_aliases()
+    with trace.span('build_dictionary'):
+        dictionary, collisions = build_dictionary(names, aliases)
+
+    if args.lookup is not None:
+        lookup = NameDictionary(dictionary)
+        t0 = time.perf_counter()
+        result = lookup.lookup(args.lookup)
+        elapsed_ms = 1000 * (time.perf_counter() - t0)
+        if result is None:
+            print("No match")
+        else:
+            print(f"{result[0]} (distance {result[1]})")
+        print(f"({lookup.comparisons} candidates scored in {elapsed_ms:.3f} ms)")
+        return 0
+
+    data = json.dumps(dictionary, ensure_ascii=False, separators=(',', ':')).encode('utf-8')
+    written = write_if_changed(OCR_NAMES_JSON, data)
+
+    print(f"{len(dictionary['names'])} cards, {len(dictionary['keys'])} keys, "
+          f"{len(dictionary['deletes'])} deletes")
+    if written:
+        print(f"Wrote {os.path.relpath(OCR_NAMES_JSON)} ({len(data)} bytes)")
+    else:
+        print(f"{os.path.relpath(OCR_NAMES_JSON)} unchanged")
+    known = {normalize(name) for name in names}
+    unknown = sorted(a for a, target in aliases.items() if normalize(target) not in known)
+    if unknown:
+        print(f"\nWARNING: {len(unknown)} aliases point at unknown cards:")
+        for alias in unknown:
+            print(f"  - {alias}")
+    if collisions:
+        print(f"\n{len(collisions)} keys shared by several cards:")
+        for key, shared in collisions:
+            print(f"  - {key}: {', '.join(shared)}")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,61 @@
+#!/usr/bin/env python3
+"""
+Build the card autocomplete index (data/card-search-index.json).
+
+Indexes every card's normalized name, word-start suffixes, card ID and
+any aliases from data/card-aliases.json, plus a trigram table for
+substring matches. See cardlib.search_index for the layout.
+
+Usage: python build_search_index.py [--query TEXT] [--players 3|4]
+"""
+
+import argparse
+import json
+import os
+import sys
+import time
+
+from cardlib import SEARCH_INDEX_JSON, load_aliases, load_cards, trace
+from cardlib.files import write_if_changed
+from cardlib.search_index import build_search_index, query
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Build the card autocomplete index.")
+    parser.add_argument('--query', help="look up TEXT in the freshly built index and print the results")
+    parser.add_argument('--players', type=int, choices=(3, 4), default=4)
+    trace.add_arguments(parser)
+    args = parser.parse_args(argv)
+    trace.configure(args)
+
+    cards = load_cards().records
+    with trace.span('build_search_index'):
+        index, unknown = build_search_index(cards, load_aliases())
+
+    if args.query is not None:
+        t0 = time.perf_counter()
+        results = query(index, args.query, player_count=args.players)
+        elapsed_ms = 1000 * (time.perf_counter() - t0)
+        for name in results:
+            print(name)
+        print(f"({len(results)} results in {elapsed_ms:.3f} ms)")
+        return 0
+
+    text = json.dumps(index, ensure_ascii=False, separators=(',', ':'))
+    written = write_if_changed(SEARCH_INDEX_JSON, text.encode('utf-8'))
+
+    print(f"{len(index['cards'])} cards, {len(index['keys'])} prefix keys, "
+          f"{len(index['trigrams'])} trigrams")
+    if written:
+        print(f"Wrote {os.path.relpath(SEARCH_INDEX_JSON)} ({len(text.encode('utf-8'))} bytes)")
+    else:
+        print(f"{os.path.relpath(SEARCH_INDEX_JSON)} unchanged")
+    if unknown:
+        print(f"\nWARNING: {len(unknown)} aliases point at unknown cards:")
+        for alias in unknown:
+            print(f"  - {alias}")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,73 @@
+#!/usr/bin/env python3
+"""
+Build the strategy function's per-player-count card index artifacts.
+
+Writes api/data/strategy-index-4p.json and strategy-index-3p.json from
+data/agricola-cards.json (see cardlib.strategy_index for the layout) and
+reports how much each index adds to the system prompt.
+
+Usage: python build_strategy_index.py [--check]
+"""
+
+import argparse
+import json
+import os
+import sys
+
+from cardlib import CARDS_JSON, STRATEGY_INDEX_3P, STRATEGY_INDEX_4P, trace
+from cardlib.files import write_atomic
+from cardlib.strategy_index import build_strategy_index, estimate_tokens
+
+OUTPUTS = {4: STRATEGY_INDEX_4P, 3: STRATEGY_INDEX_3P}
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Build the strategy function's card index artifacts.")
+    parser.add_argument(
+        '--check', action='store_true',
+        help="exit non-zero if an artifact is out of date instead of writing it",
+    )
+    trace.add_arguments(parser)
+    args = parser.parse_args(argv)
+    trace.configure(args)
+
+    with open(CARDS_JSON, 'rb') as f:
+        source = f.read()
+    cards = json.loads(source)
+
+    stale = []
+    print(f"{'players':<8} {'cards':>6} {'index bytes':>12} {'tokens':>8} {'file bytes':>11}  sha256")
+    for players, path in OUTPUTS.items():
+        with trace.span('build_strategy_index', players=players):
+            artifact = build_strategy_index(cards, players, source)
+        data = json.dumps(artifact, ensure_ascii=False, separators=(',', ':')).encode('utf-8')
+        tokens, exact = estimate_tokens(artifact['index'])
+        print(f"{players:<8} {artifact['index'].count(chr(10)) + 1:>6} "
+              f"{len(artifact['index'].encode('utf-8')):>12} "
+              f"{('' if exact else '~') + str(tokens):>8} {len(data):>11}  {artifact['sha256'][:12]}")
+
+        try:
+            with open(path, 'rb') as f:
+                current = f.read()
+        except FileNotFoundError:
+            current = None
+        if current == data:
+            continue
+        if args.check:
+            stale.append(path)
+        else:
+            write_atomic(path, data)
+            print(f"  Wrote {os.path.relpath(path)}")
+
+    if not estimate_tokens('')[1]:
+        print("\n(~ token counts assume 4 characters per token; install tiktoken for exact counts)")
+    if stale:
+        print("\nOut of date:")
+        for path in stale:
+            print(f"  - {os.path.relpath(path)}")
+        return 1
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
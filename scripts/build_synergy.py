@@ -0,0 +1,78 @@
+#!/usr/bin/env python3
+"""
+Build the card synergy partner lists (api/data/card-synergy.json).
+
+Scores every pair of cards by shared tags, description terms and
+resource producer/consumer matches (see cardlib.synergy) and keeps each
+card's top --k partners. The strategy function looks up the hand cards'
+partners among the drafted cards in it:
+
+    {"version": 1, "k": 10, "weights": {...},
+     "partners": {"Lover": [["Wet Nurse", 0.412], ...], ...}}
+
+Requires numpy.
+
+Usage: python build_synergy.py [--k N] [--card NAME]
+"""
+
+import argparse
+import json
+import os
+import sys
+import time
+
+from cardlib import SYNERGY_JSON, load_cards, trace
+from cardlib.files import write_if_changed
+from cardlib.synergy import WEIGHTS, top_k_partners
+
+VERSION = 1
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Build top-k card synergy partner lists.")
+    parser.add_argument('--k', type=int, default=10, help="partners kept per card")
+    parser.add_argument('--card', help="print NAME's partners instead of writing the files")
+    trace.add_arguments(parser)
+    args = parser.parse_args(argv)
+    trace.configure(args)
+
+    # Duplicate names keep the first record, as the draft tool does.
+    cards = []
+    seen = set()
+    for card in load_cards().records:
+        if card['name'] not in seen:
+            seen.add(card['name'])
+            cards.append(card)
+
+    t0 = time.perf_counter()
+    with trace.span('top_k_partners', cards=len(cards), k=args.k):
+        indices, scores = top_k_partners(cards, k=args.k)
+    elapsed = time.perf_counter() - t0
+
+    partners = {}
+    for i, card in enumerate(cards):
+        partners[card['name']] = [
+            [cards[j]['name'], round(float(s), 3)]
+            for j, s in zip(indices[i], scores[i]) if j >= 0
+        ]
+
+    if args.card is not None:
+        if args.card not in partners:
+            print(f"Unknown card: {args.card}")
+            return 1
+        for name, score in partners[args.card]:
+            print(f"  {score:.3f}  {name}")
+        return 0
+
+    out = {'version': VERSION, 'k': args.k, 'weights': WEIGHTS, 'partners': partners}
+    text = json.dumps(out, ensure_ascii=False, separators=(',', ':'))
+    if write_if_changed(SYNERGY_JSON, text.encode('utf-8')):
+        print(f"Wrote {os.path.relpath(SYNERGY_JSON)}")
+    pairs = sum(len(p) for p in partners.values())
+    print(f"{len(cards)} cards, {pairs} partner links, scored in {elapsed:.2f}s, "
+          f"{len(text.encode('utf-8'))} bytes")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
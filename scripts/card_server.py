@@ -0,0 +1,284 @@
+#!/usr/bin/env python3
+"""
+Local, dependency-free stand-in for the card API, for load testing.
+
+Loads agricola-cards.json once into a cardlib.card_store.CardStore (with
+the typed stat columns of data/card-stats.bin when numpy is installed and
+the file is current) and serves it over HTTP/1.1 (keep-alive) with asyncio:
+
+    GET /cards/NAME                  one card by name (any spelling that
+                                     normalizes the same), 404 if unknown
+    GET /cards?type=&tag=&banned_4p=&players=&sort=&offset=&limit=
+                                     filtered, sorted page; type and tag
+                                     may repeat (any type, all tags);
+                                     sort is a stat or "name", "-value"
+                                     sorts descending
+    GET /search?q=&players=&limit=   autocomplete-style name search
+    GET /health                      card count and cache counters
+
+Each distinct response is rendered once: the JSON body, its gzip copy
+and its ETag go into an LRU cache keyed by the path plus the sorted query
+parameters, so repeat requests cost a dict lookup and a socket write.
+Responses carry X-Cache: hit|miss for the load generator
+(bench_card_server.py).
+
+Usage: python card_server.py [--host 127.0.0.1] [--port 8765]
+                             [--cache-size 4096] [--cards PATH]
+"""
+
+import argparse
+import asyncio
+import collections
+import gzip
+import hashlib
+import json
+import sys
+import time
+from urllib.parse import parse_qsl, unquote, urlencode, urlsplit
+
+from cardlib import CARDS_JSON, load_aliases, load_cards
+from cardlib.card_store import PLAYER_COUNTS, SORT_FIELDS, CardStore
+
+try:
+    from cardlib.stats_store import load_stats
+except ImportError:  # numpy not installed; CardStore parses the stat strings
+    load_stats = None
+
+MAX_LIMIT = 500
+# Bodies smaller than this are sent uncompressed; gzip would not pay off.
+GZIP_MIN_BYTES = 512
+MAX_HEADER_BYTES = 16384
+
+REASONS = {200: 'OK', 304: 'Not Modified', 400: 'Bad Request', 404: 'Not Found',
+           405: 'Method Not Allowed', 431: 'Request Header Fields Too Large'}
+
+
+class Response:
+    """A rendered response: body, optional gzip copy and ETag."""
+
+    __slots__ = ('status', 'body', 'gzip_body', 'etag')
+
+    def __init__(self, status, payload):
+        self.status = status
+        self.body = json.dumps(payload, ensure_ascii=False, separators=(',', ':')).encode('utf-8')
+        self.gzip_body = gzip.compress(self.body, 6) if len(self.body) >= GZIP_MIN_BYTES else None
+        self.etag = '"' + hashlib.sha1(self.body).hexdigest()[:16] + '"'
+
+
+class LRUCache:
+    def __init__(self, size):
+        self.size = size
+        self.entries = collections.OrderedDict()
+        self.hits = self.misses = 0
+
+    def get(self, key):
+        response = self.entries.get(key)
+        if response is None:
+            self.misses += 1
+            return None
+        self.entries.move_to_end(key)
+        self.hits += 1
+        return response
+
+    def put(self, key, response):
+        if self.size <= 0:
+            return
+        self.entries[key] = response
+        if len(self.entries) > self.size:
+            self.entries.popitem(last=False)
+
+
+class BadRequest(ValueError):
+    pass
+
+
+def _int(params, name, default, lo, hi):
+    value = params.get(name)
+    if value is None or value == '':
+        return default
+    try:
+        n = int(value)
+    except ValueError:
+        raise BadRequest(f"{name} must be an integer")
+    if not lo <= n <= hi:
+        raise BadRequest(f"{name} must be between {lo} and {hi}")
+    return n
+
+
+def _players(params):
+    players = params.get('players')
+    if players is None or players == '':
+        return None
+    if players not in ('3', '4'):
+        raise BadRequest(f"players must be one of {', '.join(map(str, PLAYER_COUNTS))}")
+    return int(players)
+
+
+class CardService:
+    """Routing plus the response cache over one CardStore."""
+
+    def __init__(self, store, cache_size):
+        self.store = store
+        self.cache = LRUCache(cache_size)
+
+    def respond(self, target):
+        """Return (response, cache hit?) for a GET of ``target``."""
+        url = urlsplit(target)
+        pairs = sorted(parse_qsl(url.query, keep_blank_values=True))
+        # Re-encoded, so a decoded '&' or '=' cannot make two queries collide.
+        key = url.path + '?' + urlencode(pairs)
+        response = self.cache.get(key)
+        if response is not None:
+            return response, True
+        try:
+            status, payload = self.route(url.path, pairs)
+        except BadRequest as e:
+            status, payload = 400, {'error': str(e)}
+        response = Response(status, payload)
+        if status != 400:
+            self.cache.put(key, response)
+        return response, False
+
+    def route(self, path, pairs):
+        params = dict(pairs)
+        if path.startswith('/cards/') and len(path) > len('/cards/'):
+            record = self.store.get(unquote(path[len('/cards/'):]))
+            if record is None:
+                return 404, {'error': 'unknown card'}
+            return 200, record
+        if path == '/cards':
+            return 200, self.filter(pairs, params)
+        if path == '/search':
+            players = _players(params) or 4
+            limit = _int(params, 'limit', 10, 1, MAX_LIMIT)
+            return 200, {'cards': self.store.search(params.get('q', ''), limit=limit, players=players)}
+        if path == '/health':
+            return 200, {'cards': len(self.store)}
+        return 404, {'error': 'not found'}
+
+    def filter(self, pairs, params):
+        sort = params.get('sort') or 'rank'
+        descending = sort.startswith('-')
+        sort = sort.lstrip('-')
+        if sort not in SORT_FIELDS:
+            raise BadRequest(f"sort must be one of {', '.join(SORT_FIELDS)}")
+        banned = params.get('banned_4p')
+        if banned not in (None, '', 'true', 'false'):
+            raise BadRequest("banned_4p must be true or false")
+        offset = _int(params, 'offset', 0, 0, len(self.store))
+        limit = _int(params, 'limit', 50, 1, MAX_LIMIT)
+        total, page = self.store.filter(
+            types=[v for k, v in pairs if k == 'type'],
+            tags=[v for k, v in pairs if k == 'tag'],
+            banned_4p=None if not banned else banned == 'true',
+            players=_players(params),
+            sort=sort, descending=descending, offset=offset, limit=limit,
+        )
+        return {'total': total, 'offset': offset, 'cards': page}
+
+
+def _head(status, headers):
+    lines = [f"HTTP/1.1 {status} {REASONS[status]}"]
+    lines += [f"{k}: {v}" for k, v in headers]
+    return ('\r\n'.join(lines) + '\r\n\r\n').encode('latin-1')
+
+
+async def handle(service, reader, writer):
+    try:
+        while True:
+            try:
+                head = await reader.readuntil(b'\r\n\r\n')
+            except asyncio.LimitOverrunError:
+                writer.write(_head(431, [('Content-Length', '0'), ('Connection', 'close')]))
+                break
+            except asyncio.IncompleteReadError:
+                break
+            lines = head.decode('latin-1').split('\r\n')
+            try:
+                method, target, version = lines[0].split(' ')
+            except ValueError:
+                writer.write(_head(400, [('Content-Length', '0'), ('Connection', 'close')]))
+                break
+            headers = {}
+            for line in lines[1:]:
+                name, _, value = line.partition(':')
+                if name:
+                    headers[name.strip().lower()] = value.strip()
+            try:
+                length = int(headers.get('content-length') or 0)
+                if length < 0:
+                    raise ValueError(length)
+            except ValueError:
+                writer.write(_head(400, [('Content-Length', '0'), ('Connection', 'close')]))
+                break
+            if length:
+                await reader.readexactly(length)
+            connection = headers.get('connection', '').lower()
+            keep_alive = connection != 'close' if version == 'HTTP/1.1' else connection == 'keep-alive'
+
+            if method not in ('GET', 'HEAD'):
+                out = [('Allow', 'GET, HEAD'), ('Content-Length', '0')]
+                writer.write(_head(405, out))
+            else:
+                response, hit = service.respond(target)
+                out = [('Content-Type', 'application/json; charset=utf-8'),
+                       ('ETag', response.etag), ('Vary', 'Accept-Encoding'),
+                       ('X-Cache', 'hit' if hit else 'miss')]
+                if not keep_alive:
+                    out.append(('Connection', 'close'))
+                if response.status == 200 and headers.get('if-none-match') == response.etag:
+                    writer.write(_head(304, out))
+                else:
+                    body = response.body
+                    if response.gzip_body is not None and 'gzip' in headers.get('accept-encoding', ''):
+                        body = response.gzip_body
+                        out.append(('Content-Encoding', 'gzip'))
+                    out.append(('Content-Length', str(len(body))))
+                    writer.write(_head(response.status, out))
+                    if method == 'GET':
+                        writer.write(body)
+            await writer.drain()
+            if not keep_alive:
+                break
+    except (ConnectionError, asyncio.IncompleteReadError):
+        pass
+    finally:
+        writer.close()
+
+
+async def serve(service, host, port):
+    server = await asyncio.start_server(
+        lambda r, w: handle(service, r, w), host, port, limit=MAX_HEADER_BYTES,
+    )
+    addr = server.sockets[0].getsockname()
+    print(f"Serving {len(service.store)} cards on http://{addr[0]}:{addr[1]}", flush=True)
+    async with server:
+        await server.serve_forever()
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Serve card queries from in-memory indexes.")
+    parser.add_argument('--host', default='127.0.0.1')
+    parser.add_argument('--port', type=int, default=8765)
+    parser.add_argument('--cache-size', type=int, default=4096, help="cached responses (0 disables the cache)")
+    parser.add_argument('--cards', default=CARDS_JSON, help="card JSON to serve")
+    args = parser.parse_args(argv)
+
+    t0 = time.perf_counter()
+    records = load_cards(args.cards).records
+    stats = load_stats(records, cards_path=args.cards) if load_stats else None
+    store = CardStore(records, load_aliases(), stats)
+    print(f"Indexed {len(store)} cards in {1000 * (time.perf_counter() - t0):.0f} ms")
+    service = CardService(store, args.cache_size)
+    try:
+        asyncio.run(serve(service, args.host, args.port))
+    except KeyboardInterrupt:
+        pass
+    finally:
+        cache = service.cache
+        print(f"\nCache: {cache.hits} hits, {cache.misses} misses, {len(cache.entries)} entries")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
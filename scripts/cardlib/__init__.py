@@ -0,0 +1,78 @@
+"""
+Shared card-data helpers for the scripts in this directory.
+
+    from cardlib import load_cards, normalize
+
+    cards = load_cards()
+    card = cards.get("Basket Carrier")
+"""
+
+from . import trace
+from .cards import Card, CardIndex, load_aliases, load_cards
+from .fuzzy import FuzzyIndex
+from .normalize import normalize, normalize_image_name
+from .paths import (
+    ALIASES_JSON,
+    API_CARDS_BIN,
+    API_CARDS_JSON,
+    API_DATA_DIR,
+    CARD_BUNDLES_DIR,
+    CARD_BUNDLES_JSON,
+    CARD_STATS_BIN,
+    CARDS_BIN,
+    CARDS_JSON,
+    DATA_DIR,
+    DOC_INDEX_JSON,
+    IMAGES_DIR,
+    OCR_NAMES_JSON,
+    RANKING_HISTORY,
+    ROOT_DIR,
+    RULEBOOK_PDF,
+    SEARCH_INDEX_JSON,
+    STRATEGY_GUIDE_MD,
+    STRATEGY_INDEX_3P,
+    STRATEGY_INDEX_4P,
+    SURVIVAL_JSON,
+    SYNERGY_JSON,
+    TAG_OVERRIDES_JSON,
+    TAG_RULES_JSON,
+    TSV_3P,
+    TSV_4P,
+)
+
+__all__ = [
+    'ALIASES_JSON',
+    'API_CARDS_BIN',
+    'API_CARDS_JSON',
+    'API_DATA_DIR',
+    'CARD_BUNDLES_DIR',
+    'CARD_BUNDLES_JSON',
+    'CARD_STATS_BIN',
+    'CARDS_BIN',
+    'CARDS_JSON',
+    'Card',
+    'CardIndex',
+    'DATA_DIR',
+    'DOC_INDEX_JSON',
+    'FuzzyIndex',
+    'IMAGES_DIR',
+    'OCR_NAMES_JSON',
+    'RANKING_HISTORY',
+    'ROOT_DIR',
+    'RULEBOOK_PDF',
+    'SEARCH_INDEX_JSON',
+    'STRATEGY_GUIDE_MD',
+    'STRATEGY_INDEX_3P',
+    'STRATEGY_INDEX_4P',
+    'SURVIVAL_JSON',
+    'SYNERGY_JSON',
+    'TAG_OVERRIDES_JSON',
+    'TAG_RULES_JSON',
+    'TSV_3P',
+    'TSV_4P',
+    'load_aliases',
+    'load_cards',
+    'normalize',
+    'normalize_image_name',
+    'trace',
+]
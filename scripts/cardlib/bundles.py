@@ -0,0 +1,138 @@
+"""
+Field-projected, content-hashed card data bundles for the web page.
+
+index.html used to fetch all of agricola-cards.json before drawing the
+table, descriptions included. The bundles split the card list by field
+into groups, in card order:
+
+    core      name, type, card ID, passing/banned flags and every stat
+              column for 4p and 3p: what the table needs for first paint
+    tags      strategy tags (table dots and the strategy filter)
+    details   description, prerequisites, cost and VPs (the card view
+              and the prerequisites filter), split into shards of
+              ``shard_size`` cards so opening one card fetches one shard
+
+Each shard is a JSON document of rows rather than objects, so keys are
+not repeated per card:
+
+    {"group": "details", "start": 200, "fields": [...],
+     "nested": {"stats_3p": [...]}, "rows": [[...], ...]}
+
+Row ``i`` is card ``start + i``. A field listed in ``nested`` holds an
+array of the nested object's values in that order, or null. A field a
+card does not have is null, like an explicit null in the JSON.
+
+Shard files are named ``<group>-<n>.<content hash>.json`` and never
+change once written, so they can be cached indefinitely; the small
+manifest (data/card-bundles.json) names the current ones:
+
+    {"version": 1, "count": 808, "dir": "bundles",
+     "groups": [{"name": "core", "eager": true, "fields": [...],
+                 "shard_size": 808, "files": ["core-0.ab12cd34ef.json"]},
+                ...]}
+"""
+
+import hashlib
+import json
+
+VERSION = 1
+
+STAT_FIELDS = (
+    'rank', 'adp', 'apr', 'play_rate', 'elo_per_play', 'value', 'value_when_played',
+)
+
+# (name, fields, fetched before first paint)
+GROUPS = (
+    ('core', ('name', 'type', 'card_id', 'passing', 'banned_4p') + STAT_FIELDS + ('stats_3p',), True),
+    ('tags', ('tags',), False),
+    ('details', ('description', 'prerequisites', 'cost', 'vps'), False),
+)
+NESTED = {'stats_3p': STAT_FIELDS}
+
+# Groups small enough to fetch in one request regardless of shard size.
+UNSHARDED = ('core', 'tags')
+DEFAULT_SHARD_SIZE = 100
+
+HASH_CHARS = 10
+
+
+def _dumps(doc):
+    return json.dumps(doc, ensure_ascii=False, separators=(',', ':')).encode('utf-8')
+
+
+def _cell(card, field):
+    value = card.get(field)
+    keys = NESTED.get(field)
+    if keys is not None and value is not None:
+        return [value.get(k) for k in keys]
+    return value
+
+
+def project(card, fields):
+    """The card as a shard row over ``fields``."""
+    return [_cell(card, f) for f in fields]
+
+
+def _shard(name, fields, start, cards):
+    doc = {'group': name, 'start': start, 'fields': list(fields)}
+    nested = {f: list(NESTED[f]) for f in fields if f in NESTED}
+    if nested:
+        doc['nested'] = nested
+    doc['rows'] = [project(c, fields) for c in cards]
+    return _dumps(doc)
+
+
+def build_bundles(cards, shard_size=DEFAULT_SHARD_SIZE):
+    """Return (manifest, {file name: bytes}) for ``cards``."""
+    files = {}
+    groups = []
+    for name, fields, eager in GROUPS:
+        size = max(len(cards), 1) if name in UNSHARDED else shard_size
+        names = []
+        for n, start in enumerate(range(0, max(len(cards), 1), size)):
+            data = _shard(name, fields, start, cards[start:start + size])
+            digest = hashlib.sha256(data).hexdigest()[:HASH_CHARS]
+            file = f"{name}-{n}.{digest}.json"
+            files[file] = data
+            names.append(file)
+        groups.append({'name': name, 'eager': eager, 'fields': list(fields),
+                       'shard_size': size, 'files': names})
+    manifest = {'version': VERSION, 'count': len(cards), 'dir': 'bundles', 'groups': groups}
+    return manifest, files
+
+
+def decode(manifest, files):
+    """Rebuild the projected card records from a manifest and its shards.
+
+    Reference implementation of the loader in index.html; fields a card
+    lacked come back as None.
+    """
+    cards = [{} for _ in range(manifest['count'])]
+    for group in manifest['groups']:
+        for file in group['files']:
+            shard = json.loads(files[file])
+            nested = shard.get('nested', {})
+            for i, row in enumerate(shard['rows']):
+                card = cards[shard['start'] + i]
+                for field, value in zip(shard['fields'], row):
+                    keys = nested.get(field)
+                    card[field] = dict(zip(keys, value)) if keys and value is not None else value
+    return cards
+
+
+def bundled_fields():
+    return [f for _, fields, _ in GROUPS for f in fields]
+
+
+def expected(cards):
+    """What ``decode()`` should return for ``cards``: the bundled fields only."""
+    fields = bundled_fields()
+    out = []
+    for card in cards:
+        record = {}
+        for field in fields:
+            value = card.get(field)
+            keys = NESTED.get(field)
+            record[field] = {k: value.get(k) for k in keys} if keys and value is not None else value
+        out.append(record)
+    return out
@@ -0,0 +1,179 @@
+"""
+In-memory card indexes for the local query service (scripts/card_server.py).
+
+``CardStore`` is built once from the card records and answers every query
+from prebuilt structures instead of scanning the card list:
+
+    by_name     exact name -> card id (the first card of that name)
+    by_norm     normalized name -> card id (last one wins, as in CardIndex)
+    by_type     card type -> frozenset of ids
+    by_tag      strategy tag -> frozenset of ids
+    banned      banned_4p flag -> frozenset of ids
+    available   player count -> ids that have stats at that count
+                (4p: not banned_4p, 3p: has stats_3p)
+    orders      (player count, field, descending) -> every id sorted by
+                that stat, cards without it last either way
+
+A filtered, sorted page intersects the id sets smallest first, then walks
+the presorted order for the sort field and stops once the page is full,
+so no query sorts anything. Name search reuses the autocomplete index
+from cardlib.search_index.
+
+Given a cardlib.stats_store ``StatsStore`` (card_server.py passes the
+prebuilt data/card-stats.bin when numpy is installed), the stat orders
+come from its typed columns. Without one, the strings the card JSON
+stores ("1.55", "93%") are parsed to numbers once, here, for sorting.
+"""
+
+from .normalize import normalize
+from .search_index import build_search_index, query_rows, row_order
+
+PLAYER_COUNTS = (3, 4)
+STAT_FIELDS = (
+    'rank', 'adp', 'apr', 'play_rate', 'elo_per_play', 'value', 'value_when_played',
+)
+SORT_FIELDS = STAT_FIELDS + ('name',)
+
+
+def _number(value):
+    if value is None or value == '':
+        return None
+    if isinstance(value, (int, float)):
+        return value
+    try:
+        return float(str(value).rstrip('%'))
+    except ValueError:
+        return None
+
+
+def card_stats(record, players):
+    """The stats dict of ``record`` at ``players``, or None if it has none."""
+    if players == 3:
+        return record.get('stats_3p')
+    return None if record.get('banned_4p') else record
+
+
+class CardStore:
+    """Prebuilt lookups over one list of card records."""
+
+    def __init__(self, records, aliases=None, stats=None):
+        self.records = records
+        self.by_name = {}
+        self.by_norm = {}
+        by_type = {}
+        by_tag = {}
+        banned = {True: [], False: []}
+        for i, record in enumerate(records):
+            self.by_name.setdefault(record['name'], i)
+            self.by_norm[normalize(record['name'])] = i
+            by_type.setdefault(record.get('type') or '', []).append(i)
+            for tag in record.get('tags') or ():
+                by_tag.setdefault(tag, []).append(i)
+            banned[bool(record.get('banned_4p'))].append(i)
+        self.by_type = {k: frozenset(v) for k, v in by_type.items()}
+        self.by_tag = {k: frozenset(v) for k, v in by_tag.items()}
+        self.banned = {k: frozenset(v) for k, v in banned.items()}
+
+        self.available = {}
+        self.orders = {}
+        names = [r['name'] for r in records]
+        by_name = sorted(range(len(records)), key=lambda i: (names[i].lower(), i))
+        for players in PLAYER_COUNTS:
+            if stats is not None:
+                self._typed_orders(stats, players)
+            else:
+                self._parsed_orders(names, players)
+            self.orders[players, 'name', False] = by_name
+            self.orders[players, 'name', True] = by_name[::-1]
+
+        self.search_index, _ = build_search_index(records, aliases)
+        self.search_ids = row_order(records)
+
+    def _typed_orders(self, stats, players):
+        """Stat orders from a StatsStore's typed columns."""
+        self.available[players] = frozenset(stats.blocks[players].present.nonzero()[0].tolist())
+        for field in STAT_FIELDS:
+            for descending in (False, True):
+                self.orders[players, field, descending] = stats.order(field, players, descending).tolist()
+
+    def _parsed_orders(self, names, players):
+        """Stat orders from the records' stat strings."""
+        stats = [card_stats(r, players) for r in self.records]
+        self.available[players] = frozenset(i for i, s in enumerate(stats) if s is not None)
+        for field in STAT_FIELDS:
+            values = [_number(s.get(field)) if s else None for s in stats]
+            with_value = sorted(
+                (i for i, v in enumerate(values) if v is not None),
+                key=lambda i: (values[i], names[i]),
+            )
+            without = sorted((i for i, v in enumerate(values) if v is None), key=names.__getitem__)
+            self.orders[players, field, False] = with_value + without
+            self.orders[players, field, True] = with_value[::-1] + without
+
+    def __len__(self):
+        return len(self.records)
+
+    def get(self, name):
+        """The record for ``name``, or None.
+
+        An exact name wins, so "Greengrocer" never resolves to "Green
+        Grocer"; otherwise any spelling that normalizes the same matches.
+        """
+        i = self.by_name.get(name)
+        if i is None:
+            i = self.by_norm.get(normalize(name))
+        return None if i is None else self.records[i]
+
+    def select(self, types=(), tags=(), banned_4p=None, players=None):
+        """Ids matching every filter, or None for "all cards".
+
+        ``types`` matches any of the given types; ``tags`` requires all of
+        the given tags. ``players`` keeps only cards with stats at that count.
+        """
+        sets = []
+        if types:
+            sets.append(frozenset().union(*(self.by_type.get(t, frozenset()) for t in types)))
+        for tag in tags:
+            sets.append(self.by_tag.get(tag, frozenset()))
+        if banned_4p is not None:
+            sets.append(self.banned[bool(banned_4p)])
+        if players is not None:
+            sets.append(self.available[players])
+        if not sets:
+            return None
+        sets.sort(key=len)
+        return sets[0].intersection(*sets[1:])
+
+    def filter(self, types=(), tags=(), banned_4p=None, players=None,
+               sort='rank', descending=False, offset=0, limit=50):
+        """One page of matching records. Returns (total matches, records).
+
+        Sorting uses the stats for ``players`` (4 when not given);
+        cards without the sort stat always come last.
+        """
+        if sort not in SORT_FIELDS:
+            raise ValueError(f"unknown sort field: {sort}")
+        ids = self.select(types, tags, banned_4p, players)
+        total = len(self.records) if ids is None else len(ids)
+        order = self.orders[players or 4, sort, bool(descending)]
+        page = []
+        skipped = 0
+        for i in order:
+            if ids is not None and i not in ids:
+                continue
+            if skipped < offset:
+                skipped += 1
+                continue
+            page.append(self.records[i])
+            if len(page) >= limit:
+                break
+        return total, page
+
+    def search(self, text, limit=10, players=4):
+        """Records whose name, word or card ID matches ``text``, in rank order.
+
+        Index rows map straight to records, so two cards sharing a name
+        come back as two records rather than one of them twice.
+        """
+        rows = query_rows(self.search_index, text, limit=limit, player_count=players)
+        return [self.records[self.search_ids[r]] for r in rows]
@@ -0,0 +1,361 @@
+"""
+Compact columnar binary encoding of the card dataset.
+
+The file holds one column per field (``stats_3p`` sub-fields become
+``stats_3p.rank`` etc.), a deduplicated UTF-8 string table and a field
+table with each column's byte offset, so a reader can pull just the
+fields it needs. All integers are little-endian.
+
+Layout::
+
+    header      '<4sHHIIIIIII'  magic, version, reserved, n_rows,
+                                n_fields, n_layouts, n_strings,
+                                strings_off, fields_off, layouts_off
+    strings     u32[n_strings + 1] offsets, then the UTF-8 blob
+    fields      n_fields x '<IB3xII'  name string id, kind, data
+                                      offset, data length
+    layouts     u32[n_layouts + 1] offsets, then u16 field ids
+    columns     one block per field, each 4-byte aligned
+
+Key order matters to the JSON (records written by different scripts
+order their keys differently), so every object row stores a *layout* id:
+the ordered field ids present in that object. The root layout column
+is the ``@layout`` field. Encoding is lossless: ``decode(encode(cards))``
+returns records equal to ``cards``, key order included.
+
+Column kinds and their per-row data:
+
+    STR      u32 string id (NULL_ID for null)
+    INT      i32 (INT_NULL for null)
+    DEC      i32 mantissa[n] then u8 scale[n] (0xFF for null); used for
+             numeric strings such as "1.55" so they come back verbatim
+    BOOL     u8 (0xFF for null)
+    STRLIST  u32 offsets[n + 1] then u32 string ids
+    OBJ      u16 layout id (0xFFFF for null)
+    JSON     u32 string id of the JSON-encoded value, for anything else
+"""
+
+import json
+import mmap
+import re
+import struct
+
+MAGIC = b'AGCB'
+VERSION = 1
+
+HEADER = struct.Struct('<4sHHIIIIIII')
+FIELD = struct.Struct('<IB3xII')
+
+STR, INT, DEC, BOOL, STRLIST, OBJ, JSON = range(1, 8)
+KIND_NAMES = {
+    STR: 'str', INT: 'int', DEC: 'dec', BOOL: 'bool',
+    STRLIST: 'strlist', OBJ: 'obj', JSON: 'json',
+}
+
+NULL_ID = 0xFFFFFFFF
+INT_NULL = -2 ** 31
+SCALE_NULL = 0xFF
+BOOL_NULL = 0xFF
+LAYOUT_NULL = 0xFFFF
+
+ROOT = '@layout'
+
+# Placeholder for a key missing from an object; its layout already says so.
+_ABSENT = object()
+
+_DECIMAL_RE = re.compile(r'-?\d+(\.\d+)?')
+
+
+def _encode_decimal(s):
+    """Return (mantissa, scale) if ``s`` round-trips through DEC, else None."""
+    if not _DECIMAL_RE.fullmatch(s):
+        return None
+    whole, _, frac = s.partition('.')
+    mantissa = int(whole + frac) if not whole.startswith('-') else -int(whole[1:] + frac)
+    if not INT_NULL < mantissa < 2 ** 31 or _decode_decimal(mantissa, len(frac)) != s:
+        return None
+    return mantissa, len(frac)
+
+
+def _decode_decimal(mantissa, scale):
+    sign = '-' if mantissa < 0 else ''
+    digits = str(abs(mantissa))
+    if scale == 0:
+        return sign + digits
+    digits = digits.rjust(scale + 1, '0')
+    return f"{sign}{digits[:-scale]}.{digits[-scale:]}"
+
+
+def _column_kind(values):
+    """Pick the narrowest kind that holds every non-null value losslessly."""
+    present = [v for v in values if v is not None and v is not _ABSENT]
+    has_null = any(v is None for v in values)
+    if not present:
+        return STR
+    if all(isinstance(v, bool) for v in present):
+        return BOOL
+    if all(type(v) is int and INT_NULL < v < 2 ** 31 for v in present):
+        return INT
+    if all(isinstance(v, str) for v in present):
+        if all(_encode_decimal(v) is not None for v in present):
+            return DEC
+        return STR
+    if not has_null and all(
+        isinstance(v, list) and all(isinstance(x, str) for x in v) for v in present
+    ):
+        return STRLIST
+    if all(isinstance(v, dict) for v in present):
+        return OBJ
+    return JSON
+
+
+class _Writer:
+    def __init__(self):
+        self.strings = []
+        self.string_ids = {}
+        self.fields = []          # [name, kind, data]
+        self.field_ids = {}
+        self.layouts = []
+        self.layout_ids = {}
+
+    def sid(self, s):
+        i = self.string_ids.get(s)
+        if i is None:
+            i = self.string_ids[s] = len(self.strings)
+            self.strings.append(s)
+        return i
+
+    def layout(self, field_ids):
+        key = tuple(field_ids)
+        i = self.layout_ids.get(key)
+        if i is None:
+            i = self.layout_ids[key] = len(self.layouts)
+            self.layouts.append(key)
+        return i
+
+    def field_id(self, name):
+        i = self.field_ids.get(name)
+        if i is None:
+            i = self.field_ids[name] = len(self.fields)
+            self.fields.append([name, None, b''])
+        return i
+
+    def add_objects(self, name, objects):
+        """Encode a column of dicts (or None) and, recursively, their fields."""
+        n = len(objects)
+        fid = self.field_id(name)
+        prefix = '' if name == ROOT else name + '.'
+        keys = {}
+        objects = [None if obj is _ABSENT else obj for obj in objects]
+        for obj in objects:
+            if obj is not None:
+                for k in obj:
+                    keys.setdefault(k, None)
+        # Register sub-fields before building layouts so ids are stable.
+        sub_ids = {k: self.field_id(prefix + k) for k in keys}
+        layout_ids = [
+            LAYOUT_NULL if obj is None else self.layout(sub_ids[k] for k in obj)
+            for obj in objects
+        ]
+        self.fields[fid][1] = OBJ
+        self.fields[fid][2] = struct.pack(f'<{n}H', *layout_ids)
+        for k in keys:
+            values = [_ABSENT if obj is None else obj.get(k, _ABSENT) for obj in objects]
+            self.add_column(prefix + k, values)
+
+    def add_column(self, name, values):
+        n = len(values)
+        kind = _column_kind(values)
+        if kind == OBJ:
+            self.add_objects(name, values)
+            return
+        if kind == STRLIST:
+            values = [[] if v is _ABSENT else v for v in values]
+        else:
+            values = [None if v is _ABSENT else v for v in values]
+        if kind == STR:
+            data = struct.pack(f'<{n}I', *(NULL_ID if v is None else self.sid(v) for v in values))
+        elif kind == INT:
+            data = struct.pack(f'<{n}i', *(INT_NULL if v is None else v for v in values))
+        elif kind == DEC:
+            pairs = [(0, SCALE_NULL) if v is None else _encode_decimal(v) for v in values]
+            data = (struct.pack(f'<{n}i', *(m for m, _ in pairs))
+                    + struct.pack(f'<{n}B', *(s for _, s in pairs)))
+        elif kind == BOOL:
+            data = struct.pack(f'<{n}B', *(BOOL_NULL if v is None else int(v) for v in values))
+        elif kind == STRLIST:
+            offsets = [0]
+            ids = []
+            for v in values:
+                ids.extend(self.sid(x) for x in v)
+                offsets.append(len(ids))
+            data = struct.pack(f'<{n + 1}I', *offsets) + struct.pack(f'<{len(ids)}I', *ids)
+        else:
+            data = struct.pack(f'<{n}I', *(
+                NULL_ID if v is None else self.sid(json.dumps(v, ensure_ascii=False))
+                for v in values
+            ))
+        fid = self.field_id(name)
+        self.fields[fid][1] = kind
+        self.fields[fid][2] = data
+
+    def tobytes(self, n_rows):
+        # Field names go into the string table too.
+        name_ids = [self.sid(name) for name, _, _ in self.fields]
+
+        blob = bytearray()
+        offsets = [0]
+        for s in self.strings:
+            blob += s.encode('utf-8')
+            offsets.append(len(blob))
+        strings = struct.pack(f'<{len(offsets)}I', *offsets) + bytes(blob)
+
+        lay_offsets = [0]
+        lay_ids = []
+        for layout in self.layouts:
+            lay_ids.extend(layout)
+            lay_offsets.append(len(lay_ids))
+        layouts = (struct.pack(f'<{len(lay_offsets)}I', *lay_offsets)
+                   + struct.pack(f'<{len(lay_ids)}H', *lay_ids))
+
+        out = bytearray(HEADER.size)
+
+        def align():
+            out.extend(b'\0' * (-len(out) % 4))
+
+        strings_off = len(out)
+        out += strings
+        align()
+        fields_off = len(out)
+        out += b'\0' * (FIELD.size * len(self.fields))
+        layouts_off = len(out)
+        out += layouts
+        for fid, (_, kind, data) in enumerate(self.fields):
+            align()
+            FIELD.pack_into(out, fields_off + fid * FIELD.size,
+                            name_ids[fid], kind, len(out), len(data))
+            out += data
+        HEADER.pack_into(out, 0, MAGIC, VERSION, 0, n_rows, len(self.fields),
+                         len(self.layouts), len(self.strings),
+                         strings_off, fields_off, layouts_off)
+        return bytes(out)
+
+
+def encode(cards) -> bytes:
+    """Encode a list of card dicts."""
+    writer = _Writer()
+    writer.add_objects(ROOT, cards)
+    return writer.tobytes(len(cards))
+
+
+class CardBinary:
+    """Reader over an encoded buffer (bytes, or an mmap via ``open()``).
+
+    Only the header, field table and layouts are parsed up front;
+    columns and strings are decoded on first use.
+    """
+
+    def __init__(self, buf):
+        self.buf = buf
+        (magic, version, _, self.n_rows, n_fields, n_layouts, self.n_strings,
+         strings_off, fields_off, layouts_off) = HEADER.unpack_from(buf, 0)
+        n_strings = self.n_strings
+        if magic != MAGIC or version != VERSION:
+            raise ValueError(f"not a version {VERSION} card binary")
+        self._str_offsets = struct.unpack_from(f'<{n_strings + 1}I', buf, strings_off)
+        self._blob_off = strings_off + 4 * (n_strings + 1)
+        self._strings = {}
+
+        self.fields = {}
+        self.field_names = []
+        for fid in range(n_fields):
+            name_id, kind, off, length = FIELD.unpack_from(buf, fields_off + fid * FIELD.size)
+            name = self.string(name_id)
+            self.field_names.append(name)
+            self.fields[name] = (kind, off, length)
+
+        lay_offsets = struct.unpack_from(f'<{n_layouts + 1}I', buf, layouts_off)
+        lay_ids = struct.unpack_from(f'<{lay_offsets[-1]}H', buf, layouts_off + 4 * (n_layouts + 1))
+        self.layouts = [lay_ids[a:b] for a, b in zip(lay_offsets, lay_offsets[1:])]
+        self._columns = {}
+        self._rows = {}
+
+    @classmethod
+    def open(cls, path):
+        with open(path, 'rb') as f:
+            return cls(mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ))
+
+    def __len__(self):
+        return self.n_rows
+
+    def string(self, i):
+        s = self._strings.get(i)
+        if s is None:
+            a, b = self._str_offsets[i], self._str_offsets[i + 1]
+            s = self._strings[i] = bytes(self.buf[self._blob_off + a:self._blob_off + b]).decode('utf-8')
+        return s
+
+    def column(self, name) -> list:
+        """Decoded values of one field for every row (None for null/absent).
+
+        ``OBJ`` columns return layout ids; use ``records()`` for objects.
+        """
+        if name in self._columns:
+            return self._columns[name]
+        kind, off, _ = self.fields[name]
+        n, buf = self.n_rows, self.buf
+        if kind in (STR, JSON):
+            ids = struct.unpack_from(f'<{n}I', buf, off)
+            values = [None if i == NULL_ID else self.string(i) for i in ids]
+            if kind == JSON:
+                values = [None if v is None else json.loads(v) for v in values]
+        elif kind == INT:
+            values = [None if v == INT_NULL else v for v in struct.unpack_from(f'<{n}i', buf, off)]
+        elif kind == DEC:
+            mantissas = struct.unpack_from(f'<{n}i', buf, off)
+            scales = struct.unpack_from(f'<{n}B', buf, off + 4 * n)
+            values = [None if s == SCALE_NULL else _decode_decimal(m, s)
+                      for m, s in zip(mantissas, scales)]
+        elif kind == BOOL:
+            values = [None if v == BOOL_NULL else bool(v) for v in struct.unpack_from(f'<{n}B', buf, off)]
+        elif kind == STRLIST:
+            offsets = struct.unpack_from(f'<{n + 1}I', buf, off)
+            ids = struct.unpack_from(f'<{offsets[-1]}I', buf, off + 4 * (n + 1))
+            values = [[self.string(i) for i in ids[a:b]] for a, b in zip(offsets, offsets[1:])]
+        elif kind == OBJ:
+            values = list(struct.unpack_from(f'<{n}H', buf, off))
+        else:
+            raise ValueError(f"unknown column kind {kind} for {name!r}")
+        self._columns[name] = values
+        return values
+
+    def _objects(self, name):
+        """Rebuild every row of OBJ column ``name`` as a dict (or None)."""
+        if name in self._rows:
+            return self._rows[name]
+        layout_ids = self.column(name)
+        prefix = '' if name == ROOT else name + '.'
+        plans = {}
+        for lid in set(layout_ids) - {LAYOUT_NULL}:
+            plan = []
+            for fid in self.layouts[lid]:
+                field = self.field_names[fid]
+                if self.fields[field][0] == OBJ:
+                    values = self._objects(field)
+                else:
+                    values = self.column(field)
+                plan.append((field[len(prefix):], values))
+            plans[lid] = plan
+        rows = self._rows[name] = [
+            None if lid == LAYOUT_NULL else {key: values[r] for key, values in plans[lid]}
+            for r, lid in enumerate(layout_ids)
+        ]
+        return rows
+
+    def records(self) -> list[dict]:
+        """Rebuild the full list of card dicts, key order included."""
+        return self._objects(ROOT)
+
+
+def decode(buf) -> list[dict]:
+    return CardBinary(buf).records()
@@ -0,0 +1,120 @@
+"""
+Card dataset loading and the normalized-name index.
+
+``load_cards()`` parses ``agricola-cards.json`` once per process (the
+cache is keyed on the file's mtime and size, so a rewritten file is
+picked up again) and returns a ``CardIndex``. Each card gets a compact
+``Card`` record whose name is normalized exactly once at load time.
+"""
+
+import functools
+import json
+import os
+
+from . import trace
+from .normalize import normalize
+from .paths import ALIASES_JSON, CARDS_JSON
+
+
+class Card:
+    """Lightweight view of one card in the dataset.
+
+    ``record`` is the underlying JSON dict, so scripts that update the
+    dataset can mutate it in place and write ``CardIndex.records`` back.
+    """
+
+    __slots__ = ('index', 'name', 'norm', 'card_id', 'type', 'record')
+
+    def __init__(self, index, record):
+        self.index = index
+        self.name = record['name']
+        self.norm = normalize(self.name)
+        self.card_id = record.get('card_id', '')
+        self.type = record.get('type', '')
+        self.record = record
+
+    def __repr__(self):
+        return f"Card({self.index}, {self.name!r})"
+
+
+class CardIndex:
+    """All cards plus a prebuilt normalized-name -> card lookup.
+
+    A few distinct cards share a normalized name (e.g. "Greengrocer"
+    and "Green Grocer", or the two "Market Stall" entries). ``by_norm``
+    keeps the last one, matching how the scripts have always resolved
+    such names; ``groups`` keeps every card for reports that need to see
+    the collisions, and ``matching()`` resolves a name within them.
+    """
+
+    __slots__ = ('path', 'records', 'cards', 'by_norm', 'groups')
+
+    def __init__(self, records, path=None):
+        self.path = path
+        self.records = records
+        self.cards = [Card(i, r) for i, r in enumerate(records)]
+        self.by_norm = {}
+        self.groups = {}
+        for card in self.cards:
+            self.by_norm[card.norm] = card
+            self.groups.setdefault(card.norm, []).append(card)
+
+    def __len__(self):
+        return len(self.cards)
+
+    def __iter__(self):
+        return iter(self.cards)
+
+    def names(self) -> list[str]:
+        return [card.name for card in self.cards]
+
+    def get(self, name: str):
+        """Return the card matching ``name`` after normalization, or None."""
+        return self.by_norm.get(normalize(name))
+
+    def matching(self, name: str) -> list:
+        """Every card ``name`` refers to.
+
+        A name whose normalized form belongs to one card matches it
+        loosely, as ``get()`` does. Where several cards share that form,
+        only the ones named exactly ``name`` match, so "Green Grocer"
+        never resolves to "Greengrocer".
+        """
+        group = self.groups.get(normalize(name), [])
+        if len(group) > 1:
+            return [card for card in group if card.name == name]
+        return list(group)
+
+    def append(self, record):
+        """Add a new card record and index it."""
+        card = Card(len(self.cards), record)
+        self.records.append(record)
+        self.cards.append(card)
+        self.by_norm[card.norm] = card
+        self.groups.setdefault(card.norm, []).append(card)
+        return card
+
+
+@functools.lru_cache(maxsize=4)
+def _load(path, mtime_ns, size):
+    with trace.span('load_cards', path=os.path.basename(path)):
+        with open(path, 'r', encoding='utf-8') as f:
+            index = CardIndex(json.load(f), path=path)
+    trace.count('cards_loaded', len(index))
+    return index
+
+
+def load_cards(path: str = CARDS_JSON) -> CardIndex:
+    """Load (or reuse the already-loaded) card dataset at ``path``."""
+    path = os.path.abspath(path)
+    st = os.stat(path)
+    return _load(path, st.st_mtime_ns, st.st_size)
+
+
+def load_aliases(path: str = ALIASES_JSON) -> dict[str, str]:
+    """Alias -> canonical card name map, or {} if no alias file exists."""
+    try:
+        with open(path, 'r', encoding='utf-8') as f:
+            return json.load(f)
+    except FileNotFoundError:
+        return {}
@@ -0,0 +1,249 @@
+"""
+BM25 passage index over the strategy guide and the rulebook.
+
+The strategy function used to paste the whole guide into every prompt.
+This index splits the guide (by heading, then paragraph) and the
+rulebook text (by page, then sentence) into passages of roughly
+``CHUNK_WORDS`` words, so a request can send only the few passages that
+match the cards in play.
+
+Scoring is Okapi BM25 with each posting's term weight precomputed at
+build time and quantized to an integer *impact* (1-255); a query just
+adds up impacts, then multiplies by ``scale``. The artifact
+(api/data/doc-index.json):
+
+    {"version": 1, "k1": 1.2, "b": 0.75, "scale": 0.0123,
+     "stopwords": [...],
+     "sources": [{"name": "guide", "path": ..., "sha256": ...}, ...],
+     "chunks": [[source index, title, text], ...],
+     "postings": {term: [chunk delta, impact, chunk delta, impact, ...]}}
+
+Chunk ids in a posting list are delta-encoded (the first is absolute).
+Terms come from ``tokens()``: lowercase words minus stopwords, with
+plural endings stripped. ``search()`` and ``hand_query()`` are the
+reference implementations of the query side (api/strategy/index.js
+mirrors them).
+"""
+
+import heapq
+import math
+import re
+
+VERSION = 1
+K1 = 1.2
+B = 0.75
+CHUNK_WORDS = 120
+MAX_IMPACT = 255
+
+STOPWORDS = frozenset("""
+a about after all also an and any are as at be because been before being but by can
+could did do does each either for from had has have he her his how i if in into is it
+its just may more most much must no not of on once one only or other our out own per
+same she should so some such than that the their them then there these they this those
+through to too under until up very was we were what when where which while who whom
+why will with would you your
+""".split())
+
+_WORD_RE = re.compile(r"[a-z0-9]+")
+_SENTENCE_RE = re.compile(r'(?<=[.!?])\s+(?=[A-Z0-9"“(])')
+_HEADING_RE = re.compile(r'^(#{1,6})\s+(.*)$')
+
+
+def stem(word):
+    """Strip English plural endings: fields -> field, pastures -> pasture, berries -> berry."""
+    if len(word) > 4 and word.endswith('ies'):
+        return word[:-3] + 'y'
+    if len(word) > 4 and word.endswith('es') and word[-3] in 'sxz':
+        return word[:-2]
+    if len(word) > 3 and word.endswith('s') and not word.endswith('ss'):
+        return word[:-1]
+    return word
+
+
+def tokens(text):
+    """Index terms of ``text``, in order."""
+    return [stem(w) for w in _WORD_RE.findall(text.lower()) if w not in STOPWORDS]
+
+
+# --- Chunking ---------------------------------------------------------------
+
+def _pack(sentences, limit=CHUNK_WORDS):
+    """Group sentences into runs of about ``limit`` words."""
+    out = []
+    current = []
+    words = 0
+    for sentence in sentences:
+        n = len(sentence.split())
+        if current and words + n > limit:
+            out.append(' '.join(current))
+            current, words = [], 0
+        current.append(sentence)
+        words += n
+    if current:
+        out.append(' '.join(current))
+    return out
+
+
+def _sentences(paragraph):
+    return [s.strip() for s in _SENTENCE_RE.split(paragraph) if s.strip()]
+
+
+def chunk_markdown(text):
+    """(title, text) passages of a Markdown document.
+
+    Each heading starts a new passage; its title is the heading path
+    ("Part 2: Draft Strategy > Reading the Draft"). Paragraphs within a
+    section are packed together up to ``CHUNK_WORDS``; longer ones are
+    split between sentences.
+    """
+    path = []
+    passages = []
+    paragraphs = []
+
+    def flush():
+        if paragraphs:
+            title = ' > '.join(h for _, h in path[1:]) or (path[0][1] if path else '')
+            sentences = []
+            for paragraph in paragraphs:
+                if paragraph.startswith('- ') or '\n- ' in paragraph:
+                    sentences.append(paragraph)   # keep lists whole
+                else:
+                    sentences.extend(_sentences(paragraph))
+            passages.extend((title, body) for body in _pack(sentences))
+            paragraphs.clear()
+
+    block = []
+    for line in text.splitlines() + ['']:
+        m = _HEADING_RE.match(line)
+        if m or not line.strip():
+            if block:
+                paragraphs.append('\n'.join(block).strip())
+                block = []
+            if m:
+                flush()
+                level = len(m.group(1))
+                while path and path[-1][0] >= level:
+                    path.pop()
+                path.append((level, m.group(2).strip()))
+            continue
+        block.append(line.rstrip())
+    flush()
+    return passages
+
+
+def chunk_pages(pages, title='Rulebook'):
+    """(title, text) passages of extracted PDF pages, titled by page number.
+
+    Lines are joined (re-joining words hyphenated across a line break),
+    then split into sentences and packed like ``chunk_markdown()``.
+    """
+    passages = []
+    for number, page in enumerate(pages, start=1):
+        text = re.sub(r'-\n(?=[a-z])', '', page)
+        text = re.sub(r'\s+', ' ', text).strip()
+        if text:
+            passages.extend((f"{title} p. {number}", body) for body in _pack(_sentences(text)))
+    return passages
+
+
+# --- Index ------------------------------------------------------------------
+
+def build_index(sources, k1=K1, b=B):
+    """Build the artifact from ``sources``: [(name, path, sha256, [(title, text)])]."""
+    chunks = []
+    counts = []
+    for s, (_, _, _, passages) in enumerate(sources):
+        for title, text in passages:
+            chunks.append([s, title, text])
+            tf = {}
+            for term in tokens(title + ' ' + text):
+                tf[term] = tf.get(term, 0) + 1
+            counts.append(tf)
+
+    n = len(chunks)
+    lengths = [sum(tf.values()) for tf in counts]
+    avgdl = sum(lengths) / max(n, 1)
+    df = {}
+    for tf in counts:
+        for term in tf:
+            df[term] = df.get(term, 0) + 1
+
+    weights = {}
+    for c, tf in enumerate(counts):
+        norm = k1 * (1 - b + b * lengths[c] / avgdl)
+        for term, f in tf.items():
+            idf = math.log(1 + (n - df[term] + 0.5) / (df[term] + 0.5))
+            weights.setdefault(term, []).append((c, idf * f * (k1 + 1) / (f + norm)))
+
+    top = max((w for postings in weights.values() for _, w in postings), default=1.0)
+    scale = top / MAX_IMPACT
+    postings = {}
+    for term in sorted(weights):
+        flat = []
+        last = 0
+        for c, w in weights[term]:
+            flat += [c - last, max(1, round(w / scale))]
+            last = c
+        postings[term] = flat
+
+    return {
+        'version': VERSION,
+        'k1': k1,
+        'b': b,
+        'scale': scale,
+        'stopwords': sorted(STOPWORDS),
+        'sources': [{'name': name, 'path': path, 'sha256': digest} for name, path, digest, _ in sources],
+        'chunks': chunks,
+        'postings': postings,
+    }
+
+
+def search(index, query, k=5):
+    """Top ``k`` passages for ``query``: a string, or a {term: weight} map.
+
+    Returns [(score, chunk id)], best first.
+    """
+    if isinstance(query, str):
+        weights = {}
+        for term in tokens(query):
+            weights[term] = weights.get(term, 0) + 1
+    else:
+        weights = query
+    scores = {}
+    postings = index['postings']
+    for term, weight in weights.items():
+        flat = postings.get(term)
+        if flat is None:
+            continue
+        c = 0
+        for i in range(0, len(flat), 2):
+            c += flat[i]
+            scores[c] = scores.get(c, 0) + weight * flat[i + 1]
+    scale = index['scale']
+    return [(score * scale, c) for c, score in heapq.nlargest(k, scores.items(), key=lambda kv: (kv[1], -kv[0]))]
+
+
+# Relative weight of a hand's strategy tags, card names and description words.
+TAG_WEIGHT = 2.0
+NAME_WEIGHT = 1.0
+DESCRIPTION_WEIGHT = 0.5
+
+
+def hand_query(cards):
+    """{term: weight} for a list of card records (name, tags, description).
+
+    Repeated terms add up with diminishing returns (1 + log of the sum),
+    so one word common to every description does not drown the rest.
+    """
+    raw = {}
+
+    def add(text, weight):
+        for term in tokens(text):
+            raw[term] = raw.get(term, 0) + weight
+
+    for card in cards:
+        for tag in card.get('tags') or ():
+            add(tag, TAG_WEIGHT)
+        add(card.get('name') or '', NAME_WEIGHT)
+        add(card.get('description') or '', DESCRIPTION_WEIGHT)
+    return {term: 1 + math.log(w) if w > 1 else w for term, w in raw.items()}
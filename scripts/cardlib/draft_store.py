@@ -0,0 +1,380 @@
+"""
+Delta-based draft state store on SQLite.
+
+api/draft keeps one Azure Tables row per user holding the whole draft
+state (up to MAX_STATE_BYTES of JSON), and js/draft-sync.js PUTs all of
+it after every pick, though a pick changes only a few keys. This store
+accepts *deltas* instead, appends them to a per-user log, and folds the
+log into a snapshot every ``snapshot_every`` deltas. A read is the latest
+snapshot with the log tail after it replayed on top.
+
+A delta is a list of ops on the state object; ``path`` is a list of
+object keys from the root:
+
+    ["set", path, value]     set a key (creating parent objects)
+    ["del", path]            delete a key
+    ["push", path, [v, ...]] append values to a list
+    ["pull", path, [v, ...]] remove the first occurrence of each value
+
+``diff(old, new)`` produces the smallest such delta between two states,
+so a client that only has full states can still send deltas.
+
+Tables:
+
+    drafts   user, seq, snapshot_seq, snapshot JSON, lastModifiedAt,
+             clientId, schemaVersion (one row per active draft)
+    log      user, seq, ops JSON (deltas after the snapshot)
+    history  user, id, archivedAt, state, summaryMeta, schemaVersion
+
+Writes name the ``seq`` they were computed against; a delta based on a
+stale seq raises ``StaleDelta`` (the client should reload or send its
+full state), so two tabs cannot interleave deltas into a state neither
+of them had.
+"""
+
+import json
+import secrets
+import sqlite3
+
+SCHEMA_VERSION = 1
+MAX_STATE_BYTES = 64 * 1024
+MAX_DELTA_BYTES = 16 * 1024
+SNAPSHOT_EVERY = 16
+OPS = ('set', 'del', 'push', 'pull')
+REVERSE_TS_BASE = 9999999999999
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS drafts (
+    user TEXT PRIMARY KEY,
+    seq INTEGER NOT NULL,
+    snapshot_seq INTEGER NOT NULL,
+    snapshot TEXT NOT NULL,
+    last_modified_at INTEGER NOT NULL,
+    client_id TEXT NOT NULL,
+    schema_version INTEGER NOT NULL
+);
+CREATE TABLE IF NOT EXISTS log (
+    user TEXT NOT NULL,
+    seq INTEGER NOT NULL,
+    ops TEXT NOT NULL,
+    PRIMARY KEY (user, seq)
+) WITHOUT ROWID;
+CREATE TABLE IF NOT EXISTS history (
+    user TEXT NOT NULL,
+    id TEXT NOT NULL,
+    archived_at INTEGER NOT NULL,
+    state TEXT NOT NULL,
+    summary_meta TEXT NOT NULL,
+    schema_version INTEGER NOT NULL,
+    PRIMARY KEY (user, id)
+) WITHOUT ROWID;
+"""
+
+
+class StaleDelta(ValueError):
+    """A delta was computed against an older state than the stored one."""
+
+
+def encode(value) -> str:
+    return json.dumps(value, ensure_ascii=False, separators=(',', ':'))
+
+
+# --- Deltas -----------------------------------------------------------------
+
+def _parent(state, path, create):
+    node = state
+    for key in path[:-1]:
+        child = node.get(key)
+        if child is None and create:
+            child = node[key] = {}
+        if not isinstance(child, dict):
+            raise ValueError(f"no object at {'.'.join(path)}")
+        node = child
+    return node
+
+
+def apply_ops(state, ops):
+    """Apply a delta to ``state`` in place; ValueError if it does not fit."""
+    for op in ops:
+        if not isinstance(op, list) or len(op) < 2 or op[0] not in OPS:
+            raise ValueError(f"bad op {op!r}")
+        kind, path = op[0], op[1]
+        if (not isinstance(path, list) or not path
+                or not all(isinstance(key, str) for key in path)):
+            raise ValueError(f"bad path {path!r}")
+        if kind == 'del':
+            _parent(state, path, False).pop(path[-1], None)
+            continue
+        if len(op) != 3:
+            raise ValueError(f"{kind} needs a value")
+        value = op[2]
+        if kind == 'set':
+            _parent(state, path, True)[path[-1]] = value
+            continue
+        target = _parent(state, path, False).get(path[-1])
+        if not isinstance(target, list) or not isinstance(value, list):
+            raise ValueError(f"{kind} needs a list at {'.'.join(path)}")
+        if kind == 'push':
+            target.extend(value)
+        else:
+            for item in value:
+                try:
+                    target.remove(item)
+                except ValueError:
+                    raise ValueError(f"{item!r} not in {'.'.join(path)}") from None
+    return state
+
+
+def _pulled(old, new):
+    """Values removed from ``old`` to leave ``new`` (order kept), or None."""
+    removed = []
+    j = 0
+    for item in old:
+        if j < len(new) and item == new[j]:
+            j += 1
+        else:
+            removed.append(item)
+    return removed if j == len(new) else None
+
+
+def _pull_applies(old, removed, new):
+    """True if pulling ``removed`` from ``old`` (first occurrences) gives ``new``."""
+    rest = list(old)
+    for item in removed:
+        rest.remove(item)
+    return rest == new
+
+
+def diff(old, new, path=()):
+    """Ops turning ``old`` into ``new`` (both JSON objects)."""
+    ops = []
+    for key in old:
+        if key not in new:
+            ops.append(['del', [*path, key]])
+    for key, value in new.items():
+        at = [*path, key]
+        if key not in old:
+            ops.append(['set', at, value])
+            continue
+        before = old[key]
+        if before == value:
+            continue
+        if isinstance(before, dict) and isinstance(value, dict):
+            ops.extend(diff(before, value, at))
+            continue
+        best = ['set', at, value]
+        if isinstance(before, list) and isinstance(value, list):
+            candidates = []
+            if value[:len(before)] == before:
+                candidates.append(['push', at, value[len(before):]])
+            removed = _pulled(before, value)
+            if removed is not None and _pull_applies(before, removed, value):
+                candidates.append(['pull', at, removed])
+            for op in candidates:
+                if len(encode(op)) < len(encode(best)):
+                    best = op
+        ops.append(best)
+    return ops
+
+
+# --- Store ------------------------------------------------------------------
+
+def _reverse_ts(ts):
+    return str(REVERSE_TS_BASE - ts).rjust(13, '0')
+
+
+class Draft:
+    """An active draft as read back from the store."""
+
+    __slots__ = ('state', 'seq', 'last_modified_at', 'client_id', 'schema_version')
+
+    def __init__(self, state, seq, last_modified_at, client_id, schema_version):
+        self.state = state
+        self.seq = seq
+        self.last_modified_at = last_modified_at
+        self.client_id = client_id
+        self.schema_version = schema_version
+
+
+class DraftStore:
+    """Active drafts (snapshot + delta log) and archived history in one SQLite file.
+
+    ``path`` may be ':memory:'. The latest state of every draft written
+    through this store is kept in memory, so appending a delta does not
+    re-read the snapshot; the database stays the source of truth.
+    """
+
+    __slots__ = ('db', 'snapshot_every', 'max_state_bytes', 'hot',
+                 'bytes_written', 'snapshots')
+
+    def __init__(self, path=':memory:', snapshot_every=SNAPSHOT_EVERY,
+                 max_state_bytes=MAX_STATE_BYTES):
+        self.db = sqlite3.connect(path, isolation_level=None, check_same_thread=False)
+        if path != ':memory:':
+            self.db.execute('PRAGMA journal_mode=WAL')
+            self.db.execute('PRAGMA synchronous=NORMAL')
+        self.db.executescript(SCHEMA)
+        self.snapshot_every = snapshot_every
+        self.max_state_bytes = max_state_bytes
+        self.hot = {}   # user -> (seq, state)
+        # Bytes of JSON written into rows, and snapshots taken, for reporting.
+        self.bytes_written = 0
+        self.snapshots = 0
+
+    def close(self):
+        self.db.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def _snapshot_blob(self, state):
+        blob = encode(state)
+        if len(blob.encode('utf-8')) > self.max_state_bytes:
+            raise ValueError("state too large")
+        return blob
+
+    # Active draft ------------------------------------------------------
+
+    def get(self, user):
+        """The user's active ``Draft``, or None."""
+        row = self.db.execute(
+            'SELECT seq, snapshot_seq, snapshot, last_modified_at, client_id, schema_version '
+            'FROM drafts WHERE user = ?', (user,)).fetchone()
+        if row is None:
+            return None
+        seq, snapshot_seq, snapshot, last_modified_at, client_id, schema_version = row
+        state = json.loads(snapshot)
+        for (ops,) in self.db.execute(
+                'SELECT ops FROM log WHERE user = ? AND seq > ? ORDER BY seq', (user, snapshot_seq)):
+            apply_ops(state, json.loads(ops))
+        return Draft(state, seq, last_modified_at, client_id, schema_version)
+
+    def _current(self, user):
+        hot = self.hot.get(user)
+        if hot is not None:
+            return hot
+        draft = self.get(user)
+        return None if draft is None else (draft.seq, draft.state)
+
+    def put(self, user, state, last_modified_at, client_id='', schema_version=SCHEMA_VERSION):
+        """Replace the active draft with a full ``state`` (the old PUT). Returns the new seq."""
+        blob = self._snapshot_blob(state)
+        with self.db:
+            self.db.execute('BEGIN IMMEDIATE')
+            row = self.db.execute('SELECT seq FROM drafts WHERE user = ?', (user,)).fetchone()
+            seq = row[0] + 1 if row else 1
+            self.db.execute('DELETE FROM log WHERE user = ?', (user,))
+            self.db.execute(
+                'INSERT OR REPLACE INTO drafts VALUES (?, ?, ?, ?, ?, ?, ?)',
+                (user, seq, seq, blob, last_modified_at, client_id, schema_version))
+        self.bytes_written += len(blob)
+        self.hot[user] = (seq, json.loads(blob))
+        return seq
+
+    def append(self, user, base_seq, ops, last_modified_at, client_id=''):
+        """Apply a delta computed against ``base_seq``. Returns the new seq.
+
+        Raises StaleDelta if the stored draft is not at ``base_seq``
+        (or does not exist), ValueError if the delta is malformed or
+        does not apply.
+        """
+        blob = encode(ops)
+        if len(blob.encode('utf-8')) > MAX_DELTA_BYTES:
+            raise ValueError("delta too large")
+        try:
+            with self.db:
+                self.db.execute('BEGIN IMMEDIATE')
+                row = self.db.execute(
+                    'SELECT seq, snapshot_seq FROM drafts WHERE user = ?', (user,)).fetchone()
+                if row is None or row[0] != base_seq:
+                    raise StaleDelta(f"draft is at seq {row[0] if row else 0}, not {base_seq}")
+                seq, snapshot_seq = row
+                current = self._current(user)
+                if current is None or current[0] != seq:
+                    self.hot.pop(user, None)
+                    current = self._current(user)
+                state = apply_ops(current[1], ops)
+                seq += 1
+                if seq - snapshot_seq >= self.snapshot_every:
+                    snapshot = self._snapshot_blob(state)
+                    self.db.execute('DELETE FROM log WHERE user = ?', (user,))
+                    self.db.execute(
+                        'UPDATE drafts SET seq = ?, snapshot_seq = ?, snapshot = ?, '
+                        'last_modified_at = ?, client_id = ? WHERE user = ?',
+                        (seq, seq, snapshot, last_modified_at, client_id, user))
+                    self.bytes_written += len(snapshot)
+                    self.snapshots += 1
+                else:
+                    self.db.execute('INSERT INTO log VALUES (?, ?, ?)', (user, seq, blob))
+                    self.db.execute(
+                        'UPDATE drafts SET seq = ?, last_modified_at = ?, client_id = ? WHERE user = ?',
+                        (seq, last_modified_at, client_id, user))
+                    self.bytes_written += len(blob)
+        except BaseException:
+            # The cached state may hold half-applied ops; the database rolled back.
+            self.hot.pop(user, None)
+            raise
+        self.hot[user] = (seq, state)
+        return seq
+
+    def compact(self, user):
+        """Fold the user's log into a fresh snapshot now."""
+        with self.db:
+            # Read under the write lock so no delta lands between the read
+            # and the rewrite; the log is only trimmed once the snapshot
+            # row is known to be at the seq that was read.
+            self.db.execute('BEGIN IMMEDIATE')
+            draft = self.get(user)
+            if draft is None:
+                return
+            snapshot = self._snapshot_blob(draft.state)
+            updated = self.db.execute(
+                'UPDATE drafts SET snapshot_seq = ?, snapshot = ? WHERE user = ? AND seq = ?',
+                (draft.seq, snapshot, user, draft.seq)).rowcount
+            if updated != 1:
+                return
+            self.db.execute('DELETE FROM log WHERE user = ? AND seq <= ?', (user, draft.seq))
+        self.bytes_written += len(snapshot)
+        self.snapshots += 1
+
+    def delete(self, user):
+        with self.db:
+            self.db.execute('BEGIN IMMEDIATE')
+            self.db.execute('DELETE FROM log WHERE user = ?', (user,))
+            self.db.execute('DELETE FROM drafts WHERE user = ?', (user,))
+        self.hot.pop(user, None)
+
+    # History -----------------------------------------------------------
+
+    def archive(self, user, state, summary_meta, archived_at, schema_version=SCHEMA_VERSION):
+        """Store a finished draft; returns its id (newest ids sort first)."""
+        blob = self._snapshot_blob(state)
+        entry_id = f"hist_{_reverse_ts(archived_at)}_{secrets.token_hex(3)}"
+        with self.db:
+            self.db.execute('INSERT INTO history VALUES (?, ?, ?, ?, ?, ?)',
+                            (user, entry_id, archived_at, blob, encode(summary_meta), schema_version))
+        return entry_id
+
+    def history(self, user):
+        """[(id, archivedAt, summaryMeta)], newest first."""
+        return [(entry_id, archived_at, json.loads(meta)) for entry_id, archived_at, meta in self.db.execute(
+            'SELECT id, archived_at, summary_meta FROM history WHERE user = ? ORDER BY id', (user,))]
+
+    def history_entry(self, user, entry_id):
+        """(archivedAt, state, summaryMeta, schemaVersion), or None."""
+        row = self.db.execute(
+            'SELECT archived_at, state, summary_meta, schema_version FROM history '
+            'WHERE user = ? AND id = ?', (user, entry_id)).fetchone()
+        if row is None:
+            return None
+        return row[0], json.loads(row[1]), json.loads(row[2]), row[3]
+
+    def size(self):
+        """Bytes of JSON currently stored for active drafts (snapshots + log)."""
+        snapshots = self.db.execute('SELECT COALESCE(SUM(LENGTH(snapshot)), 0) FROM drafts').fetchone()[0]
+        log = self.db.execute('SELECT COALESCE(SUM(LENGTH(ops)), 0) FROM log').fetchone()[0]
+        return snapshots + log
+
@@ -0,0 +1,199 @@
+"""
+Monte Carlo simulation of the 10-card, 7-pick draft.
+
+Every simulated draft deals each player a hand of HAND_SIZE occupations
+and HAND_SIZE minor improvements. Each round every player takes one card
+of each type from the hand they hold and passes it on, so a hand comes
+back to you after ``players`` rounds with ``players - 1`` opponent picks
+taken out of it.
+
+Picks follow a Plackett-Luce model on average draft position: a drafter
+takes the card maximising ``-adp / temperature + Gumbel noise``, so the
+lowest-ADP card is the most likely pick but not a certainty. Cards with
+no ADP for the player count are treated as LAST_ADP. With the default
+TEMPERATURE the simulated mean pick position of each occupation lands
+within about a quarter pick of its real ADP.
+
+``simulate()`` runs whole drafts in batches of ``batch`` as NumPy array
+operations, spread over a process pool. Each batch draws from its own
+child of ``numpy.random.SeedSequence(seed)``, so the counts (and the
+tables built from them) depend only on the seed, draft count and batch
+size, never on the number of workers.
+
+Requires numpy.
+"""
+
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+
+HAND_SIZE = 10
+PICKS = 7
+LAST_ADP = float(PICKS)
+TEMPERATURE = 0.75
+CARD_TYPES = ('Occupation', 'Minor Improvement')
+
+
+def returning_rounds(players: int) -> list[int]:
+    """Rounds whose hand comes back to the same player later in the draft."""
+    return [r for r in range(1, PICKS + 1) if r + players <= PICKS]
+
+
+def hand_size(round_num: int) -> int:
+    return HAND_SIZE - (round_num - 1)
+
+
+def _adp(card, players):
+    stats = card if players == 4 else (card.get('stats_3p') or {})
+    try:
+        return float(stats.get('adp'))
+    except (TypeError, ValueError):
+        return LAST_ADP
+
+
+def card_pools(cards, players: int):
+    """Per type: (names, adp array) of the cards that can be dealt.
+
+    Duplicate names keep the first record, as the draft tool does.
+    """
+    pools = {}
+    seen = set()
+    for card_type in CARD_TYPES:
+        names, adps = [], []
+        for card in cards:
+            if card.get('type') != card_type or card['name'] in seen:
+                continue
+            seen.add(card['name'])
+            names.append(card['name'])
+            adps.append(_adp(card, players))
+        pools[card_type] = (names, np.array(adps, dtype=np.float64))
+    return pools
+
+
+def _run_batch(args):
+    """Simulate ``n`` drafts of one card type; runs in a worker process.
+
+    Returns ``(seen, kept)``, each shaped (len(rounds), N): how often each
+    card was left in a hand after the holder's pick in that round, and how
+    often it was still there when the hand came back.
+    """
+    seed_seq, n, utility, players, rounds = args
+    rng = np.random.default_rng(seed_seq)
+    n_cards = len(utility)
+    dealt = players * HAND_SIZE
+
+    keys = rng.random((n, n_cards))
+    hands = np.argpartition(keys, dealt - 1, axis=1)[:, :dealt].reshape(n, players, HAND_SIZE)
+    base = utility[hands]
+
+    alive = np.ones(hands.shape, dtype=bool)
+    after_pick = []
+    for _ in range(PICKS):
+        scores = np.where(alive, base + rng.gumbel(size=hands.shape), -np.inf)
+        pick = scores.argmax(axis=2)
+        np.put_along_axis(alive, pick[..., None], False, axis=2)
+        after_pick.append(alive.copy())
+
+    seen = np.empty((len(rounds), n_cards), dtype=np.int64)
+    kept = np.empty((len(rounds), n_cards), dtype=np.int64)
+    for i, r in enumerate(rounds):
+        # after_pick[r - 1]: left in the hand once its holder picked in round r;
+        # after_pick[r + players - 2]: still there at the start of round r + players.
+        seen[i] = np.bincount(hands[after_pick[r - 1]], minlength=n_cards)
+        kept[i] = np.bincount(hands[after_pick[r + players - 2]], minlength=n_cards)
+    return seen, kept
+
+
+def simulate(adp, players: int, drafts: int, seed=0, batch: int = 20000,
+             temperature: float = TEMPERATURE, jobs=None):
+    """Survival counts for one card type over ``drafts`` simulated drafts.
+
+    ``seed`` is anything ``numpy.random.SeedSequence`` accepts. Returns
+    ``(seen, kept)`` int arrays shaped (len(returning_rounds), N).
+    """
+    if len(adp) < players * HAND_SIZE:
+        raise ValueError(f"need at least {players * HAND_SIZE} cards, got {len(adp)}")
+    rounds = returning_rounds(players)
+    utility = -np.asarray(adp, dtype=np.float64) / temperature
+    sizes = [batch] * (drafts // batch)
+    if drafts % batch:
+        sizes.append(drafts % batch)
+    children = np.random.SeedSequence(seed).spawn(len(sizes))
+    tasks = [(child, size, utility, players, rounds) for child, size in zip(children, sizes)]
+
+    if jobs == 1:
+        results = list(map(_run_batch, tasks))
+    else:
+        with ProcessPoolExecutor(max_workers=jobs) as pool:
+            results = list(pool.map(_run_batch, tasks))
+    seen = sum(s for s, _ in results)
+    kept = sum(k for _, k in results)
+    return seen, kept
+
+
+def survival_table(cards, players: int, drafts: int, seed: int = 0, batch: int = 20000,
+                   temperature: float = TEMPERATURE, min_samples: int = 200, decimals: int = 3, jobs=None):
+    """Compact survival-probability table for one player count.
+
+    ``cards`` maps each card name to one probability per returning round:
+    the chance it is still in the hand when the hand comes back, given it
+    was left in the hand that round. Entries seen fewer than
+    ``min_samples`` times are None.
+    """
+    rounds = returning_rounds(players)
+    table = {
+        'rounds': rounds,
+        'hand_sizes': [hand_size(r) for r in rounds],
+        'return_rounds': [r + players for r in rounds],
+        'cards': {},
+    }
+    for type_index, (names, adp) in enumerate(card_pools(cards, players).values()):
+        seen, kept = simulate(adp, players, drafts, seed=[seed, players, type_index], batch=batch,
+                              temperature=temperature, jobs=jobs)
+        with np.errstate(invalid='ignore', divide='ignore'):
+            prob = np.round(kept / seen, decimals)
+        for j, name in enumerate(names):
+            table['cards'][name] = [
+                float(prob[i, j]) if seen[i, j] >= min_samples else None
+                for i in range(len(rounds))
+            ]
+    return table
+
+
+def record_draft(pools, players: int, rng, temperature: float = TEMPERATURE):
+    """Deal and play one draft, recorded as draft.html records it for seat 0.
+
+    ``pools`` is ``card_pools()`` output and ``rng`` a numpy Generator.
+    Seat ``s`` receives in round ``r + s`` the hand seat 0 held in round
+    ``r``. Returns ``(state, taken)``: the draft state ({"playerCount",
+    "hands", "draftedCards", "othersDrafted"}; a returning round's hand
+    is the previous visit's hand less your picks, and the cards opponents
+    took in between are appended to othersDrafted when the hand comes
+    back) and ``taken[round][seat]``, the names each seat picked.
+    """
+    hands = {}   # card type -> per-hand lists of pool indices
+    for card_type, (names, _) in pools.items():
+        dealt = rng.choice(len(names), size=(players, HAND_SIZE), replace=False)
+        hands[card_type] = [list(row) for row in dealt]
+    state = {'playerCount': players, 'hands': {}, 'draftedCards': {}, 'othersDrafted': []}
+    taken = {}
+    for r in range(1, PICKS + 1):
+        h = (r - 1) % players
+        if r > players:
+            seen = state['hands'][str(r - players)]
+            mine = state['draftedCards'][str(r - players)].values()
+            state['hands'][str(r)] = [n for n in seen if n not in mine]
+            names = {pools[t][0][i] for t in pools for i in hands[t][h]}
+            state['othersDrafted'] += [n for n in state['hands'][str(r)]
+                                       if n not in names and n not in state['othersDrafted']]
+        else:
+            state['hands'][str(r)] = [pools[t][0][i] for t in pools for i in hands[t][h]]
+        taken[r] = {}
+        for card_type, (names, adp) in pools.items():
+            for seat in range(players):
+                hand = hands[card_type][(r - 1 - seat) % players]
+                noise = rng.gumbel(size=len(hand))
+                pick = names[hand.pop(int(np.argmax(-adp[hand] / temperature + noise)))]
+                taken[r].setdefault(seat, []).append(pick)
+        state['draftedCards'][str(r)] = {'occupation': taken[r][0][0], 'minor': taken[r][0][1]}
+    return state, taken
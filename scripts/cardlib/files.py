@@ -0,0 +1,118 @@
+"""
+Atomic output writes for the data scripts.
+
+Every output is written to a temporary file in the destination directory
+and moved into place with ``os.replace``, so a reader (the dev server, the
+API function, a concurrent script) sees either the old file or the new
+one, never a truncated one. ``write_card_json()`` serializes the card list
+once and installs the same bytes as both ``data/`` and ``api/data/``
+copies, so the two can no longer drift apart. ``file_digest()`` is the
+content hash the image scripts cache their results by.
+"""
+
+import hashlib
+import io
+import json
+import os
+import tempfile
+
+from .paths import API_CARDS_JSON, CARDS_JSON
+
+
+def dump_cards(cards) -> bytes:
+    """The canonical agricola-cards.json serialization.
+
+    Streams through ``json.dump`` rather than ``json.dumps``, which
+    collects every indent chunk in a list first and peaks at several
+    times the output size.
+    """
+    buf = io.BytesIO()
+    text = io.TextIOWrapper(buf, encoding='utf-8', newline='')
+    json.dump(cards, text, indent=2, ensure_ascii=False)
+    text.flush()
+    data = buf.getvalue()
+    text.detach()
+    return data
+
+
+def file_digest(path) -> str:
+    """Hex SHA-256 of a file's contents, read in 1 MB chunks."""
+    h = hashlib.sha256()
+    with open(path, 'rb') as f:
+        for chunk in iter(lambda: f.read(1 << 20), b''):
+            h.update(chunk)
+    return h.hexdigest()
+
+
+def _stage(path, data):
+    """Write ``data`` to a temp file next to ``path``; return its name."""
+    directory, name = os.path.split(path)
+    fd, tmp = tempfile.mkstemp(prefix=f'.{name}.', suffix='.tmp', dir=directory)
+    try:
+        with os.fdopen(fd, 'wb') as f:
+            f.write(data)
+            f.flush()
+            os.fsync(f.fileno())
+        try:
+            mode = os.stat(path).st_mode & 0o777
+        except FileNotFoundError:
+            mode = 0o644
+        os.chmod(tmp, mode)
+    except BaseException:
+        os.unlink(tmp)
+        raise
+    return tmp
+
+
+def _holds(path, data):
+    """True if ``path`` already contains exactly ``data``."""
+    try:
+        if os.path.getsize(path) != len(data):
+            return False
+        view = memoryview(data)
+        with open(path, 'rb') as f:
+            for start in range(0, len(data), 1 << 16):
+                if f.read(1 << 16) != view[start:start + (1 << 16)]:
+                    return False
+        return True
+    except FileNotFoundError:
+        return False
+
+
+def write_atomic(path, data: bytes):
+    """Replace ``path`` with ``data`` atomically."""
+    os.replace(_stage(path, data), path)
+
+
+def write_if_changed(path, data: bytes):
+    """Atomically write ``data`` to ``path`` unless it already holds exactly that."""
+    if _holds(path, data):
+        return False
+    write_atomic(path, data)
+    return True
+
+
+def write_copies(paths, data: bytes):
+    """Install the same ``data`` at every path in ``paths``.
+
+    All temp files are written before any is moved into place, so the
+    copies are swapped in together. Paths that already hold ``data`` are
+    left alone. Returns the paths that were written.
+    """
+    staged = []
+    try:
+        for path in paths:
+            if not _holds(path, data):
+                staged.append((_stage(path, data), path))
+    except BaseException:
+        for tmp, _ in staged:
+            os.unlink(tmp)
+        raise
+    for tmp, path in staged:
+        os.replace(tmp, path)
+    return [path for _, path in staged]
+
+
+def write_card_json(cards, paths=(CARDS_JSON, API_CARDS_JSON)):
+    """Write the card list to both JSON copies. Returns the paths written."""
+    return write_copies(paths, dump_cards(cards))
@@ -0,0 +1,150 @@
+"""
+Indexed fuzzy name matching.
+
+``FuzzyIndex`` replaces the all-pairs ``SequenceMatcher`` loop: names are
+blocked by a character-trigram inverted index, so a query is only scored
+against names that share trigrams with it. Scores are plain
+``SequenceMatcher(None, query, name).ratio()`` values, the same ratio
+the scripts have always used, with the indexed name as the second
+sequence.
+
+    index = FuzzyIndex(["basketcarrier", "cesspit"])
+    index.search("basketcarier", k=1, cutoff=0.85)
+    # -> [("basketcarrier", 0.96)]
+"""
+
+import heapq
+import math
+from collections import defaultdict
+from difflib import SequenceMatcher
+
+
+def trigrams(s: str) -> set[str]:
+    """Character trigrams of ``s``, padded so short names still get some."""
+    padded = f"  {s} "
+    return {padded[i:i + 3] for i in range(len(padded) - 2)}
+
+
+def min_shared(qgram_count: int, qlen: int, klen: int, cutoff: float) -> int:
+    """Trigrams a key of length ``klen`` must share with the query to reach ``cutoff``.
+
+    ratio() is 2 * M / (qlen + klen) for M matched characters, so reaching
+    ``cutoff`` takes M >= cutoff * (qlen + klen) / 2. Every trigram of the
+    padded query whose characters all sit inside one matching block is
+    also a trigram of the key. The others each contain an unmatched query
+    character (at most three per character, qlen - M of them) or span a
+    gap on the key's side only (at most two per gap, and there are at
+    most klen - M gaps). Losing a trigram position loses at most one of
+    the query's distinct trigrams, so a key reaching ``cutoff`` shares at
+    least the returned number of them. Zero or less means trigrams cannot
+    rule the key out.
+    """
+    matched = math.ceil(cutoff * (qlen + klen) / 2 - 1e-9)
+    return qgram_count - 3 * (qlen - matched) - 2 * (klen - matched)
+
+
+class FuzzyIndex:
+    """Trigram inverted index over a fixed list of (already normalized) keys.
+
+    ``values`` defaults to the keys themselves; pass e.g. display names to
+    get them back from ``search()`` instead.
+    """
+
+    __slots__ = ('keys', 'values', 'grams', 'postings', 'lengths', 'comparisons')
+
+    def __init__(self, keys, values=None):
+        self.keys = list(keys)
+        self.values = list(values) if values is not None else self.keys
+        if len(self.values) != len(self.keys):
+            raise ValueError("keys and values must have the same length")
+        self.grams = [frozenset(trigrams(key)) for key in self.keys]
+        self.postings = defaultdict(list)
+        for i, grams in enumerate(self.grams):
+            for gram in grams:
+                self.postings[gram].append(i)
+        self.lengths = sorted({len(key) for key in self.keys})
+        # Number of full ratio() computations performed, for reporting.
+        self.comparisons = 0
+
+    def __len__(self):
+        return len(self.keys)
+
+    def candidates(self, query: str, cutoff: float = 0.0) -> list[int]:
+        """Indexes of keys worth scoring against ``query``, most similar first.
+
+        Keys whose length alone rules out ``cutoff`` are dropped, since
+        ratio() can never exceed 2 * min(len) / (len(a) + len(b)), and so
+        are keys sharing fewer trigrams with the query than
+        ``min_shared()`` allows for their length. Only the postings of the
+        query's rarest trigrams are scanned: any key reaching the smallest
+        of those thresholds has to appear in one of them. Short queries
+        and low cutoffs, where no threshold is positive, scan every key,
+        so the result never misses a key that brute force would score
+        at or above ``cutoff``.
+        """
+        qgrams = trigrams(query)
+        qlen = len(query)
+
+        def long_enough(klen):
+            return 2.0 * min(qlen, klen) >= cutoff * (qlen + klen)
+
+        lengths = [klen for klen in self.lengths if long_enough(klen)]
+        if not lengths:
+            return []
+        need = min(min_shared(len(qgrams), qlen, klen, cutoff) for klen in lengths)
+        postings = self.postings
+        if need > 0:
+            ordered = sorted(qgrams, key=lambda g: len(postings.get(g, ())))
+            seen = set()
+            for gram in ordered[:len(ordered) - need + 1]:
+                seen.update(postings.get(gram, ()))
+        else:
+            seen = range(len(self.keys))
+
+        keys = self.keys
+        grams = self.grams
+        out = []
+        for i in seen:
+            klen = len(keys[i])
+            if not long_enough(klen):
+                continue
+            shared = len(qgrams & grams[i])
+            if shared >= min_shared(len(qgrams), qlen, klen, cutoff):
+                out.append((-shared, i))
+        out.sort()
+        return [i for _, i in out]
+
+    def search(self, query: str, k: int = 1, cutoff: float = 0.0):
+        """Return up to ``k`` ``(value, ratio)`` pairs with ratio >= cutoff.
+
+        Results are ordered by ratio, highest first; ties keep index order,
+        so ``k=1`` picks the same key as a first-wins brute-force scan.
+        """
+        if k <= 0:
+            return []
+        heap = []  # (ratio, -index), worst of the current top-k at heap[0]
+        matcher = SequenceMatcher(None, query, "")
+        for i in self.candidates(query, cutoff):
+            floor = cutoff
+            if len(heap) == k:
+                floor = max(floor, heap[0][0])
+            matcher.set_seq2(self.keys[i])
+            # Cheap upper bounds first, as difflib.get_close_matches does.
+            if matcher.real_quick_ratio() < floor or matcher.quick_ratio() < floor:
+                continue
+            self.comparisons += 1
+            ratio = matcher.ratio()
+            if ratio < floor:
+                continue
+            item = (ratio, -i)
+            if len(heap) < k:
+                heapq.heappush(heap, item)
+            elif item > heap[0]:
+                heapq.heapreplace(heap, item)
+        ranked = sorted(heap, reverse=True)
+        return [(self.values[-neg_i], ratio) for ratio, neg_i in ranked]
+
+    def best(self, query: str, cutoff: float = 0.0):
+        """Return the single best ``(value, ratio)`` pair, or None."""
+        found = self.search(query, k=1, cutoff=cutoff)
+        return found[0] if found else None
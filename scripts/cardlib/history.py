@@ -0,0 +1,359 @@
+"""
+Append-only, memory-mapped history of ingested ranking snapshots.
+
+Every ranking TSV that merge_rankings.py ingests is appended to
+data/ranking-history.bin as one snapshot, so earlier rankings survive
+the JSON being overwritten. The file is only ever appended to; readers
+``mmap`` it and look at just the columns a query needs, so a trend over
+hundreds of snapshots never loads them all into memory.
+
+Layout (little-endian, every block 4-byte aligned)::
+
+    header      '<4sHH'     magic, version, reserved
+    blocks      '<4sII'     kind, payload length, CRC-32 of payload,
+                            then the payload, zero-padded to 4 bytes
+
+    NAME block  '<II'       first id, count
+                            u32 offsets[count + 1], then the UTF-8 blob
+                Extends the card dictionary: ids are assigned in order
+                of first appearance and never change. Cards are keyed
+                by exact name; a name stored k times stands for the
+                first k rows of that name in a snapshot, since two
+                cards can share a name (and Greengrocer and Green
+                Grocer only differ once normalized).
+
+    SNAP block  '<B3xIIq20s' player count, n_rows, label length,
+                            timestamp (Unix seconds), SHA-1 of the source
+                            label (UTF-8, padded to 4 bytes)
+                            one column per COLUMNS entry, n_rows values
+                            each; rows are sorted by card id
+
+Opening a history reads only the block headers. The last block's CRC is
+checked so a write cut short by a crash is ignored; ``append_snapshot()``
+trims such a tail before writing. ``verify()`` checks every block.
+
+Requires numpy.
+"""
+
+import mmap
+import os
+import struct
+import zlib
+
+import numpy as np
+
+from .normalize import normalize
+
+MAGIC = b'AGRH'
+VERSION = 1
+
+FILE_HEADER = struct.Struct('<4sHH')
+BLOCK = struct.Struct('<4sII')
+NAME_HEADER = struct.Struct('<II')
+SNAP_HEADER = struct.Struct('<B3xIIq20s')
+
+NAME = b'NAME'
+SNAP = b'SNAP'
+
+# Stored columns: field -> (dtype, TSV column).
+COLUMNS = {
+    'card': ('<u4', None),
+    'rank': ('<i4', 'Rank'),
+    'adp': ('<f4', 'ADP'),
+    'apr': ('<f4', 'APR'),
+    'deals': ('<i4', 'Deals'),
+    'drafted': ('<i4', 'Drafted'),
+    'plays': ('<i4', 'Plays'),
+    'elo_per_play': ('<f4', 'Elo/Play'),
+}
+STAT_FIELDS = tuple(f for f in COLUMNS if f != 'card')
+
+
+def _pad(n):
+    return -n % 4
+
+
+class Snapshot:
+    """Directory entry for one stored snapshot."""
+
+    __slots__ = ('index', 'players', 'n_rows', 'timestamp', 'source', 'label', 'offset')
+
+    def __init__(self, index, players, n_rows, timestamp, source, label, offset):
+        self.index = index
+        self.players = players
+        self.n_rows = n_rows
+        self.timestamp = timestamp
+        self.source = source
+        self.label = label
+        self.offset = offset  # of the first column
+
+    def __repr__(self):
+        return f"Snapshot({self.index}, {self.players}p, {self.label!r}, {self.n_rows} rows)"
+
+
+def _scan(buf, size):
+    """Walk the blocks in ``buf``.
+
+    Returns (names, snapshots, end): ``end`` is the offset just past the
+    last intact block. Only the last block's CRC is checked.
+    """
+    if size < FILE_HEADER.size:
+        return [], [], 0
+    magic, version, _ = FILE_HEADER.unpack_from(buf, 0)
+    if magic != MAGIC or version != VERSION:
+        raise ValueError(f"not a version {VERSION} ranking history file")
+
+    blocks = []
+    pos = FILE_HEADER.size
+    while pos + BLOCK.size <= size:
+        kind, length, crc = BLOCK.unpack_from(buf, pos)
+        start = pos + BLOCK.size
+        if kind not in (NAME, SNAP) or start + length > size:
+            break
+        blocks.append((kind, start, length, crc))
+        pos = start + length + _pad(length)
+    if blocks:
+        kind, start, length, crc = blocks[-1]
+        if zlib.crc32(buf[start:start + length]) != crc:
+            blocks.pop()  # torn final write; ignore it
+
+    names = []
+    snapshots = []
+    end = FILE_HEADER.size
+    for kind, start, length, _ in blocks:
+        if kind == NAME:
+            first, count = NAME_HEADER.unpack_from(buf, start)
+            offsets = struct.unpack_from(f'<{count + 1}I', buf, start + NAME_HEADER.size)
+            blob = start + NAME_HEADER.size + 4 * (count + 1)
+            if first != len(names):
+                raise ValueError("ranking history card dictionary is out of order")
+            names.extend(
+                bytes(buf[blob + offsets[i]:blob + offsets[i + 1]]).decode('utf-8')
+                for i in range(count)
+            )
+        else:
+            players, n_rows, label_len, timestamp, source = SNAP_HEADER.unpack_from(buf, start)
+            label_at = start + SNAP_HEADER.size
+            label = bytes(buf[label_at:label_at + label_len]).decode('utf-8')
+            snapshots.append(Snapshot(len(snapshots), players, n_rows, timestamp, source.hex(),
+                                      label, label_at + label_len + _pad(label_len)))
+        end = start + length + _pad(length)
+    return names, snapshots, end
+
+
+def _block(kind, payload):
+    return BLOCK.pack(kind, len(payload), zlib.crc32(payload)) + payload + b'\0' * _pad(len(payload))
+
+
+class RankingHistory:
+    """Read-only, memory-mapped view of a ranking history file.
+
+    ``column(snapshot, field)`` returns a NumPy view straight into the
+    mapping; nothing is copied until a query combines values. Drop such
+    views before ``close()``, which cannot unmap while they exist.
+    """
+
+    def __init__(self, path):
+        self.path = path
+        self._file = None
+        self._map = None
+        size = os.path.getsize(path) if os.path.exists(path) else 0
+        if size:
+            self._file = open(path, 'rb')
+            self._map = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+            self.names, self.snapshots, _ = _scan(self._map, size)
+        else:
+            self.names, self.snapshots = [], []
+        self.ids = {}        # exact name -> card ids, in row order
+        self.by_norm = {}    # normalized name -> card ids
+        for i, name in enumerate(self.names):
+            self.ids.setdefault(name, []).append(i)
+            self.by_norm.setdefault(normalize(name), []).append(i)
+
+    def close(self):
+        if self._map is not None:
+            self._map.close()
+            self._file.close()
+            self._map = self._file = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def __len__(self):
+        return len(self.snapshots)
+
+    def card_ids(self, name):
+        """Ids of the cards called ``name``; by normalized name if no card has that exact name."""
+        return self.ids.get(name) or self.by_norm.get(normalize(name), [])
+
+    def card_id(self, name):
+        """The first of ``card_ids(name)``, or None."""
+        ids = self.card_ids(name)
+        return ids[0] if ids else None
+
+    def select(self, players=None):
+        """Snapshots for one player count (all when None), oldest first."""
+        return [s for s in self.snapshots if players is None or s.players == players]
+
+    def column(self, snapshot, field):
+        """Zero-copy array of one column of ``snapshot``."""
+        offset = snapshot.offset
+        for name, (dtype, _) in COLUMNS.items():
+            if name == field:
+                return np.frombuffer(self._map, dtype=dtype, count=snapshot.n_rows, offset=offset)
+            offset += np.dtype(dtype).itemsize * snapshot.n_rows
+        raise KeyError(field)
+
+    def trend(self, card, players=4, fields=('rank', 'adp', 'elo_per_play')):
+        """One card's values in every ``players`` snapshot, oldest first.
+
+        ``card`` is a card id, or a name standing for ``card_id(name)``.
+        Returns a dict with ``snapshots`` (the Snapshot entries) and one
+        float array per field, NaN where the card is missing from that
+        snapshot. Raises KeyError for a card never seen.
+        """
+        if isinstance(card, str):
+            name, card = card, self.card_id(card)
+            if card is None:
+                raise KeyError(name)
+        elif not 0 <= card < len(self.names):
+            raise KeyError(card)
+        snapshots = self.select(players)
+        out = {f: np.full(len(snapshots), np.nan) for f in fields}
+        for j, snap in enumerate(snapshots):
+            ids = self.column(snap, 'card')
+            i = int(np.searchsorted(ids, card))
+            if i < len(ids) and ids[i] == card:
+                for f in fields:
+                    out[f][j] = self.column(snap, f)[i]
+        out['snapshots'] = snapshots
+        return out
+
+    def matrix(self, field, players=4):
+        """(snapshots, values) with values[s, card] for every card id; NaN if absent."""
+        snapshots = self.select(players)
+        values = np.full((len(snapshots), len(self.names)), np.nan, dtype=np.float32)
+        for j, snap in enumerate(snapshots):
+            values[j, self.column(snap, 'card')] = self.column(snap, field)
+        return snapshots, values
+
+    def movers(self, field='rank', players=4, first=0, last=-1, n=10):
+        """Cards whose ``field`` changed most between two snapshots.
+
+        ``first``/``last`` index the ``players`` snapshots. Returns
+        [(name, before, after)] by largest absolute change; cards missing
+        from either snapshot or unchanged are left out.
+        """
+        snapshots = self.select(players)
+        if not snapshots:
+            return []
+        a, b = snapshots[first], snapshots[last]
+        before = np.full(len(self.names), np.nan)
+        after = np.full(len(self.names), np.nan)
+        before[self.column(a, 'card')] = self.column(a, field)
+        after[self.column(b, 'card')] = self.column(b, field)
+        delta = np.abs(after - before)
+        order = np.argsort(-np.nan_to_num(delta, nan=-1), kind='stable')[:n]
+        return [(self.names[i], float(before[i]), float(after[i]))
+                for i in order if delta[i] > 0]
+
+    def verify(self):
+        """Check every block's CRC; return the number of bad blocks."""
+        if self._map is None:
+            return 0
+        bad = 0
+        pos = FILE_HEADER.size
+        while pos + BLOCK.size <= len(self._map):
+            kind, length, crc = BLOCK.unpack_from(self._map, pos)
+            start = pos + BLOCK.size
+            if start + length > len(self._map):
+                break
+            bad += zlib.crc32(self._map[start:start + length]) != crc
+            pos = start + length + _pad(length)
+        return bad
+
+
+def append_snapshot(path, players, names, columns, label='', timestamp=0, source=b''):
+    """Append one snapshot; return its Snapshot entry, or None if already stored.
+
+    ``names`` are the rows' card names; ``columns`` maps each stat field to
+    an array of the same length (missing fields are stored as 0). Rows are
+    matched to the dictionary by exact name and, for a repeated name, by
+    how many rows of that name came before. ``source`` is a SHA-1 digest of
+    the snapshot's source; a snapshot whose source and player count are
+    already stored is skipped.
+    """
+    source = source.ljust(20, b'\0')[:20]
+    if os.path.exists(path) and os.path.getsize(path):
+        with open(path, 'rb') as f:
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as m:
+                known, snapshots, end = _scan(m, len(m))
+    else:
+        known, snapshots, end = [], [], 0
+    if any(s.source == source.hex() and s.players == players for s in snapshots):
+        return None
+
+    ids = {}
+    for i, name in enumerate(known):
+        ids.setdefault(name, []).append(i)
+    seen = {}
+    new_names = []
+    rows = {}
+    for row, name in enumerate(names):
+        k = seen[name] = seen.get(name, -1) + 1
+        same = ids.setdefault(name, [])
+        if k == len(same):
+            same.append(len(known) + len(new_names))
+            new_names.append(name)
+        rows[same[k]] = row
+    cards = np.array(sorted(rows), dtype='<u4')
+    take = np.array([rows[c] for c in cards.tolist()], dtype=np.int64)
+
+    out = b''
+    if not end:
+        out += FILE_HEADER.pack(MAGIC, VERSION, 0)
+    if new_names:
+        encoded = [n.encode('utf-8') for n in new_names]
+        offsets = [0]
+        for e in encoded:
+            offsets.append(offsets[-1] + len(e))
+        payload = (NAME_HEADER.pack(len(known), len(new_names))
+                   + struct.pack(f'<{len(offsets)}I', *offsets) + b''.join(encoded))
+        out += _block(NAME, payload)
+
+    label_bytes = label.encode('utf-8')
+    parts = [SNAP_HEADER.pack(players, len(cards), len(label_bytes), int(timestamp), source),
+             label_bytes, b'\0' * _pad(len(label_bytes)), cards.tobytes()]
+    for field, (dtype, _) in COLUMNS.items():
+        if field == 'card':
+            continue
+        values = columns.get(field)
+        if values is None:
+            parts.append(np.zeros(len(cards), dtype=dtype).tobytes())
+        else:
+            parts.append(np.asarray(values)[take].astype(dtype).tobytes())
+    snap = _block(SNAP, b''.join(parts))
+    columns_at = (end + len(out) + BLOCK.size + SNAP_HEADER.size
+                  + len(label_bytes) + _pad(len(label_bytes)))
+    out += snap
+
+    with open(path, 'r+b' if end else 'wb') as f:
+        f.seek(end)
+        f.truncate()  # drop a torn tail from an interrupted append
+        f.write(out)
+        f.flush()
+        os.fsync(f.fileno())
+    return Snapshot(len(snapshots), players, len(cards), int(timestamp), source.hex(),
+                    label, columns_at)
+
+
+def append_table(path, table, players, label='', timestamp=0, source=b''):
+    """Append a parsed rankings TSV (cardlib.rankings.RankingTable)."""
+    columns = {field: table.column(tsv_name)
+               for field, (_, tsv_name) in COLUMNS.items()
+               if tsv_name is not None and tsv_name in table.header}
+    return append_snapshot(path, players, table.names, columns,
+                           label=label, timestamp=timestamp, source=source)
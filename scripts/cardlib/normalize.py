@@ -0,0 +1,29 @@
+"""
+Canonical card-name normalization.
+
+Every script that compares card names (JSON entries, TSV rows, image
+filenames) must go through ``normalize`` so that they agree on what
+counts as the same card.
+"""
+
+import functools
+import os
+import unicodedata
+
+# Characters dropped entirely when comparing names.
+_STRIP_CHARS = (" ", "-", "'", ".", "’")  # include smart apostrophe
+_STRIP_TABLE = str.maketrans("", "", "".join(_STRIP_CHARS))
+
+
+@functools.lru_cache(maxsize=None)
+def normalize(name: str) -> str:
+    """Lowercase, strip accents, remove spaces/hyphens/apostrophes/periods."""
+    # Strip accents via NFKD decomposition
+    nfkd = unicodedata.normalize("NFKD", name.strip())
+    stripped = "".join(c for c in nfkd if unicodedata.category(c) != "Mn")
+    return stripped.lower().translate(_STRIP_TABLE)
+
+
+def normalize_image_name(filename: str) -> str:
+    """Normalize an image filename, ignoring its extension."""
+    return normalize(os.path.splitext(filename)[0])
@@ -0,0 +1,43 @@
+"""Filesystem locations shared by the data scripts."""
+
+import os
+
+PACKAGE_DIR = os.path.dirname(os.path.abspath(__file__))
+SCRIPT_DIR = os.path.dirname(PACKAGE_DIR)
+ROOT_DIR = os.path.dirname(SCRIPT_DIR)
+DATA_DIR = os.path.join(ROOT_DIR, 'data')
+CARDS_JSON = os.path.join(DATA_DIR, 'agricola-cards.json')
+API_DATA_DIR = os.path.join(ROOT_DIR, 'api', 'data')
+API_CARDS_JSON = os.path.join(API_DATA_DIR, 'agricola-cards.json')
+CARDS_BIN = os.path.join(DATA_DIR, 'agricola-cards.bin')
+# Typed stat columns parsed from the card JSON (cardlib.stats_store).
+CARD_STATS_BIN = os.path.join(DATA_DIR, 'card-stats.bin')
+API_CARDS_BIN = os.path.join(API_DATA_DIR, 'agricola-cards.bin')
+# Prebuilt prompt index + stats lookup for the strategy function, per player count.
+STRATEGY_INDEX_4P = os.path.join(API_DATA_DIR, 'strategy-index-4p.json')
+STRATEGY_INDEX_3P = os.path.join(API_DATA_DIR, 'strategy-index-3p.json')
+# Optional alias -> canonical card name map (nicknames, old spellings).
+ALIASES_JSON = os.path.join(DATA_DIR, 'card-aliases.json')
+SEARCH_INDEX_JSON = os.path.join(DATA_DIR, 'card-search-index.json')
+# Deletion-neighbourhood dictionary for resolving OCR'd names (cardlib.symspell).
+OCR_NAMES_JSON = os.path.join(DATA_DIR, 'ocr-name-dictionary.json')
+# Strategy tagging: declarative phrase rules plus per-card manual overrides.
+TAG_RULES_JSON = os.path.join(DATA_DIR, 'tag-rules.json')
+TAG_OVERRIDES_JSON = os.path.join(DATA_DIR, 'tag-overrides.json')
+# Sources of the strategy function's BM25 passage index (cardlib.doc_index).
+STRATEGY_GUIDE_MD = os.path.join(ROOT_DIR, 'api', 'docs', 'agricola-strategy-guide.md')
+RULEBOOK_PDF = os.path.join(ROOT_DIR, 'f5-agricola-rulebook.pdf')
+DOC_INDEX_JSON = os.path.join(API_DATA_DIR, 'doc-index.json')
+# Top-k synergy partners per card for the strategy function (scripts/build_synergy.py).
+SYNERGY_JSON = os.path.join(API_DATA_DIR, 'card-synergy.json')
+# Field-projected, content-hashed shards of the card JSON for index.html
+# (scripts/build_card_bundles.py); the manifest names the current files.
+CARD_BUNDLES_JSON = os.path.join(DATA_DIR, 'card-bundles.json')
+CARD_BUNDLES_DIR = os.path.join(DATA_DIR, 'bundles')
+# Simulated P(card comes back) per draft round (scripts/simulate_draft.py).
+SURVIVAL_JSON = os.path.join(DATA_DIR, 'draft-survival.json')
+# Every ingested ranking snapshot, append-only (cardlib.history).
+RANKING_HISTORY = os.path.join(DATA_DIR, 'ranking-history.bin')
+TSV_4P = os.path.join(DATA_DIR, 'agricola-4p-rankings.tsv')
+TSV_3P = os.path.join(DATA_DIR, 'agricola-3p-rankings.tsv')
+IMAGES_DIR = os.path.join(ROOT_DIR, 'card-images') + '/'
@@ -0,0 +1,552 @@
+"""
+Plain-text extraction from simple PDFs, standard library only.
+
+Enough of PDF to read the text of the rulebook (f5-agricola-rulebook.pdf)
+for the document index: classic (non-stream) cross-reference layout,
+Flate-compressed content streams, Form XObjects, and fonts decoded
+through their ToUnicode CMap, or a standard encoding plus /Differences.
+Encryption, object streams and vertical writing are not supported.
+
+    pages = extract_pages('f5-agricola-rulebook.pdf')   # one str per page
+
+Layout is approximated from the text positioning operators: a change of
+baseline starts a new line, and a horizontal jump or a large TJ
+adjustment becomes a space. Each run advances the pen by its glyph
+widths (/Widths, or /W of a CID font), character and word spacing, so
+runs that merely continue a word ("G" then a smaller "AME", as the
+rulebook sets its small caps) join up. Good enough for search, not for
+display.
+"""
+
+import re
+import zlib
+
+# --- Object syntax ---------------------------------------------------------
+
+_WHITESPACE = b' \t\r\n\f\x00'
+_DELIMITERS = b'()<>[]{}/%'
+_OBJ_RE = re.compile(rb'(\d+)\s+(\d+)\s+obj\b')
+_NUMBER_RE = re.compile(rb'[+-]?(\d+\.?\d*|\.\d+)')
+_REF_RE = re.compile(rb'\s+\d+\s+R(?![A-Za-z])')
+_ESCAPES = {ord('n'): b'\n', ord('r'): b'\r', ord('t'): b'\t', ord('b'): b'\b',
+            ord('f'): b'\f', ord('('): b'(', ord(')'): b')', ord('\\'): b'\\'}
+
+
+class Name(str):
+    """A PDF name (``/Font``), distinct from a string."""
+    __slots__ = ()
+
+
+class Ref:
+    __slots__ = ('num',)
+
+    def __init__(self, num):
+        self.num = num
+
+
+class Operator(str):
+    """A bare keyword in a content stream (``Tj``, ``BT``)."""
+    __slots__ = ()
+
+
+def _skip(data, i):
+    while i < len(data):
+        c = data[i]
+        if c in _WHITESPACE:
+            i += 1
+        elif c == 0x25:  # % comment
+            while i < len(data) and data[i] not in b'\r\n':
+                i += 1
+        else:
+            break
+    return i
+
+
+def _literal_string(data, i):
+    """Parse ``(...)`` starting after the opening parenthesis."""
+    out = bytearray()
+    depth = 1
+    while i < len(data):
+        c = data[i]
+        if c == 0x5C:  # backslash
+            i += 1
+            c = data[i]
+            if c in _ESCAPES:
+                out += _ESCAPES[c]
+            elif 0x30 <= c <= 0x37:
+                j = i
+                while j < i + 3 and j < len(data) and 0x30 <= data[j] <= 0x37:
+                    j += 1
+                out.append(int(data[i:j], 8) & 0xFF)
+                i = j - 1
+            elif c == 0x0D:
+                if i + 1 < len(data) and data[i + 1] == 0x0A:
+                    i += 1
+            elif c != 0x0A:
+                out.append(c)
+        elif c == 0x28:
+            depth += 1
+            out.append(c)
+        elif c == 0x29:
+            depth -= 1
+            if depth == 0:
+                return bytes(out), i + 1
+            out.append(c)
+        else:
+            out.append(c)
+        i += 1
+    return bytes(out), i
+
+
+def parse_value(data, i=0, refs=True):
+    """Parse one object at ``data[i:]``; return (value, next index).
+
+    Strings come back as bytes, names as ``Name``, ``n 0 R`` as ``Ref``
+    (when ``refs``), keywords as ``Operator``.
+    """
+    i = _skip(data, i)
+    c = data[i]
+    if c == 0x2F:  # /Name
+        j = i + 1
+        while j < len(data) and data[j] not in _WHITESPACE and data[j] not in _DELIMITERS:
+            j += 1
+        name = re.sub(rb'#([0-9A-Fa-f]{2})', lambda m: bytes([int(m.group(1), 16)]), data[i + 1:j])
+        return Name(name.decode('latin-1')), j
+    if c == 0x28:
+        return _literal_string(data, i + 1)
+    if c == 0x3C:
+        if data[i + 1:i + 2] == b'<':
+            out = {}
+            i += 2
+            while True:
+                i = _skip(data, i)
+                if data[i:i + 2] == b'>>':
+                    return out, i + 2
+                key, i = parse_value(data, i, refs)
+                value, i = parse_value(data, i, refs)
+                out[key] = value
+        j = data.index(b'>', i)
+        digits = re.sub(rb'[^0-9A-Fa-f]', b'', data[i + 1:j])
+        if len(digits) % 2:
+            digits += b'0'
+        return bytes.fromhex(digits.decode('ascii')), j + 1
+    if c == 0x5B:
+        out = []
+        i += 1
+        while True:
+            i = _skip(data, i)
+            if data[i] == 0x5D:
+                return out, i + 1
+            value, i = parse_value(data, i, refs)
+            out.append(value)
+    m = _NUMBER_RE.match(data, i)
+    if m:
+        text = m.group(0)
+        if refs and b'.' not in text:
+            r = _REF_RE.match(data, m.end())
+            if r:
+                return Ref(int(text)), r.end()
+        return (float(text) if b'.' in text else int(text)), m.end()
+    j = i
+    while j < len(data) and data[j] not in _WHITESPACE and data[j] not in _DELIMITERS:
+        j += 1
+    word = data[i:j].decode('latin-1')
+    if word == 'true':
+        return True, j
+    if word == 'false':
+        return False, j
+    if word == 'null':
+        return None, j
+    return Operator(word or chr(c)), max(j, i + 1)
+
+
+class Document:
+    """Objects of a PDF file, parsed lazily."""
+
+    def __init__(self, data):
+        self.data = data
+        self.offsets = {}
+        for m in _OBJ_RE.finditer(data):
+            # Later definitions (incremental updates) win.
+            self.offsets[int(m.group(1))] = m.end()
+        self._cache = {}
+        if re.search(rb'/Encrypt\b', data):
+            raise ValueError("encrypted PDFs are not supported")
+
+    def get(self, num):
+        if num not in self._cache:
+            value, i = parse_value(self.data, self.offsets[num])
+            if isinstance(value, dict):
+                j = _skip(self.data, i)
+                if self.data.startswith(b'stream', j):
+                    value = Stream(self, value, j + len(b'stream'))
+            self._cache[num] = value
+        return self._cache[num]
+
+    def resolve(self, value):
+        while isinstance(value, Ref):
+            value = self.get(value.num) if value.num in self.offsets else None
+        return value
+
+    def trailer_root(self):
+        roots = re.findall(rb'/Root\s+(\d+)\s+\d+\s+R', self.data)
+        if not roots:
+            raise ValueError("no document catalog found")
+        return self.get(int(roots[-1]))
+
+    def pages(self):
+        """Page dictionaries in order, with inherited Resources filled in."""
+        out = []
+
+        def walk(node, inherited):
+            node = self.resolve(node)
+            resources = node.get('Resources', inherited)
+            if node.get('Type') == 'Pages' or 'Kids' in node:
+                for kid in self.resolve(node.get('Kids', [])):
+                    walk(kid, resources)
+            else:
+                out.append((node, self.resolve(resources) or {}))
+
+        walk(self.trailer_root()['Pages'], None)
+        return out
+
+
+class Stream:
+    __slots__ = ('doc', 'dict', 'start')
+
+    def __init__(self, doc, dictionary, start):
+        self.doc = doc
+        self.dict = dictionary
+        self.start = start
+
+    def get(self, key, default=None):
+        return self.dict.get(key, default)
+
+    def data(self):
+        raw = self.doc.data
+        i = self.start
+        if raw[i:i + 2] == b'\r\n':
+            i += 2
+        elif raw[i:i + 1] in (b'\n', b'\r'):
+            i += 1
+        length = self.doc.resolve(self.dict.get('Length'))
+        if isinstance(length, int) and raw[i + length:i + length + 20].lstrip().startswith(b'endstream'):
+            body = raw[i:i + length]
+        else:
+            body = raw[i:raw.index(b'endstream', i)].rstrip(b'\r\n')
+        filters = self.doc.resolve(self.dict.get('Filter'))
+        if filters is None:
+            filters = []
+        elif not isinstance(filters, list):
+            filters = [filters]
+        for f in filters:
+            if f == 'FlateDecode':
+                body = zlib.decompressobj().decompress(body)
+            else:
+                raise ValueError(f"unsupported filter {f}")
+        return body
+
+
+# --- Fonts -----------------------------------------------------------------
+
+# Glyph names outside the single-letter ones, for /Differences arrays.
+_GLYPHS = {
+    'space': ' ', 'exclam': '!', 'quotedbl': '"', 'numbersign': '#', 'dollar': '$',
+    'percent': '%', 'ampersand': '&', 'quoteright': '’', 'quotesingle': "'",
+    'parenleft': '(', 'parenright': ')', 'asterisk': '*', 'plus': '+', 'comma': ',',
+    'hyphen': '-', 'period': '.', 'slash': '/', 'colon': ':', 'semicolon': ';',
+    'less': '<', 'equal': '=', 'greater': '>', 'question': '?', 'at': '@',
+    'bracketleft': '[', 'backslash': '\\', 'bracketright': ']', 'underscore': '_',
+    'quoteleft': '‘', 'braceleft': '{', 'bar': '|', 'braceright': '}',
+    'endash': '–', 'emdash': '—', 'quotedblleft': '“',
+    'quotedblright': '”', 'bullet': '•', 'ellipsis': '…',
+    'fi': 'fi', 'fl': 'fl', 'ff': 'ff', 'ffi': 'ffi', 'ffl': 'ffl',
+    'zero': '0', 'one': '1', 'two': '2', 'three': '3', 'four': '4', 'five': '5',
+    'six': '6', 'seven': '7', 'eight': '8', 'nine': '9', 'multiply': '×',
+    'eacute': 'é', 'egrave': 'è', 'agrave': 'à', 'ccedilla': 'ç',
+    'minus': '-', 'degree': '°', 'arrowright': '→',
+}
+
+
+def _glyph_char(name):
+    if len(name) == 1:
+        return name
+    if name in _GLYPHS:
+        return _GLYPHS[name]
+    m = re.fullmatch(r'uni([0-9A-Fa-f]{4})', name)
+    if m:
+        return chr(int(m.group(1), 16))
+    return ''
+
+
+def _parse_cmap(data):
+    """Code -> text map from a ToUnicode CMap."""
+    out = {}
+
+    def text(hexstr):
+        raw = bytes.fromhex(hexstr.decode('ascii'))
+        return raw.decode('utf-16-be', errors='replace')
+
+    for block in re.findall(rb'beginbfchar(.*?)endbfchar', data, re.S):
+        for src, dst in re.findall(rb'<([0-9A-Fa-f]+)>\s*<([0-9A-Fa-f]*)>', block):
+            out[int(src, 16)] = text(dst)
+    for block in re.findall(rb'beginbfrange(.*?)endbfrange', data, re.S):
+        for lo, hi, dst in re.findall(rb'<([0-9A-Fa-f]+)>\s*<([0-9A-Fa-f]+)>\s*(<[0-9A-Fa-f]*>|\[[^\]]*\])', block):
+            lo, hi = int(lo, 16), int(hi, 16)
+            if dst.startswith(b'['):
+                for k, item in enumerate(re.findall(rb'<([0-9A-Fa-f]*)>', dst)):
+                    out[lo + k] = text(item)
+            else:
+                raw = bytes.fromhex(dst[1:-1].decode('ascii'))
+                base = int.from_bytes(raw, 'big')
+                width = len(raw)
+                for k in range(hi - lo + 1):
+                    out[lo + k] = (base + k).to_bytes(width, 'big').decode('utf-16-be', errors='replace')
+    return out
+
+
+def _cid_widths(doc, w):
+    """Code -> width from a CID font's /W array."""
+    out = {}
+    items = doc.resolve(w) or []
+    i = 0
+    while i + 1 < len(items):
+        first = doc.resolve(items[i])
+        rest = doc.resolve(items[i + 1])
+        if isinstance(rest, list):
+            for k, width in enumerate(rest):
+                out[first + k] = doc.resolve(width)
+            i += 2
+        elif i + 2 < len(items):
+            width = doc.resolve(items[i + 2])
+            for code in range(first, rest + 1):
+                out[code] = width
+            i += 3
+        else:
+            break
+    return out
+
+
+class Font:
+    __slots__ = ('width', 'cmap', 'encoding', 'widths', 'default_width')
+
+    def __init__(self, doc, font):
+        font = doc.resolve(font) or {}
+        self.width = 2 if font.get('Subtype') == 'Type0' else 1
+        # Glyph widths in thousandths of an em.
+        if self.width == 2:
+            descendants = doc.resolve(font.get('DescendantFonts')) or [{}]
+            cid_font = doc.resolve(descendants[0]) or {}
+            self.widths = _cid_widths(doc, cid_font.get('W'))
+            self.default_width = doc.resolve(cid_font.get('DW', 1000))
+        else:
+            first = doc.resolve(font.get('FirstChar', 0))
+            widths = doc.resolve(font.get('Widths')) or []
+            self.widths = {first + k: doc.resolve(w) for k, w in enumerate(widths)}
+            descriptor = doc.resolve(font.get('FontDescriptor')) or {}
+            self.default_width = doc.resolve(descriptor.get('MissingWidth', 0)) if widths else 500
+        self.cmap = None
+        to_unicode = doc.resolve(font.get('ToUnicode'))
+        if isinstance(to_unicode, Stream):
+            try:
+                self.cmap = _parse_cmap(to_unicode.data())
+            except (ValueError, zlib.error):
+                self.cmap = None
+        # cp1252 covers WinAnsi and, for ASCII, Standard and MacRoman.
+        self.encoding = {code: bytes([code]).decode('cp1252', errors='replace') for code in range(256)}
+        encoding = doc.resolve(font.get('Encoding'))
+        if isinstance(encoding, dict):
+            code = 0
+            for item in doc.resolve(encoding.get('Differences', [])):
+                if isinstance(item, int):
+                    code = item
+                else:
+                    self.encoding[code] = _glyph_char(item)
+                    code += 1
+
+    def codes(self, raw):
+        if self.width == 2:
+            return [int.from_bytes(raw[i:i + 2], 'big') for i in range(0, len(raw) - 1, 2)]
+        return list(raw)
+
+    def advance(self, raw, size, char_spacing=0.0, word_spacing=0.0):
+        """Horizontal displacement of showing ``raw``, in unscaled text space."""
+        total = 0.0
+        for code in self.codes(raw):
+            total += self.widths.get(code, self.default_width) / 1000 * size + char_spacing
+            if code == 32 and self.width == 1:
+                total += word_spacing
+        return total
+
+    def decode(self, raw):
+        out = []
+        for code in self.codes(raw):
+            if self.cmap is not None and code in self.cmap:
+                out.append(self.cmap[code])
+            elif self.width == 1:
+                out.append(self.encoding.get(code, ''))
+        return ''.join(out)
+
+
+# --- Content streams -------------------------------------------------------
+
+def _tokens(data):
+    """(operands, operator) pairs of a content stream."""
+    i = 0
+    operands = []
+    n = len(data)
+    while True:
+        i = _skip(data, i)
+        if i >= n:
+            return
+        value, i = parse_value(data, i, refs=False)
+        if isinstance(value, Operator):
+            if value == 'BI':
+                # Inline image: skip to EI.
+                m = re.compile(rb'\sEI[\s]').search(data, i)
+                i = m.end() if m else n
+                operands = []
+                continue
+            yield operands, value
+            operands = []
+        else:
+            operands.append(value)
+
+
+class _TextWriter:
+    """Turns positioned text runs into lines."""
+
+    def __init__(self):
+        self.lines = []
+        self.line = []
+        self.y = None
+        self.x_end = None
+
+    def move(self, x, y, size):
+        if self.y is None or abs(y - self.y) > max(size, 1) * 0.5:
+            self.newline()
+        elif self.x_end is not None and x - self.x_end > max(size, 1) * 0.2:
+            self.line.append(' ')
+        self.y = y
+        self.x_end = x
+
+    def text(self, s, x_end):
+        self.line.append(s)
+        self.x_end = x_end
+
+    def space(self):
+        self.line.append(' ')
+
+    def newline(self):
+        if self.line:
+            self.lines.append(''.join(self.line))
+            self.line = []
+
+    def result(self):
+        self.newline()
+        return '\n'.join(re.sub(r'[ \t]+', ' ', line).strip() for line in self.lines)
+
+
+def _run(doc, content, resources, writer, depth=0):
+    fonts = doc.resolve((resources or {}).get('Font')) or {}
+    xobjects = doc.resolve((resources or {}).get('XObject')) or {}
+    loaded = {}
+    font = None
+    size = 10.0
+    leading = 0.0
+    char_spacing = 0.0
+    word_spacing = 0.0
+    scaling = 1.0
+    tm = [1, 0, 0, 1, 0, 0]
+    lm = [1, 0, 0, 1, 0, 0]
+
+    def place():
+        scale = abs(tm[3]) or abs(tm[0]) or 1
+        writer.move(tm[4], tm[5], size * scale)
+
+    def shift(tx):
+        # Tm = [1 0 0 1 tx 0] x Tm
+        tm[4] += tx * tm[0]
+        tm[5] += tx * tm[1]
+
+    def show(raw):
+        if font is None:
+            return
+        shift(font.advance(raw, size, char_spacing, word_spacing) * scaling)
+        writer.text(font.decode(raw), tm[4])
+
+    for operands, op in _tokens(content):
+        try:
+            if op == 'BT':
+                tm = [1, 0, 0, 1, 0, 0]
+                lm = list(tm)
+            elif op == 'Tf':
+                name, size = operands[0], float(operands[1])
+                if name not in loaded:
+                    loaded[name] = Font(doc, fonts.get(name))
+                font = loaded[name]
+            elif op == 'TL':
+                leading = float(operands[0])
+            elif op == 'Tc':
+                char_spacing = float(operands[0])
+            elif op == 'Tw':
+                word_spacing = float(operands[0])
+            elif op == 'Tz':
+                scaling = float(operands[0]) / 100
+            elif op in ('Td', 'TD'):
+                tx, ty = float(operands[0]), float(operands[1])
+                if op == 'TD':
+                    leading = -ty
+                lm = [lm[0], lm[1], lm[2], lm[3],
+                      lm[4] + tx * lm[0] + ty * lm[2], lm[5] + tx * lm[1] + ty * lm[3]]
+                tm = list(lm)
+                place()
+            elif op == 'Tm':
+                lm = [float(v) for v in operands[:6]]
+                tm = list(lm)
+                place()
+            elif op == 'T*':
+                lm = [lm[0], lm[1], lm[2], lm[3], lm[4] - leading * lm[2], lm[5] - leading * lm[3]]
+                tm = list(lm)
+                place()
+            elif op == 'Tj':
+                show(operands[0])
+            elif op in ("'", '"'):
+                lm = [lm[0], lm[1], lm[2], lm[3], lm[4] - leading * lm[2], lm[5] - leading * lm[3]]
+                tm = list(lm)
+                place()
+                show(operands[-1])
+            elif op == 'TJ':
+                for item in operands[0]:
+                    if isinstance(item, bytes):
+                        show(item)
+                    else:
+                        shift(-item / 1000 * size * scaling)
+                        if item < -200:
+                            writer.space()
+            elif op == 'Do' and depth < 8:
+                xobject = doc.resolve(xobjects.get(operands[0]))
+                if isinstance(xobject, Stream) and xobject.get('Subtype') == 'Form':
+                    inner = doc.resolve(xobject.get('Resources')) or resources
+                    _run(doc, xobject.data(), inner, writer, depth + 1)
+        except (IndexError, TypeError, ValueError, zlib.error):
+            continue
+
+
+def extract_pages(path):
+    """Return the text of each page of the PDF at ``path``."""
+    with open(path, 'rb') as f:
+        doc = Document(f.read())
+    pages = []
+    for page, resources in doc.pages():
+        contents = doc.resolve(page.get('Contents'))
+        if contents is None:
+            pages.append('')
+            continue
+        if not isinstance(contents, list):
+            contents = [contents]
+        data = b'\n'.join(doc.resolve(c).data() for c in contents if isinstance(doc.resolve(c), Stream))
+        writer = _TextWriter()
+        _run(doc, data, resources, writer)
+        pages.append(writer.result())
+    return pages
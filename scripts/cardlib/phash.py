@@ -0,0 +1,158 @@
+"""
+Perceptual hashes of card images and near-duplicate search.
+
+``image_hashes()`` computes a 64-bit DCT perceptual hash for every image,
+in a process pool, caching results by the file's SHA-256 so unchanged
+files are never decoded twice. ``near_duplicates()`` finds every pair of
+images within a Hamming distance using a BK-tree rather than comparing
+all pairs.
+
+Requires numpy and Pillow.
+"""
+
+import json
+import os
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+from PIL import Image
+
+from .files import file_digest
+from .paths import IMAGES_DIR
+
+CACHE_JSON = os.path.join(IMAGES_DIR, '.phash-cache.json')
+CACHE_VERSION = 2
+
+HASH_SIZE = 8
+_SAMPLE = 32
+
+# Every card shares the same frame, title banner and text box, so hashing
+# the whole image makes unrelated cards look alike. Only the artwork inside
+# the hexagon is hashed: (left, top, right, bottom) as fractions of the size.
+ART_BOX = (0.22, 0.20, 0.78, 0.56)
+
+
+def _dct_matrix(n):
+    k = np.arange(n)[:, None]
+    x = np.arange(n)[None, :]
+    m = np.cos(np.pi * (2 * x + 1) * k / (2 * n))
+    m[0] /= np.sqrt(2)
+    return m * np.sqrt(2 / n)
+
+
+_DCT = _dct_matrix(_SAMPLE)
+
+
+def phash(path) -> int:
+    """64-bit perceptual hash of the card art: low-frequency DCT vs. its median."""
+    with Image.open(path) as im:
+        im = im.convert('RGBA')
+        w, h = im.size
+        left, top, right, bottom = ART_BOX
+        im = im.crop((round(w * left), round(h * top), round(w * right), round(h * bottom)))
+        # Flatten transparency onto white so padding doesn't dominate.
+        background = Image.new('RGBA', im.size, (255, 255, 255, 255))
+        gray = Image.alpha_composite(background, im).convert('L')
+        gray = gray.resize((_SAMPLE, _SAMPLE), Image.LANCZOS)
+    pixels = np.asarray(gray, dtype=np.float64)
+    low = (_DCT @ pixels @ _DCT.T)[:HASH_SIZE, :HASH_SIZE].ravel()
+    bits = low > np.median(low[1:])
+    return int(''.join('1' if b else '0' for b in bits), 2)
+
+
+def _load_cache():
+    try:
+        with open(CACHE_JSON, 'r', encoding='utf-8') as f:
+            cache = json.load(f)
+    except FileNotFoundError:
+        return {}
+    if cache.get('version') != CACHE_VERSION:
+        return {}
+    return cache.get('hashes', {})
+
+
+def _save_cache(hashes):
+    with open(CACHE_JSON, 'w', encoding='utf-8') as f:
+        json.dump({'version': CACHE_VERSION, 'hashes': hashes}, f, indent=0, sort_keys=True)
+
+
+def image_hashes(filenames, images_dir=IMAGES_DIR, jobs=None) -> dict[str, int]:
+    """Return {filename: perceptual hash} for files in ``images_dir``.
+
+    Hashes are cached by content SHA-256 in CACHE_JSON; only files whose
+    content is new get decoded, in parallel.
+    """
+    cache = _load_cache()
+    digests = {name: file_digest(os.path.join(images_dir, name)) for name in filenames}
+    missing = sorted({d for d in digests.values() if d not in cache})
+    if missing:
+        paths = {}
+        for name, d in digests.items():
+            paths.setdefault(d, os.path.join(images_dir, name))
+        with ProcessPoolExecutor(max_workers=jobs) as pool:
+            for d, h in zip(missing, pool.map(phash, [paths[d] for d in missing], chunksize=16)):
+                cache[d] = f"{h:016x}"
+        _save_cache(cache)
+    return {name: int(cache[d], 16) for name, d in digests.items()}
+
+
+def hamming(a: int, b: int) -> int:
+    return (a ^ b).bit_count()
+
+
+class BKTree:
+    """Burkhard-Keller tree over hashes under Hamming distance.
+
+    A query for radius r only descends into children whose edge distance
+    d satisfies |d - dist(query, node)| <= r (triangle inequality).
+    """
+
+    __slots__ = ('root',)
+
+    def __init__(self, items=()):
+        self.root = None  # [hash, [keys], {distance: child}]
+        for h, key in items:
+            self.add(h, key)
+
+    def add(self, h, key):
+        if self.root is None:
+            self.root = [h, [key], {}]
+            return
+        node = self.root
+        while True:
+            d = hamming(h, node[0])
+            if d == 0:
+                node[1].append(key)
+                return
+            child = node[2].get(d)
+            if child is None:
+                node[2][d] = [h, [key], {}]
+                return
+            node = child
+
+    def query(self, h, radius):
+        """Return [(distance, key)] for every stored hash within ``radius``."""
+        out = []
+        stack = [self.root] if self.root is not None else []
+        while stack:
+            node = stack.pop()
+            d = hamming(h, node[0])
+            if d <= radius:
+                out.extend((d, key) for key in node[1])
+            for edge, child in node[2].items():
+                if d - radius <= edge <= d + radius:
+                    stack.append(child)
+        return out
+
+
+def near_duplicates(hashes: dict, max_distance: int = 4) -> list[tuple]:
+    """Pairs ``(distance, name_a, name_b)`` with name_a < name_b, sorted."""
+    tree = BKTree()
+    pairs = []
+    for name in sorted(hashes):
+        h = hashes[name]
+        for d, other in tree.query(h, max_distance):
+            pairs.append((d, other, name))
+        tree.add(h, name)
+    pairs.sort()
+    return pairs
@@ -0,0 +1,277 @@
+"""
+Score every occupation x minor pick in a draft hand at once.
+
+Each round of the draft you keep one occupation and one minor from the
+hand. ``PickModel`` scores every such pair, and any number of hands at
+once, as broadcast NumPy array operations:
+
+    score(o, m) = value[o] + value[m]
+                + PAIR_WEIGHT    * synergy(o, m)
+                + DRAFTED_WEIGHT * (synergy(o, drafted) + synergy(m, drafted))
+                + RETURN_WEIGHT  * (comeback(o) + comeback(m))
+
+``value`` is the card's "value" stat at the table's player count (4p
+top level or ``stats_3p``); cards without one get the median of their
+type. ``synergy`` is the cosine of the two cards' strategy tag vectors
+(cardlib.synergy.tag_matrix), and ``synergy(c, drafted)`` sums it over
+the cards already kept in earlier rounds.
+
+``comeback(c)`` is what passing the rest of the hand is worth when the
+hand comes back (rounds where ``round + players <= 7``): the expected
+value of the best card of c's type still in the hand on its return if
+c is taken now. Each passed card survives independently with its
+simulated probability from data/draft-survival.json (as draft-stats.js
+treats them); if none does, the hand's weakest card is what is left.
+Taking a strong card that will not come back costs nothing here;
+taking one that probably would have come back costs its share of the
+expected return.
+
+``evaluate_batch()`` takes padded index arrays, so a replay of
+thousands of recorded drafts is a single call.
+
+Requires numpy.
+"""
+
+import numpy as np
+
+from .pick_inference import hand_visits
+from .synergy import tag_matrix
+
+ROUNDS = 7
+CARD_TYPES = ('Occupation', 'Minor Improvement')
+PAIR_WEIGHT = 2.0
+DRAFTED_WEIGHT = 1.0
+RETURN_WEIGHT = 1.0
+
+
+def _value(card, players):
+    stats = card if players == 4 else (card.get('stats_3p') or {})
+    try:
+        return float(stats.get('value'))
+    except (TypeError, ValueError):
+        return np.nan
+
+
+def _pad(rows, width=None):
+    """Lists of indices -> (len(rows), width) int array padded with -1."""
+    width = max((len(r) for r in rows), default=0) if width is None else width
+    out = np.full((len(rows), max(width, 1)), -1, dtype=np.int32)
+    for i, row in enumerate(rows):
+        out[i, :len(row)] = row
+    return out
+
+
+class PickModel:
+    """Per-card arrays for one player count, ready for batched scoring.
+
+    ``survival`` is the player count's section of draft-survival.json
+    ({"rounds": [...], "cards": {name: [p per round]}}); without it the
+    comeback term is zero.
+    """
+
+    __slots__ = ('players', 'names', 'index', 'types', 'value', 'tags',
+                 'survival', 'survival_rounds', 'weights')
+
+    def __init__(self, cards, players, survival=None,
+                 pair_weight=PAIR_WEIGHT, drafted_weight=DRAFTED_WEIGHT, return_weight=RETURN_WEIGHT):
+        # Duplicate names keep the first record, as the draft tool does.
+        seen = set()
+        cards = [c for c in cards if c.get('type') in CARD_TYPES
+                 and not (c['name'] in seen or seen.add(c['name']))]
+        self.players = players
+        self.names = [c['name'] for c in cards]
+        self.index = {name: i for i, name in enumerate(self.names)}
+        self.types = np.array([CARD_TYPES.index(c['type']) for c in cards], dtype=np.int8)
+
+        value = np.array([_value(c, players) for c in cards], dtype=np.float64)
+        for t in range(len(CARD_TYPES)):
+            of_type = self.types == t
+            known = value[of_type & ~np.isnan(value)]
+            fill = float(np.median(known)) if len(known) else 0.0
+            value[of_type & np.isnan(value)] = fill
+        self.value = value
+        self.tags = tag_matrix(cards).astype(np.float64)
+
+        self.survival_rounds = list((survival or {}).get('rounds') or ())
+        table = np.full((len(cards), len(self.survival_rounds)), np.nan)
+        probs = (survival or {}).get('cards') or {}
+        for i, name in enumerate(self.names):
+            row = probs.get(name)
+            if row is not None:
+                table[i, :len(row)] = row
+        for col in table.T:
+            known = col[~np.isnan(col)]
+            col[np.isnan(col)] = known.mean() if len(known) else 0.0
+        self.survival = table
+        self.weights = (pair_weight, drafted_weight, return_weight)
+
+    def __len__(self):
+        return len(self.names)
+
+    def indices(self, names):
+        """Card indices for ``names``; ValueError listing any unknown ones."""
+        unknown = [n for n in names if n not in self.index]
+        if unknown:
+            raise ValueError(f"unknown card(s): {', '.join(unknown)}")
+        return [self.index[n] for n in names]
+
+    def split_hand(self, names):
+        """(occupation indices, minor indices) of a hand given by name."""
+        ids = self.indices(names)
+        return ([i for i in ids if self.types[i] == 0], [i for i in ids if self.types[i] == 1])
+
+    # --- Scoring --------------------------------------------------------
+
+    def _survival(self, ids, valid, rounds):
+        """P(card survives until its hand returns)."""
+        out = np.zeros(ids.shape)
+        for col, r in enumerate(self.survival_rounds):
+            rows = rounds == r
+            if rows.any():
+                out[rows] = self.survival[ids[rows], col]
+        return np.where(valid, out, 0.0)
+
+    @staticmethod
+    def _comeback(value, p, valid):
+        """(B, n): expected best value left on return if card i is taken now."""
+        b, n = value.shape
+        v = np.where(valid, value, -np.inf)
+        order = np.argsort(-v, axis=1, kind='stable')
+        vs = np.take_along_axis(np.where(valid, value, 0.0), order, axis=1)
+        ps = np.take_along_axis(p, order, axis=1)
+        floor = np.where(valid, value, np.inf).min(axis=1)
+        floor = np.where(np.isfinite(floor), floor, 0.0)
+
+        # Row i of the (n, n) block: the hand with sorted card i taken.
+        P = np.broadcast_to(ps[:, None, :], (b, n, n)).copy()
+        P[:, np.arange(n), np.arange(n)] = 0.0
+        gone = np.cumprod(1.0 - P, axis=2)
+        before = np.concatenate([np.ones((b, n, 1)), gone[:, :, :-1]], axis=2)
+        expected = (vs[:, None, :] * P * before).sum(axis=2) + gone[:, :, -1] * floor[:, None]
+
+        out = np.empty_like(expected)
+        np.put_along_axis(out, order, expected, axis=1)
+        return np.where(valid, out, 0.0)
+
+    def terms(self, occ, minor, rounds, drafted):
+        """Score components for padded index arrays (see ``evaluate_batch``).
+
+        Returns (per-occupation (B, n), per-minor (B, m), pair (B, n, m))
+        dicts of 'value', 'drafted' and 'comeback' arrays and the pair
+        synergy matrix, unweighted.
+        """
+        rounds = np.asarray(rounds)
+        returns = (rounds + self.players <= ROUNDS)[:, None]
+        sides = []
+        dprofile = None
+        if drafted is not None and drafted.size:
+            dvalid = drafted >= 0
+            dprofile = (self.tags[np.where(dvalid, drafted, 0)] * dvalid[..., None]).sum(axis=1)
+        vecs = []
+        for ids in (occ, minor):
+            valid = ids >= 0
+            safe = np.where(valid, ids, 0)
+            value = np.where(valid, self.value[safe], 0.0)
+            tags = self.tags[safe] * valid[..., None]
+            vecs.append(tags)
+            sides.append({
+                'valid': valid,
+                'value': value,
+                'drafted': (np.einsum('bnt,bt->bn', tags, dprofile) if dprofile is not None
+                            else np.zeros(ids.shape)),
+                'comeback': np.where(returns, self._comeback(
+                    value, self._survival(safe, valid, rounds), valid), 0.0),
+            })
+        pair = np.einsum('bnt,bmt->bnm', vecs[0], vecs[1])
+        return sides[0], sides[1], pair
+
+    def evaluate_batch(self, occ, minor, rounds, drafted=None):
+        """Scores of every pair for a batch of hands: (B, n, m), -inf on padding.
+
+        ``occ`` (B, n) and ``minor`` (B, m) hold card indices padded with
+        -1, ``rounds`` (B,) the draft round of each hand, ``drafted``
+        (B, d) the cards kept in earlier rounds (also -1 padded).
+        """
+        o, m, pair = self.terms(occ, minor, rounds, drafted)
+        pw, dw, rw = self.weights
+        side_o = o['value'] + dw * o['drafted'] + rw * o['comeback']
+        side_m = m['value'] + dw * m['drafted'] + rw * m['comeback']
+        scores = side_o[:, :, None] + side_m[:, None, :] + pw * pair
+        return np.where(o['valid'][:, :, None] & m['valid'][:, None, :], scores, -np.inf)
+
+    def evaluate(self, hand, round_num, drafted=(), k=10):
+        """Best ``k`` picks for one hand of card names, best first.
+
+        Returns dicts with the pair, its score and the weighted terms.
+        """
+        occ_ids, minor_ids = self.split_hand(hand)
+        if not occ_ids or not minor_ids:
+            raise ValueError("hand needs at least one occupation and one minor")
+        occ, minor = _pad([occ_ids]), _pad([minor_ids])
+        drafted = _pad([self.indices(drafted)]) if drafted else None
+        o, m, pair = self.terms(occ, minor, [round_num], drafted)
+        scores = self.evaluate_batch(occ, minor, [round_num], drafted)[0]
+        pw, dw, rw = self.weights
+        out = []
+        for flat in top_pairs(scores[None], k)[0]:
+            i, j = divmod(int(flat), scores.shape[1])
+            out.append({
+                'occupation': self.names[occ_ids[i]],
+                'minor': self.names[minor_ids[j]],
+                'score': float(scores[i, j]),
+                'value': float(o['value'][0, i] + m['value'][0, j]),
+                'synergy': float(pw * pair[0, i, j]),
+                'drafted': float(dw * (o['drafted'][0, i] + m['drafted'][0, j])),
+                'comeback': float(rw * (o['comeback'][0, i] + m['comeback'][0, j])),
+            })
+        return out
+
+
+def top_pairs(scores, k):
+    """(B, k) flat pair indices of the ``k`` best scores per hand, best first."""
+    flat = scores.reshape(len(scores), -1)
+    k = min(k, flat.shape[1])
+    top = np.argpartition(-flat, k - 1, axis=1)[:, :k]
+    order = np.argsort(-np.take_along_axis(flat, top, axis=1), axis=1, kind='stable')
+    return np.take_along_axis(top, order, axis=1)
+
+
+def replay_rows(model, drafts):
+    """Pack recorded drafts into one batch for ``evaluate_batch``.
+
+    ``drafts`` are draft states as draft.html saves and archives them
+    ({"hands": {round: names}, "draftedCards": {round: {"occupation",
+    "minor"}}, "othersDrafted": [...], ...}). Every round with a recorded
+    hand and both picks becomes a row; a returning hand's row leaves out
+    the cards opponents took (cardlib.pick_inference.hand_visits), and
+    cards unknown to the model are dropped. Returns (occ, minor, rounds,
+    drafted, picked occ, picked minor) arrays, the picks as column
+    positions within the row.
+    """
+    occ_rows, minor_rows, rounds, drafted_rows, pick_o, pick_m = [], [], [], [], [], []
+    index = model.index
+
+    def type_of(name):
+        return int(model.types[index[name]]) if name in index else None
+
+    for state in drafts:
+        picks = state.get('draftedCards') or {}
+        visits = {v.round: v for v in hand_visits(state, type_of)}
+        kept = []
+        for r in range(1, ROUNDS + 1):
+            visit = visits.get(r)
+            pick = picks.get(str(r)) or {}
+            o_name, m_name = pick.get('occupation'), pick.get('minor')
+            if visit is not None and o_name in index and m_name in index:
+                o_ids = [index[n] for n in visit.present.get(0, ())]
+                m_ids = [index[n] for n in visit.present.get(1, ())]
+                if index[o_name] in o_ids and index[m_name] in m_ids:
+                    occ_rows.append(o_ids)
+                    minor_rows.append(m_ids)
+                    rounds.append(r)
+                    drafted_rows.append(list(kept))
+                    pick_o.append(o_ids.index(index[o_name]))
+                    pick_m.append(m_ids.index(index[m_name]))
+            kept += [index[n] for n in (o_name, m_name) if n in index]
+    return (_pad(occ_rows), _pad(minor_rows), np.array(rounds, dtype=np.int32),
+            _pad(drafted_rows), np.array(pick_o, dtype=np.int32), np.array(pick_m, dtype=np.int32))
@@ -0,0 +1,271 @@
+"""
+Exact inference of what each opponent took from the hands you pass.
+
+Seat ``s`` (1 = the player you pass to) holds in round ``r + s`` the
+hand you held in round ``r``. A 4-player hand comes back after seats 1-3
+have each taken one occupation and one minor; at 3 players it comes back
+after seats 1 and 2, and the first hand goes round twice (rounds 1, 4
+and 7). After your last visit the hand keeps going round unseen.
+
+Picks follow the Plackett-Luce model of cardlib.draftsim: a drafter
+takes card c from what is left with probability w[c] / sum(w), where
+w = exp(-adp / temperature). For a hand you passed holding A (per card
+type) that came back as S, the taken set T = A - S is known but not who
+took what. With
+
+    F(X) = P(the first |X| picks are exactly the cards in X)
+    G(X) = P(the remaining picks are exactly T - X, given X is gone)
+
+the posterior that the i-th opponent took c is
+
+    sum over |X| = i - 1, c in T - X of
+        F(X) * w[c] / (W - w(X)) * G(X + c) / F(T)
+
+F and G run over subsets of T only: at most 8 states for 3 picks, where
+brute force would weigh every order of every way to deal the rest. For
+a hand not back yet (or never coming back) the same forward pass over
+subsets of A of size <= picks, with G = 1, gives each opponent's pick
+distribution and every card's chance to still be there: 176 states for
+10 cards and 3 picks.
+
+draft.html records a returning hand with the cards taken in between
+still in it and appends those cards to ``othersDrafted`` when the hand
+comes back, so ``hand_visits()`` splits ``othersDrafted`` among the
+visits in that order.
+
+Requires numpy (for cardlib.draftsim's card pools).
+"""
+
+import math
+
+from .draftsim import CARD_TYPES, PICKS, TEMPERATURE, card_pools
+
+
+class Visit:
+    """One of your visits to a hand: the cards in it and what was taken since.
+
+    ``present`` and ``taken`` map card type to names; ``taken`` is None
+    on your first visit. ``picked`` holds the names you took.
+    """
+
+    __slots__ = ('hand', 'round', 'present', 'taken', 'picked')
+
+    def __init__(self, hand, round_num, present, taken, picked):
+        self.hand = hand
+        self.round = round_num
+        self.present = present
+        self.taken = taken
+        self.picked = picked
+
+    def passed(self):
+        """{type: names} left in the hand after your pick."""
+        return {t: [n for n in names if n not in self.picked] for t, names in self.present.items()}
+
+
+def hand_visits(state, type_of):
+    """Your recorded visits to each hand of a draft state, in round order.
+
+    ``type_of`` maps a card name to its type, or None for cards it does
+    not know (temp cards), which are left out. Each hand's visits stop at
+    the first round without a recorded hand.
+    """
+    players = 3 if state.get('playerCount') == 3 else 4
+    hands = state.get('hands') or {}
+    drafted = state.get('draftedCards') or {}
+    others = [n for n in state.get('othersDrafted') or () if type_of(n) is not None]
+    used = set()
+    visits = []
+    for h in range(1, players + 1):
+        passed = None
+        for r in range(h, PICKS + 1, players):
+            names = hands.get(str(r))
+            if names is None:
+                break
+            if passed is None:
+                taken = None
+                present = {}
+                for n in dict.fromkeys(names):
+                    t = type_of(n)
+                    if t is not None:
+                        present.setdefault(t, []).append(n)
+            else:
+                taken = {t: [] for t in passed}
+                for n in others:
+                    t = type_of(n)
+                    if n not in used and n in passed.get(t, ()) and len(taken[t]) < players - 1:
+                        taken[t].append(n)
+                        used.add(n)
+                present = {t: [n for n in names if n not in taken[t]] for t, names in passed.items()}
+            pick = drafted.get(str(r)) or {}
+            visit = Visit(h, r, present, taken, {pick.get('occupation'), pick.get('minor')} - {None})
+            visits.append(visit)
+            passed = visit.passed()
+    visits.sort(key=lambda v: v.round)
+    return visits
+
+
+def pick_probs(weights, picks, taken=None):
+    """Per-pick card probabilities for ``picks`` Plackett-Luce picks.
+
+    ``weights`` are the cards' pick weights; ``taken`` (positions), if
+    given, is the set the picks are known to have taken, in unknown
+    order. Returns (rows, likelihood): ``picks`` rows of one probability
+    per card, and the probability of ``taken`` under the model (1.0
+    when not conditioning).
+    """
+    n = len(weights)
+    picks = min(picks, n)
+    total = sum(weights)
+    allowed = (1 << n) - 1 if taken is None else sum(1 << c for c in taken)
+    cards = [c for c in range(n) if allowed >> c & 1]
+
+    layers = [{0: [1.0, total]}]   # mask -> [F, weight left]
+    for _ in range(picks):
+        layer = {}
+        for mask, (f, rest) in layers[-1].items():
+            for c in cards:
+                if not mask >> c & 1:
+                    entry = layer.get(mask | 1 << c)
+                    p = f * weights[c] / rest
+                    if entry is None:
+                        layer[mask | 1 << c] = [p, rest - weights[c]]
+                    else:
+                        entry[0] += p
+        layers.append(layer)
+
+    if taken is None:
+        after = None
+        likelihood = 1.0
+    else:
+        after = {allowed: 1.0}
+        for layer in reversed(layers[:-1]):
+            for mask, (_, rest) in layer.items():
+                after[mask] = sum(weights[c] / rest * after[mask | 1 << c]
+                                  for c in cards if not mask >> c & 1)
+        likelihood = after[0]
+
+    rows = []
+    for layer in layers[:-1]:
+        row = [0.0] * n
+        for mask, (f, rest) in layer.items():
+            for c in cards:
+                if not mask >> c & 1:
+                    p = f * weights[c] / rest
+                    row[c] += p if after is None else p * after[mask | 1 << c]
+        if after is not None and likelihood > 0:
+            row = [p / likelihood for p in row]
+        rows.append(row)
+    return rows, likelihood
+
+
+class PickInference:
+    """Pick weights for one player count, and inference over draft states."""
+
+    __slots__ = ('players', 'weights', 'types')
+
+    def __init__(self, cards, players, temperature=TEMPERATURE):
+        self.players = players
+        self.weights = {}
+        self.types = {}
+        for card_type, (names, adp) in card_pools(cards, players).items():
+            for name, a in zip(names, adp):
+                self.weights[name] = math.exp(-a / temperature)
+                self.types[name] = card_type
+
+    def type_of(self, name):
+        return self.types.get(name)
+
+    def split(self, names):
+        """{type: names} of the known cards in ``names``."""
+        out = {t: [] for t in CARD_TYPES}
+        for n in dict.fromkeys(names):
+            if n in self.types:
+                out[self.types[n]].append(n)
+        return out
+
+    def picks(self, hand, picks, taken=None):
+        """Who takes what from one type's ``hand`` over the next ``picks`` picks.
+
+        With ``taken`` (the cards known to be gone when the hand came
+        back) the result is the posterior. Returns (list of {name: p}
+        per pick, likelihood of ``taken``).
+        """
+        weights = [self.weights[n] for n in hand]
+        positions = None if taken is None else [hand.index(n) for n in taken]
+        rows, likelihood = pick_probs(weights, picks, positions)
+        return [{n: p for n, p in zip(hand, row) if p > 0} for row in rows], likelihood
+
+    def survival(self, hand, picks=None):
+        """P(each card of ``hand`` is still there after ``picks`` picks).
+
+        ``hand`` is what you pass on; ``picks`` defaults to the opponent
+        picks before it comes back (players - 1). Unknown cards are
+        left out.
+        """
+        picks = self.players - 1 if picks is None else picks
+        out = {}
+        for names in self.split(hand).values():
+            rows, _ = self.picks(names, picks)
+            for n in names:
+                out[n] = 1.0 - sum(row.get(n, 0.0) for row in rows)
+        return out
+
+    def infer(self, state):
+        """Opponent-pick inference for every hand you have passed.
+
+        Returns {"segments": [...], "seats": {seat: {name: p}}}. Each
+        segment covers the picks after one of your visits: "hand",
+        "round", "status" ("observed" when the hand came back and its
+        marking adds up, "unmarked" when it came back but does not,
+        "pending" when it has not come back yet, "unseen" when it never
+        will), "likelihood" of the marking (observed only), "picks"
+        [{"round", "seat", "probs": {name: p}}] with one occupation and
+        one minor per pick, and "survival" {name: p} for the cards left
+        after your pick. "seats" sums each seat's picks over all hands.
+        """
+        players = self.players
+        visits = hand_visits(state, self.type_of)
+        following = {}
+        for v in visits:
+            following.setdefault(v.hand, []).append(v)
+
+        segments = []
+        seats = {s: {} for s in range(1, players)}
+        for v in visits:
+            later = following[v.hand]
+            nxt = later[later.index(v) + 1] if later[-1] is not v else None
+            passed = v.passed()
+            if nxt is not None:
+                expected = {t: min(players - 1, len(names)) for t, names in passed.items()}
+                marked = all(len(nxt.taken.get(t, ())) == k for t, k in expected.items())
+                status = 'observed' if marked else 'unmarked'
+                count = players - 1
+            elif v.round + players <= PICKS:
+                status, count = 'pending', players - 1
+            else:
+                status, count = 'unseen', PICKS - v.round
+
+            per_pick = [{} for _ in range(count)]
+            survival = {}
+            likelihood = 1.0
+            for t, names in passed.items():
+                taken = nxt.taken[t] if status == 'observed' else None
+                rows, lk = self.picks(names, count, taken)
+                likelihood *= lk
+                for i, row in enumerate(rows):
+                    per_pick[i].update(row)
+                for n in names:
+                    survival[n] = 1.0 - sum(row.get(n, 0.0) for row in rows)
+
+            picks = []
+            for i, probs in enumerate(per_pick):
+                seat = i + 1
+                picks.append({'round': v.round + seat, 'seat': seat, 'probs': probs})
+                for n, p in probs.items():
+                    seats[seat][n] = seats[seat].get(n, 0.0) + p
+            segment = {'hand': v.hand, 'round': v.round, 'status': status,
+                       'picks': picks, 'survival': survival}
+            if status == 'observed':
+                segment['likelihood'] = likelihood
+            segments.append(segment)
+        return {'segments': segments, 'seats': seats}
@@ -0,0 +1,212 @@
+"""
+A small dependency-graph runner for the data scripts.
+
+Each ``Stage`` names a script plus the files it reads (``inputs``) and
+writes (``outputs``). Several stages update agricola-cards.json in place,
+so a file may be both. Dependencies come from the declarations: a stage
+waits for every earlier-declared stage it shares a written file with
+(read-after-write, write-after-read or write-after-write), so
+declaration order settles the order of in-place updates.
+
+A stage is skipped when the content hashes of everything it touches,
+plus its script and the cardlib sources, are the ones recorded after its
+last successful run. Hashes are recorded once the whole run finishes, so
+an in-place edit by a later stage (add-tags rewriting the JSON
+merge_rankings wrote) does not make the earlier stage look stale next
+time. A directory is fingerprinted by its file names and sizes, not
+their contents.
+
+Ready stages run concurrently, each as its own ``python <script>``
+subprocess; output is captured and reported per stage.
+"""
+
+import hashlib
+import json
+import os
+import subprocess
+import sys
+import time
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+
+from . import trace
+from .paths import PACKAGE_DIR, ROOT_DIR, SCRIPT_DIR
+
+
+class Stage:
+    """One script in the pipeline and the files it reads and writes."""
+
+    __slots__ = ('name', 'script', 'args', 'inputs', 'outputs', 'deps')
+
+    def __init__(self, name, script, inputs=(), outputs=(), args=()):
+        self.name = name
+        self.script = os.path.join(SCRIPT_DIR, script)
+        self.args = list(args)
+        self.inputs = tuple(inputs)
+        self.outputs = tuple(outputs)
+        self.deps = set()
+
+    @property
+    def files(self):
+        return sorted(set(self.inputs) | set(self.outputs))
+
+    def __repr__(self):
+        return f"Stage({self.name!r})"
+
+
+class StageResult:
+    __slots__ = ('stage', 'status', 'seconds', 'output', 'returncode')
+
+    def __init__(self, stage, status, seconds=0.0, output='', returncode=0):
+        self.stage = stage
+        self.status = status  # 'ran', 'skipped', 'failed' or 'blocked'
+        self.seconds = seconds
+        self.output = output
+        self.returncode = returncode
+
+
+def link(stages):
+    """Fill in each stage's ``deps`` from the declared files; returns ``stages``."""
+    names = [s.name for s in stages]
+    if len(set(names)) != len(names):
+        raise ValueError("duplicate stage names")
+    for i, stage in enumerate(stages):
+        stage.deps = set()
+        reads, writes = set(stage.inputs), set(stage.outputs)
+        for earlier in stages[:i]:
+            if writes & (set(earlier.inputs) | set(earlier.outputs)) or reads & set(earlier.outputs):
+                stage.deps.add(earlier.name)
+    return stages
+
+
+def with_dependencies(stages, names):
+    """The named stages plus everything upstream of them, in declared order."""
+    by_name = {s.name: s for s in stages}
+    wanted = set()
+    todo = list(names)
+    while todo:
+        name = todo.pop()
+        if name not in wanted:
+            wanted.add(name)
+            todo.extend(by_name[name].deps)
+    return [s for s in stages if s.name in wanted]
+
+
+def _hash_file(path, h):
+    with open(path, 'rb') as f:
+        for chunk in iter(lambda: f.read(1 << 20), b''):
+            h.update(chunk)
+
+
+def fingerprint(path):
+    """Content hash of a file, a listing hash of a directory, None if missing."""
+    h = hashlib.sha256()
+    if os.path.isdir(path):
+        with os.scandir(path) as it:
+            entries = sorted((e.name, e.stat().st_size) for e in it if e.is_file())
+        for name, size in entries:
+            h.update(f"{name}\0{size}\n".encode('utf-8'))
+    elif os.path.exists(path):
+        _hash_file(path, h)
+    else:
+        return None
+    return h.hexdigest()
+
+
+def code_fingerprint():
+    """Hash of the cardlib sources, shared by every stage's key."""
+    h = hashlib.sha256()
+    for name in sorted(os.listdir(PACKAGE_DIR)):
+        if name.endswith('.py'):
+            h.update(name.encode('utf-8'))
+            _hash_file(os.path.join(PACKAGE_DIR, name), h)
+    return h.hexdigest()
+
+
+def stage_key(stage, code):
+    """Everything that decides whether ``stage`` needs to run again."""
+    return {
+        'code': code,
+        'script': fingerprint(stage.script),
+        'args': stage.args,
+        'files': {os.path.relpath(p, ROOT_DIR): fingerprint(p) for p in stage.files},
+    }
+
+
+def _run_script(stage):
+    t0 = time.perf_counter()
+    with trace.span(stage.name, script=os.path.basename(stage.script)):
+        proc = subprocess.run(
+            [sys.executable, stage.script, *stage.args],
+            cwd=SCRIPT_DIR, stdout=subprocess.PIPE, stderr=subprocess.STDOUT,
+            text=True, encoding='utf-8', errors='replace',
+        )
+    status = 'ran' if proc.returncode == 0 else 'failed'
+    return StageResult(stage, status, time.perf_counter() - t0, proc.stdout, proc.returncode)
+
+
+def run(stages, state, force=(), jobs=None, dry_run=False, on_done=None):
+    """Run ``stages`` (already linked) against the recorded ``state``.
+
+    ``state`` maps stage name -> key from the previous run; ``force``
+    names stages to run even if unchanged. ``on_done(result)`` is called
+    as each stage finishes. Returns (results in declared order, new state).
+    A stage's key is checked only once all its dependencies are done, so
+    it sees their fresh outputs.
+    """
+    code = code_fingerprint()
+    pending = {s.name: s for s in stages}
+    known = set(pending)
+    results = {}
+    running = {}
+
+    def finish(result):
+        results[result.stage.name] = result
+        if on_done is not None:
+            on_done(result)
+
+    with ThreadPoolExecutor(max_workers=jobs or os.cpu_count() or 1) as pool:
+        while pending or running:
+            for name, stage in list(pending.items()):
+                deps = stage.deps & known
+                if any(d not in results for d in deps):
+                    continue
+                del pending[name]
+                if any(results[d].status in ('failed', 'blocked') for d in deps):
+                    finish(StageResult(stage, 'blocked'))
+                elif name not in force and state.get(name) == stage_key(stage, code):
+                    finish(StageResult(stage, 'skipped'))
+                elif dry_run:
+                    finish(StageResult(stage, 'ran'))
+                else:
+                    running[pool.submit(_run_script, stage)] = name
+            if not running:
+                continue
+            done, _ = wait(running, return_when=FIRST_COMPLETED)
+            for future in done:
+                del running[future]
+                finish(future.result())
+
+    new_state = dict(state)
+    if not dry_run:
+        for result in results.values():
+            if result.status in ('ran', 'skipped'):
+                new_state[result.stage.name] = stage_key(result.stage, code)
+            else:
+                new_state.pop(result.stage.name, None)
+    return [results[s.name] for s in stages], new_state
+
+
+def load_state(path, version):
+    try:
+        with open(path, 'r', encoding='utf-8') as f:
+            state = json.load(f)
+    except FileNotFoundError:
+        return {}
+    if state.get('version') != version:
+        return {}
+    return state.get('stages', {})
+
+
+def save_state(path, version, stages):
+    with open(path, 'w', encoding='utf-8') as f:
+        json.dump({'version': version, 'stages': stages}, f, indent=2, sort_keys=True)
@@ -0,0 +1,173 @@
+"""
+Streaming ranking-TSV ingestion and vectorized stat derivation.
+
+``parse_tsv()`` reads a rankings export line by line into per-column
+string lists and converts the numeric columns to typed NumPy arrays in
+one shot each. ``derive_stats()`` then computes play rate, value and
+value-when-played for every row in a single vectorized pass, and
+``stats_records()`` formats them into the string fields stored in
+agricola-cards.json.
+
+Requires numpy.
+"""
+
+import os
+
+import numpy as np
+
+from . import trace
+
+# Numeric TSV columns and the dtype they are parsed into.
+NUMERIC_COLUMNS = {
+    'Rank': np.int32,
+    'ADP': np.float64,
+    'APR': np.float64,
+    'Drafted': np.int64,
+    'Plays': np.int64,
+    'Elo/Play': np.float64,
+}
+
+
+def _to_array(values, dtype):
+    """Convert a column of strings to ``dtype``.
+
+    Float columns map unparseable entries to NaN instead of failing the
+    whole column; integer columns must be clean, as before.
+    """
+    try:
+        return np.array(values, dtype=dtype)
+    except ValueError:
+        if not np.issubdtype(dtype, np.floating):
+            raise
+    out = np.empty(len(values), dtype=dtype)
+    for i, v in enumerate(values):
+        try:
+            out[i] = float(v)
+        except ValueError:
+            out[i] = np.nan
+    return out
+
+
+class RankingTable:
+    """Column-oriented contents of one rankings TSV.
+
+    ``raw`` keeps every column as stripped strings (the JSON stores
+    ADP/APR/Elo exactly as exported); ``column()`` returns typed arrays,
+    converted once and cached.
+    """
+
+    __slots__ = ('header', 'raw', '_typed')
+
+    def __init__(self, header, raw):
+        self.header = header
+        self.raw = raw
+        self._typed = {}
+
+    def __len__(self):
+        return len(self.raw[self.header[0]]) if self.header else 0
+
+    @property
+    def names(self) -> list[str]:
+        return self.raw.get('Card Name', [])
+
+    def column(self, name, dtype=None):
+        """Typed array for column ``name`` (dtype from NUMERIC_COLUMNS by default)."""
+        if name not in self._typed:
+            dtype = dtype or NUMERIC_COLUMNS.get(name, np.float64)
+            self._typed[name] = _to_array(self.raw.get(name, ['0'] * len(self)), dtype)
+        return self._typed[name]
+
+    def row(self, i) -> dict:
+        """Row ``i`` as a column -> string dict."""
+        return {col: self.raw[col][i] for col in self.header}
+
+
+def parse_tsv(filepath) -> RankingTable:
+    """Stream a rankings TSV file into a RankingTable.
+
+    Cells are whitespace-stripped (the 4p export right-aligns the
+    ``Card Name`` column with spaces); blank and short rows are skipped.
+    """
+    with trace.span('parse_tsv', path=os.path.basename(filepath)), \
+            open(filepath, 'r', encoding='utf-8') as f:
+        header = [h.strip() for h in f.readline().strip().split('\t')]
+        cols = [[] for _ in header]
+        width = len(header)
+        for line in f:
+            line = line.strip()
+            if not line:
+                continue
+            parts = line.split('\t')
+            if len(parts) < width:
+                continue
+            for col, part in zip(cols, parts):
+                col.append(part.strip())
+    table = RankingTable(header, dict(zip(header, cols)))
+    trace.count('rows_parsed', len(table))
+    return table
+
+
+def derive_stats(table: RankingTable) -> dict:
+    """Vectorized stat derivation over every row of ``table``.
+
+    Returns arrays keyed by stat field. ``value`` and
+    ``value_when_played`` are NaN where they cannot be computed (bad
+    numbers, or a card that was never played); they are stored as "0".
+    """
+    drafted = table.column('Drafted')
+    plays = table.column('Plays')
+    adp = table.column('ADP')
+    elo_per_play = table.column('Elo/Play')
+
+    played = drafted > 0
+    safe_drafted = np.where(played, drafted, 1)
+    # Plays/Drafted, 0 for cards never drafted
+    pr_frac = np.where(played, plays / safe_drafted, 0.0)
+    play_rate = np.where(played, np.rint(100 * plays / safe_drafted), 0).astype(np.int64)
+
+    # value = adp * elo_per_play
+    value = adp * elo_per_play
+
+    # value_when_played = elo_per_play / play_rate_fraction: the elo
+    # impact adjusted for how often the card is actually played
+    with np.errstate(divide='ignore', invalid='ignore'):
+        value_when_played = np.where(pr_frac > 0, elo_per_play / pr_frac, np.nan)
+
+    return {
+        'rank': table.column('Rank'),
+        'play_rate': play_rate,
+        'value': value,
+        'value_when_played': value_when_played,
+    }
+
+
+def _fmt(x, ndigits):
+    return '0' if x != x else str(round(x, ndigits))
+
+
+def stats_records(table: RankingTable, derived=None, rows=None) -> list[dict]:
+    """Format derived stats into the per-card dicts stored in the JSON.
+
+    ``rows`` limits the output to those row indexes, in that order.
+    """
+    if derived is None:
+        derived = derive_stats(table)
+    ranks = derived['rank'].tolist()
+    play_rates = derived['play_rate'].tolist()
+    values = derived['value'].tolist()
+    vwps = derived['value_when_played'].tolist()
+    raw_adp = table.raw.get('ADP', ['0'] * len(table))
+    raw_apr = table.raw.get('APR', ['0'] * len(table))
+    raw_epp = table.raw.get('Elo/Play', ['0'] * len(table))
+    return [
+        {
+            'rank': ranks[i],
+            'adp': raw_adp[i],
+            'apr': raw_apr[i],
+            'play_rate': f"{play_rates[i]}%",
+            'elo_per_play': raw_epp[i],
+            'value': _fmt(values[i], 4),
+            'value_when_played': _fmt(vwps[i], 1),
+        }
+        for i in (range(len(table)) if rows is None else rows)
+    ]
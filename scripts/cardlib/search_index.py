@@ -0,0 +1,169 @@
+"""
+Precomputed autocomplete index over card names, card IDs and aliases.
+
+The index is a plain JSON document so the browser can fetch it once and
+answer every keystroke with lookups instead of scanning the card list:
+
+    cards     [name, norm, card_id, type, rank_4p, rank_3p] rows, sorted
+              by 4p rank (3p-only cards after, by 3p rank). Everywhere
+              else a card is referred to by its row number, so a sorted
+              posting list is already in 4p rank order.
+    pos_3p    each row's position in 3p rank order, for 3-player drafts.
+    keys      sorted [key, row] pairs: each normalized name plus every
+              word-start suffix of it ("basketcarrier", "carrier") and
+              any aliases. A binary search for the typed prefix replaces
+              walking a trie.
+    ids       sorted [card_id, row] pairs (lowercased), consulted only
+              when the query contains a digit.
+    trigrams  {trigram: [row, ...]} over normalized names, for substring
+              queries of three or more characters.
+
+Keys and names go through ``cardlib.normalize``; queries must be
+normalized the same way. ``query()`` below is the reference lookup, and
+js/card-search.js (the index.html and draft.html autocomplete) mirrors
+it and ``normalize`` step for step, so change them together.
+"""
+
+import bisect
+import re
+
+from .normalize import normalize
+
+VERSION = 1
+
+_WORD_START_RE = re.compile(r"[\s\-]+")
+
+
+def _rank_key(rank, fallback):
+    return (rank is None, rank if rank is not None else 0, fallback)
+
+
+def word_suffixes(name: str) -> list[str]:
+    """Normalized suffixes of ``name`` starting at each word."""
+    words = [w for w in _WORD_START_RE.split(name.strip()) if w]
+    return [normalize(" ".join(words[i:])) for i in range(len(words))]
+
+
+def trigrams(s: str) -> list[str]:
+    return [s[i:i + 3] for i in range(len(s) - 2)]
+
+
+def _stats_rank(card):
+    stats = card.get('stats_3p')
+    return stats.get('rank') if stats else None
+
+
+def row_order(cards) -> list[int]:
+    """Positions in ``cards`` of the index's rows, in row order.
+
+    Lets a caller holding the same card list map the rows ``query_rows()``
+    returns back to its own records.
+    """
+    return sorted(
+        range(len(cards)),
+        key=lambda i: (_rank_key(cards[i].get('rank'), 0), _rank_key(_stats_rank(cards[i]), 0),
+                       cards[i]['name']),
+    )
+
+
+def build_search_index(cards, aliases=None):
+    """Build the index from card records and an alias -> card name map.
+
+    Returns ``(index, unknown)`` where ``unknown`` lists aliases whose
+    target card does not exist.
+    """
+    records = [cards[i] for i in row_order(cards)]
+    rows = []
+    row_by_norm = {}
+    for card in records:
+        norm = normalize(card['name'])
+        row_by_norm.setdefault(norm, len(rows))
+        rows.append([
+            card['name'], norm, card.get('card_id', ''), card.get('type', ''),
+            card.get('rank'), _stats_rank(card),
+        ])
+
+    keys = set()
+    ids = set()
+    grams = {}
+    for row, (name, norm, card_id, *_rest) in enumerate(rows):
+        for suffix in word_suffixes(name):
+            if suffix:
+                keys.add((suffix, row))
+        if card_id:
+            ids.add((card_id.lower(), row))
+        for gram in set(trigrams(norm)):
+            grams.setdefault(gram, []).append(row)
+
+    unknown = []
+    for alias, target in (aliases or {}).items():
+        row = row_by_norm.get(normalize(target))
+        if row is None:
+            unknown.append(alias)
+            continue
+        for suffix in word_suffixes(alias):
+            if suffix:
+                keys.add((suffix, row))
+
+    order_3p = sorted(range(len(rows)), key=lambda r: _rank_key(rows[r][5], r))
+    pos_3p = [0] * len(rows)
+    for pos, row in enumerate(order_3p):
+        pos_3p[row] = pos
+    index = {
+        'version': VERSION,
+        'cards': rows,
+        'pos_3p': pos_3p,
+        'keys': [list(k) for k in sorted(keys)],
+        'ids': [list(k) for k in sorted(ids)],
+        'trigrams': dict(sorted(grams.items())),
+    }
+    return index, sorted(unknown)
+
+
+def query(index: dict, text: str, limit: int = 10, player_count: int = 4,
+          exclude=frozenset()) -> list[str]:
+    """Card names matching ``text`` by prefix, word prefix or substring.
+
+    Results come back in 4p or 3p rank order; names in ``exclude`` (e.g.
+    cards already placed in the draft) are skipped. Distinct cards that
+    share a name each appear.
+    """
+    rows = index['cards']
+    return [rows[r][0] for r in query_rows(index, text, limit, player_count, exclude)]
+
+
+def query_rows(index: dict, text: str, limit: int = 10, player_count: int = 4,
+               exclude=frozenset()) -> list[int]:
+    """Like ``query()``, but returns the matching rows of ``index['cards']``."""
+    q = normalize(text)
+    if not q:
+        return []
+    rows = index['cards']
+    keys = index['keys']
+
+    hits = set()
+    tables = [keys, index['ids']] if any(ch.isdigit() for ch in q) else [keys]
+    for table in tables:
+        i = bisect.bisect_left(table, [q, -1])
+        while i < len(table) and table[i][0].startswith(q):
+            hits.add(table[i][1])
+            i += 1
+
+    if len(q) >= 3:
+        postings = [index['trigrams'].get(g) for g in set(trigrams(q))]
+        if all(postings):
+            postings.sort(key=len)
+            candidates = set(postings[0]).intersection(*postings[1:])
+            hits.update(r for r in candidates if q in rows[r][1])
+
+    if player_count == 3:
+        ordered = sorted(hits, key=index['pos_3p'].__getitem__)
+    else:
+        ordered = sorted(hits)
+    out = []
+    for r in ordered:
+        if rows[r][0] not in exclude:
+            out.append(r)
+            if len(out) == limit:
+                break
+    return out
@@ -0,0 +1,347 @@
+"""
+Typed columnar store of the per-card ranking stats.
+
+agricola-cards.json keeps every stat as text ("adp": "1.55",
+"play_rate": "93%"), top level for 4 players and in ``stats_3p`` for 3.
+``StatsStore`` parses them once, at build time
+(scripts/build_card_stats.py writes data/card-stats.bin), into one
+typed array per stat and player count:
+
+    rank, play_rate          int32 (play_rate in whole percent)
+    adp, apr, elo_per_play,  float32, plus a uint8 scale per cell: the
+    value, value_when_played digits after the point in the source text
+
+with an explicit null mask beside each column (the 4p stats of cards
+banned in 4p are None, for example) and a ``present`` mask for rows that
+have a stat block at that count at all. Card names, types and IDs are
+kept in a string column table. Consumers open the file and get NumPy
+views of the columns without parsing a single string.
+
+``stats()`` / ``export()`` turn a row back into the JSON's text fields;
+the scales make that exact, so the JSON stats are derived from the
+store and ``build_card_stats.py`` checks the round trip before writing.
+
+Layout (little-endian, every column 4-byte aligned)::
+
+    header      '<4sHHI20s'  magic, version, n_columns, n_rows, SHA-1
+                             of the card JSON the store was built from
+    columns     n_columns x '<32sB3xII'  name (UTF-8, NUL-padded),
+                                         kind, data offset, data length
+    data        F32 / I32 / U8: n_rows values
+                STR: u32 offsets[n_rows + 1], then the UTF-8 blob
+
+Column names are ``name``, ``type``, ``card_id`` and, per player count,
+``4p.present``, ``4p.<stat>``, ``4p.<stat>.null`` and, for decimal
+stats, ``4p.<stat>.scale``.
+
+Requires numpy.
+"""
+
+import hashlib
+import mmap
+import re
+import struct
+
+import numpy as np
+
+from .cards import load_cards
+from .paths import CARD_STATS_BIN, CARDS_JSON
+
+MAGIC = b'AGST'
+VERSION = 1
+
+HEADER = struct.Struct('<4sHHI20s')
+COLUMN = struct.Struct('<32sB3xII')
+
+F32, I32, U8, STR = range(1, 5)
+DTYPES = {F32: '<f4', I32: '<i4', U8: 'u1'}
+
+PLAYER_COUNTS = (4, 3)
+STRING_COLUMNS = ('name', 'type', 'card_id')
+INT_STATS = ('rank', 'play_rate')
+DECIMAL_STATS = ('adp', 'apr', 'elo_per_play', 'value', 'value_when_played')
+# JSON key order of a stats_3p block.
+STAT_FIELDS = ('rank', 'adp', 'apr', 'play_rate', 'elo_per_play', 'value', 'value_when_played')
+
+_DECIMAL_RE = re.compile(r'-?\d+(?:\.(\d+))?')
+_PERCENT_RE = re.compile(r'\d+%')
+
+
+def stat_block(record, players):
+    """The stats dict of ``record`` at ``players``, or None if it has none."""
+    if players == 3:
+        return record.get('stats_3p')
+    return None if record.get('banned_4p') else record
+
+
+def _parse(name, field, text):
+    """One JSON stat -> (number, scale); ValueError if it would not round-trip."""
+    if field == 'rank':
+        if type(text) is int and -2 ** 31 < text < 2 ** 31:
+            return text, 0
+    elif field == 'play_rate':
+        if isinstance(text, str) and _PERCENT_RE.fullmatch(text):
+            return int(text[:-1]), 0
+    elif isinstance(text, str):
+        m = _DECIMAL_RE.fullmatch(text)
+        if m is not None:
+            scale = len(m.group(1) or '')
+            if _format(np.float32(text), scale) == text:
+                return float(text), scale
+    raise ValueError(f"{name}: {field} {text!r} cannot be stored exactly")
+
+
+def _format(number, scale):
+    return f"{number:.{scale}f}"
+
+
+class StatBlock:
+    """Typed stat columns for one player count.
+
+    ``values[field]`` is the array, ``null[field]`` its null mask (True
+    where the JSON has None or no value), ``scale[field]`` the decimal
+    digits of each decimal stat.
+    """
+
+    __slots__ = ('players', 'present', 'values', 'null', 'scale')
+
+    def __init__(self, players, present, values, null, scale):
+        self.players = players
+        self.present = present
+        self.values = values
+        self.null = null
+        self.scale = scale
+
+    @classmethod
+    def from_records(cls, records, players):
+        n = len(records)
+        present = np.zeros(n, dtype=bool)
+        values = {f: np.zeros(n, dtype=np.int32 if f in INT_STATS else np.float32) for f in STAT_FIELDS}
+        null = {f: np.ones(n, dtype=bool) for f in STAT_FIELDS}
+        scale = {f: np.zeros(n, dtype=np.uint8) for f in DECIMAL_STATS}
+        for i, record in enumerate(records):
+            stats = stat_block(record, players)
+            if stats is None:
+                continue
+            present[i] = True
+            for field in STAT_FIELDS:
+                text = stats.get(field)
+                if text is not None:
+                    values[field][i], digits = _parse(record.get('name'), field, text)
+                    null[field][i] = False
+                    if field in scale:
+                        scale[field][i] = digits
+        return cls(players, present, values, null, scale)
+
+    def text(self, field, i):
+        """The JSON form of one cell, None when null."""
+        if self.null[field][i]:
+            return None
+        if field == 'rank':
+            return int(self.values[field][i])
+        if field == 'play_rate':
+            return f"{self.values[field][i]}%"
+        return _format(self.values[field][i], int(self.scale[field][i]))
+
+
+class StatsStore:
+    """Typed stats for every card row, at both player counts."""
+
+    __slots__ = ('strings', 'blocks', 'source', '_name_rank')
+
+    def __init__(self, strings, blocks, source=b''):
+        self.strings = strings
+        self.blocks = blocks
+        self.source = source
+        self._name_rank = None
+
+    @classmethod
+    def from_records(cls, records, source=b''):
+        """Parse the card records' stats. ``source`` is recorded as-is."""
+        strings = {col: [r.get(col) or '' for r in records] for col in STRING_COLUMNS}
+        blocks = {p: StatBlock.from_records(records, p) for p in PLAYER_COUNTS}
+        return cls(strings, blocks, source)
+
+    def __len__(self):
+        return len(self.strings['name'])
+
+    @property
+    def names(self) -> list[str]:
+        return self.strings['name']
+
+    # --- Queries ----------------------------------------------------------
+
+    def column(self, field, players=4):
+        """(values, valid) arrays for one stat; ``valid`` is False where null."""
+        block = self.blocks[players]
+        return block.values[field], ~block.null[field]
+
+    def name_rank(self):
+        """Each row's position in name order (ties by row), for stable sorts."""
+        if self._name_rank is None:
+            names = self.names
+            order = sorted(range(len(names)), key=lambda i: (names[i], i))
+            rank = np.empty(len(names), dtype=np.int32)
+            rank[order] = np.arange(len(names), dtype=np.int32)
+            self._name_rank = rank
+        return self._name_rank
+
+    def order(self, field, players=4, descending=False, rows=None):
+        """Row ids sorted by a stat, ties by name; rows without it last, by name.
+
+        ``rows`` limits the result to those ids. Descending reverses the
+        rows that have the stat, tie order included.
+        """
+        values, valid = self.column(field, players)
+        rows = np.arange(len(self), dtype=np.int32) if rows is None else np.asarray(rows, dtype=np.int32)
+        name_rank = self.name_rank()
+        has = rows[valid[rows]]
+        has = has[np.lexsort((name_rank[has], values[has]))]
+        if descending:
+            has = has[::-1]
+        missing = rows[~valid[rows]]
+        return np.concatenate([has, missing[np.argsort(name_rank[missing], kind='stable')]])
+
+    def where(self, field, players=4, lo=None, hi=None, rows=None):
+        """Row ids whose stat is non-null and within [lo, hi]."""
+        values, valid = self.column(field, players)
+        keep = valid.copy()
+        if lo is not None:
+            keep &= values >= lo
+        if hi is not None:
+            keep &= values <= hi
+        ids = np.flatnonzero(keep)
+        return ids if rows is None else np.intersect1d(ids, rows)
+
+    def top_k(self, field, k, players=4, descending=False, rows=None):
+        """The first ``k`` ids of ``order()`` without sorting every row."""
+        values, valid = self.column(field, players)
+        rows = np.arange(len(self), dtype=np.int32) if rows is None else np.asarray(rows, dtype=np.int32)
+        has = rows[valid[rows]]
+        if k >= len(has):
+            return self.order(field, players, descending, rows)[:k]
+        key = -values[has] if descending else values[has]
+        kth = np.partition(key, k - 1)[k - 1]
+        # Everything tied with the k-th value competes on name order.
+        return self.order(field, players, descending, has[key <= kth])[:k]
+
+    # --- JSON export ------------------------------------------------------
+
+    def stats(self, i, players):
+        """Row ``i``'s stats at ``players`` as the JSON stores them, or None."""
+        block = self.blocks[players]
+        if not block.present[i]:
+            return None
+        return {field: block.text(field, i) for field in STAT_FIELDS}
+
+    def export(self, records):
+        """Write every row's stat fields into ``records`` (the same rows) in place."""
+        if len(records) != len(self):
+            raise ValueError(f"store has {len(self)} rows, got {len(records)} records")
+        four = self.blocks[4]
+        for i, record in enumerate(records):
+            for field in STAT_FIELDS:
+                text = four.text(field, i) if four.present[i] else None
+                if text is not None or field in record:
+                    record[field] = text
+            stats = self.stats(i, 3)
+            if stats is not None or 'stats_3p' in record:
+                record['stats_3p'] = stats
+        return records
+
+    # --- Binary file ------------------------------------------------------
+
+    def _columns(self):
+        for col in STRING_COLUMNS:
+            yield col, STR, self.strings[col]
+        for players, block in self.blocks.items():
+            prefix = f"{players}p."
+            yield prefix + 'present', U8, block.present
+            for field in STAT_FIELDS:
+                yield prefix + field, I32 if field in INT_STATS else F32, block.values[field]
+                yield prefix + field + '.null', U8, block.null[field]
+                if field in block.scale:
+                    yield prefix + field + '.scale', U8, block.scale[field]
+
+    def tobytes(self) -> bytes:
+        columns = list(self._columns())
+        out = bytearray(HEADER.size + COLUMN.size * len(columns))
+        for c, (name, kind, data) in enumerate(columns):
+            out.extend(b'\0' * (-len(out) % 4))
+            if kind == STR:
+                blob = bytearray()
+                offsets = [0]
+                for s in data:
+                    blob += s.encode('utf-8')
+                    offsets.append(len(blob))
+                payload = struct.pack(f'<{len(offsets)}I', *offsets) + bytes(blob)
+            else:
+                payload = np.ascontiguousarray(data, dtype=DTYPES[kind]).tobytes()
+            COLUMN.pack_into(out, HEADER.size + c * COLUMN.size,
+                             name.encode('utf-8'), kind, len(out), len(payload))
+            out += payload
+        HEADER.pack_into(out, 0, MAGIC, VERSION, len(columns), len(self), self.source)
+        return bytes(out)
+
+    @classmethod
+    def frombuffer(cls, buf):
+        """Store over an encoded buffer; numeric columns are views into it."""
+        magic, version, n_columns, n_rows, source = HEADER.unpack_from(buf, 0)
+        if magic != MAGIC or version != VERSION:
+            raise ValueError(f"not a version {VERSION} card stats file")
+        columns = {}
+        for c in range(n_columns):
+            raw, kind, off, length = COLUMN.unpack_from(buf, HEADER.size + c * COLUMN.size)
+            name = raw.rstrip(b'\0').decode('utf-8')
+            if kind == STR:
+                offsets = struct.unpack_from(f'<{n_rows + 1}I', buf, off)
+                blob = bytes(buf[off + 4 * (n_rows + 1):off + length])
+                columns[name] = [blob[a:b].decode('utf-8') for a, b in zip(offsets, offsets[1:])]
+            elif kind in DTYPES:
+                columns[name] = np.frombuffer(buf, dtype=DTYPES[kind], count=n_rows, offset=off)
+            else:
+                raise ValueError(f"unknown column kind {kind} for {name!r}")
+        strings = {col: columns[col] for col in STRING_COLUMNS}
+        blocks = {}
+        for players in PLAYER_COUNTS:
+            prefix = f"{players}p."
+            blocks[players] = StatBlock(
+                players,
+                columns[prefix + 'present'].view(bool),
+                {f: columns[prefix + f] for f in STAT_FIELDS},
+                {f: columns[prefix + f + '.null'].view(bool) for f in STAT_FIELDS},
+                {f: columns[prefix + f + '.scale'] for f in DECIMAL_STATS},
+            )
+        return cls(strings, blocks, source)
+
+    @classmethod
+    def open(cls, path):
+        with open(path, 'rb') as f:
+            return cls.frombuffer(mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ))
+
+
+def source_hash(path) -> bytes:
+    """SHA-1 of a card JSON file, as recorded in the stats file built from it."""
+    with open(path, 'rb') as f:
+        return hashlib.sha1(f.read()).digest()
+
+
+def load_stats(records=None, cards_path=CARDS_JSON, path=CARD_STATS_BIN):
+    """The prebuilt store, if it was built from ``cards_path`` as it is now.
+
+    Otherwise (no file, or the JSON changed since) the stats are parsed
+    from ``records``, or from the card JSON when not given. With
+    ``records``, the prebuilt store must also hold the same card names
+    row for row; records edited in memory since loading are not noticed.
+    """
+    source = source_hash(cards_path)
+    try:
+        store = StatsStore.open(path)
+    except (FileNotFoundError, ValueError):
+        store = None
+    if store is not None and store.source == source and (
+            records is None or store.names == [r.get('name') or '' for r in records]):
+        return store
+    if records is None:
+        records = load_cards(cards_path).records
+    return StatsStore.from_records(records, source)
@@ -0,0 +1,97 @@
+"""
+Prebuilt card index and stats lookup for the strategy function.
+
+``api/strategy/index.js`` used to derive, on every cold start, the compact
+"name|rank|adp|O/M" card index it appends to the system prompt, and to
+resolve per-player-count stats for every card named in a request.
+``build_strategy_index()`` does both ahead of time for one player count:
+
+    version        artifact format version
+    player_count   3 or 4
+    source_sha256  SHA-256 of the agricola-cards.json it was built from
+    sha256         SHA-256 of the index text and card table below
+    index          the prompt index, one card per line
+    cards          {name: {name, rank, apr, adp, play_rate, elo_per_play,
+                           type, description, cost, vps, tags}}
+
+``cards`` holds exactly the objects ``enrichCards()`` used to assemble,
+keys in the same order and with missing stats left out, so the function
+can put them into the user message as they are.
+"""
+
+import hashlib
+import json
+
+VERSION = 1
+
+STAT_KEYS = ('rank', 'apr', 'adp', 'play_rate', 'elo_per_play')
+CARD_KEYS = ('type', 'description', 'cost', 'vps', 'tags')
+
+
+def _js(value) -> str:
+    """Format ``value`` the way a JS template literal would."""
+    if value is None:
+        return 'null'
+    if isinstance(value, bool):
+        return 'true' if value else 'false'
+    return str(value)
+
+
+def _stats(card, players):
+    if players == 3 and card.get('stats_3p'):
+        return card['stats_3p']
+    return card
+
+
+def index_lines(cards, players: int) -> list[str]:
+    lines = []
+    for c in cards:
+        if players == 3:
+            stats = c.get('stats_3p')
+            if not stats:
+                continue
+        else:
+            stats = c
+            if c.get('rank') is None:
+                continue
+        kind = 'O' if c.get('type') == 'Occupation' else 'M'
+        lines.append(f"{c['name']}|{_js(stats.get('rank'))}|{_js(stats.get('adp'))}|{kind}")
+    return lines
+
+
+def card_table(cards, players: int) -> dict:
+    """Name -> enriched card object; later duplicates win, like CARD_MAP."""
+    table = {}
+    for c in cards:
+        stats = _stats(c, players)
+        entry = {'name': c['name']}
+        entry.update((k, stats[k]) for k in STAT_KEYS if k in stats)
+        entry.update((k, c[k]) for k in CARD_KEYS if k in c)
+        table[c['name']] = entry
+    return table
+
+
+def build_strategy_index(cards, players: int, source: bytes) -> dict:
+    """Artifact for ``players`` built from the card records parsed from ``source``."""
+    index = "\n".join(index_lines(cards, players))
+    table = card_table(cards, players)
+    digest = hashlib.sha256()
+    digest.update(index.encode('utf-8'))
+    digest.update(json.dumps(table, ensure_ascii=False, sort_keys=True).encode('utf-8'))
+    return {
+        'version': VERSION,
+        'player_count': players,
+        'source_sha256': hashlib.sha256(source).hexdigest(),
+        'sha256': digest.hexdigest(),
+        'index': index,
+        'cards': table,
+    }
+
+
+def estimate_tokens(text: str):
+    """``(tokens, exact)``: tiktoken's o200k count if installed, else ~4 chars/token."""
+    try:
+        import tiktoken
+    except ImportError:
+        return round(len(text) / 4), False
+    return len(tiktoken.get_encoding('o200k_base').encode(text)), True
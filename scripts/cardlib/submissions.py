@@ -0,0 +1,208 @@
+"""
+Approved card submissions: reading, validation and bulk dedupe.
+
+api/submit-card turns each submission into a GitHub issue whose body ends
+with a machine-readable JSON block:
+
+    {"name": ..., "type": ..., "description": ..., "cost": ...,
+     "prerequisites": ..., "vps": ..., "passing": ..., "card_id": null,
+     "tags": []}
+
+``read_submissions()`` collects those objects from a JSONL file, a JSON
+file (one object or a list), a saved issue body (.md), or a directory of
+any of these. ``validate()`` applies the same rules as the function, so a
+hand-edited entry cannot sneak past them. ``plan()`` then sorts a whole
+batch against the card index in one go:
+
+    exact         normalized name (or alias) already in the dataset, or
+                  earlier in the batch
+    near          within ``NEAR_CUTOFF`` of a card (or an earlier
+                  submission) by the FuzzyIndex ratio: a likely typo of
+                  an existing card, held back unless explicitly allowed
+    new           everything else, as card records ready to append
+"""
+
+import json
+import os
+import re
+
+from .fuzzy import FuzzyIndex
+from .normalize import normalize
+
+VALID_TYPES = ('Occupation', 'Minor Improvement')
+PASSING_PHRASE = 'pass it to the player on your left'
+LIMITS = {'name': 100, 'description': 1000, 'cost': 50, 'prerequisites': 150, 'vps': 20}
+NAME_PUNCTUATION = frozenset("'-.,!&()")
+# Same threshold as fuzzy_rename.py.
+NEAR_CUTOFF = 0.85
+
+_JSON_BLOCK_RE = re.compile(r'```json\s*\n(.*?)\n```', re.S)
+
+
+class Submission:
+    """One approved submission: where it came from and its raw fields."""
+
+    __slots__ = ('source', 'raw')
+
+    def __init__(self, source, raw):
+        self.source = source
+        self.raw = raw
+
+    def __repr__(self):
+        return f"Submission({self.source!r}, {self.raw.get('name')!r})"
+
+
+def _read_file(path):
+    with open(path, 'r', encoding='utf-8') as f:
+        text = f.read()
+    name = os.path.basename(path)
+    if path.endswith('.jsonl'):
+        return [Submission(f"{name}:{n}", json.loads(line))
+                for n, line in enumerate(text.splitlines(), start=1) if line.strip()]
+    if path.endswith('.md'):
+        blocks = _JSON_BLOCK_RE.findall(text)
+        if not blocks:
+            raise ValueError(f"{name}: no ```json block")
+        return [Submission(name, json.loads(blocks[-1]))]
+    data = json.loads(text)
+    if isinstance(data, list):
+        return [Submission(f"{name}[{i}]", item) for i, item in enumerate(data)]
+    return [Submission(name, data)]
+
+
+def read_submissions(path):
+    """Submissions in ``path`` (a file, or a directory read in name order)."""
+    if not os.path.isdir(path):
+        return _read_file(path)
+    out = []
+    for name in sorted(os.listdir(path)):
+        if name.endswith(('.json', '.jsonl', '.md')):
+            out.extend(_read_file(os.path.join(path, name)))
+    return out
+
+
+def _text(raw, field):
+    value = raw.get(field)
+    if value is None:
+        return ''
+    if not isinstance(value, str):
+        raise ValueError(f"{field} must be a string")
+    return value.strip()
+
+
+def validate(raw):
+    """Card record for a submission, or raise ValueError naming the problem.
+
+    Mirrors api/submit-card: trimmed fields, the same length limits and
+    name characters, occupations never carry prerequisites or VPs, and
+    ``passing`` is derived from the description.
+    """
+    if not isinstance(raw, dict):
+        raise ValueError("submission must be a JSON object")
+    name = _text(raw, 'name')
+    card_type = raw.get('type')
+    description = _text(raw, 'description')
+    cost = _text(raw, 'cost')
+    prerequisites = '' if card_type == 'Occupation' else _text(raw, 'prerequisites')
+    vps = '' if card_type == 'Occupation' else _text(raw, 'vps')
+    card_id = raw.get('card_id') or ''
+
+    if not name:
+        raise ValueError("card name is required")
+    if not all(c.isalnum() or c.isspace() or c in NAME_PUNCTUATION for c in name):
+        raise ValueError("card name contains invalid characters")
+    if card_type not in VALID_TYPES:
+        raise ValueError('type must be "Occupation" or "Minor Improvement"')
+    for field, value in (('name', name), ('description', description), ('cost', cost),
+                         ('prerequisites', prerequisites), ('vps', vps)):
+        if len(value) > LIMITS[field]:
+            raise ValueError(f"{field} must be {LIMITS[field]} characters or less")
+    if not isinstance(card_id, str):
+        raise ValueError("card_id must be a string")
+
+    return {
+        'name': name,
+        'rank': None,
+        'adp': None,
+        'apr': None,
+        'play_rate': None,
+        'elo_per_play': None,
+        'value': None,
+        'value_when_played': None,
+        'description': description,
+        'card_id': card_id.strip(),
+        'type': card_type,
+        'cost': cost,
+        'vps': vps,
+        'prerequisites': prerequisites,
+        'passing': PASSING_PHRASE in description.lower(),
+        'tags': [],
+    }
+
+
+class Plan:
+    """Outcome of ``plan()``, each list in submission order.
+
+    ``new`` holds (submission, record); ``exact`` and ``near`` hold
+    (submission, matching name, ratio); ``invalid`` holds (submission,
+    message).
+    """
+
+    __slots__ = ('new', 'exact', 'near', 'invalid')
+
+    def __init__(self):
+        self.new = []
+        self.exact = []
+        self.near = []
+        self.invalid = []
+
+
+def plan(index, submissions, aliases=None, cutoff=NEAR_CUTOFF, allow=()):
+    """Sort ``submissions`` against ``index`` (a CardIndex) in one pass.
+
+    The dataset's names are indexed once (exact: ``by_norm`` plus
+    aliases; near: a FuzzyIndex over the normalized names), so each
+    submission costs a dict lookup and a trigram-blocked search rather
+    than a scan of every card. Names in ``allow`` skip the near-duplicate
+    check (for genuinely distinct cards with similar names).
+    """
+    known = {norm: card.name for norm, card in index.by_norm.items()}
+    for alias, target in (aliases or {}).items():
+        known.setdefault(normalize(alias), target)
+    fuzzy = FuzzyIndex(list(known), list(known.values()))
+    allow = {normalize(name) for name in allow}
+
+    result = Plan()
+    valid = []
+    for submission in submissions:
+        try:
+            valid.append((submission, validate(submission.raw)))
+        except ValueError as e:
+            result.invalid.append((submission, str(e)))
+
+    # Earlier submissions count as known too; the batch gets its own
+    # (small) index so the dataset's is built only once.
+    norms = [normalize(record['name']) for _, record in valid]
+    batch = FuzzyIndex(norms, list(range(len(norms))))
+    accepted = {}
+    for i, (submission, record) in enumerate(valid):
+        norm = norms[i]
+        if norm in known:
+            result.exact.append((submission, known[norm], 1.0))
+            continue
+        if norm in accepted:
+            result.exact.append((submission, accepted[norm], 1.0))
+            continue
+        if norm not in allow:
+            hit = fuzzy.best(norm, cutoff)
+            earlier = [(valid[j][1]['name'], ratio)
+                       for j, ratio in batch.search(norm, k=len(norms), cutoff=cutoff)
+                       if j < i and norms[j] in accepted]
+            if earlier and (hit is None or earlier[0][1] > hit[1]):
+                hit = earlier[0]
+            if hit is not None:
+                result.near.append((submission, hit[0], hit[1]))
+                continue
+        accepted[norm] = record['name']
+        result.new.append((submission, record))
+    return result
@@ -0,0 +1,209 @@
+"""
+Typo-tolerant card-name lookup for OCR output (SymSpell-style).
+
+Names read off a screenshot by the OCR function are usually a character
+or two away from the real card: "Basket Camier", "Cessp1t", "Wood
+Cart". Instead of scoring every card name (the Levenshtein scan in
+js/screenshot-ocr.js), the dictionary stores, for every name, the
+strings left after deleting up to ``max_distance`` characters from its
+first ``prefix_length`` characters. A query generates its own deletes
+the same way; any name sharing one of them is a candidate, and only
+candidates are scored. That is a fixed number of hash lookups per query,
+however many cards there are.
+
+Names are compared as *keys*: ``cardlib.normalize``, then ``ocr_key()``,
+which folds characters OCR commonly confuses (0/o, 1/l/i, 5/s, rn/m,
+vv/w) onto one spelling, so those confusions cost nothing. Aliases
+(data/card-aliases.json) are added as extra keys for their card.
+
+The artifact (data/ocr-name-dictionary.json) is plain JSON:
+
+    {"version": 1, "max_distance": 2, "prefix_length": 7,
+     "digits": {"0": "o", ...}, "folds": [["rn", "m"], ...],
+     "names": [canonical name, ...],
+     "keys": [[key, name index or [indices]], ...],
+     "deletes": {delete: key index or [key indices], ...}}
+
+``lookup()`` below is the reference implementation of the query side
+(js/screenshot-ocr.js mirrors it).
+"""
+
+import re
+
+from .normalize import normalize
+
+VERSION = 1
+MAX_DISTANCE = 2
+PREFIX_LENGTH = 7
+
+# OCR confusions, applied to both names and queries. Digits first, then
+# anything that is not a letter is dropped, then letter groups are folded.
+DIGITS = {'0': 'o', '1': 'l', '5': 's', '8': 'b', '|': 'l', '$': 's'}
+FOLDS = (('rn', 'm'), ('vv', 'w'), ('i', 'l'))
+
+_NON_LETTER_RE = re.compile(r'[^a-z]')
+
+
+def ocr_key(name: str) -> str:
+    """Normalize ``name`` and fold OCR-confusable characters."""
+    key = normalize(name)
+    key = ''.join(DIGITS.get(c, c) for c in key)
+    key = _NON_LETTER_RE.sub('', key)
+    for a, b in FOLDS:
+        key = key.replace(a, b)
+    return key
+
+
+def deletes(s: str, max_distance: int) -> set[str]:
+    """``s`` and every string left after deleting up to ``max_distance`` characters."""
+    out = {s}
+    frontier = {s}
+    for _ in range(max_distance):
+        frontier = {x[:i] + x[i + 1:] for x in frontier for i in range(len(x))}
+        out |= frontier
+    return out
+
+
+def distance(a: str, b: str, limit: int) -> int:
+    """Optimal string alignment distance, or ``limit + 1`` once it exceeds ``limit``.
+
+    Like Levenshtein, plus adjacent transpositions at cost 1.
+    """
+    if abs(len(a) - len(b)) > limit:
+        return limit + 1
+    prev2 = None
+    prev = list(range(len(b) + 1))
+    for i in range(1, len(a) + 1):
+        cur = [i] + [0] * len(b)
+        best = i
+        for j in range(1, len(b) + 1):
+            cost = 0 if a[i - 1] == b[j - 1] else 1
+            d = min(prev[j] + 1, cur[j - 1] + 1, prev[j - 1] + cost)
+            if (prev2 is not None and i > 1 and j > 1
+                    and a[i - 1] == b[j - 2] and a[i - 2] == b[j - 1]):
+                d = min(d, prev2[j - 2] + 1)
+            cur[j] = d
+            best = min(best, d)
+        if best > limit:
+            return limit + 1
+        prev2, prev = prev, cur
+    return prev[-1] if prev[-1] <= limit else limit + 1
+
+
+def allowed_distance(key: str, max_distance: int = MAX_DISTANCE) -> int:
+    """Edits tolerated for a query key: one per four characters, at least one."""
+    return min(max_distance, max(1, len(key) // 4))
+
+
+def _pack(ids):
+    return ids[0] if len(ids) == 1 else ids
+
+
+def _unpack(value):
+    return [value] if isinstance(value, int) else value
+
+
+def build_dictionary(names, aliases=None, max_distance=MAX_DISTANCE, prefix_length=PREFIX_LENGTH):
+    """Build the artifact for canonical ``names`` plus an alias -> name map.
+
+    Returns (dictionary, collisions), where collisions lists keys shared
+    by more than one card (ambiguous; lookups that land there prefer
+    the name whose plain normalized form, then whose spelling, is closer).
+    """
+    # Every distinct name is its own entry, even where two normalize alike
+    # (Greengrocer, Green Grocer); lookup() settles such ties.
+    names = list(dict.fromkeys(names))
+    exact = {name: i for i, name in enumerate(names)}
+    by_norm = {}
+    for i, name in enumerate(names):
+        by_norm.setdefault(normalize(name), []).append(i)
+    by_key = {}
+    for i, name in enumerate(names):
+        by_key.setdefault(ocr_key(name), []).append(i)
+    for alias, target in sorted((aliases or {}).items()):
+        targets = [exact[target]] if target in exact else by_norm.get(normalize(target), [])
+        ids = by_key.setdefault(ocr_key(alias), []) if targets else []
+        for i in targets:
+            if i not in ids:
+                ids.append(i)
+    by_key.pop('', None)
+
+    keys = sorted(by_key)
+    delete_map = {}
+    for k, key in enumerate(keys):
+        for d in deletes(key[:prefix_length], max_distance):
+            delete_map.setdefault(d, []).append(k)
+
+    collisions = [(key, [names[i] for i in by_key[key]]) for key in keys if len(by_key[key]) > 1]
+    dictionary = {
+        'version': VERSION,
+        'max_distance': max_distance,
+        'prefix_length': prefix_length,
+        'digits': DIGITS,
+        'folds': [list(f) for f in FOLDS],
+        'names': names,
+        'keys': [[key, _pack(by_key[key])] for key in keys],
+        'deletes': {d: _pack(ids) for d, ids in sorted(delete_map.items())},
+    }
+    return dictionary, collisions
+
+
+class NameDictionary:
+    """Query side of a ``build_dictionary()`` artifact."""
+
+    __slots__ = ('names', 'keys', 'key_names', 'exact', 'deletes', 'max_distance',
+                 'prefix_length', 'comparisons')
+
+    def __init__(self, dictionary):
+        if dictionary.get('version') != VERSION:
+            raise ValueError(f"unsupported dictionary version {dictionary.get('version')}")
+        self.names = dictionary['names']
+        self.keys = [key for key, _ in dictionary['keys']]
+        self.key_names = [_unpack(ids) for _, ids in dictionary['keys']]
+        self.exact = {key: k for k, key in enumerate(self.keys)}
+        self.deletes = dictionary['deletes']
+        self.max_distance = dictionary['max_distance']
+        self.prefix_length = dictionary['prefix_length']
+        # Candidate keys scored with distance(), for reporting.
+        self.comparisons = 0
+
+    def lookup(self, raw):
+        """Return (canonical name, distance) for an OCR'd name, or None.
+
+        None means no card is within the allowed distance, or two cards
+        are equally close and the query cannot tell them apart.
+        """
+        key = ocr_key(raw)
+        if not key:
+            return None
+        limit = allowed_distance(key, self.max_distance)
+        k = self.exact.get(key)
+        if k is not None:
+            best, best_d = self.key_names[k], 0
+        else:
+            candidates = set()
+            for d in deletes(key[:self.prefix_length], limit):
+                ids = self.deletes.get(d)
+                if ids is not None:
+                    candidates.update(_unpack(ids))
+            best, best_d = [], limit + 1
+            for k in candidates:
+                self.comparisons += 1
+                dist = distance(key, self.keys[k], best_d if best else limit)
+                if dist < best_d:
+                    best, best_d = list(self.key_names[k]), dist
+                elif dist == best_d and dist <= limit:
+                    best += [i for i in self.key_names[k] if i not in best]
+            if not best:
+                return None
+        if len(best) > 1:
+            # Same folded distance: fall back to the unfolded spelling, then
+            # to spacing and case for names that normalize alike.
+            plain = normalize(raw)
+            spelled = raw.strip().lower()
+            scored = sorted((distance(plain, normalize(self.names[i]), 64),
+                             distance(spelled, self.names[i].lower(), 64), i) for i in best)
+            if scored[0][:2] == scored[1][:2]:
+                return None
+            best = [scored[0][2]]
+        return self.names[best[0]], best_d
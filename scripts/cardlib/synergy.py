@@ -0,0 +1,155 @@
+"""
+Pairwise card synergy scores and top-k partner lists.
+
+Each card is described by three sparse feature sets:
+
+    tags       its strategy tags (shared tags count most)
+    terms      TF-IDF weighted description terms: single words plus the
+               quoted action-space names ("Day Laborer", "Grain Seeds")
+    resources  what it produces (resources its description gives) and
+               what it consumes (resources in its cost/prerequisites)
+
+The synergy of two cards is a weighted sum of the cosine similarity of
+their tag and term vectors and a producer/consumer match: card A giving
+wood goes well with card B costing wood, in either direction.
+
+``top_k_partners()`` computes the scores a block of rows at a time and
+keeps only each card's ``k`` best partners, so memory stays
+O(block x cards) and the full matrix is never materialised.
+
+Requires numpy.
+"""
+
+import re
+
+import numpy as np
+
+WEIGHTS = {'tags': 0.5, 'terms': 0.35, 'resources': 0.15}
+
+RESOURCES = (
+    'wood', 'clay', 'reed', 'stone', 'grain', 'vegetable', 'food',
+    'sheep', 'wild boar', 'cattle', 'occupation', 'field', 'pasture',
+    'room', 'stable',
+)
+_RESOURCE_RE = re.compile(
+    r"\b(" + "|".join(r.replace(' ', r'\s+') for r in RESOURCES) + r")(?:s|es)?\b", re.I
+)
+_AMOUNT_RE = re.compile(
+    r"(\d+)\s+(" + "|".join(r.replace(' ', r'\s+') for r in RESOURCES) + r")(?:s|es)?\b", re.I
+)
+# "you get 2 wood", "you immediately get 1 grain and 1 food", "receive 3 clay"
+_GAIN_RE = re.compile(r"\b(?:get|gets|receive|receives|take|takes)\b([^.;]*)", re.I)
+_QUOTED_RE = re.compile(r'"([^"]+)"')
+_WORD_RE = re.compile(r"[a-z]+")
+
+STOPWORDS = frozenset("""
+a about after afterward all also an and any are as at be before both but by can card
+cards choose each either even exactly for from get gets has have if immediately in
+instead into is it its just least may more most must next no not now of on once one
+only or other own per play played player players same so such than that the their them
+then there these they this those through time times to total until up use used uses
+using via was when where whether which while who with without you your
+""".split())
+
+
+def _resource_index(name):
+    name = re.sub(r'\s+', ' ', name.lower())
+    return RESOURCES.index(name)
+
+
+def _words(text):
+    return [w for w in _WORD_RE.findall(text.lower()) if len(w) > 2 and w not in STOPWORDS]
+
+
+def _normalize_rows(m):
+    norms = np.linalg.norm(m, axis=1, keepdims=True)
+    norms[norms == 0] = 1
+    return m / norms
+
+
+def tag_matrix(cards):
+    tags = sorted({t for c in cards for t in c.get('tags') or ()})
+    col = {t: j for j, t in enumerate(tags)}
+    m = np.zeros((len(cards), len(tags)), dtype=np.float32)
+    for i, c in enumerate(cards):
+        for t in c.get('tags') or ():
+            m[i, col[t]] = 1
+    return _normalize_rows(m)
+
+
+def term_matrix(cards, min_df=2, max_df=0.3):
+    """Row-normalized TF-IDF over description words and quoted space names."""
+    docs = []
+    for c in cards:
+        text = c.get('description') or ''
+        terms = _words(_QUOTED_RE.sub(' ', text))
+        terms += ['"' + q.lower() + '"' for q in _QUOTED_RE.findall(text)]
+        docs.append(terms)
+
+    df = {}
+    for terms in docs:
+        for t in set(terms):
+            df[t] = df.get(t, 0) + 1
+    n = len(docs)
+    vocab = sorted(t for t, d in df.items() if d >= min_df and d <= max_df * n)
+    col = {t: j for j, t in enumerate(vocab)}
+    idf = np.array([np.log(n / df[t]) for t in vocab], dtype=np.float32)
+
+    m = np.zeros((n, len(vocab)), dtype=np.float32)
+    for i, terms in enumerate(docs):
+        for t in terms:
+            j = col.get(t)
+            if j is not None:
+                m[i, j] += 1
+    return _normalize_rows(m * idf)
+
+
+def resource_matrices(cards):
+    """(produces, consumes) row-normalized resource vectors."""
+    produces = np.zeros((len(cards), len(RESOURCES)), dtype=np.float32)
+    consumes = np.zeros_like(produces)
+    for i, c in enumerate(cards):
+        for clause in _GAIN_RE.findall(c.get('description') or ''):
+            for name in _RESOURCE_RE.findall(clause):
+                produces[i, _resource_index(name)] += 1
+        needs = f"{c.get('cost') or ''}, {c.get('prerequisites') or ''}"
+        for amount, name in _AMOUNT_RE.findall(needs):
+            consumes[i, _resource_index(name)] += int(amount)
+    return _normalize_rows(produces), _normalize_rows(consumes)
+
+
+def top_k_partners(cards, k=10, weights=WEIGHTS, block=512):
+    """Each card's ``k`` highest-synergy partners.
+
+    Returns ``(indices, scores)``, both shaped (len(cards), k), best
+    first; slots without a positive score have index -1.
+    """
+    n = len(cards)
+    k = max(0, min(k, n - 1))
+    indices = np.full((n, k), -1, dtype=np.int32)
+    scores = np.zeros((n, k), dtype=np.float32)
+    if k == 0:
+        # A single card (or k <= 0) has no partners to rank.
+        return indices, scores
+
+    tags = tag_matrix(cards)
+    terms = term_matrix(cards)
+    produces, consumes = resource_matrices(cards)
+    for start in range(0, n, block):
+        stop = min(start + block, n)
+        s = weights['tags'] * (tags[start:stop] @ tags.T)
+        s += weights['terms'] * (terms[start:stop] @ terms.T)
+        s += weights['resources'] / 2 * (
+            produces[start:stop] @ consumes.T + consumes[start:stop] @ produces.T
+        )
+        s[np.arange(stop - start), np.arange(start, stop)] = 0  # no self-synergy
+
+        top = np.argpartition(-s, k - 1, axis=1)[:, :k]
+        top_scores = np.take_along_axis(s, top, axis=1)
+        order = np.lexsort((top, -top_scores), axis=1)
+        top = np.take_along_axis(top, order, axis=1)
+        top_scores = np.take_along_axis(top_scores, order, axis=1)
+        keep = top_scores > 0
+        indices[start:stop] = np.where(keep, top, -1)
+        scores[start:stop] = np.where(keep, top_scores, 0)
+    return indices, scores
@@ -0,0 +1,110 @@
+"""
+Synthetic, scaled copies of the card data for benchmarks.
+
+``write_dataset(out_dir, scale)`` writes a self-contained data set shaped
+like the real one, ``scale`` times larger:
+
+    out_dir/agricola-cards.json         every real card, ``scale`` times,
+                                        copies renamed "<name> <n>"
+    out_dir/agricola-4p-rankings.tsv    the real ranking rows, replicated
+    out_dir/agricola-3p-rankings.tsv    the same way
+    out_dir/card-images/                empty .png files named after the
+                                        cards: mostly exact, some with
+                                        typos, some missing, plus strays
+
+Copies reuse the real records and TSV rows, so value distributions,
+description lengths and name shapes match the real data. Output is
+deterministic for a given seed.
+"""
+
+import json
+import os
+import random
+import string
+
+from .paths import CARDS_JSON, TSV_3P, TSV_4P
+
+IMAGE_TYPO_RATE = 0.04
+IMAGE_MISSING_RATE = 0.03
+IMAGE_STRAY_RATE = 0.02
+
+
+def _copy_name(name, copy):
+    return name if copy == 0 else f"{name} {copy + 1}"
+
+
+def _read_tsv(path):
+    with open(path, 'r', encoding='utf-8') as f:
+        lines = f.read().splitlines()
+    header = lines[0].split('\t')
+    return header, [line.split('\t') for line in lines[1:] if line.strip()]
+
+
+def _typo(name, rng):
+    s = list(name)
+    pos = rng.randrange(len(s))
+    if rng.random() < 0.5 and len(s) > 4:
+        del s[pos]
+    else:
+        s[pos] = rng.choice(string.ascii_lowercase)
+    return "".join(s)
+
+
+def write_tsv(path, header, rows, scale):
+    name_col = header.index('Card Name') if 'Card Name' in header else 1
+    with open(path, 'w', encoding='utf-8') as f:
+        f.write('\t'.join(header) + '\n')
+        rank = 0
+        for copy in range(scale):
+            for row in rows:
+                rank += 1
+                row = list(row)
+                row[0] = str(rank)
+                row[name_col] = _copy_name(row[name_col].strip(), copy)
+                f.write('\t'.join(row) + '\n')
+
+
+def write_dataset(out_dir, scale=1, seed=0):
+    """Write a ``scale``x data set under ``out_dir``; return its paths."""
+    rng = random.Random(seed)
+    os.makedirs(out_dir, exist_ok=True)
+    paths = {
+        'cards': os.path.join(out_dir, 'agricola-cards.json'),
+        'api_cards': os.path.join(out_dir, 'api-agricola-cards.json'),
+        'tsv_4p': os.path.join(out_dir, 'agricola-4p-rankings.tsv'),
+        'tsv_3p': os.path.join(out_dir, 'agricola-3p-rankings.tsv'),
+        'images': os.path.join(out_dir, 'card-images') + '/',
+    }
+
+    with open(CARDS_JSON, 'r', encoding='utf-8') as f:
+        base = json.load(f)
+    cards = []
+    for copy in range(scale):
+        for record in base:
+            record = dict(record, name=_copy_name(record['name'], copy))
+            cards.append(record)
+    with open(paths['cards'], 'w', encoding='utf-8') as f:
+        json.dump(cards, f, indent=2, ensure_ascii=False)
+
+    for key, src in (('tsv_4p', TSV_4P), ('tsv_3p', TSV_3P)):
+        header, rows = _read_tsv(src)
+        write_tsv(paths[key], header, rows, scale)
+
+    os.makedirs(paths['images'], exist_ok=True)
+    images = set()
+    for card in cards:
+        r = rng.random()
+        if r < IMAGE_MISSING_RATE:
+            continue
+        name = card['name'].lower()
+        if r < IMAGE_MISSING_RATE + IMAGE_TYPO_RATE:
+            name = _typo(name, rng)
+        images.add(name + '.png')
+    for _ in range(int(len(cards) * IMAGE_STRAY_RATE)):
+        images.add("".join(rng.choices(string.ascii_lowercase, k=rng.randint(6, 16))) + '.png')
+    for name in images:
+        open(os.path.join(paths['images'], name), 'wb').close()
+
+    paths['n_cards'] = len(cards)
+    paths['n_images'] = len(images)
+    return paths
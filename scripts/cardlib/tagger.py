@@ -0,0 +1,146 @@
+"""
+Rule-based strategy tagging of card descriptions.
+
+Rules are declarative (data/tag-rules.json): each tag lists the phrases
+that imply it. A phrase matches whole words, case-insensitively; a
+trailing ``*`` lets the last word continue ("renovat*" matches
+"renovate" and "renovation"):
+
+    {"version": 1,
+     "tags": {"Fishing": ["fishing", "fish*"], ...}}
+
+All phrases of all tags are compiled into one Aho-Corasick automaton, so
+tagging a description is a single pass over its characters regardless of
+how many rules there are, and overlapping phrases from different tags
+are all reported.
+
+Manual overrides (data/tag-overrides.json) are layered on top of the
+rule output, per card name:
+
+    {"Bookcase": {"add": ["Lesson"]}, "Cow Patty": {"remove": ["Animal"]}}
+"""
+
+import hashlib
+import json
+from collections import deque
+
+from .paths import TAG_OVERRIDES_JSON, TAG_RULES_JSON
+
+RULES_VERSION = 1
+
+
+class PhraseMatcher:
+    """Aho-Corasick automaton over lowercase phrases.
+
+    Each phrase carries a payload; ``find(text)`` returns the set of
+    payloads whose phrase occurs in ``text`` as whole words.
+    """
+
+    __slots__ = ('goto', 'fail', 'out')
+
+    def __init__(self, phrases):
+        """``phrases``: iterable of (phrase, payload)."""
+        self.goto = [{}]
+        self.fail = [0]
+        self.out = [[]]  # state -> [(length, open_ended, payload)]
+        for phrase, payload in phrases:
+            phrase = phrase.lower().strip()
+            open_ended = phrase.endswith('*')
+            if open_ended:
+                phrase = phrase[:-1]
+            if not phrase:
+                continue
+            state = 0
+            for ch in phrase:
+                nxt = self.goto[state].get(ch)
+                if nxt is None:
+                    nxt = len(self.goto)
+                    self.goto[state][ch] = nxt
+                    self.goto.append({})
+                    self.fail.append(0)
+                    self.out.append([])
+                state = nxt
+            self.out[state].append((len(phrase), open_ended, payload))
+
+        queue = deque(self.goto[0].values())
+        while queue:
+            state = queue.popleft()
+            for ch, nxt in self.goto[state].items():
+                queue.append(nxt)
+                f = self.fail[state]
+                while f and ch not in self.goto[f]:
+                    f = self.fail[f]
+                self.fail[nxt] = self.goto[f].get(ch, 0)
+                self.out[nxt] = self.out[nxt] + self.out[self.fail[nxt]]
+
+    def find(self, text: str) -> set:
+        text = text.lower()
+        n = len(text)
+        goto, fail, out = self.goto, self.fail, self.out
+        found = set()
+        state = 0
+        for i, ch in enumerate(text):
+            while state and ch not in goto[state]:
+                state = fail[state]
+            state = goto[state].get(ch, 0)
+            for length, open_ended, payload in out[state]:
+                start = i - length + 1
+                if start > 0 and text[start - 1].isalnum():
+                    continue
+                if not open_ended and i + 1 < n and text[i + 1].isalnum():
+                    continue
+                found.add(payload)
+        return found
+
+
+def load_rules(path: str = TAG_RULES_JSON) -> dict[str, list[str]]:
+    with open(path, 'r', encoding='utf-8') as f:
+        rules = json.load(f)
+    if rules.get('version') != RULES_VERSION:
+        raise ValueError(f"{path}: unsupported rules version {rules.get('version')!r}")
+    return rules['tags']
+
+
+def load_overrides(path: str = TAG_OVERRIDES_JSON) -> dict[str, dict]:
+    """Card name -> {"add": [...], "remove": [...]}, or {} if no file exists."""
+    try:
+        with open(path, 'r', encoding='utf-8') as f:
+            return json.load(f)
+    except FileNotFoundError:
+        return {}
+
+
+def rule_hashes(rules: dict) -> dict[str, str]:
+    """Tag -> hash of its phrase list, to tell which tags' rules changed."""
+    return {
+        tag: hashlib.sha1(json.dumps(sorted(phrases), ensure_ascii=False).encode('utf-8')).hexdigest()
+        for tag, phrases in rules.items()
+    }
+
+
+def text_hash(text: str) -> str:
+    return hashlib.sha1(text.encode('utf-8')).hexdigest()
+
+
+class Tagger:
+    """Rule tags for card descriptions, from one compiled matcher."""
+
+    __slots__ = ('tags', 'matcher')
+
+    def __init__(self, rules: dict):
+        self.tags = list(rules)
+        self.matcher = PhraseMatcher(
+            (phrase, tag) for tag, phrases in rules.items() for phrase in phrases
+        )
+
+    def tag(self, description: str) -> set[str]:
+        return self.matcher.find(description or '')
+
+
+def apply_override(tags, override) -> list[str]:
+    """Rule tags with an override's "add"/"remove" applied, sorted."""
+    result = set(tags)
+    if override:
+        result.update(override.get('add', ()))
+        result.difference_update(override.get('remove', ()))
+    return sorted(result)
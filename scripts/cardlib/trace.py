@@ -0,0 +1,223 @@
+"""
+Opt-in timing spans, counters and cProfile capture for the data scripts.
+
+    from cardlib import trace
+
+    with trace.span('merge'):
+        with trace.span('parse_tsv', path=p):  # spans nest
+            table = parse_tsv(p)
+        trace.count('rows_parsed', len(table))
+
+Tracing is off unless the AGRICOLA_TRACE environment variable names an
+output file, or a script's ``--profile`` flag (``add_arguments()`` /
+``configure()``) sets it. When off, ``span()`` returns a shared no-op
+context manager and ``count()`` returns at once, so the calls can stay
+in the code; keep ``count()`` out of per-item inner loops and add batch
+totals instead.
+
+When on, events are buffered in memory and appended to the file as JSON
+lines when the process exits, one object per line:
+
+    {"type": "process", "run": ..., "pid": ..., "script": ..., "argv": [...],
+     "ts": ..., "dur": ...}
+    {"type": "span", "run": ..., "pid": ..., "tid": ..., "name": ...,
+     "parent": ..., "depth": ..., "ts": ..., "dur": ..., "args": {...}}
+    {"type": "counter", "run": ..., "pid": ..., "name": ..., "value": ...}
+
+``ts`` is wall-clock microseconds, ``dur`` microseconds. Processes
+started by run_pipeline.py inherit the variables, so one pipeline run's
+events share a ``run`` id and land in the same file; successive runs
+append, so they can be compared later (scripts/trace_report.py, which
+also converts a run to Chrome trace format).
+
+With AGRICOLA_PROFILE=1 (or ``--cprofile``) each process also runs
+under cProfile from the moment tracing starts, and dumps
+``<trace file>.<run>.<script>.<pid>.prof`` for pstats / snakeviz at
+exit; the process event records the path. Every pipeline stage is its
+own process, so that is one profile per stage.
+"""
+
+import atexit
+import cProfile
+import json
+import os
+import sys
+import threading
+import time
+import uuid
+
+from .paths import DATA_DIR
+
+ENV_TRACE = 'AGRICOLA_TRACE'
+ENV_PROFILE = 'AGRICOLA_PROFILE'
+ENV_RUN = 'AGRICOLA_TRACE_RUN'
+
+# Where --profile writes when no path is given (git-ignored).
+DEFAULT_TRACE = os.path.join(DATA_DIR, 'pipeline-trace.jsonl')
+
+
+class _Noop:
+    __slots__ = ()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        return False
+
+
+_NOOP = _Noop()
+
+_enabled = False
+_path = None
+_run = None
+_events = []
+_counters = {}
+_lock = threading.Lock()
+_local = threading.local()
+_profiler = None
+# Wall clock at start, paired with perf_counter_ns for monotonic offsets.
+_wall0 = 0
+_perf0 = 0
+
+
+def _now_us():
+    return _wall0 + (time.perf_counter_ns() - _perf0) // 1000
+
+
+def enabled():
+    return _enabled
+
+
+def enable(path, profile=False, run=None):
+    """Start tracing to ``path`` for the rest of the process.
+
+    Also exports the settings to the environment, so child processes
+    (pipeline stages) trace into the same file under the same run id.
+    """
+    global _enabled, _path, _run, _wall0, _perf0, _profiler
+    if _enabled:
+        return
+    _path = os.path.abspath(path)
+    _run = run or os.environ.get(ENV_RUN) or uuid.uuid4().hex[:12]
+    _wall0 = time.time_ns() // 1000
+    _perf0 = time.perf_counter_ns()
+    _enabled = True
+    os.environ[ENV_TRACE] = _path
+    os.environ[ENV_RUN] = _run
+    if profile:
+        os.environ[ENV_PROFILE] = '1'
+        _profiler = cProfile.Profile()
+        _profiler.enable()
+    atexit.register(flush)
+
+
+def _stack():
+    stack = getattr(_local, 'stack', None)
+    if stack is None:
+        stack = _local.stack = []
+    return stack
+
+
+class _Span:
+    __slots__ = ('name', 'args', 'start')
+
+    def __init__(self, name, args):
+        self.name = name
+        self.args = args
+
+    def __enter__(self):
+        _stack().append(self.name)
+        self.start = _now_us()
+        return self
+
+    def __exit__(self, *exc):
+        end = _now_us()
+        stack = _stack()
+        stack.pop()
+        event = {
+            'type': 'span', 'run': _run, 'pid': os.getpid(), 'tid': threading.get_ident(),
+            'name': self.name, 'parent': stack[-1] if stack else None, 'depth': len(stack),
+            'ts': self.start, 'dur': end - self.start,
+        }
+        if self.args:
+            event['args'] = self.args
+        if exc[0] is not None:
+            event['error'] = exc[0].__name__
+        with _lock:
+            _events.append(event)
+        return False
+
+
+def span(name, **args):
+    """Context manager timing a block as ``name``; ``args`` are recorded with it."""
+    if not _enabled:
+        return _NOOP
+    return _Span(name, args)
+
+
+def count(name, n=1):
+    """Add ``n`` to counter ``name`` (reported once, at exit)."""
+    if not _enabled:
+        return
+    with _lock:
+        _counters[name] = _counters.get(name, 0) + n
+
+
+def flush():
+    """Append the buffered events to the trace file."""
+    if not _enabled:
+        return
+    with _lock:
+        events = list(_events)
+        counters = dict(_counters)
+        _events.clear()
+        _counters.clear()
+    pid = os.getpid()
+    script = os.path.basename(sys.argv[0]) if sys.argv else ''
+    process = {
+        'type': 'process', 'run': _run, 'pid': pid, 'script': script, 'argv': sys.argv[1:],
+        'ts': _wall0, 'dur': _now_us() - _wall0,
+    }
+    if _profiler is not None:
+        _profiler.disable()
+        process['profile'] = f"{_path}.{_run}.{os.path.splitext(script)[0]}.{pid}.prof"
+        _profiler.dump_stats(process['profile'])
+    lines = [process]
+    lines += events
+    lines += [{'type': 'counter', 'run': _run, 'pid': pid, 'name': k, 'value': v}
+              for k, v in sorted(counters.items())]
+    text = ''.join(json.dumps(e, separators=(',', ':')) + '\n' for e in lines)
+    os.makedirs(os.path.dirname(_path), exist_ok=True)
+    # One O_APPEND write per process keeps concurrent stages' lines whole.
+    fd = os.open(_path, os.O_WRONLY | os.O_APPEND | os.O_CREAT, 0o644)
+    try:
+        os.write(fd, text.encode('utf-8'))
+    finally:
+        os.close(fd)
+
+
+def add_arguments(parser):
+    """Add --profile [PATH] and --cprofile to an argparse parser."""
+    parser.add_argument(
+        '--profile', nargs='?', const=DEFAULT_TRACE, metavar='PATH',
+        help=f"append a timing trace to PATH (default {os.path.relpath(DEFAULT_TRACE)}); "
+             f"same as setting {ENV_TRACE}",
+    )
+    parser.add_argument('--cprofile', action='store_true',
+                        help=f"with --profile, also dump a cProfile per process (or set {ENV_PROFILE}=1)")
+
+
+def configure(args):
+    """Enable tracing from parsed ``add_arguments()`` flags."""
+    if args.profile:
+        enable(args.profile, profile=args.cprofile or os.environ.get(ENV_PROFILE) == '1')
+
+
+def _init_from_env():
+    path = os.environ.get(ENV_TRACE)
+    if path:
+        enable(path, profile=os.environ.get(ENV_PROFILE) == '1', run=os.environ.get(ENV_RUN))
+
+
+_init_from_env()
@@ -0,0 +1,247 @@
+#!/usr/bin/env python3
+"""
+Local stand-in for the draft sync API (api/draft), backed by SQLite.
+
+Serves the same routes as the Azure function, with cardlib.draft_store
+in place of Azure Tables, plus PATCH for deltas:
+
+    GET    /api/draft/active        {state, seq, lastModifiedAt, clientId,
+                                     schemaVersion}, 404 if none
+    PUT    /api/draft/active        {state, lastModifiedAt, clientId,
+                                     schemaVersion}: replace the whole state
+    PATCH  /api/draft/active        {baseSeq, ops, lastModifiedAt, clientId}:
+                                     apply a delta; 409 with the current seq
+                                     if baseSeq is stale
+    DELETE /api/draft/active
+    POST   /api/draft/archive       {state, summaryMeta, schemaVersion}
+    GET    /api/draft/history       {entries: [{id, archivedAt, summaryMeta}]}
+    GET    /api/draft/history/ID
+
+The user comes from the x-ms-client-principal header when present (as
+Static Web Apps sends it), otherwise it is --user.
+
+Usage: python draft_server.py [--host 127.0.0.1] [--port 8766]
+                              [--db data/drafts.sqlite3] [--user local]
+                              [--snapshot-every 16]
+"""
+
+import argparse
+import asyncio
+import base64
+import json
+import os
+import sys
+import time
+from urllib.parse import unquote, urlsplit
+
+from cardlib import DATA_DIR
+from cardlib.draft_store import SCHEMA_VERSION, SNAPSHOT_EVERY, DraftStore, StaleDelta
+
+DEFAULT_DB = os.path.join(DATA_DIR, 'drafts.sqlite3')
+PREFIX = '/api/draft/'
+MAX_HEADER_BYTES = 16384
+MAX_BODY_BYTES = 128 * 1024
+
+REASONS = {200: 'OK', 204: 'No Content', 400: 'Bad Request', 401: 'Unauthorized',
+           404: 'Not Found', 409: 'Conflict', 413: 'Payload Too Large',
+           431: 'Request Header Fields Too Large'}
+
+
+def principal_user(header):
+    """userId from an x-ms-client-principal header, or None."""
+    try:
+        p = json.loads(base64.b64decode(header).decode('utf-8'))
+    except (ValueError, UnicodeDecodeError):
+        return None
+    if not isinstance(p, dict) or not p.get('userId'):
+        return None
+    if 'authenticated' not in (p.get('userRoles') or ()):
+        return None
+    return p['userId']
+
+
+def _now_ms():
+    return int(time.time() * 1000)
+
+
+class DraftService:
+    """Routing over one DraftStore."""
+
+    def __init__(self, store):
+        self.store = store
+
+    def route(self, method, path, user, body):
+        """Return (status, payload) for one request."""
+        if not path.startswith(PREFIX):
+            return 404, {'error': 'Unknown route.'}
+        action, _, entry_id = path[len(PREFIX):].partition('/')
+        entry_id = unquote(entry_id)
+        store = self.store
+
+        if action == 'active' and method == 'GET':
+            draft = store.get(user)
+            if draft is None:
+                return 404, {'error': 'No active draft.'}
+            return 200, {'state': draft.state, 'seq': draft.seq,
+                         'lastModifiedAt': draft.last_modified_at,
+                         'clientId': draft.client_id or None,
+                         'schemaVersion': draft.schema_version}
+
+        if action == 'active' and method == 'PUT':
+            last_modified_at = int(body.get('lastModifiedAt') or 0) or _now_ms()
+            client_id = body.get('clientId') if isinstance(body.get('clientId'), str) else ''
+            seq = store.put(user, body.get('state') or {}, last_modified_at, client_id,
+                            int(body.get('schemaVersion') or SCHEMA_VERSION))
+            return 200, {'ok': True, 'lastModifiedAt': last_modified_at, 'seq': seq}
+
+        if action == 'active' and method == 'PATCH':
+            base_seq = body.get('baseSeq')
+            ops = body.get('ops')
+            if not isinstance(base_seq, int) or not isinstance(ops, list):
+                return 400, {'error': 'baseSeq and ops are required.'}
+            last_modified_at = int(body.get('lastModifiedAt') or 0) or _now_ms()
+            client_id = body.get('clientId') if isinstance(body.get('clientId'), str) else ''
+            try:
+                seq = store.append(user, base_seq, ops, last_modified_at, client_id)
+            except StaleDelta as e:
+                draft = store.get(user)
+                return 409, {'error': str(e), 'seq': draft.seq if draft else 0}
+            return 200, {'ok': True, 'lastModifiedAt': last_modified_at, 'seq': seq}
+
+        if action == 'active' and method == 'DELETE':
+            store.delete(user)
+            return 200, {'ok': True}
+
+        if action == 'archive' and method == 'POST':
+            archived_at = _now_ms()
+            entry = store.archive(user, body.get('state') or {}, body.get('summaryMeta') or {},
+                                  archived_at, int(body.get('schemaVersion') or SCHEMA_VERSION))
+            return 200, {'ok': True, 'id': entry, 'archivedAt': archived_at}
+
+        if action == 'history' and method == 'GET' and not entry_id:
+            return 200, {'entries': [{'id': i, 'archivedAt': at, 'summaryMeta': meta}
+                                     for i, at, meta in store.history(user)]}
+
+        if action == 'history' and method == 'GET':
+            found = store.history_entry(user, entry_id)
+            if found is None:
+                return 404, {'error': 'Not found.'}
+            archived_at, state, meta, schema_version = found
+            return 200, {'id': entry_id, 'archivedAt': archived_at, 'state': state,
+                         'summaryMeta': meta, 'schemaVersion': schema_version}
+
+        return 404, {'error': 'Unknown route.'}
+
+
+def _head(status, headers):
+    lines = [f"HTTP/1.1 {status} {REASONS[status]}"]
+    lines += [f"{k}: {v}" for k, v in headers]
+    return ('\r\n'.join(lines) + '\r\n\r\n').encode('latin-1')
+
+
+def _write(writer, status, payload, keep_alive):
+    body = b'' if payload is None else json.dumps(payload, ensure_ascii=False,
+                                                  separators=(',', ':')).encode('utf-8')
+    out = [('Content-Type', 'application/json; charset=utf-8'),
+           ('Access-Control-Allow-Origin', '*'),
+           ('Access-Control-Allow-Methods', 'GET, PUT, PATCH, POST, DELETE, OPTIONS'),
+           ('Access-Control-Allow-Headers', 'Content-Type'),
+           ('Content-Length', str(len(body)))]
+    if not keep_alive:
+        out.append(('Connection', 'close'))
+    writer.write(_head(status, out) + body)
+
+
+async def handle(service, default_user, reader, writer):
+    try:
+        while True:
+            try:
+                head = await reader.readuntil(b'\r\n\r\n')
+            except asyncio.LimitOverrunError:
+                _write(writer, 431, None, False)
+                break
+            except asyncio.IncompleteReadError:
+                break
+            lines = head.decode('latin-1').split('\r\n')
+            try:
+                method, target, version = lines[0].split(' ')
+            except ValueError:
+                _write(writer, 400, None, False)
+                break
+            headers = {}
+            for line in lines[1:]:
+                name, _, value = line.partition(':')
+                if name:
+                    headers[name.strip().lower()] = value.strip()
+            try:
+                length = int(headers.get('content-length') or 0)
+                if length < 0:
+                    raise ValueError(length)
+            except ValueError:
+                _write(writer, 400, {'error': 'Invalid Content-Length.'}, False)
+                break
+            if length > MAX_BODY_BYTES:
+                _write(writer, 413, {'error': 'Request too large.'}, False)
+                break
+            raw = await reader.readexactly(length) if length else b''
+            connection = headers.get('connection', '').lower()
+            keep_alive = connection != 'close' if version == 'HTTP/1.1' else connection == 'keep-alive'
+
+            if method == 'OPTIONS':
+                _write(writer, 204, None, keep_alive)
+            else:
+                principal = headers.get('x-ms-client-principal')
+                user = principal_user(principal) if principal else default_user
+                if user is None:
+                    status, payload = 401, {'error': 'Authentication required.'}
+                else:
+                    try:
+                        body = json.loads(raw) if raw else {}
+                        if not isinstance(body, dict):
+                            raise ValueError("body must be a JSON object")
+                        status, payload = service.route(method, urlsplit(target).path, user, body)
+                    except (TypeError, ValueError) as e:
+                        status, payload = 400, {'error': str(e)}
+                _write(writer, status, payload, keep_alive)
+            await writer.drain()
+            if not keep_alive:
+                break
+    except (ConnectionError, asyncio.IncompleteReadError):
+        pass
+    finally:
+        writer.close()
+
+
+async def serve(service, default_user, host, port):
+    server = await asyncio.start_server(
+        lambda r, w: handle(service, default_user, r, w), host, port, limit=MAX_HEADER_BYTES,
+    )
+    addr = server.sockets[0].getsockname()
+    print(f"Serving drafts on http://{addr[0]}:{addr[1]}{PREFIX}", flush=True)
+    async with server:
+        await server.serve_forever()
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Serve the draft sync API from a local SQLite store.")
+    parser.add_argument('--host', default='127.0.0.1')
+    parser.add_argument('--port', type=int, default=8766)
+    parser.add_argument('--db', default=DEFAULT_DB, help="SQLite file (':memory:' for a throwaway store)")
+    parser.add_argument('--user', default='local', help="user for requests without a principal header")
+    parser.add_argument('--snapshot-every', type=int, default=SNAPSHOT_EVERY,
+                        help=f"fold the delta log into a snapshot every N deltas (default {SNAPSHOT_EVERY})")
+    args = parser.parse_args(argv)
+
+    store = DraftStore(args.db, snapshot_every=args.snapshot_every)
+    try:
+        asyncio.run(serve(DraftService(store), args.user, args.host, args.port))
+    except KeyboardInterrupt:
+        pass
+    finally:
+        print(f"\n{store.bytes_written} bytes written, {store.snapshots} snapshots")
+        store.close()
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -4,33 +4,15 @@ Fuzzy-match image filenames to Agricola card names, rename close matches,
 then report the final match analysis.
 """
 
-import json
 import os
-import unicodedata
-from difflib import SequenceMatcher
 
-SCRIPT_DIR = os.path.dirname(os.path.abspath(__file__))
-ROOT_DIR = os.path.join(SCRIPT_DIR, '..')
-CARDS_JSON = os.path.join(ROOT_DIR, 'data', 'agricola-cards.json')
-IMAGES_DIR = os.path.join(ROOT_DIR, 'card-images') + '/'
+from cardlib import FuzzyIndex, IMAGES_DIR, load_cards, normalize, normalize_image_name, trace
 
-
-def normalize(name: str) -> str:
-    """Lowercase, strip accents, remove spaces/hyphens/apostrophes/periods."""
-    # Strip accents via NFD decomposition
-    nfkd = unicodedata.normalize("NFKD", name)
-    stripped = "".join(c for c in nfkd if unicodedata.category(c) != "Mn")
-    # Lowercase and remove certain characters
-    stripped = stripped.lower()
-    for ch in (" ", "-", "'", ".", "\u2019"):
-        stripped = stripped.replace(ch, "")
-    return stripped
+FUZZY_THRESHOLD = 0.85
 
 
 def load_card_names() -> list[str]:
-    with open(CARDS_JSON, "r", encoding="utf-8") as f:
-        data = json.load(f)
-    return [card["name"] for card in data]
+    return load_cards().names()
 
 
 def load_image_files() -> list[str]:
@@ -46,11 +28,10 @@ def compute_matches(card_names, image_files):
     for name in card_names:
         norm_to_card[normalize(name)] = name
 
-    # Build normalized -> image filename mapping (strip .png before normalizing)
+    # Build normalized -> image filename mapping (extension stripped)
     norm_to_image = {}
     for img in image_files:
-        base = img[:-4]  # remove .png
-        norm_to_image[normalize(base)] = img
+        norm_to_image[normalize_image_name(img)] = img
 
     matched_pairs = []
     matched_card_norms = set()
@@ -66,12 +47,42 @@ def compute_matches(card_names, image_files):
         name for name in card_names if normalize(name) not in matched_card_norms
     ]
     unmatched_images = [
-        img for img in image_files if normalize(img[:-4]) not in matched_image_norms
+        img for img in image_files if normalize_image_name(img) not in matched_image_norms
     ]
 
     return matched_pairs, unmatched_cards, unmatched_images
 
 
+def find_fuzzy_renames(unmatched_cards, unmatched_images, threshold=FUZZY_THRESHOLD):
+    """Pair each unmatched image with its closest unmatched card.
+
+    Returns (old_path, new_path, old_filename, new_filename, card_name, ratio)
+    tuples for every image whose best match reaches ``threshold``.
+    """
+    norm_unmatched_cards = {normalize(c): c for c in unmatched_cards}
+    index = FuzzyIndex(norm_unmatched_cards.keys(), norm_unmatched_cards.values())
+
+    renames = []
+    with trace.span('find_fuzzy_renames', images=len(unmatched_images)):
+        for img in unmatched_images:
+            best = index.best(normalize_image_name(img), cutoff=threshold)
+            if best is None:
+                continue
+            card_name, ratio = best
+            new_filename = card_name.lower() + ".png"
+            if new_filename != img:
+                renames.append((
+                    os.path.join(IMAGES_DIR, img),
+                    os.path.join(IMAGES_DIR, new_filename),
+                    img,
+                    new_filename,
+                    card_name,
+                    ratio,
+                ))
+    trace.count('fuzzy_comparisons', index.comparisons)
+    return renames
+
+
 def main():
     card_names = load_card_names()
     image_files = load_image_files()
@@ -88,38 +99,10 @@ def main():
     print(f"Unmatched cards  (before fuzzy):         {len(unmatched_cards)}")
     print()
 
-    # Build lookup for fuzzy matching
-    norm_unmatched_cards = {normalize(c): c for c in unmatched_cards}
-
-    renames = []  # (old_path, new_path, old_filename, new_filename, card_name, ratio)
-
-    for img in unmatched_images:
-        base = img[:-4]
-        norm_img = normalize(base)
-        best_ratio = 0.0
-        best_card_norm = None
-
-        for norm_card, card_name in norm_unmatched_cards.items():
-            ratio = SequenceMatcher(None, norm_img, norm_card).ratio()
-            if ratio > best_ratio:
-                best_ratio = ratio
-                best_card_norm = norm_card
-
-        if best_ratio >= 0.85 and best_card_norm is not None:
-            card_name = norm_unmatched_cards[best_card_norm]
-            new_filename = card_name.lower() + ".png"
-            if new_filename != img:
-                renames.append((
-                    os.path.join(IMAGES_DIR, img),
-                    os.path.join(IMAGES_DIR, new_filename),
-                    img,
-                    new_filename,
-                    card_name,
-                    best_ratio,
-                ))
+    renames = find_fuzzy_renames(unmatched_cards, unmatched_images)
 
     if not renames:
-        print("No fuzzy matches found with ratio >= 0.85.")
+        print(f"No fuzzy matches found with ratio >= {FUZZY_THRESHOLD}.")
     else:
         print(f"Found {len(renames)} fuzzy rename(s):\n")
         for old_path, new_path, old_fn, new_fn, card_name, ratio in renames:
@@ -140,6 +123,8 @@ def main():
     matched_pairs, unmatched_cards, unmatched_images = compute_matches(
         card_names, image_files_after
     )
+    trace.count('cards_matched', len(matched_pairs))
+    trace.count('images_renamed', len(renames))
 
     print(f"Total cards:              {len(card_names)}")
     print(f"Total images:             {len(image_files_after)}")
@@ -0,0 +1,192 @@
+#!/usr/bin/env python3
+"""
+Infer which cards each opponent took from the hands you passed
+(cardlib.pick_inference), or measure the inference on synthetic drafts.
+
+With --state (a draft state or archived history entry, as draft.html
+saves them), prints each seat's most likely picks per hand and the
+survival odds of the hands that have not come back yet. With
+--synthetic N (drafts dealt from the card pools, every seat picking by
+ADP with Plackett-Luce noise as in cardlib.draftsim), scores the
+inference against what the simulated opponents actually took, next to
+the rank heuristic of js/draft-stats.js (opponents take the best-ranked
+cards, in pass order) and, for survival, the per-card table in
+data/draft-survival.json:
+
+  who took it   how often the seat that really took each card of a
+                returned hand has it as its top guess, and the mean
+                probability the inference gave it
+  unseen picks  the same for picks made after your last visit
+  survival      Brier score of P(card is still there) for every card you
+                passed in a hand that comes back
+
+Requires numpy.
+
+Usage: python infer_opponent_picks.py --state draft.json [--players 4] [--top 3]
+       python infer_opponent_picks.py --synthetic 2000 [--players 4] [--seed 0]
+"""
+
+import argparse
+import json
+import math
+import statistics
+import sys
+import time
+
+import numpy as np
+
+from cardlib import SURVIVAL_JSON, load_cards
+from cardlib.draftsim import CARD_TYPES, PICKS, card_pools, record_draft
+from cardlib.pick_inference import PickInference, hand_visits
+
+
+def load_state(path):
+    with open(path, 'r', encoding='utf-8') as f:
+        state = json.load(f)
+    # Archived history entries wrap the state.
+    return state['state'] if isinstance(state.get('state'), dict) else state
+
+
+def load_survival(players):
+    try:
+        with open(SURVIVAL_JSON, 'r', encoding='utf-8') as f:
+            return json.load(f)['players'].get(str(players))
+    except FileNotFoundError:
+        return None
+
+
+def show(model, state, top):
+    t0 = time.perf_counter()
+    result = model.infer(state)
+    elapsed = 1000 * (time.perf_counter() - t0)
+    if not result['segments']:
+        print("No recorded hands")
+        return 1
+    for seg in result['segments']:
+        status = seg['status']
+        if status == 'observed':
+            status += f" (likelihood {seg['likelihood']:.3g})"
+        print(f"\nHand {seg['hand']}, passed in round {seg['round']}: {status}")
+        for pick in seg['picks']:
+            best = []
+            for card_type in CARD_TYPES:
+                probs = [kv for kv in pick['probs'].items() if model.types[kv[0]] == card_type]
+                best += sorted(probs, key=lambda kv: -kv[1])[:top]
+            print(f"  round {pick['round']} seat {pick['seat']}: "
+                  + ', '.join(f"{n} {p:.0%}" for n, p in best))
+        if seg['status'] in ('pending', 'unmarked'):
+            odds = sorted(seg['survival'].items(), key=lambda kv: -kv[1])
+            print("  comes back: " + ', '.join(f"{n} {p:.0%}" for n, p in odds))
+    print(f"\nInferred in {elapsed:.2f} ms")
+    return 0
+
+
+def rank_order(cards, players):
+    """name -> rank at the player count; unranked cards sort last."""
+    out = {}
+    for card in cards:
+        stats = card if players == 4 else (card.get('stats_3p') or {})
+        rank = stats.get('rank')
+        out.setdefault(card['name'], rank if isinstance(rank, (int, float)) else math.inf)
+    return out
+
+
+def rank_picks(hand, rank, count, round_num):
+    """round -> the cards the rank heuristic has taken from ``hand`` that round."""
+    out = {}
+    for names in hand.values():
+        for i, name in enumerate(sorted(names, key=lambda c: rank[c])[:count]):
+            out.setdefault(round_num + i + 1, set()).add(name)
+    return out
+
+
+def bench(model, cards, players, n, seed):
+    rng = np.random.default_rng(seed)
+    pools = card_pools(cards, players)
+    rank = rank_order(cards, players)
+    survival = load_survival(players)
+    table = (survival or {}).get('cards') or {}
+    table_rounds = (survival or {}).get('rounds') or []
+
+    who = {'inference': [], 'rank': []}        # (p on the true card, top guess right)
+    unseen = {'inference': [], 'rank': []}
+    brier = {'inference': [], 'rank': [], 'table': []}
+    times = []
+    for _ in range(n):
+        state, taken = record_draft(pools, players, rng)
+        t0 = time.perf_counter()
+        result = model.infer(state)
+        times.append(time.perf_counter() - t0)
+        by_visit = {v.round: v for v in hand_visits(state, model.type_of)}
+
+        for seg in result['segments']:
+            passed = by_visit[seg['round']].passed()
+            back = seg['round'] + players
+            count = len(seg['picks'])
+            # On a returned hand the heuristic, too, knows which cards went.
+            observed = seg['status'] == 'observed'
+            heuristic = rank_picks(by_visit[back].taken if observed else passed, rank, count, seg['round'])
+            out = who if seg['status'] == 'observed' else unseen
+            for pick in seg['picks']:
+                for name in taken[pick['round']][pick['seat']]:
+                    p = pick['probs'].get(name, 0.0)
+                    best = max(p2 for n2, p2 in pick['probs'].items() if model.types[n2] == model.types[name])
+                    out['inference'].append((p, p >= best))
+                    hit = name in heuristic.get(pick['round'], ())
+                    out['rank'].append((None, hit))
+
+            if back <= PICKS:
+                comes_back = {n for names in by_visit[back].present.values() for n in names}
+                forecast = model.survival([n for names in passed.values() for n in names])
+                gone = set().union(*rank_picks(passed, rank, count, seg['round']).values())
+                col = table_rounds.index(seg['round']) if seg['round'] in table_rounds else None
+                for name, p in forecast.items():
+                    truth = float(name in comes_back)
+                    brier['inference'].append((p - truth) ** 2)
+                    brier['rank'].append((float(name not in gone) - truth) ** 2)
+                    if col is not None and (table.get(name) or [None] * (col + 1))[col] is not None:
+                        brier['table'].append((table[name][col] - truth) ** 2)
+
+    times.sort()
+    print(f"{n} synthetic {players}p drafts; inference {1000 * statistics.mean(times):.2f} ms per draft "
+          f"(p99 {1000 * times[int(0.99 * (len(times) - 1))]:.2f} ms), "
+          f"{1000 * statistics.mean(times) / players:.2f} ms per hand\n")
+    print(f"{'':<14} {'model':<10} {'p(true)':>8} {'top guess':>10}")
+    for label, scores in (('who took it', who), ('unseen picks', unseen)):
+        for name, rows in scores.items():
+            if rows:
+                mean_p = f"{statistics.mean(p for p, _ in rows):8.3f}" if rows[0][0] is not None else f"{'-':>8}"
+                print(f"{label:<14} {name:<10} {mean_p} {100 * statistics.mean(hit for _, hit in rows):9.1f}%")
+    print(f"\n{'survival':<14} {'model':<10} {'Brier':>8}")
+    for name, rows in brier.items():
+        if rows:
+            print(f"{'':<14} {name:<10} {statistics.mean(rows):8.4f}")
+    if not brier['table']:
+        print(f"{'':<14} {'table':<10} (no {players}p survival table)")
+    return 0
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Infer opponents' picks from returning draft hands.")
+    source = parser.add_mutually_exclusive_group(required=True)
+    source.add_argument('--state', help="draft state JSON (or archived history entry)")
+    source.add_argument('--synthetic', type=int, metavar='N', help="score the inference on N synthetic drafts")
+    parser.add_argument('--players', type=int, choices=(3, 4),
+                        help="player count (default: the state's, else 4)")
+    parser.add_argument('--top', type=int, default=3, help="cards of each type to show per pick")
+    parser.add_argument('--seed', type=int, default=0)
+    args = parser.parse_args(argv)
+
+    cards = load_cards().records
+    state = load_state(args.state) if args.state else None
+    players = args.players or (3 if state and state.get('playerCount') == 3 else 4)
+    if state is not None:
+        state = dict(state, playerCount=players)
+    model = PickInference(cards, players)
+    if state is not None:
+        return show(model, state, args.top)
+    return bench(model, cards, players, args.synthetic, args.seed)
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,87 @@
+#!/usr/bin/env python3
+"""
+Add a batch of approved card submissions to agricola-cards.json.
+
+Reads approved submissions (the JSON block of each api/submit-card issue)
+from a JSONL file, a JSON file, or a directory of .json/.jsonl/.md files;
+see cardlib.submissions. The whole batch is validated and deduplicated
+against the dataset at once: names already present (after normalization,
+or as an alias) are skipped, and names within the fuzzy-match threshold
+of an existing card are held back as likely typos unless passed with
+--allow. The new cards are appended and both JSON copies are written
+once, however many there are.
+
+New cards have no ranking stats and no tags; run run_pipeline.py
+afterwards to tag them and refresh the derived files.
+
+Usage: python ingest_submissions.py PATH [--allow NAME ...] [--dry-run]
+"""
+
+import argparse
+import os
+import sys
+
+from cardlib import API_CARDS_JSON, CARDS_JSON, load_aliases, load_cards, trace
+from cardlib.files import write_card_json
+from cardlib.submissions import NEAR_CUTOFF, plan, read_submissions
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Add approved card submissions to agricola-cards.json.")
+    parser.add_argument('path', help="JSONL/JSON file or directory of approved submissions")
+    parser.add_argument(
+        '--allow', action='append', default=[], metavar='NAME',
+        help="add NAME even if it is close to an existing card (repeatable)",
+    )
+    parser.add_argument(
+        '--cutoff', type=float, default=NEAR_CUTOFF,
+        help=f"similarity ratio treated as a near-duplicate (default {NEAR_CUTOFF})",
+    )
+    parser.add_argument('--dry-run', action='store_true', help="report what would be added; write nothing")
+    trace.add_arguments(parser)
+    args = parser.parse_args(argv)
+    trace.configure(args)
+
+    with trace.span('read_submissions'):
+        try:
+            submissions = read_submissions(args.path)
+        except (OSError, ValueError) as e:
+            print(f"Cannot read submissions: {e}")
+            return 1
+    index = load_cards(CARDS_JSON)
+    print(f"Loaded {len(index)} cards, {len(submissions)} submissions")
+
+    with trace.span('plan', submissions=len(submissions)):
+        result = plan(index, submissions, load_aliases(), cutoff=args.cutoff, allow=args.allow)
+
+    for submission, message in result.invalid:
+        print(f"  invalid    {submission.source}: {message}")
+    for submission, name, _ in result.exact:
+        print(f"  duplicate  {submission.source}: {submission.raw['name']!r} is {name!r}")
+    for submission, name, ratio in result.near:
+        print(f"  near       {submission.source}: {submission.raw['name']!r} ~ {name!r} ({ratio:.2f})")
+    for submission, record in result.new:
+        print(f"  new        {submission.source}: {record['name']} ({record['type']})")
+    print(f"\n{len(result.new)} new, {len(result.exact)} duplicate, "
+          f"{len(result.near)} near-duplicate, {len(result.invalid)} invalid")
+
+    if result.invalid:
+        print("Fix the invalid submissions and run again; nothing written")
+        return 1
+    if result.near:
+        print("Near-duplicates were skipped; pass --allow NAME for any that are distinct cards")
+    if args.dry_run or not result.new:
+        return 0
+
+    for _, record in result.new:
+        index.append(record)
+    with trace.span('write_card_json'):
+        written = write_card_json(index.records, (CARDS_JSON, API_CARDS_JSON))
+    for path in written:
+        print(f"Wrote {os.path.relpath(path)}")
+    print("Run scripts/run_pipeline.py to tag the new cards and refresh derived data")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
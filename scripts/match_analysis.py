@@ -1,25 +1,14 @@
-import json, os, unicodedata
+import os
 
-SCRIPT_DIR = os.path.dirname(os.path.abspath(__file__))
-ROOT_DIR = os.path.join(SCRIPT_DIR, '..')
-CARDS_JSON = os.path.join(ROOT_DIR, 'data', 'agricola-cards.json')
-IMAGES_DIR = os.path.join(ROOT_DIR, 'card-images') + '/'
+from cardlib import IMAGES_DIR, load_cards, normalize_image_name
 
-def normalize(name):
-    nfkd = unicodedata.normalize("NFKD", name)
-    stripped = "".join(c for c in nfkd if unicodedata.category(c) != "Mn")
-    stripped = stripped.lower()
-    for ch in (" ", "-", "'", ".", "\u2019"):
-        stripped = stripped.replace(ch, "")
-    return stripped
-
-with open(CARDS_JSON, "r", encoding="utf-8") as f:
-    card_names = [card["name"] for card in json.load(f)]
+cards = load_cards()
+card_names = cards.names()
 
 image_files = sorted(f for f in os.listdir(IMAGES_DIR) if f.lower().endswith(".png"))
 
-norm_cards = {normalize(n): n for n in card_names}
-norm_images = {normalize(f[:-4]): f for f in image_files}
+norm_cards = {c.norm: c.name for c in cards}
+norm_images = {normalize_image_name(f): f for f in image_files}
 
 matched_norms = set(norm_cards.keys()) & set(norm_images.keys())
 unmatched_cards = sorted([norm_cards[n] for n in set(norm_cards.keys()) - matched_norms])
@@ -1,24 +1,19 @@
-import json
 import os
 
-# --- Config ---
-SCRIPT_DIR = os.path.dirname(os.path.abspath(__file__))
-ROOT_DIR = os.path.join(SCRIPT_DIR, '..')
-CARDS_JSON = os.path.join(ROOT_DIR, 'data', 'agricola-cards.json')
-IMAGES_DIR = os.path.join(ROOT_DIR, 'card-images') + '/'
+from cardlib import IMAGES_DIR, load_cards, normalize, normalize_image_name, trace
 
-# --- Normalize function ---
-def normalize(name: str) -> str:
-    """Lowercase, remove spaces, hyphens, apostrophes, and periods."""
-    s = name.lower()
-    for ch in (" ", "-", "'", "."):
-        s = s.replace(ch, "")
-    return s
+try:
+    from cardlib.phash import image_hashes, near_duplicates
+except ImportError:  # numpy / Pillow not installed
+    image_hashes = None
+
+# Max Hamming distance between art hashes to report two images as the same
+# picture. Re-encoded or resized copies land at 0-2; distinct cards at 6+.
+PHASH_MAX_DISTANCE = 4
 
 # --- Load card names ---
-with open(CARDS_JSON, "r") as f:
-    cards = json.load(f)
-card_names = [c["name"] for c in cards]
+cards = load_cards()
+card_names = cards.names()
 
 # --- Load image filenames ---
 image_files = sorted(
@@ -27,16 +22,14 @@ image_files = sorted(
 
 # --- Build normalized lookup maps ---
 # card normalized -> list of original card names
-norm_to_cards: dict[str, list[str]] = {}
-for name in card_names:
-    n = normalize(name)
-    norm_to_cards.setdefault(n, []).append(name)
+norm_to_cards: dict[str, list[str]] = {
+    n: [c.name for c in group] for n, group in cards.groups.items()
+}
 
 # image normalized (without .png) -> list of original filenames
 norm_to_images: dict[str, list[str]] = {}
 for fname in image_files:
-    base = fname[:-4]  # strip .png
-    n = normalize(base)
+    n = normalize_image_name(fname)
     norm_to_images.setdefault(n, []).append(fname)
 
 # --- Compute matches ---
@@ -64,6 +57,7 @@ unmatched_images.sort(key=str.lower)
 matched_card_count = sum(
     len(norm_to_cards[n]) for n in matched_norms
 )
+trace.count('cards_matched', matched_card_count)
 matched_image_count = sum(
     len(norm_to_images[n]) for n in matched_norms
 )
@@ -95,10 +89,33 @@ print("-" * 60)
 print(f"UNMATCHED IMAGES ({len(unmatched_images)} images, no matching card):")
 print("-" * 60)
 for i, fname in enumerate(unmatched_images, 1):
-    base = fname[:-4]
-    norm = normalize(base)
+    norm = normalize_image_name(fname)
     print(f"  {i:>3}. {fname}  [normalized: {norm}]")
 print()
+
+print("-" * 60)
+if image_hashes is None:
+    print("NEAR-DUPLICATE IMAGES: skipped (needs numpy and Pillow)")
+    print("-" * 60)
+else:
+    with trace.span('near_duplicates', images=len(image_files)):
+        pairs = near_duplicates(image_hashes(image_files), PHASH_MAX_DISTANCE)
+    print(f"NEAR-DUPLICATE IMAGES ({len(pairs)} pairs, art hash distance <= {PHASH_MAX_DISTANCE}):")
+    print("-" * 60)
+    for i, (dist, a, b) in enumerate(pairs, 1):
+        na, nb = normalize_image_name(a), normalize_image_name(b)
+        a_known, b_known = na in matched_norms, nb in matched_norms
+        if na == nb:
+            note = "same card" if a_known else "same name; matches no card"
+        elif a_known and b_known:
+            # Both files are claimed by different cards but show the same art.
+            note = "DIFFERENT CARDS - wrong art or bad rename?"
+        elif a_known or b_known:
+            note = f"duplicate; {b if a_known else a} matches no card"
+        else:
+            note = "duplicate; neither file matches a card"
+        print(f"  {i:>3}. {a}  ~  {b}  [distance {dist}: {note}]")
+print()
 print("=" * 60)
 print("DONE")
 print("=" * 60)
@@ -5,200 +5,226 @@ Merge 3-player and 4-player ranking TSVs into agricola-cards.json.
 Updates 4p stats at top level, adds stats_3p object.
 Removes 'pwr' field (redundant with rank).
 Derives play_rate from Plays/Drafted and value/value_when_played.
+Each TSV is also appended to the ranking history (data/ranking-history.bin)
+the first time it is seen, so earlier snapshots are kept.
 
 Source data: Lumin_S's BGA forum post (Jan-Jul 2025)
 https://forum.boardgamearena.com/viewtopic.php?p=226327#p226327
 """
 
+import argparse
+import hashlib
 import json
 import os
 import sys
+import time
 
-SCRIPT_DIR = os.path.dirname(os.path.abspath(__file__))
-ROOT_DIR = os.path.join(SCRIPT_DIR, '..')
-CARDS_JSON = os.path.join(ROOT_DIR, 'data', 'agricola-cards.json')
-API_CARDS_JSON = os.path.join(ROOT_DIR, 'api', 'data', 'agricola-cards.json')
-TSV_4P = os.path.join(ROOT_DIR, 'data', 'agricola-4p-rankings.tsv')
-TSV_3P = os.path.join(ROOT_DIR, 'data', 'agricola-3p-rankings.tsv')
-
-
-def normalize(name: str) -> str:
-    """Lowercase, remove spaces, hyphens, apostrophes, periods, accents."""
-    s = name.lower().strip()
-    for ch in (" ", "-", "'", ".", "\u2019"):  # include smart apostrophe
-        s = s.replace(ch, "")
-    # Handle common accent variants
-    s = s.replace("\u00e9", "e")  # e with accent
-    return s
-
-
-def parse_tsv(filepath):
-    """Parse a rankings TSV file. Returns list of dicts."""
-    rows = []
-    with open(filepath, 'r', encoding='utf-8') as f:
-        lines = f.readlines()
-
-    # Parse header
-    header = lines[0].strip().split('\t')
-    header = [h.strip() for h in header]
-
-    for line in lines[1:]:
-        line = line.strip()
-        if not line:
-            continue
-        parts = line.split('\t')
-        parts = [p.strip() for p in parts]
-        if len(parts) < len(header):
-            continue
-        row = {}
-        for i, col in enumerate(header):
-            row[col] = parts[i] if i < len(parts) else ''
-        rows.append(row)
-
-    return rows
-
-
-def derive_stats(row):
-    """Convert a TSV row to our stat fields."""
-    rank = int(row.get('Rank', '0'))
-    adp = row.get('ADP', '0')
-    apr = row.get('APR', '0')
-    elo_per_play = row.get('Elo/Play', '0')
-
-    # Derive play_rate from Plays/Drafted
-    drafted = int(row.get('Drafted', '0'))
-    plays = int(row.get('Plays', '0'))
-    if drafted > 0:
-        play_rate_pct = round(100 * plays / drafted)
-        play_rate = f"{play_rate_pct}%"
-    else:
-        play_rate = "0%"
+from cardlib import (
+    API_CARDS_JSON,
+    CARDS_JSON,
+    DATA_DIR,
+    RANKING_HISTORY,
+    TSV_3P,
+    TSV_4P,
+    load_cards,
+    trace,
+)
+from cardlib.files import write_card_json
+from cardlib.history import append_table
+from cardlib.rankings import parse_tsv, stats_records
 
-    # Derive value = adp * elo_per_play
-    try:
-        adp_f = float(adp)
-        epp_f = float(elo_per_play)
-        value = round(adp_f * epp_f, 4)
-    except (ValueError, ZeroDivisionError):
-        value = 0
-
-    # Derive value_when_played = elo_per_play / (play_rate_fraction)
-    # This represents the elo impact adjusted for how often it's played
+# Per-row content hashes of the last ingested TSVs, used by --incremental.
+STATE_JSON = os.path.join(DATA_DIR, 'agricola-rankings-state.json')
+# Bump whenever derive_stats() changes so stored hashes are not trusted.
+STATE_VERSION = 2
+
+STAT_FIELDS = (
+    'rank', 'adp', 'apr', 'play_rate', 'elo_per_play', 'value', 'value_when_played',
+)
+
+
+def occurrences(names):
+    """For each name, how many earlier entries of ``names`` have that exact name."""
+    seen = {}
+    out = []
+    for name in names:
+        seen[name] = seen.get(name, -1) + 1
+        out.append(seen[name])
+    return out
+
+
+def row_key(name, k):
+    """State key of the ``k``-th row named ``name``."""
+    return name if k == 0 else f"{name}#{k}"
+
+
+def split_key(key):
+    name, sep, k = key.rpartition('#')
+    return (name, int(k)) if sep and k.isdigit() else (key, 0)
+
+
+def resolve(index, name, k=0):
+    """The card the ``k``-th TSV row named ``name`` applies to, or None.
+
+    Rows resolve through ``index.matching()``, so Greengrocer and Green
+    Grocer each get their own row. Where one name matches several cards
+    (the two Market Stalls), its rows go to those cards in order.
+    """
+    matches = index.matching(name)
+    if not matches:
+        return None
+    return matches[min(k, len(matches) - 1)]
+
+
+def effective_rows(table):
+    """Map each row's state key (see ``row_key()``) to its row index."""
+    return {row_key(name, k): i
+            for i, (name, k) in enumerate(zip(table.names, occurrences(table.names)))}
+
+
+def row_hashes(table):
+    """Content hash of each row, keyed by ``row_key()``."""
+    columns = [(col, table.raw[col]) for col in table.header]
+    hashes = {}
+    for key, i in effective_rows(table).items():
+        text = '\t'.join(f"{col}={values[i]}" for col, values in columns)
+        hashes[key] = hashlib.sha1(text.encode('utf-8')).hexdigest()
+    return hashes
+
+
+def diff_hashes(old, new):
+    """Return (added, removed, changed) row keys, each sorted."""
+    added = sorted(new.keys() - old.keys())
+    removed = sorted(old.keys() - new.keys())
+    changed = sorted(k for k in new.keys() & old.keys() if new[k] != old[k])
+    return added, removed, changed
+
+
+def load_state():
     try:
-        epp_f = float(elo_per_play)
-        pr_frac = plays / drafted if drafted > 0 else 0
-        if pr_frac > 0:
-            value_when_played = round(epp_f / pr_frac, 1)
-        else:
-            value_when_played = 0
-    except (ValueError, ZeroDivisionError):
-        value_when_played = 0
-
-    return {
-        'rank': rank,
-        'adp': adp,
-        'apr': apr,
-        'play_rate': play_rate,
-        'elo_per_play': elo_per_play,
-        'value': str(value),
-        'value_when_played': str(value_when_played),
-    }
-
-
-def main():
-    # Load existing cards
-    with open(CARDS_JSON, 'r', encoding='utf-8') as f:
-        cards = json.load(f)
-    print(f"Loaded {len(cards)} cards from JSON")
+        with open(STATE_JSON, 'r', encoding='utf-8') as f:
+            state = json.load(f)
+    except FileNotFoundError:
+        return None
+    if state.get('version') != STATE_VERSION:
+        return None
+    return state
 
-    # Build normalized name -> card index map
-    norm_to_idx = {}
-    for i, card in enumerate(cards):
-        n = normalize(card['name'])
-        norm_to_idx[n] = i
 
-    # Parse TSVs
-    rows_4p = parse_tsv(TSV_4P)
-    rows_3p = parse_tsv(TSV_3P)
-    print(f"Parsed {len(rows_4p)} rows from 4p TSV")
-    print(f"Parsed {len(rows_3p)} rows from 3p TSV")
+def save_state(hashes):
+    state = {'version': STATE_VERSION, **hashes}
+    with open(STATE_JSON, 'w', encoding='utf-8') as f:
+        json.dump(state, f, indent=2, sort_keys=True)
+
+
+def apply_4p(index, name, stats, k=0):
+    """Copy a 4p row's stats onto its card's top-level fields.
+
+    ``k`` counts the earlier rows with the same name. Returns False if
+    no card matches the row's name.
+    """
+    card = resolve(index, name, k)
+    if card is None:
+        return False
+    for field in STAT_FIELDS:
+        card.record[field] = stats[field]
+    # Remove pwr if present
+    card.record.pop('pwr', None)
+    return True
+
+
+def apply_3p(index, name, stats, k=0):
+    """Set ``stats_3p`` from a 3p row (``k`` as in ``apply_4p()``).
+
+    A 3p-only card (banned in 4p) is added as a new entry; returns True
+    in that case.
+    """
+    card = resolve(index, name, k)
+    if card is not None:
+        card.record['stats_3p'] = stats
+        return False
+    index.append({
+        'name': name,
+        'rank': None,
+        'adp': None,
+        'apr': None,
+        'play_rate': None,
+        'elo_per_play': None,
+        'value': None,
+        'value_when_played': None,
+        'description': '',
+        'card_id': '',
+        'type': '',
+        'cost': '',
+        'vps': '',
+        'prerequisites': '',
+        'passing': False,
+        'tags': [],
+        'banned_4p': True,
+        'stats_3p': stats,
+    })
+    return True
+
+
+def write_cards(cards):
+    written = write_card_json(cards, (CARDS_JSON, API_CARDS_JSON))
+    for path in written:
+        print(f"Wrote {path}")
+    if not written:
+        print("Card JSON unchanged; nothing written")
+
+
+def record_history(tables):
+    """Append each (players, path, table) to the ranking history unless already stored."""
+    for players, path, table in tables:
+        with open(path, 'rb') as f:
+            source = hashlib.sha1(f.read()).digest()
+        snapshot = append_table(RANKING_HISTORY, table, players, label=os.path.basename(path),
+                                timestamp=time.time(), source=source)
+        if snapshot is not None:
+            print(f"Recorded {players}p snapshot #{snapshot.index} in {os.path.relpath(RANKING_HISTORY)}")
+
+
+def print_names(title, names):
+    if names:
+        print(f"  {title}:")
+        for name in names:
+            print(f"    - {name}")
+
+
+def merge_full(index, table_4p, table_3p):
+    """Re-derive every card's stats from both TSVs. Returns unmatched 4p names."""
+    cards = index.records
 
     # --- Match and merge 4p data ---
     unmatched_4p = []
     matched_4p = 0
-    for row in rows_4p:
-        name = row.get('Card Name', '').strip()
-        n = normalize(name)
-        if n in norm_to_idx:
-            idx = norm_to_idx[n]
-            stats = derive_stats(row)
-            # Update top-level fields
-            cards[idx]['rank'] = stats['rank']
-            cards[idx]['adp'] = stats['adp']
-            cards[idx]['apr'] = stats['apr']
-            cards[idx]['play_rate'] = stats['play_rate']
-            cards[idx]['elo_per_play'] = stats['elo_per_play']
-            cards[idx]['value'] = stats['value']
-            cards[idx]['value_when_played'] = stats['value_when_played']
-            # Remove pwr if present
-            cards[idx].pop('pwr', None)
+    for name, k, stats in zip(table_4p.names, occurrences(table_4p.names), stats_records(table_4p)):
+        if apply_4p(index, name, stats, k):
             matched_4p += 1
         else:
             unmatched_4p.append(name)
 
+    trace.count('cards_matched_4p', matched_4p)
     print(f"\n4p: {matched_4p} matched, {len(unmatched_4p)} unmatched")
-    if unmatched_4p:
-        print("  Unmatched 4p names:")
-        for name in unmatched_4p:
-            print(f"    - {name}")
+    print_names("Unmatched 4p names", unmatched_4p)
 
     # --- Match and merge 3p data ---
-    unmatched_3p = []
     matched_3p = 0
     # First, set all cards to stats_3p: null
     for card in cards:
         card['stats_3p'] = None
 
     new_3p_only = []
-    for row in rows_3p:
-        name = row.get('Card Name', '').strip()
-        n = normalize(name)
-        if n in norm_to_idx:
-            idx = norm_to_idx[n]
-            stats = derive_stats(row)
-            cards[idx]['stats_3p'] = stats
-            matched_3p += 1
-        else:
-            # 3p-only card (banned in 4p) — add as new entry
-            stats = derive_stats(row)
-            new_card = {
-                'name': name,
-                'rank': None,
-                'adp': None,
-                'apr': None,
-                'play_rate': None,
-                'elo_per_play': None,
-                'value': None,
-                'value_when_played': None,
-                'description': '',
-                'card_id': '',
-                'type': '',
-                'cost': '',
-                'vps': '',
-                'prerequisites': '',
-                'passing': False,
-                'tags': [],
-                'banned_4p': True,
-                'stats_3p': stats,
-            }
-            cards.append(new_card)
+    for name, k, stats in zip(table_3p.names, occurrences(table_3p.names), stats_records(table_3p)):
+        if apply_3p(index, name, stats, k):
             new_3p_only.append(name)
+        else:
+            matched_3p += 1
 
+    trace.count('cards_matched_3p', matched_3p)
     print(f"\n3p: {matched_3p} matched, {len(new_3p_only)} new 3p-only (banned in 4p)")
-    if new_3p_only:
-        print("  Added as new cards (banned_4p=true):")
-        for name in new_3p_only:
-            print(f"    - {name}")
+    print_names("Added as new cards (banned_4p=true)", new_3p_only)
 
     # Summary
     cards_with_3p = sum(1 for c in cards if c.get('stats_3p') is not None)
@@ -208,11 +234,100 @@ def main():
     print(f"  {cards_with_3p} with 3p data, {cards_without_3p} without")
     print(f"  {banned_count} banned-in-4p cards (3p only)")
 
+    return unmatched_4p
+
+
+def merge_incremental(index, table_4p, table_3p, state, hashes):
+    """Patch only the cards whose TSV rows were added, removed or changed.
+
+    Returns (changed_any, unmatched 4p names).
+    """
+    unmatched_4p = []
+    changed_any = False
+
+    rows = effective_rows(table_4p)
+    added, removed, changed = diff_hashes(state['4p'], hashes['4p'])
+    print(f"\n4p: {len(added)} added, {len(removed)} removed, {len(changed)} changed")
+    keys = added + changed
+    for key, stats in zip(keys, stats_records(table_4p, rows=[rows[key] for key in keys])):
+        name, k = split_key(key)
+        if not apply_4p(index, name, stats, k):
+            unmatched_4p.append(name)
+    # The full merge never clears 4p stats for rows that disappear, so
+    # removed 4p rows only need reporting.
+    print_names("Added", [table_4p.names[rows[k]] for k in added])
+    print_names("Changed", [table_4p.names[rows[k]] for k in changed])
+    print_names("Removed", removed)
+    print_names("Unmatched 4p names", unmatched_4p)
+    changed_any |= bool(added or removed or changed)
+
+    rows = effective_rows(table_3p)
+    added, removed, changed = diff_hashes(state['3p'], hashes['3p'])
+    print(f"\n3p: {len(added)} added, {len(removed)} removed, {len(changed)} changed")
+    new_3p_only = []
+    keys = added + changed
+    for key, stats in zip(keys, stats_records(table_3p, rows=[rows[key] for key in keys])):
+        name, k = split_key(key)
+        if apply_3p(index, name, stats, k):
+            new_3p_only.append(name)
+    for key in removed:
+        card = resolve(index, *split_key(key))
+        if card is not None:
+            card.record['stats_3p'] = None
+    print_names("Added", [table_3p.names[rows[k]] for k in added])
+    print_names("Changed", [table_3p.names[rows[k]] for k in changed])
+    print_names("Removed", removed)
+    print_names("Added as new cards (banned_4p=true)", new_3p_only)
+    changed_any |= bool(added or removed or changed)
+
+    return changed_any, unmatched_4p
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Merge ranking TSVs into agricola-cards.json.")
+    parser.add_argument(
+        '--incremental', action='store_true',
+        help="only patch cards whose TSV rows changed since the last run "
+             "(falls back to a full merge when there is no saved state)",
+    )
+    trace.add_arguments(parser)
+    args = parser.parse_args(argv)
+    trace.configure(args)
+
+    # Load existing cards (indexed by normalized name)
+    index = load_cards(CARDS_JSON)
+    cards = index.records
+    print(f"Loaded {len(cards)} cards from JSON")
+
+    # Parse TSVs
+    table_4p = parse_tsv(TSV_4P)
+    table_3p = parse_tsv(TSV_3P)
+    print(f"Parsed {len(table_4p)} rows from 4p TSV")
+    print(f"Parsed {len(table_3p)} rows from 3p TSV")
+
+    with trace.span('record_history'):
+        record_history([(4, TSV_4P, table_4p), (3, TSV_3P, table_3p)])
+
+    with trace.span('row_hashes'):
+        hashes = {'4p': row_hashes(table_4p), '3p': row_hashes(table_3p)}
+    state = load_state() if args.incremental else None
+    if args.incremental and state is None:
+        print("No saved ingest state; running a full merge")
+
+    if state is None:
+        with trace.span('merge_full'):
+            unmatched_4p = merge_full(index, table_4p, table_3p)
+    else:
+        with trace.span('merge_incremental'):
+            changed_any, unmatched_4p = merge_incremental(index, table_4p, table_3p, state, hashes)
+        if not changed_any:
+            print("\nNo ranking rows changed since the last run; nothing written")
+            return 0
+
     # Write output
-    for path in [CARDS_JSON, API_CARDS_JSON]:
-        with open(path, 'w', encoding='utf-8') as f:
-            json.dump(cards, f, indent=2, ensure_ascii=False)
-        print(f"Wrote {path}")
+    with trace.span('write_cards'):
+        write_cards(cards)
+    save_state(hashes)
 
     if unmatched_4p:
         print(f"\nWARNING: {len(unmatched_4p)} unmatched 4p names need manual review")
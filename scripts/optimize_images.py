@@ -0,0 +1,188 @@
+#!/usr/bin/env python3
+"""
+Transcode card images to WebP plus fixed-size thumbnails and write the
+image manifest.
+
+Scans card-images/ for PNGs, and for every file whose content changed
+since the last run writes (in a process pool):
+
+  card-images/webp/<name>.<hash>.webp        full size
+  card-images/webp/<name>.<hash>.thumb.webp  THUMB_SIZE, padded
+
+Filenames carry the source content hash, so they can be cached forever.
+Per-file results are kept in card-images/webp/manifest.json; files whose
+content hash matches the cached entry are skipped. The manifest holds
+nothing checkout-specific (no mtimes), so it is committed and an
+unchanged run rewrites nothing. Outputs no longer referenced are deleted.
+
+js/card-image-list.js is regenerated from the manifest. Every page loads
+it before rendering, so it stays small: CARD_IMAGE_LIST as before, plus
+CARD_IMAGE_WEBP mapping each filename to its full-size WebP, the only
+variant the pages use. Dimensions, byte sizes and thumbnails stay in
+manifest.json.
+
+Requires Pillow.
+
+Usage: python optimize_images.py [--jobs N] [--force]
+"""
+
+import argparse
+import json
+import os
+import sys
+from concurrent.futures import ProcessPoolExecutor
+
+from PIL import Image, ImageOps
+
+from cardlib import IMAGES_DIR, ROOT_DIR, normalize_image_name
+from cardlib.files import file_digest, write_if_changed
+
+OUT_SUBDIR = 'webp'
+OUT_DIR = os.path.join(IMAGES_DIR, OUT_SUBDIR)
+MANIFEST_JSON = os.path.join(OUT_DIR, 'manifest.json')
+IMAGE_LIST_JS = os.path.join(ROOT_DIR, 'js', 'card-image-list.js')
+
+MANIFEST_VERSION = 1
+THUMB_SIZE = (120, 188)
+WEBP_QUALITY = 80
+THUMB_QUALITY = 70
+
+
+def scan_images():
+    """Return {filename: os.DirEntry} for every PNG in card-images/."""
+    with os.scandir(IMAGES_DIR) as it:
+        return {
+            entry.name: entry for entry in it
+            if entry.is_file() and entry.name.lower().endswith('.png')
+        }
+
+
+def transcode(src_path, filename, digest):
+    """Write the WebP and thumbnail for one image; runs in a worker process."""
+    stem = f"{normalize_image_name(filename)}.{digest[:10]}"
+    webp_name = f"{OUT_SUBDIR}/{stem}.webp"
+    thumb_name = f"{OUT_SUBDIR}/{stem}.thumb.webp"
+
+    with Image.open(src_path) as im:
+        im.load()
+        width, height = im.size
+        im = im.convert('RGBA')
+        im.save(os.path.join(IMAGES_DIR, webp_name), 'WEBP', quality=WEBP_QUALITY, method=6)
+        thumb = ImageOps.pad(im, THUMB_SIZE, method=Image.LANCZOS, color=(0, 0, 0, 0))
+        thumb.save(os.path.join(IMAGES_DIR, thumb_name), 'WEBP', quality=THUMB_QUALITY, method=6)
+
+    return {
+        'sha256': digest,
+        'width': width,
+        'height': height,
+        'bytes': os.path.getsize(src_path),
+        'webp': {
+            'file': webp_name,
+            'width': width,
+            'height': height,
+            'bytes': os.path.getsize(os.path.join(IMAGES_DIR, webp_name)),
+        },
+        'thumb': {
+            'file': thumb_name,
+            'width': THUMB_SIZE[0],
+            'height': THUMB_SIZE[1],
+            'bytes': os.path.getsize(os.path.join(IMAGES_DIR, thumb_name)),
+        },
+    }
+
+
+def load_manifest():
+    try:
+        with open(MANIFEST_JSON, 'r', encoding='utf-8') as f:
+            manifest = json.load(f)
+    except FileNotFoundError:
+        return {}
+    if manifest.get('version') != MANIFEST_VERSION:
+        return {}
+    return manifest.get('images', {})
+
+
+def outputs_exist(entry):
+    return all(
+        os.path.exists(os.path.join(IMAGES_DIR, entry[key]['file']))
+        for key in ('webp', 'thumb')
+    )
+
+
+def write_image_list_js(images):
+    names = sorted(images)
+    webp = {name: images[name]['webp']['file'] for name in names}
+    lines = [
+        "// Generated by scripts/optimize_images.py — do not edit by hand.",
+        "// Shared list of all card image filenames — used by both index.html and draft.html",
+        "var CARD_IMAGE_LIST = [",
+    ]
+    lines += [f"    {json.dumps(name, ensure_ascii=False)}," for name in names]
+    lines.append("];")
+    lines.append("")
+    lines.append("// Full-size WebP per CARD_IMAGE_LIST filename (relative to card-images/);")
+    lines.append("// sizes and thumbnails are in card-images/webp/manifest.json")
+    lines.append("var CARD_IMAGE_WEBP = {")
+    lines += [f"    {json.dumps(name, ensure_ascii=False)}: {json.dumps(webp[name], ensure_ascii=False)}," for name in names]
+    lines.append("};")
+    return write_if_changed(IMAGE_LIST_JS, ("\n".join(lines) + "\n").encode('utf-8'))
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Transcode card images and write the image manifest.")
+    parser.add_argument('--jobs', type=int, default=None, help="worker processes (default: CPU count)")
+    parser.add_argument('--force', action='store_true', help="re-transcode every image")
+    args = parser.parse_args(argv)
+
+    os.makedirs(OUT_DIR, exist_ok=True)
+    cached = {} if args.force else load_manifest()
+    entries = scan_images()
+
+    images = {}
+    todo = []
+    for name, entry in sorted(entries.items()):
+        prev = cached.get(name)
+        digest = file_digest(entry.path)
+        if prev and prev['sha256'] == digest and outputs_exist(prev):
+            images[name] = prev
+            continue
+        todo.append((entry.path, name, digest))
+
+    print(f"{len(entries)} images, {len(images)} unchanged, {len(todo)} to transcode")
+
+    if todo:
+        with ProcessPoolExecutor(max_workers=args.jobs) as pool:
+            futures = [(name, pool.submit(transcode, path, name, digest)) for path, name, digest in todo]
+            for name, future in futures:
+                images[name] = future.result()
+
+    # Drop outputs that no manifest entry points at any more.
+    keep = {os.path.basename(e[k]['file']) for e in images.values() for k in ('webp', 'thumb')}
+    removed = 0
+    with os.scandir(OUT_DIR) as it:
+        for entry in it:
+            if entry.name.endswith('.webp') and entry.name not in keep:
+                os.remove(entry.path)
+                removed += 1
+
+    manifest = json.dumps({'version': MANIFEST_VERSION, 'images': images},
+                          indent=1, sort_keys=True, ensure_ascii=False)
+    wrote_manifest = write_if_changed(MANIFEST_JSON, (manifest + "\n").encode('utf-8'))
+    wrote_list = write_image_list_js(images)
+
+    src_bytes = sum(e['bytes'] for e in images.values())
+    webp_bytes = sum(e['webp']['bytes'] for e in images.values())
+    thumb_bytes = sum(e['thumb']['bytes'] for e in images.values())
+    print(f"PNG:   {src_bytes / 1e6:8.1f} MB")
+    print(f"WebP:  {webp_bytes / 1e6:8.1f} MB")
+    print(f"Thumb: {thumb_bytes / 1e6:8.1f} MB")
+    if removed:
+        print(f"Removed {removed} stale outputs")
+    for path, written in ((MANIFEST_JSON, wrote_manifest), (IMAGE_LIST_JS, wrote_list)):
+        if written:
+            print(f"Wrote {os.path.relpath(path)}")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,137 @@
+#!/usr/bin/env python3
+"""
+Query and extend the ranking history (data/ranking-history.bin).
+
+merge_rankings.py appends every new TSV it ingests; this script reads
+the history back and can import older exports:
+
+    list                       stored snapshots
+    trend NAME                 one card's rank / ADP / Elo per snapshot
+    movers                     biggest changes between two snapshots
+    append TSV --players N     add an older export (--label, --date)
+    verify                     check every block's checksum
+
+Usage: python ranking_history.py list
+       python ranking_history.py trend "Basket Carrier" [--players 3]
+       python ranking_history.py movers [--field adp] [--from 0] [--to -1] [-n 10]
+       python ranking_history.py append old-4p.tsv --players 4 --date 2025-01-31
+"""
+
+import argparse
+import datetime
+import hashlib
+import os
+import sys
+
+from cardlib import RANKING_HISTORY
+from cardlib.history import STAT_FIELDS, RankingHistory, append_table
+from cardlib.rankings import parse_tsv
+
+
+def _date(timestamp):
+    return datetime.datetime.fromtimestamp(timestamp, datetime.timezone.utc).strftime('%Y-%m-%d')
+
+
+def _fmt(value):
+    if value != value:
+        return '-'
+    return f"{value:.0f}" if value == int(value) else f"{value:.2f}"
+
+
+def cmd_list(history, args):
+    for snap in history.snapshots:
+        print(f"  #{snap.index:<4} {snap.players}p  {_date(snap.timestamp)}  "
+              f"{snap.n_rows:>5} cards  {snap.label}")
+    print(f"{len(history)} snapshots, {len(history.names)} cards")
+    return 0
+
+
+def cmd_trend(history, args):
+    fields = args.fields.split(',')
+    cards = history.card_ids(args.name)
+    if not cards:
+        print(f"Unknown card: {args.name}")
+        return 1
+    for n, card in enumerate(cards):
+        trend = history.trend(card, players=args.players, fields=fields)
+        if len(cards) > 1:
+            if n:
+                print()
+            print(f"{history.names[card]} ({n + 1} of {len(cards)})")
+        print(f"{'#':<6} {'date':<11} " + ' '.join(f"{f:>13}" for f in fields) + "  label")
+        for j, snap in enumerate(trend['snapshots']):
+            print(f"{snap.index:<6} {_date(snap.timestamp):<11} "
+                  + ' '.join(f"{_fmt(trend[f][j]):>13}" for f in fields) + f"  {snap.label}")
+    return 0
+
+
+def cmd_movers(history, args):
+    if len(history.select(args.players)) < 2:
+        print("Not enough snapshots")
+        return 1
+    movers = history.movers(args.field, players=args.players, first=args.first, last=args.last, n=args.n)
+    if not movers:
+        print("No changes between those snapshots")
+    for name, before, after in movers:
+        print(f"  {name:<32} {_fmt(before):>8} -> {_fmt(after):<8}")
+    return 0
+
+
+def cmd_append(args):
+    with open(args.tsv, 'rb') as f:
+        source = hashlib.sha1(f.read()).digest()
+    if args.date:
+        when = datetime.datetime.strptime(args.date, '%Y-%m-%d').replace(tzinfo=datetime.timezone.utc)
+    else:
+        when = datetime.datetime.fromtimestamp(os.path.getmtime(args.tsv), datetime.timezone.utc)
+    table = parse_tsv(args.tsv)
+    snap = append_table(RANKING_HISTORY, table, args.players, label=args.label or os.path.basename(args.tsv),
+                        timestamp=when.timestamp(), source=source)
+    if snap is None:
+        print("Already stored; nothing appended")
+    else:
+        print(f"Appended {args.players}p snapshot #{snap.index} ({snap.n_rows} cards) "
+              f"to {os.path.relpath(RANKING_HISTORY)}")
+    return 0
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Query the ranking history.")
+    sub = parser.add_subparsers(dest='command', required=True)
+    sub.add_parser('list', help="list stored snapshots")
+    p = sub.add_parser('trend', help="one card's stats per snapshot")
+    p.add_argument('name')
+    p.add_argument('--players', type=int, choices=(3, 4), default=4)
+    p.add_argument('--fields', default='rank,adp,elo_per_play',
+                   help=f"comma-separated, from {', '.join(STAT_FIELDS)}")
+    p = sub.add_parser('movers', help="biggest changes between two snapshots")
+    p.add_argument('--field', choices=STAT_FIELDS, default='rank')
+    p.add_argument('--players', type=int, choices=(3, 4), default=4)
+    p.add_argument('--from', dest='first', type=int, default=0, help="snapshot position (default: oldest)")
+    p.add_argument('--to', dest='last', type=int, default=-1, help="snapshot position (default: newest)")
+    p.add_argument('-n', type=int, default=10)
+    p = sub.add_parser('append', help="append a rankings TSV export")
+    p.add_argument('tsv')
+    p.add_argument('--players', type=int, choices=(3, 4), required=True)
+    p.add_argument('--label', help="defaults to the file name")
+    p.add_argument('--date', help="snapshot date, YYYY-MM-DD (default: file mtime)")
+    sub.add_parser('verify', help="check every block's checksum")
+    args = parser.parse_args(argv)
+
+    if args.command == 'trend':
+        unknown = set(args.fields.split(',')) - set(STAT_FIELDS)
+        if unknown:
+            parser.error(f"unknown field(s): {', '.join(sorted(unknown))}")
+    if args.command == 'append':
+        return cmd_append(args)
+
+    with RankingHistory(RANKING_HISTORY) as history:
+        if args.command == 'verify':
+            bad = history.verify()
+            print(f"{len(history)} snapshots, {bad} bad blocks")
+            return 1 if bad else 0
+        return {'list': cmd_list, 'trend': cmd_trend, 'movers': cmd_movers}[args.command](history, args)
+
+
+if __name__ == '__main__':
+    sys.exit(main())
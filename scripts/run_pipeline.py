@@ -0,0 +1,173 @@
+#!/usr/bin/env python3
+"""
+Refresh all derived card data in one go.
+
+Runs the data scripts as a dependency graph (see cardlib.pipeline):
+
+    merge_rankings   ranking TSVs        -> agricola-cards.json (both copies)
+                                            and ranking-history.bin
+    add_tags         tag rules/overrides -> agricola-cards.json (both copies)
+    fuzzy_rename     card names          -> card-images/ renames
+    match_cards      report: cards vs images, near-duplicate art
+    match_analysis   report: unmatched cards and images
+    search_index     -> data/card-search-index.json
+    strategy_index   -> api/data/strategy-index-{4p,3p}.json
+    synergy          -> api/data/card-synergy.json
+    ocr_dictionary   -> data/ocr-name-dictionary.json
+    doc_index        strategy guide, rulebook -> api/data/doc-index.json
+    card_binary      -> agricola-cards.bin (both copies); JSON re-encoded from it
+    card_stats       -> data/card-stats.bin; JSON stats re-exported from it
+    card_bundles     -> data/card-bundles.json and data/bundles/ shards
+
+Stages whose inputs, outputs and code are unchanged since their last
+successful run are skipped; the hashes live in data/pipeline-state.json
+(git-ignored). Stages that do not depend on each other run in parallel.
+The slow, seeded draft simulation (simulate_draft.py) and the image
+transcoder (optimize_images.py) are not part of the graph; run them by
+hand when their inputs change.
+
+Naming stages runs just those plus whatever they depend on. Exit status
+is 1 if any stage fails. --profile traces every stage into one run (see
+cardlib.trace; summarize with trace_report.py).
+
+Usage: python run_pipeline.py [STAGE ...] [--force] [--jobs N]
+                              [--dry-run] [--list] [--quiet]
+                              [--profile [PATH]] [--cprofile]
+"""
+
+import argparse
+import os
+import sys
+import time
+
+from cardlib import (
+    ALIASES_JSON,
+    API_CARDS_BIN,
+    API_CARDS_JSON,
+    CARD_BUNDLES_DIR,
+    CARD_BUNDLES_JSON,
+    CARD_STATS_BIN,
+    CARDS_BIN,
+    CARDS_JSON,
+    DATA_DIR,
+    DOC_INDEX_JSON,
+    IMAGES_DIR,
+    OCR_NAMES_JSON,
+    RANKING_HISTORY,
+    RULEBOOK_PDF,
+    SEARCH_INDEX_JSON,
+    STRATEGY_GUIDE_MD,
+    STRATEGY_INDEX_3P,
+    STRATEGY_INDEX_4P,
+    SYNERGY_JSON,
+    TAG_OVERRIDES_JSON,
+    TAG_RULES_JSON,
+    TSV_3P,
+    TSV_4P,
+    trace,
+)
+from cardlib.pipeline import Stage, link, load_state, run, save_state, with_dependencies
+
+# Per-stage input/output hashes from the last run (git-ignored).
+STATE_JSON = os.path.join(DATA_DIR, 'pipeline-state.json')
+# Bump whenever the key format changes so recorded hashes are not trusted.
+STATE_VERSION = 1
+
+CARD_JSONS = (CARDS_JSON, API_CARDS_JSON)
+
+# Declaration order decides the order of in-place updates to the card JSON.
+STAGES = link([
+    Stage('merge_rankings', 'merge_rankings.py',
+          inputs=(TSV_4P, TSV_3P, CARDS_JSON), outputs=CARD_JSONS + (RANKING_HISTORY,)),
+    Stage('add_tags', 'add-tags.py',
+          inputs=(TAG_RULES_JSON, TAG_OVERRIDES_JSON, CARDS_JSON), outputs=CARD_JSONS),
+    Stage('fuzzy_rename', 'fuzzy_rename.py',
+          inputs=(CARDS_JSON, IMAGES_DIR), outputs=(IMAGES_DIR,)),
+    Stage('match_cards', 'match_cards.py', inputs=(CARDS_JSON, IMAGES_DIR)),
+    Stage('match_analysis', 'match_analysis.py', inputs=(CARDS_JSON, IMAGES_DIR)),
+    Stage('search_index', 'build_search_index.py',
+          inputs=(CARDS_JSON, ALIASES_JSON), outputs=(SEARCH_INDEX_JSON,)),
+    Stage('strategy_index', 'build_strategy_index.py',
+          inputs=(CARDS_JSON,), outputs=(STRATEGY_INDEX_4P, STRATEGY_INDEX_3P)),
+    Stage('synergy', 'build_synergy.py',
+          inputs=(CARDS_JSON,), outputs=(SYNERGY_JSON,)),
+    Stage('ocr_dictionary', 'build_ocr_dictionary.py',
+          inputs=(CARDS_JSON, ALIASES_JSON), outputs=(OCR_NAMES_JSON,)),
+    Stage('doc_index', 'build_doc_index.py',
+          inputs=(STRATEGY_GUIDE_MD, RULEBOOK_PDF), outputs=(DOC_INDEX_JSON,)),
+    # card_binary and card_stats re-serialize the JSON they decode, so they
+    # go after every JSON reader. card_stats comes last: card-stats.bin
+    # records the SHA-1 of the JSON as it is finally written.
+    Stage('card_binary', 'build_card_binary.py',
+          inputs=(CARDS_JSON,), outputs=(CARDS_BIN, API_CARDS_BIN) + CARD_JSONS),
+    Stage('card_stats', 'build_card_stats.py',
+          inputs=(CARDS_JSON,), outputs=(CARD_STATS_BIN,) + CARD_JSONS),
+    Stage('card_bundles', 'build_card_bundles.py',
+          inputs=(CARDS_JSON,), outputs=(CARD_BUNDLES_JSON, CARD_BUNDLES_DIR)),
+])
+
+
+def report(result, quiet):
+    stage = result.stage
+    if result.status == 'skipped':
+        print(f"-- {stage.name}: unchanged, skipped")
+    elif result.status == 'blocked':
+        print(f"-- {stage.name}: not run, a dependency failed")
+    else:
+        label = 'done' if result.status == 'ran' else f"FAILED (exit {result.returncode})"
+        print(f"== {stage.name}: {label} in {result.seconds:.2f}s")
+        if result.output and (not quiet or result.status == 'failed'):
+            for line in result.output.rstrip('\n').split('\n'):
+                print(f"   {line}")
+    sys.stdout.flush()
+
+
+def main(argv=None):
+    names = [s.name for s in STAGES]
+    parser = argparse.ArgumentParser(description="Run the card data scripts as a cached dependency graph.")
+    parser.add_argument('stages', nargs='*', metavar='STAGE',
+                        help=f"stages to run (default: all); one of {', '.join(names)}")
+    parser.add_argument('--force', action='store_true', help="run the selected stages even if unchanged")
+    parser.add_argument('--jobs', type=int, default=None, help="stages run at once (default: CPU count)")
+    parser.add_argument('--dry-run', action='store_true', help="list the stages that would run, run nothing")
+    parser.add_argument('--list', action='store_true', help="print the stages and their dependencies")
+    parser.add_argument('--quiet', action='store_true', help="only show the output of failed stages")
+    trace.add_arguments(parser)
+    args = parser.parse_args(argv)
+    trace.configure(args)
+
+    unknown = [n for n in args.stages if n not in names]
+    if unknown:
+        parser.error(f"unknown stage(s): {', '.join(unknown)}")
+
+    if args.list:
+        for stage in STAGES:
+            deps = ', '.join(n for n in names if n in stage.deps) or '-'
+            print(f"{stage.name:<16} after: {deps}")
+        return 0
+
+    stages = with_dependencies(STAGES, args.stages) if args.stages else STAGES
+    force = set(args.stages or names) if args.force else set()
+    state = load_state(STATE_JSON, STATE_VERSION)
+
+    t0 = time.perf_counter()
+    if args.dry_run:
+        results, _ = run(stages, state, force=force, dry_run=True)
+        for result in results:
+            print(f"{result.stage.name:<16} {'run' if result.status == 'ran' else result.status}")
+        return 0
+
+    results, state = run(stages, state, force=force, jobs=args.jobs,
+                         on_done=lambda r: report(r, args.quiet))
+    save_state(STATE_JSON, STATE_VERSION, state)
+
+    counts = {}
+    for result in results:
+        counts[result.status] = counts.get(result.status, 0) + 1
+    summary = ', '.join(f"{counts[s]} {s}" for s in ('ran', 'skipped', 'failed', 'blocked') if s in counts)
+    print(f"\n{len(results)} stages in {time.perf_counter() - t0:.2f}s: {summary}")
+    return 1 if counts.get('failed') else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
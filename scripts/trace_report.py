@@ -0,0 +1,199 @@
+#!/usr/bin/env python3
+"""
+Summarize, compare and export timing traces written by cardlib.trace.
+
+Record one with --profile on run_pipeline.py or any data script (or by
+setting AGRICOLA_TRACE), then:
+
+    python trace_report.py                      last run: spans, counters, processes
+    python trace_report.py --run ID             a particular run
+    python trace_report.py --runs               list the runs in the file
+    python trace_report.py --compare OTHER      span totals vs OTHER (a run id,
+                                                or a trace file's last run)
+    python trace_report.py --chrome out.json    Chrome trace format, for
+                                                chrome://tracing or Perfetto
+
+Usage: python trace_report.py [TRACE] [--run ID] [--runs]
+                              [--compare OTHER] [--chrome OUT]
+"""
+
+import argparse
+import json
+import os
+import sys
+
+from cardlib.trace import DEFAULT_TRACE
+
+
+def read_events(path):
+    """Return the trace file's events grouped by run id, in file order."""
+    runs = {}
+    with open(path, 'r', encoding='utf-8') as f:
+        for line in f:
+            line = line.strip()
+            if not line:
+                continue
+            try:
+                event = json.loads(line)
+            except ValueError:
+                continue  # a torn line from an interrupted process
+            runs.setdefault(event.get('run'), []).append(event)
+    return runs
+
+
+def pick_run(runs, run_id):
+    if not runs:
+        raise KeyError("no runs in trace")
+    if run_id is None:
+        return list(runs)[-1]
+    matches = [r for r in runs if r and r.startswith(run_id)]
+    if len(matches) != 1:
+        raise KeyError(f"{'ambiguous' if matches else 'unknown'} run: {run_id}")
+    return matches[0]
+
+
+def span_stats(events):
+    """Map (script, span name) -> [count, total µs, max µs]."""
+    scripts = {e['pid']: e['script'] for e in events if e['type'] == 'process'}
+    stats = {}
+    for e in events:
+        if e['type'] != 'span':
+            continue
+        key = (scripts.get(e['pid'], '?'), e['name'])
+        s = stats.setdefault(key, [0, 0, 0])
+        s[0] += 1
+        s[1] += e['dur']
+        s[2] = max(s[2], e['dur'])
+    return stats
+
+
+def counter_totals(events):
+    scripts = {e['pid']: e['script'] for e in events if e['type'] == 'process'}
+    totals = {}
+    for e in events:
+        if e['type'] == 'counter':
+            key = (scripts.get(e['pid'], '?'), e['name'])
+            totals[key] = totals.get(key, 0) + e['value']
+    return totals
+
+
+def _ms(us):
+    return f"{us / 1000:10.1f}"
+
+
+def summarize(run_id, events):
+    processes = [e for e in events if e['type'] == 'process']
+    print(f"Run {run_id}: {len(processes)} processes")
+    for e in sorted(processes, key=lambda e: e['ts']):
+        extra = f"  {e['profile']}" if e.get('profile') else ''
+        print(f"  {e['script']:<28} pid {e['pid']:<7} {_ms(e['dur'])} ms{extra}")
+
+    stats = span_stats(events)
+    if stats:
+        print(f"\n{'span':<44} {'count':>6} {'total ms':>10} {'mean ms':>10} {'max ms':>10}")
+        for (script, name), (n, total, peak) in sorted(stats.items(), key=lambda kv: -kv[1][1]):
+            print(f"  {script + ':' + name:<42} {n:>6} {_ms(total)} {_ms(total / n)} {_ms(peak)}")
+
+    counters = counter_totals(events)
+    if counters:
+        print(f"\n{'counter':<44} {'value':>12}")
+        for (script, name), value in sorted(counters.items()):
+            print(f"  {script + ':' + name:<42} {value:>12}")
+
+
+def compare(base_id, base, other_id, other):
+    """Print span totals of ``base`` next to ``other``, largest change first."""
+    a, b = span_stats(base), span_stats(other)
+    rows = []
+    for key in a.keys() | b.keys():
+        before = b[key][1] if key in b else None
+        after = a[key][1] if key in a else None
+        change = (after or 0) - (before or 0)
+        rows.append((key, before, after, change))
+    rows.sort(key=lambda r: -abs(r[3]))
+    print(f"{'span':<44} {other_id[:12]:>12} {base_id[:12]:>12} {'change':>10}")
+    for (script, name), before, after, change in rows:
+        pct = f"{100 * change / before:+.0f}%" if before else ''
+        print(f"  {script + ':' + name:<42} "
+              f"{'-' if before is None else f'{before / 1000:.1f}':>12} "
+              f"{'-' if after is None else f'{after / 1000:.1f}':>12} "
+              f"{change / 1000:>+9.1f}ms {pct}")
+
+
+def to_chrome(events):
+    """Convert one run's events to the Chrome trace event format."""
+    out = []
+    for e in events:
+        if e['type'] == 'process':
+            out.append({'ph': 'M', 'name': 'process_name', 'pid': e['pid'], 'tid': 0,
+                        'args': {'name': e['script']}})
+            out.append({'ph': 'X', 'name': e['script'], 'cat': 'process', 'pid': e['pid'], 'tid': 0,
+                        'ts': e['ts'], 'dur': e['dur']})
+        elif e['type'] == 'span':
+            out.append({'ph': 'X', 'name': e['name'], 'cat': 'span', 'pid': e['pid'], 'tid': e['tid'],
+                        'ts': e['ts'], 'dur': e['dur'], 'args': e.get('args', {})})
+    ends = {e['pid']: e['ts'] + e['dur'] for e in events if e['type'] == 'process'}
+    for e in events:
+        if e['type'] == 'counter':
+            out.append({'ph': 'C', 'name': e['name'], 'pid': e['pid'], 'tid': 0,
+                        'ts': ends.get(e['pid'], 0), 'args': {'value': e['value']}})
+    return {'traceEvents': out, 'displayTimeUnit': 'ms'}
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Summarize timing traces from --profile runs.")
+    parser.add_argument('trace', nargs='?', default=DEFAULT_TRACE,
+                        help=f"trace file (default {os.path.relpath(DEFAULT_TRACE)})")
+    parser.add_argument('--run', help="run id or unique prefix (default: the last run)")
+    parser.add_argument('--runs', action='store_true', help="list the runs in the file")
+    parser.add_argument('--compare', metavar='OTHER',
+                        help="compare with another run id, or the last run of another trace file")
+    parser.add_argument('--chrome', metavar='OUT', help="write the run as a Chrome trace JSON")
+    args = parser.parse_args(argv)
+
+    try:
+        runs = read_events(args.trace)
+    except FileNotFoundError:
+        print(f"No trace at {os.path.relpath(args.trace)}; run a script with --profile first")
+        return 1
+
+    if args.runs:
+        for run_id, events in runs.items():
+            processes = [e for e in events if e['type'] == 'process']
+            scripts = sorted({e['script'] for e in processes})
+            print(f"  {run_id}  {len(processes):>3} processes  {', '.join(scripts)}")
+        return 0
+
+    try:
+        run_id = pick_run(runs, args.run)
+    except KeyError as e:
+        print(e.args[0])
+        return 1
+    events = runs[run_id]
+
+    if args.chrome:
+        with open(args.chrome, 'w', encoding='utf-8') as f:
+            json.dump(to_chrome(events), f)
+        print(f"Wrote {args.chrome}")
+        return 0
+
+    if args.compare:
+        try:
+            if os.path.isfile(args.compare):
+                other_runs = read_events(args.compare)
+                other_id = pick_run(other_runs, None)
+            else:
+                other_runs = runs
+                other_id = pick_run(runs, args.compare)
+        except KeyError as e:
+            print(e.args[0])
+            return 1
+        compare(run_id, events, other_id, other_runs[other_id])
+        return 0
+
+    summarize(run_id, events)
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())